@@ -1,7 +1,8 @@
 from pyrecodes.component.component import Component
 from pyrecodes.component.r2d_component import R2DBuilding
-import pandas as pd
-from pyrecodes.resource_distribution_model.residual_demand_traffic_distribution_model import ResidualDemandTrafficDistributionModel
+import numpy as np
+from pyrecodes.resource_distribution_model.residual_demand_traffic_distribution_model import ResidualDemandTrafficDistributionModel, TravelTimeTable
+from pyrecodes.time_step_history import TimeStepValues, TimeStepRecords
 
 TRAVEL_TIME_CUTOFF = 14400  # four hours in seconds, used to determine if a business has access to suppliers
 TRAVEL_TIME_CHANGE_CUTOFF = 4  # if the difference between pre and post disaster travel times is greater than this, the business has no access to suppliers
@@ -29,6 +30,27 @@ class Business():
         self.parameters = parameters
         self.employee_homes = []
 
+    def set_compact_history(self, max_time_step: int) -> None:
+        """
+        Store the ratios of available employees, the revenue and the reasons for drop per time step in arrays preallocated for max_time_step time steps instead of dicts.
+        """
+        self.employees_available = TimeStepValues(max_time_step, self.employees_available)
+        self.revenue = TimeStepValues(max_time_step, self.revenue)
+        self.reason_for_drop = TimeStepRecords(max_time_step, self.reason_for_drop)
+
+    def reset_reasons_for_drop(self, time_step: int) -> None:
+        if isinstance(self.reason_for_drop, TimeStepRecords):
+            self.reason_for_drop.reset(time_step)
+        else:
+            self.reason_for_drop[time_step] = []
+
+    def add_reason_for_drop(self, time_step: int, reason_for_drop: str, level: float) -> None:
+        if isinstance(self.reason_for_drop, TimeStepRecords):
+            self.reason_for_drop.add(time_step, reason_for_drop, level)
+        else:
+            self.reason_for_drop[time_step].append({'Name': reason_for_drop,
+                                                    'Level': level})
+
     def set_employee_homes(self, components: list[Component]) -> None:
         for component in components:
             if isinstance(component, R2DBuilding):
@@ -36,10 +58,17 @@ class Business():
                     self.employee_homes.append(component)
 
     def check_employees(self, time_step: int, traffic_flow_model: ResidualDemandTrafficDistributionModel) -> None:
+        """
+        Update the ratio of available employees. An employee is available if their home is fully functional and they can reach the business.
+        Accessibility of all employees with functional homes is checked at once.
+        """
         employee_available = 0
-        for employee_home in self.employee_homes:
-            if employee_home.functionality_level == 1.0 and self.business_accessible(time_step, traffic_flow_model, employee_home):
-                employee_available += 1
+        functional_employee_homes = [employee_home for employee_home in self.employee_homes if employee_home.functionality_level == 1.0]
+        if len(functional_employee_homes) > 0:
+            business_closest_node = traffic_flow_model.building_to_traffic_node_dict[self.home_component.aim_id]
+            employee_closest_nodes = [traffic_flow_model.building_to_traffic_node_dict[employee_home.aim_id] for employee_home in functional_employee_homes]
+            travel_time_table = self.get_latest_travel_time_table(traffic_flow_model, time_step)
+            employee_available = int(np.count_nonzero(self.check_accessibility_of_nodes(business_closest_node, employee_closest_nodes, travel_time_table)))
 
         self.employees_available[time_step] = employee_available / self.parameters['NumEmployees']
         self.update_current_business_functionality(time_step, self.employees_available[time_step], 'Labor')
@@ -47,16 +76,14 @@ class Business():
     def business_accessible(self, time_step: int, transfer_service_distribution_model: ResidualDemandTrafficDistributionModel, employee_home: R2DBuilding) -> bool:
         employee_closest_node = transfer_service_distribution_model.building_to_traffic_node_dict[employee_home.aim_id]
         business_closest_node = transfer_service_distribution_model.building_to_traffic_node_dict[self.home_component.aim_id]
-        latest_travel_times, latest_travel_time_change = self.get_latest_travel_times(transfer_service_distribution_model, time_step)       
+        travel_time_table = self.get_latest_travel_time_table(transfer_service_distribution_model, time_step)
 
-        accessible = self.check_accessibility(business_closest_node, employee_closest_node, latest_travel_times, latest_travel_time_change)
+        accessible = self.check_accessibility(business_closest_node, employee_closest_node, travel_time_table)
         return accessible
     
-    def get_latest_travel_times(self, transfer_service_distribution_model: ResidualDemandTrafficDistributionModel, time_step: int) -> pd.DataFrame:
+    def get_latest_travel_time_table(self, transfer_service_distribution_model: ResidualDemandTrafficDistributionModel, time_step: int) -> TravelTimeTable:
         last_distribution_time_step = transfer_service_distribution_model.find_nearest_distribution_time_step(time_step)
-        latest_travel_times = transfer_service_distribution_model.travel_times[last_distribution_time_step]
-        latest_travel_time_change = transfer_service_distribution_model.travel_time_change_factors[last_distribution_time_step]
-        return latest_travel_times, latest_travel_time_change
+        return transfer_service_distribution_model.travel_time_tables[last_distribution_time_step]
         
     def get_employee_demand(self) -> float:
         if self.business_needs_employees():
@@ -82,7 +109,7 @@ class Business():
         Update the business.
         """
         self.business_functionality_level = 1.0
-        self.reason_for_drop[time_step] = []
+        self.reset_reasons_for_drop(time_step)
         self.update_current_business_functionality(time_step, self.home_component.functionality_level, 'Home Component Functionality')
         
     def update_functionality_based_on_unmet_demand(self, time_step, percent_of_met_demand: float) -> None:
@@ -119,8 +146,7 @@ class Business():
         if self.business_functionality_level > updated_level:
             self.business_functionality_level = updated_level
         if updated_level < 1.0:
-            self.reason_for_drop[time_step].append({'Name': reason_for_drop,
-                                             'Level': updated_level})
+            self.add_reason_for_drop(time_step, reason_for_drop, updated_level)
         self.update_revenue(time_step)
 
     def check_trips_in_od_matrix(self, transfer_service_distribution_model: ResidualDemandTrafficDistributionModel, component_ids: list[str]) -> list[dict]:
@@ -141,7 +167,7 @@ class Business():
         return self.check_trips_in_od_matrix(transfer_service_distribution_model, self.parameters['EmployeeLocations'])
 
     def update_access_to_suppliers(self, time_step, transfer_service_distribution_model: ResidualDemandTrafficDistributionModel) -> None:
-        latest_travel_times, latest_travel_time_change = self.get_latest_travel_times(transfer_service_distribution_model, time_step)
+        travel_time_table = self.get_latest_travel_time_table(transfer_service_distribution_model, time_step)
 
         home_component_closest_node = transfer_service_distribution_model.building_to_traffic_node_dict[self.home_component.aim_id]
         
@@ -150,63 +176,27 @@ class Business():
             if supplier_closest_node is None:
                 print(f"Supplier {supplier} not found in building_to_traffic_node_dict")
             else:
-                accessible = self.check_accessibility(home_component_closest_node, supplier_closest_node, latest_travel_times, latest_travel_time_change)
+                accessible = self.check_accessibility(home_component_closest_node, supplier_closest_node, travel_time_table)
         if not(accessible):
             self.update_current_business_functionality(time_step, 0, 'LocalSuppliers')
 
-    def find_trip_id(self, origin_node: str, stop_node: str, travel_times: dict, bidirectional: bool = True) -> int:
+    def check_accessibility(self, home_component_closest_node: str, supplier_closest_node: str, travel_time_table: TravelTimeTable) -> bool:
+        return bool(self.check_accessibility_of_nodes(home_component_closest_node, [supplier_closest_node], travel_time_table)[0])
+
+    def check_accessibility_of_nodes(self, origin_node: str, destin_nodes: list[str], travel_time_table: TravelTimeTable) -> np.ndarray:
         """
-        Find the trip ID for a given origin-destination pair.
-        
-        Args:
-            origin_node: Origin node ID (as string)
-            stop_node: Destination node ID (as string)
-            travel_times: List of travel time dictionaries
-            
+        | Check whether trips between the origin node and each of the destination nodes are possible, in either direction.
+        | A trip is not possible if it is not found in the travel time table or if both its travel time and its travel time change factor are above the cutoffs.
+
         Returns:
-            int: Index of the trip in travel_times, or -1 if not found
+            np.ndarray: Boolean array, True for destination nodes that are accessible.
         """
-        # Convert to integers for comparison if needed
-        try:
-            origin_node_int = int(origin_node)
-            stop_node_int = int(stop_node)
-        except ValueError:
-            print(f"Warning: Could not convert node IDs to integers: {origin_node}, {stop_node}")
-            return -1
-            
-        for i, travel_time in enumerate(travel_times):
-            # Check for exact match (directional)         
-            if (travel_time['origin_nid'] == origin_node_int and 
-                travel_time['destin_nid'] == stop_node_int):
-                return i
-            
-            if bidirectional and (travel_time['origin_nid'] == stop_node_int and 
-                travel_time['destin_nid'] == origin_node_int):
-                return i
-                
-        print(f"Trip not found for {origin_node} to {stop_node}")
-        return -1
-
-    def check_accessibility(self, home_component_closest_node: str, supplier_closest_node: str, latest_travel_times: pd.DataFrame, travel_time_change: list[dict]) -> bool:
-        accessible = False
-        latest_travel_times_dict = latest_travel_times.to_dict(orient='records')
-        agent_row = self.find_trip_id(home_component_closest_node, supplier_closest_node, latest_travel_times_dict)
-        
-        # If no trip found, assume not accessible
-        if agent_row == -1:
-            return False
-            
-        travel_time = self.get_travel_time(agent_row, latest_travel_times_dict)
-        travel_time_change_factor = self.get_travel_time_change_factor(agent_row, travel_time_change)
-        if not(travel_time_change_factor > TRAVEL_TIME_CHANGE_CUTOFF and travel_time > TRAVEL_TIME_CUTOFF):
-            accessible = True
-            
+        trip_rows = travel_time_table.get_trip_rows(origin_node, destin_nodes)
+        trip_found = trip_rows >= 0
+        for destin_node in np.asarray(destin_nodes, dtype=object)[~trip_found]:
+            print(f"Trip not found for {origin_node} to {destin_node}")
+        found_rows = trip_rows[trip_found]
+        accessible = np.zeros(len(trip_rows), dtype=bool)
+        accessible[trip_found] = ~((travel_time_table.travel_time_change[found_rows] > TRAVEL_TIME_CHANGE_CUTOFF) &
+                                   (travel_time_table.travel_time_used[found_rows] > TRAVEL_TIME_CUTOFF))
         return accessible
-       
-    def get_travel_time(self, agent_row: int, travel_times: dict) -> float:
-        return travel_times[agent_row]['travel_time_used']
-
-    def get_travel_time_change_factor(self, agent_row: int, travel_time_change: list[dict]) -> float:
-        return travel_time_change[agent_row]['travel_time_change']                             
-
-    
\ No newline at end of file
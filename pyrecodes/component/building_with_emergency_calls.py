@@ -55,6 +55,20 @@ class BuildingWithEmergencyCalls(StandardiReCoDeSComponent):
             current_communication_demand = self.modify_emergency_calls_demand(initial_communication_demand, time_step)
         communication_resource_object.set_current_amount(current_communication_demand)
 
+    def get_next_event_time_step(self, time_step: int) -> float:
+        """
+        | *extend parent method*
+        | Communication demand increases at COMMUNICATION_DEMAND_INCREASE_TIME_STEP and changes at each time step until it decreases to the initial demand.
+        """
+        next_event_time_step = super().get_next_event_time_step(time_step)
+        if time_step < self.COMMUNICATION_DEMAND_INCREASE_TIME_STEP:
+            return min(next_event_time_step, self.COMMUNICATION_DEMAND_INCREASE_TIME_STEP)
+        initial_communication_demand = getattr(self, SupplyOrDemand.DEMAND.value)[self.DemandTypes.OPERATION_DEMAND.value][
+            self.COMMUNICATION_RESOURCE_NAME].initial_amount
+        if self.modify_emergency_calls_demand(initial_communication_demand, time_step) > initial_communication_demand:
+            return time_step + 1
+        return next_event_time_step
+
     def modify_emergency_calls_demand(self, initial_communication_demand: float, time_step: int) -> float:
         """
         | Modify communication demand based on the current time step, the exponential function parameters and initial communication demand.
@@ -14,7 +14,7 @@ class Component(ABC):
     """
     name: str
     functionality_level: float 
-    functional: list[int]
+    functional: list[int]  # time steps at which the component is functional, see time_step_history.TimeStepIntervals
     locality: list
     supply: dict
     demand: dict
@@ -15,6 +15,7 @@ class InfrastructureInterface(StandardiReCoDeSComponent):
         | **Note 1**: The supply dynamics are defined in the system configuration file, but in the component library file the interface component has to have the resource defined.
         | **Note 2**: It is assumed that last value in the Amount key is the initial supply amount and the highest value that the infrastructure system provides. 
         """
+        self.supply_dynamics = supply_dynamics
         restoration_times = self.get_restoration_times(supply_dynamics)
         total_restoration_time = max(restoration_times)
         # avoid divison with zero if the last restoration time is zero
@@ -30,6 +31,14 @@ class InfrastructureInterface(StandardiReCoDeSComponent):
                                             'StepValues': step_values})
         self.supply['Supply'][supply_dynamics['Resource']].set_initial_amount(max(supply_dynamics['Amount']))
     
+    def sample_random_variables(self) -> None:
+        """
+        Extend the parent method to resample the restoration times of the supply dynamics.
+        """
+        super().sample_random_variables()
+        if hasattr(self, 'supply_dynamics'):
+            self.set_supply_dynamics(self.supply_dynamics)
+
     def add_initial_zero_supply(self, step_limits: list, step_values: list) -> tuple:
         """
         | Add the initial zero supply to the step limits and step values.
@@ -6,7 +6,14 @@ class R2DComponent(StandardiReCoDeSComponent):
     Class used to simulate components created using R2D outputs.
 
     Note that SimCenter's infrastructure simulators (REWET, residual demand) only work with R2DComponent objects.
+
+    Distribution models that reference the component's R2D dictionary add their change sets to r2d_change_sets.
+    The component adds itself to these change sets when the data in its R2D dictionary changes.
     """
+    def __init__(self) -> None:
+        super().__init__()
+        self.r2d_change_sets = []
+
     def update(self, time_step: int) -> None:
         """
         Extend the parent method to update the R2D dictionary used to interface pyrecodes with SimCenter's infrastructure simulators.
@@ -18,9 +25,29 @@ class R2DComponent(StandardiReCoDeSComponent):
         """
         Update the R2D dictionary with the current resource demand of the component. SimCenter's infrastructure simulators get component's demand from this dictionary.
         """
+        r2d_dict_changed = False
         for demand_type in demand_types:
             for resource in self.demand[demand_type].values():
-                self.general_information[demand_type][resource.name] = resource.current_amount
+                if self.general_information[demand_type].get(resource.name) != resource.current_amount:
+                    self.general_information[demand_type][resource.name] = resource.current_amount
+                    r2d_dict_changed = True
+        if r2d_dict_changed:
+            self.add_to_r2d_change_sets()
+
+    def add_to_r2d_change_sets(self) -> None:
+        """
+        Add the component's (asset type, asset subtype, AIM id) to the change sets of distribution models that reference its R2D dictionary.
+        """
+        for change_set in self.r2d_change_sets:
+            change_set.add((self.asset_type, self.asset_subtype, self.aim_id))
+
+    def set_r2d_general_information(self, key: str, value) -> None:
+        """
+        Set a value in the component's general information and add the component to the change sets if the value changed.
+        """
+        if self.general_information.get(key) != value:
+            self.general_information[key] = value
+            self.add_to_r2d_change_sets()
 
 class R2DTransportationComponent(R2DComponent):
     """
@@ -32,7 +59,7 @@ class R2DTransportationComponent(R2DComponent):
         """
         Update the resource-to-damage dictionary based on the current damage level of the pipe.
         """
-        self.general_information['FunctionalityLevel'] = self.functionality_level
+        self.set_r2d_general_information('FunctionalityLevel', self.functionality_level)
 
 class R2DBridge(R2DTransportationComponent):
     """
@@ -74,10 +101,12 @@ class R2DPipe(R2DComponent):
         """
         super().update_r2d_dict()
         if self.functionality_level < 1.0:
-            self.general_information['Status'] = 'CLOSED'
+            self.set_r2d_general_information('Status', 'CLOSED')
         elif self.functionality_level == 1.0:
-            self.general_information['Status'] = 'OPEN'
-            self.damage_information  = {'Location': [], 'Type': []}
+            self.set_r2d_general_information('Status', 'OPEN')
+            if self.damage_information != {'Location': [], 'Type': []}:
+                self.damage_information  = {'Location': [], 'Type': []}
+                self.add_to_r2d_change_sets()
 
 class R2DBuilding(R2DComponent):
     """
@@ -94,7 +123,7 @@ class R2DBuilding(R2DComponent):
         The population ratio is used by SimCenter infrastructure simulators (residual demand) to calculate the demand for resources.
         """
         super().update_r2d_dict()
-        self.general_information['PopulationRatio'] = self.functionality_level
+        self.set_r2d_general_information('PopulationRatio', self.functionality_level)
 
 class R2DBuildingWithBusiness(R2DBuilding):
     """
@@ -108,6 +137,14 @@ class R2DBuildingWithBusiness(R2DBuilding):
         super().update(time_step)
         self.update_businesses(time_step)
 
+    def set_compact_history(self, max_time_step: int) -> None:
+        """
+        Extend the parent method to store the histories of businesses in preallocated arrays as well.
+        """
+        super().set_compact_history(max_time_step)
+        for business in self.businesses:
+            business.set_compact_history(max_time_step)
+
     def update_businesses(self, time_step: int) -> None:
         for business in self.businesses:
             business.update(time_step)
@@ -135,6 +172,24 @@ class R2DBuildingWithBusiness(R2DBuilding):
         for business in self.businesses:
             business.recover(time_step)
 
+    def skip_time_steps(self, time_steps: range, recover: bool) -> None:
+        """
+        Extend the parent method. Businesses record their state at each time step, so they are recovered at each skipped time step.
+        """
+        super().skip_time_steps(time_steps, recover)
+        if recover:
+            for time_step in time_steps:
+                for business in self.businesses:
+                    business.recover(time_step)
+
+    def get_next_event_time_step(self, time_step: int) -> float:
+        """
+        Extend the parent method. Businesses record their state at each time step, so buildings with businesses are updated at each time step.
+        """
+        if len(self.businesses) > 0:
+            return time_step + 1
+        return super().get_next_event_time_step(time_step)
+
     def update_access_of_businesses_to_suppliers(self, time_step, transfer_service_distribution_model) -> None:
         # there is no need to have transfer_service_distribution_model as input here, change the code to reference the model in the business class as attribute. TODO: Implement later.
         for business in self.businesses:
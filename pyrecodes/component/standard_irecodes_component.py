@@ -3,11 +3,22 @@ from pyrecodes.component.component import SupplyOrDemand
 from enum import Enum
 from pyrecodes.utilities import get_class
 from pyrecodes.relation import relation
+from pyrecodes.time_step_history import TimeStepIntervals, TimeStepSet
 
 class StandardiReCoDeSComponent(Component):
     """
     Implementation of the Component interface to define standard functionality of a component in pyrecodes.
     """
+    # set by the ResourceStore if the component's resource amounts are stored in the system's columnar resource store
+    resource_store = None
+    # set by the system's ComponentStateCounter, which counts damaged and functional components
+    state_counter = None
+    # set by the system's ResourceAmountUpdater, which updates the functionality level and, if none are consumable, the supply and operation demand before the component is updated
+    functionality_updated_in_batch = False
+    amounts_updated_in_batch = False
+    # (resource name, changed rows, row) of system matrices that hold the component's resource amounts, see add_resource_change_set
+    resource_change_sets = ()
+
     class SupplyTypes(Enum):
         """
         | Enum Class to specify the strings used for component's supply types.
@@ -26,10 +37,10 @@ class StandardiReCoDeSComponent(Component):
     def __init__(self) -> None:
         """
         | Initialiaze the StandardiReCoDeSComponent. Set functionality level of a component to 1.
-        | Initialize the "functional" time step list and supply and demand of a component as empty dicts.
+        | Initialize the "functional" time steps as empty TimeStepIntervals and supply and demand of a component as empty dicts.
         """
         self.functionality_level = 1.0
-        self.functional = []
+        self.functional = TimeStepIntervals()
         self.recovery_model = None
         self.locality = None
         self.supply = {supply_type.value: dict() for supply_type in self.SupplyTypes}
@@ -59,7 +70,22 @@ class StandardiReCoDeSComponent(Component):
     
     def set_recovery_time_steps(self, recovery_time_steps: list) -> None:
         self.recovery_model.set_recovery_time_steps(recovery_time_steps)
+
+    def set_compact_history(self, max_time_step: int) -> None:
+        """
+        | Store the time steps at which the component is functional in a TimeStepSet preallocated for max_time_step time steps instead of a list.
+        | Used in the compact object mode, see BuiltEnvironment.set_compact_objects.
+        """
+        self.functional = TimeStepSet(max_time_step, self.functional)
     
+    def sample_random_variables(self) -> None:
+        """
+        | Resample component's random variables. At the moment, these are the durations of recovery activities.
+        | Used to get a new realization of a component that was copied from an existing component.
+        """
+        for recovery_activity in getattr(self.recovery_model, 'recovery_activities', {}).values():
+            recovery_activity.resample_duration()
+
     def set_supply(self, supply_parameters: dict) -> None:
         """
         | Set component's supply as defined in supply_parameters.
@@ -146,6 +172,28 @@ class StandardiReCoDeSComponent(Component):
         place_to_add = getattr(self, supply_or_demand)[type]
         for resource_name, resource_parameters in resource_dict.items():            
             place_to_add[resource_name] = self.form_resource(resource_name, resource_parameters)
+            self.notify_resource_change_sets(resource_name, place_to_add[resource_name])
+
+    def add_resource_change_set(self, resource_name: str, changed_rows: set, row: int) -> None:
+        """
+        | Add row to changed_rows whenever the amount of the component's supply, operation demand or recovery demand of resource_name changes or the resource object is replaced.
+        | Used by the SingleResourceSystemMatrixCreator, so it only reads the rows of components whose resources changed.
+        """
+        self.resource_change_sets = self.resource_change_sets + ((resource_name, changed_rows, row),)
+        for supply_or_demand in [self.supply, self.demand]:
+            for resources in supply_or_demand.values():
+                if resource_name in resources:
+                    resources[resource_name].add_change_set(changed_rows, row)
+
+    def notify_resource_change_sets(self, resource_name: str, resource_object) -> None:
+        """
+        Add the component's rows to the change sets of resource_name, as the resource object was replaced, and bind the new resource object to the change sets.
+        """
+        for change_set_resource_name, changed_rows, row in self.resource_change_sets:
+            if change_set_resource_name == resource_name:
+                changed_rows.add(row)
+                if resource_object is not None:
+                    resource_object.add_change_set(changed_rows, row)
     
     def form_resource(self, resource_name: str, resource_parameters: dict, 
                       default_resource_class_name = 'ConcreteResource', 
@@ -177,23 +225,28 @@ class StandardiReCoDeSComponent(Component):
         """
         | Update component's state based on its current damage level and damage-to-functionality relation.
         | This includes updating component's functionality_level, checking if the component is functional at time_step and updating its supply, operation and recovery demand.
+        | The functionality level, supply and operation demand are not updated again if the system's ResourceAmountUpdater already updated them in this time step.
         """
-        self.update_functionality()
+        if not self.functionality_updated_in_batch:
+            self.update_functionality()
         self.check_if_functional(time_step)
-        self.update_supply_based_on_component_functionality()
-        self.update_operation_demand()
+        if not self.amounts_updated_in_batch:
+            self.update_supply_based_on_component_functionality()
+            self.update_operation_demand()
         self.update_recovery_demand()
 
     def update_functionality(self) -> None:
         """
-        Update component's functionality level by calling the recovery model's get_functionality_level method.
+        Update component's functionality level by calling the recovery model's get_functionality_level method. The system's ComponentStateCounter, if there is one, is notified.
         """
         self.functionality_level = self.recovery_model.get_functionality_level()
+        if self.state_counter is not None:
+            self.state_counter.set_functionality_level(self.state_counter_id, self.functionality_level)
         
     def check_if_functional(self, time_step: int) -> None:
         """
         | Check if the component is functional at time_step. Component is considered functional if its functionality level is higher than 0.
-        | If the component is functional at time_step, add time_step to the component's "functional" list.
+        | If the component is functional at time_step, add time_step to the component's "functional" time steps.
         """
         if self.functionality_level > 0:
             self.functional.append(time_step)
@@ -201,10 +254,12 @@ class StandardiReCoDeSComponent(Component):
     def update_resources_based_on_component_functionality(self, supply_or_demand: str, type: str) -> None:
         """
         Update component's supply or demand based on its current functionality level.
+        Resources already updated by the system's ResourceAmountUpdater are skipped.
         """
         resources_to_update = getattr(self, supply_or_demand)[type]
         for resource_object in resources_to_update.values():
-            resource_object.update_based_on_component_functionality(self.functionality_level)
+            if not resource_object.amount_updated_in_batch:
+                resource_object.update_based_on_component_functionality(self.functionality_level)
 
     def update_supply_based_on_component_functionality(self) -> None:
         """
@@ -227,7 +282,14 @@ class StandardiReCoDeSComponent(Component):
         | It is important that this method is called before the resource distribution in a time step of the resilience assessment.
         """
         self.set_recovery_model_activities_demand_to_met()
+        previous_recovery_demand = self.demand[self.DemandTypes.RECOVERY_DEMAND.value]
         self.demand[self.DemandTypes.RECOVERY_DEMAND.value] = self.recovery_model.get_demand()
+        for resource_name in {change_set[0] for change_set in self.resource_change_sets}:
+            resource_object = self.demand[self.DemandTypes.RECOVERY_DEMAND.value].get(resource_name, None)
+            if resource_object is not previous_recovery_demand.get(resource_name, None):
+                self.notify_resource_change_sets(resource_name, resource_object)
+        if self.resource_store is not None:
+            self.resource_store.update_recovery_demand(self)
 
     def set_recovery_model_activities_demand_to_met(self):
         """
@@ -269,4 +331,36 @@ class StandardiReCoDeSComponent(Component):
         """
         Recover the component as defined in its recovery model.
         """
-        self.recovery_model.recover(time_step)
\ No newline at end of file
+        self.recovery_model.recover(time_step)
+
+    def get_next_event_time_step(self, time_step: int) -> float:
+        """
+        | Get the next time step at which the component's supply or demand can change, as reported by its recovery model.
+        | Supply of consumable resources changes whenever it is consumed, so it can change at the next time step.
+        | Used by the event-driven time advancement of the BuiltEnvironment.
+        """
+        for resource_object in self.supply[self.SupplyTypes.SUPPLY.value].values():
+            if resource_object.CONSUMABLE and resource_object.initial_amount > 0:
+                return time_step + 1
+        return self.recovery_model.get_next_event_time_step(time_step)
+
+    def skip_time_steps(self, time_steps: range, recover: bool) -> None:
+        """
+        | Advance the component over time_steps skipped by the event-driven time advancement, in which its functionality level, supply and demand do not change.
+        | If the component is functional, all time_steps are recorded as functional at once. If recover is True, the recovery model recovers over time_steps at once.
+        """
+        if len(time_steps) == 0:
+            return
+        if self.functionality_level > 0:
+            self.add_functional_time_steps(time_steps)
+        if recover:
+            self.recovery_model.recover_over_skipped_time_steps(time_steps)
+
+    def add_functional_time_steps(self, time_steps: range) -> None:
+        """
+        Add consecutive time_steps to the component's "functional" time steps. Lists of time steps (e.g., in systems loaded from older pickle files) are extended.
+        """
+        if hasattr(self.functional, 'add_interval'):
+            self.functional.add_interval(time_steps.start, time_steps.stop)
+        else:
+            self.functional.extend(time_steps)
\ No newline at end of file
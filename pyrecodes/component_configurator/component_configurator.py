@@ -3,6 +3,7 @@ from pyrecodes.component.standard_irecodes_component import StandardiReCoDeSComp
 from pyrecodes.component.component import SupplyOrDemand
 from pyrecodes.utilities import format_locality_id
 from pyrecodes.component_configurator.repair_configurator import RepairConfigurator
+from pyrecodes.component_recovery_model.recovery_time_schedule import get_recovery_time_schedule
 
 class ComponentConfigurator():    
     """
@@ -45,13 +46,15 @@ class ComponentConfigurator():
     def set_recovery_time_stepping_rules(self, recovery_time_stepping: list):
         """
         Set recovery time stepping rules for the component. If None, the component will be recovered at each time step.
+        Recovery time steps are compiled into a RecoveryTimeSchedule, shared by all components configured by the configurator.
         """
         if recovery_time_stepping is None:
-            self.recovery_time_steps = list(range(self.system_level_data['START_TIME_STEP'], self.system_level_data['MAX_TIME_STEP']))
+            recovery_time_steps = list(range(self.system_level_data['START_TIME_STEP'], self.system_level_data['MAX_TIME_STEP']))
         else: 
-            self.recovery_time_steps = []
+            recovery_time_steps = []
             for time_stepping in recovery_time_stepping:
-                self.recovery_time_steps += list(range(time_stepping['start'], time_stepping['end'], time_stepping['step']))    
+                recovery_time_steps += list(range(time_stepping['start'], time_stepping['end'], time_stepping['step']))    
+        self.recovery_time_steps = get_recovery_time_schedule(recovery_time_steps)
 
     def set_repair_configurator(self, component: Component) -> None:
         self.repair_configurator = RepairConfigurator(component, self.system_level_data)        
@@ -13,10 +13,29 @@ class R2DDictGetter():
     def get_dict(self) -> dict:
         return {'GeneralInformation': self.component.general_information,
                 'Damage': {}}
+
+    def update_dict(self, r2d_dict: dict) -> bool:
+        """
+        Point the component's dictionary created by get_dict to the component's current data, if the component replaced it.
+
+        Returns:
+            bool: True if the dictionary was updated.
+        """
+        if r2d_dict['GeneralInformation'] is self.component.general_information:
+            return False
+        r2d_dict['GeneralInformation'] = self.component.general_information
+        return True
     
 class R2DPipeDictGetter(R2DDictGetter):
 
     def get_dict(self) -> dict:
         return {'GeneralInformation': self.component.general_information,
                 'Damage': self.component.damage_information}
+
+    def update_dict(self, r2d_dict: dict) -> bool:
+        general_information_updated = super().update_dict(r2d_dict)
+        if r2d_dict['Damage'] is self.component.damage_information:
+            return general_information_updated
+        r2d_dict['Damage'] = self.component.damage_information
+        return True
                   
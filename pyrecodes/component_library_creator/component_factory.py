@@ -0,0 +1,34 @@
+"""
+Module used to create components of a component library entry.
+"""
+
+from pyrecodes.component.component import Component
+
+class ComponentFactory:
+    """
+    | Creates new components of a single component library entry.
+
+    | Components are constructed from the component class and the parameters read from the component library file, instead of deep copying the component template.
+    | Parameters from the component library are not modified during the resilience assessment, so they are shared between all components created by the factory.
+    | Relations and probability distributions are shared as well, see the get_relation and get_distribution functions.
+    | Random variables (i.e., durations of recovery activities) are sampled when a component is constructed, so each created component gets a new realization.
+
+    Attributes:
+        | component_class (type): The class of the created components.
+        | component_name (str): The name of the component library entry.
+        | component_parameters (dict): The parameters of the component library entry.
+
+    """
+
+    def __init__(self, component_class: type, component_name: str, component_parameters: dict) -> None:
+        self.component_class = component_class
+        self.component_name = component_name
+        self.component_parameters = component_parameters
+
+    def create(self) -> Component:
+        """
+        Create a new component.
+        """
+        component = self.component_class()
+        component.construct(self.component_name, self.component_parameters)
+        return component
@@ -1,5 +1,6 @@
 from pyrecodes.component_library_creator.component_library_creator import ComponentLibraryCreator
 from pyrecodes.component.component import Component
+from pyrecodes.component_library_creator.component_factory import ComponentFactory
 from pyrecodes.utilities import get_class
 import json
 
@@ -34,10 +35,12 @@ class JSONComponentLibraryCreator(ComponentLibraryCreator):
     def form_component(self, component_name: str, component_parameters: dict) -> Component:
         """
         Form and return a component object based on the input component_name and component_parameters to be used as component template in system creation.
+        The component factory used to create system components of this type is stored in the template's factory attribute.
         """
         target_class = get_class(component_parameters["ComponentClass"]["FileName"], 
                                  component_parameters['ComponentClass']['ClassName'], 
                                  "component")
-        component = target_class()
-        component.construct(component_name, component_parameters)     
+        factory = ComponentFactory(target_class, component_name, component_parameters)
+        component = factory.create()
+        component.factory = factory
         return component
\ No newline at end of file
@@ -1,5 +1,6 @@
 from pyrecodes.component_recovery_model.recovery_model import RecoveryModel
 from pyrecodes.relation import relation
+from pyrecodes.component_recovery_model.recovery_time_schedule import get_recovery_time_schedule
 
 class AbstractRecoveryModel(RecoveryModel):
     """
@@ -7,6 +8,8 @@ class AbstractRecoveryModel(RecoveryModel):
     """
 
     parameters = {}
+    # set by the system's ComponentStateCounter, which is notified when the component's damage level changes
+    state_counter = None
 
     def __init__(self, recovery_model_parameters: dict) -> None:
         """
@@ -32,6 +35,13 @@ class AbstractRecoveryModel(RecoveryModel):
         """
         pass
 
+    def notify_state_counter(self) -> None:
+        """
+        Notify the system's ComponentStateCounter, if there is one, of the component's current damage level. Called by subclasses after the damage level changes.
+        """
+        if self.state_counter is not None:
+            self.state_counter.set_damage_level(self.state_counter_id, self.get_damage_level())
+
     def set_damage_functionality(self, damage_functionality_relation: dict) -> None:
         """
         | Set damage functionality relation. This relation is used to get the component's functionality level based on its current damage level.
@@ -42,8 +52,7 @@ class AbstractRecoveryModel(RecoveryModel):
         """
         damage_functionality_relation_type = damage_functionality_relation.get('Type', 'Constant')
         damage_functionality_relation_parameters = damage_functionality_relation.get('Parameters', {})
-        target_damage_functionality = getattr(relation, damage_functionality_relation_type)
-        self.damage_to_functionality_relation = target_damage_functionality(damage_functionality_relation_parameters)
+        self.damage_to_functionality_relation = relation.get_relation(damage_functionality_relation_type, damage_functionality_relation_parameters)
 
     def recover(self, time_step: int) -> None:
         """
@@ -51,6 +60,14 @@ class AbstractRecoveryModel(RecoveryModel):
         """
         pass
 
+    def recover_over_skipped_time_steps(self, time_steps: range) -> None:
+        """
+        | Perform recovery at time_steps skipped by the event-driven time advancement of the BuiltEnvironment.
+        | By default, the component is recovered at each time step. Models that can recover over an interval of time steps at once override this method.
+        """
+        for time_step in time_steps:
+            self.recover(time_step)
+
     def get_functionality_level(self) -> float:
         """
         Get the functionality level of the component based on current damage level.
@@ -67,7 +84,18 @@ class AbstractRecoveryModel(RecoveryModel):
         pass
 
     def set_recovery_time_steps(self, time_steps: list) -> None:
-        self.recovery_time_steps = time_steps
+        """
+        Set the time steps at which the component's recovery is simulated. Time steps are stored as a RecoveryTimeSchedule shared by all components with the same time steps.
+        """
+        self.recovery_time_steps = get_recovery_time_schedule(time_steps)
+
+    def get_next_event_time_step(self, time_step: int) -> float:
+        """
+        | Get the next time step at which the component's functionality level or recovery demand can change, if the component is recovered at time_step and later
+        | with the current percent of met demand. Used by the event-driven time advancement of the BuiltEnvironment.
+        | The returned time step can be earlier than the actual change, but never later. By default, the state can change at each time step.
+        """
+        return time_step + 1
     
     def get_time_step_length(self, time_step: int, option_to_use=3) -> int:
         """
@@ -85,12 +113,8 @@ class AbstractRecoveryModel(RecoveryModel):
                 end_time_step = time_step + 1
             return start_time_step, end_time_step
         elif option_to_use == 3:
-            if self.recovery_time_steps.index(time_step) == 0:
-                return time_step, time_step+1
-            else:
-                start_time_step = self.recovery_time_steps[self.recovery_time_steps.index(time_step)-1] + 1
-                end_time_step = time_step + 1
-            return start_time_step, end_time_step
+            # intervals are precomputed in the RecoveryTimeSchedule
+            return self.recovery_time_steps.get_interval(time_step)
     
     def set_met_demand_for_recovery_activities(self, resource_name: str, percent_of_met_demand: float) -> None:
         """
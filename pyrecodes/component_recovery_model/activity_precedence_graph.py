@@ -0,0 +1,105 @@
+"""
+Module used to compile the precedence of recovery activities defined in a component library entry.
+"""
+
+from pyrecodes.utilities import get_shared_object
+
+# Precedence graphs shared between recovery models, with activity names and their preceding activities as keys.
+# The oldest precedence graph is removed once MAX_SHARED_PRECEDENCE_GRAPHS graphs are stored, so the dict does not grow with the number of component library entries.
+shared_precedence_graphs = {}
+MAX_SHARED_PRECEDENCE_GRAPHS = 1024
+
+def get_precedence_graph(recovery_activities_parameters: dict) -> 'ActivityPrecedenceGraph':
+    """
+    Get the precedence graph of recovery activities described by the Parameters of a recovery model, e.g., {'Repair': {'PrecedingActivities': ['Inspection'], ...}, ...}.
+    Precedence graphs do not change during the resilience assessment, so they are shared between all recovery models created from the same component library entry.
+    """
+    key = tuple((activity_name, tuple(activity_parameters.get('PrecedingActivities', [])))
+                for activity_name, activity_parameters in recovery_activities_parameters.items())
+    return get_shared_object(shared_precedence_graphs, key, lambda: ActivityPrecedenceGraph(dict(key)), MAX_SHARED_PRECEDENCE_GRAPHS)
+
+class ActivityPrecedenceGraph:
+    """
+    | Precedence of recovery activities compiled into bitmasks.
+
+    | Activity i is represented by bit i (1 << i), in the order in which activities are defined.
+    | The state of a component's activities is a finished mask, with bits of finished activities set.
+    | An activity is ready if all its preceding activities are finished, i.e., if its predecessor mask has no bits outside the finished mask.
+    | Ready masks are cached for each finished mask, so they are computed only once per combination of finished activities.
+
+    Attributes:
+        | activity_names (list[str]): Names of activities, in the order in which they are defined.
+        | activity_ids (dict): Maps activity names to their bits.
+        | predecessor_masks (list[int]): Bitmasks of preceding activities of each activity.
+        | ready_masks (dict): Cached ready masks, with finished masks as keys.
+
+    """
+
+    activity_names: list[str]
+    activity_ids: dict
+    predecessor_masks: list[int]
+    ready_masks: dict
+
+    def __init__(self, preceding_activities: dict) -> None:
+        """
+        Compile the precedence graph.
+
+        Args:
+            preceding_activities (dict): Activity names as keys and lists of names of their preceding activities as values.
+
+        Raises:
+            ValueError: If a preceding activity is not defined or if preceding activities form a cycle.
+        """
+        self.activity_names = list(preceding_activities.keys())
+        self.activity_ids = {activity_name: activity_id for activity_id, activity_name in enumerate(self.activity_names)}
+        self.predecessor_masks = [self.get_predecessor_mask(activity_name, activity_preceding_activities)
+                                  for activity_name, activity_preceding_activities in preceding_activities.items()]
+        self.ready_masks = {}
+        self.check_cycles()
+
+    def get_predecessor_mask(self, activity_name: str, preceding_activities: list) -> int:
+        predecessor_mask = 0
+        for preceding_activity in preceding_activities:
+            if preceding_activity not in self.activity_ids:
+                raise ValueError(f'Preceding activity {preceding_activity} of recovery activity {activity_name} is not defined.')
+            predecessor_mask |= 1 << self.activity_ids[preceding_activity]
+        return predecessor_mask
+
+    def check_cycles(self) -> None:
+        """
+        Check that all activities can start, by repeatedly marking activities whose preceding activities are all marked.
+
+        Raises:
+            ValueError: If preceding activities form a cycle, as activities in the cycle could never start.
+        """
+        ordered_mask, all_activities_mask = 0, (1 << len(self.activity_names)) - 1
+        while ordered_mask != all_activities_mask:
+            ready_mask = self.get_ready_mask(ordered_mask) & ~ordered_mask
+            if ready_mask == 0:
+                raise ValueError(f'Preceding activities of recovery activities {self.activity_names} form a cycle.')
+            ordered_mask |= ready_mask
+
+    def get_ready_mask(self, finished_mask: int) -> int:
+        """
+        Get the bitmask of activities whose preceding activities are all finished.
+
+        Args:
+            finished_mask (int): Bitmask of finished activities.
+
+        Returns:
+            int: Bitmask of ready activities. Finished activities can be ready as well.
+        """
+        ready_mask = self.ready_masks.get(finished_mask)
+        if ready_mask is None:
+            ready_mask = 0
+            for activity_id, predecessor_mask in enumerate(self.predecessor_masks):
+                if predecessor_mask & ~finished_mask == 0:
+                    ready_mask |= 1 << activity_id
+            self.ready_masks[finished_mask] = ready_mask
+        return ready_mask
+
+    def is_ready(self, activity_name: str, finished_mask: int) -> bool:
+        """
+        Check whether all preceding activities of the activity activity_name are finished.
+        """
+        return self.predecessor_masks[self.activity_ids[activity_name]] & ~finished_mask == 0
@@ -1,7 +1,10 @@
 from pyrecodes.component_recovery_model.abstract_recovery_model import AbstractRecoveryModel
 from pyrecodes.component_recovery_model.concrete_recovery_activity import ConcreteRecoveryActivity
 from pyrecodes.component_recovery_model.recovery_activity import RecoveryActivity
+from pyrecodes.component_recovery_model.activity_precedence_graph import ActivityPrecedenceGraph, get_precedence_graph
 from pyrecodes.relation import relation
+import bisect
+import math
 
 class ComponentLevelRecoveryActivitiesModel(AbstractRecoveryModel):
     """
@@ -13,12 +16,18 @@ class ComponentLevelRecoveryActivitiesModel(AbstractRecoveryModel):
         damage_level (float): The damage level of the component (between 0 and 1).
         damage_to_functionality_relation (relation.Relation): The relation to get the functionality level based on the current damage level.
         recovery_activities (dict): A dictionary of recovery activities parameters.
+        precedence_graph (ActivityPrecedenceGraph): The compiled precedence of recovery activities, shared by all components created from the same component library entry.
+        finished_mask (int): Bitmask of finished recovery activities, in the order of activities in the precedence graph. Updated by the activities whenever their levels are set.
         REPAIR_ACTIVITY_NAME (str): The name of the repair activity - one that actually reduces the damage level.
+        recovery_activities_engine (RecoveryActivitiesEngine): The system-level engine that recovers the component, if the component is bound to one. None otherwise.
     """
 
     damage_level: float
     damage_to_functionality_relation: relation.Relation
     recovery_activities: dict
+    precedence_graph: ActivityPrecedenceGraph
+    finished_mask: int
+    recovery_activities_engine = None
 
     def __init__(self, recovery_model_parameters: dict, REPAIR_ACTIVITY_NAME = 'Repair') -> None:
         """
@@ -41,18 +50,23 @@ class ComponentLevelRecoveryActivitiesModel(AbstractRecoveryModel):
             parameters (dict): Parameters for the recovery model.
         """
         self.parameters = parameters # store the parameters to resample the duration between components in the SubsystemCreator class
+        self.precedence_graph = get_precedence_graph(parameters)
+        self.recovery_activities = {}
         for recovery_activity, recovery_activity_parameters in parameters.items():
             self.recovery_activities[recovery_activity] = ConcreteRecoveryActivity(recovery_activity, initial_level=1.0)
+            self.recovery_activities[recovery_activity].recovery_model = self
             self.recovery_activities[recovery_activity].set_preceding_activities(
                 recovery_activity_parameters.get('PrecedingActivities', []))
             self.recovery_activities[recovery_activity].set_duration(recovery_activity_parameters.get('Duration', ''))
             self.recovery_activities[recovery_activity].set_demand(recovery_activity_parameters.get('Demand', ''))
+        self.finished_mask = (1 << len(self.recovery_activities)) - 1
 
     def set_initial_damage_level(self, damage_level: float) -> None:
         """
         Set the initial damage level. The damage level must be between 0 and 1.
 
         Sets the progress level of all activities to 0 and the progress level of the repair activity to 1 - damage_level.
+        The activities update the finished mask accordingly: only the repair activity can be finished, if the component is not damaged.
 
         Args:
             damage_level (float): The initial damage level (between 0 and 1).
@@ -61,6 +75,7 @@ class ComponentLevelRecoveryActivitiesModel(AbstractRecoveryModel):
             for recovery_activity_object in self.recovery_activities.values():
                 recovery_activity_object.set_level(0.0)
             self.set_initial_repair_activity_state(damage_level)
+            self.notify_state_counter()
         else:
             raise ValueError('Damage level must be between 0 and 1.')
 
@@ -78,29 +93,164 @@ class ComponentLevelRecoveryActivitiesModel(AbstractRecoveryModel):
     def recover(self, time_step: int) -> None:
         """
         Perform recovery for a time step. Increase the level of all activities that are not finished, for which all preceding activities are finished and the resource demand is met.
+        If the time step is a recovery time step, the component recovers over all time steps covered by it, see the recover_over_time_steps method.
 
         Args:
             time_step (int): The time step for which recovery is performed.
-        
-        TODO: Not sure if there should be a for loop with start and end time steps or just get the length and multiply by the rate. Compare computational time.
+
+        If the component is bound to a RecoveryActivitiesEngine, the engine recovers all bound components at once and this method does nothing.
         """
+        if self.recovery_activities_engine is not None:
+            return
         if time_step in self.recovery_time_steps:
             start_time_step, end_time_step = self.get_time_step_length(time_step)
-            for time_step in range(start_time_step, end_time_step):
-                self.check_preceding_activities()
-                for recovery_activity_object in self.recovery_activities.values():
-                    if recovery_activity_object.preceding_activities_finished and self.get_damage_level() > 0:
-                        recovery_activity_object.recover(time_step)
+            self.recover_over_time_steps(start_time_step, end_time_step)
+
+    def recover_over_skipped_time_steps(self, time_steps: range) -> None:
+        """
+        | Perform recovery at time_steps skipped by the event-driven time advancement, with one call of the recover_over_time_steps method
+        | over the interval of time steps covered by the recovery time steps in time_steps.
 
-    def check_preceding_activities(self) -> None:
+        Args:
+            time_steps (range): Consecutive time steps at which recovery is performed.
+        """
+        if self.recovery_activities_engine is not None:
+            return
+        covered_interval = self.recovery_time_steps.get_covered_interval(time_steps.start, time_steps.stop)
+        if covered_interval is not None:
+            self.recover_over_time_steps(*covered_interval)
+
+    def recover_over_time_steps(self, start_time_step: int, end_time_step: int) -> None:
+        """
+        | Recover the component from start_time_step up to end_time_step (not included) with the current percent of met demand.
+        | Levels of activities increase linearly, with kinks only when an activity is finished, as that can change which activities are ready or stop recovery if the component is repaired.
+        | The interval is advanced in phases between activity completions. In each phase, the number of time steps until the first activity in progress is finished is computed directly
+        | and all activities in progress advance by that many time steps. As when recovering one time step at a time,
+        | activities after the repair activity in the recovery activities dict do not progress in the time step in which the component is repaired.
+        | Results are the same as when recovering one time step at a time, up to floating point rounding of the levels.
+        | Activities set their bits in the finished mask when they are finished, so levels of activities are not checked again in the next phase.
+
+        Args:
+            start_time_step (int): The first time step of the interval.
+            end_time_step (int): The time step after the last time step of the interval.
+        """
+        recovery_activities = list(self.recovery_activities.values())
+        repair_activity = self.recovery_activities[self.REPAIR_ACTIVITY_NAME]
+        repair_activity_id = recovery_activities.index(repair_activity)
+        time_step = start_time_step
+        while time_step < end_time_step:
+            finished_mask = self.finished_mask
+            ready_mask = self.precedence_graph.get_ready_mask(finished_mask)
+            self.check_preceding_activities(ready_mask)
+            if not (self.get_damage_level() > 0):
+                break
+            activities_in_progress = {activity_id: recovery_activity for activity_id, recovery_activity in enumerate(recovery_activities)
+                                      if (ready_mask >> activity_id) & 1 and not (finished_mask >> activity_id) & 1 and recovery_activity.get_level_increase() > 0}
+            if len(activities_in_progress) == 0:
+                break
+            num_steps = min(min(recovery_activity.get_exact_num_steps_to_finish() for recovery_activity in activities_in_progress.values()),
+                            end_time_step - time_step)
+            component_repaired = (repair_activity_id in activities_in_progress and
+                                  min(repair_activity.level + num_steps * repair_activity.get_level_increase(), 1.0) >= 1.0)
+            for activity_id, recovery_activity in activities_in_progress.items():
+                if component_repaired and activity_id > repair_activity_id:
+                    recovery_activity.advance(time_step, num_steps - 1)
+                else:
+                    recovery_activity.advance(time_step, num_steps)
+            time_step += num_steps
+        self.notify_state_counter()
+
+    def get_next_event_time_step(self, time_step: int) -> float:
+        """
+        | Get the next time step at which the component's functionality level or recovery demand can change, if the component is recovered at time_step and later
+        | with the current percent of met demand. That is when an activity in progress is finished or when the progress of the repair activity changes the functionality level.
+        | The returned time step can be earlier than the actual change, but never later.
+
+        Args:
+            time_step (int): The current time step.
+
+        Returns:
+            float: The next time step, or math.inf if the component's state does not change.
+        """
+        if not (self.get_damage_level() > 0):
+            return math.inf
+        finished_mask = self.get_finished_mask()
+        ready_mask = self.precedence_graph.get_ready_mask(finished_mask)
+        activities_in_progress = [recovery_activity for activity_id, recovery_activity in enumerate(self.recovery_activities.values())
+                                  if (ready_mask >> activity_id) & 1 and not (finished_mask >> activity_id) & 1]
+        num_steps = min([recovery_activity.get_num_steps_to_finish() for recovery_activity in activities_in_progress], default=math.inf)
+        if self.recovery_activities[self.REPAIR_ACTIVITY_NAME] in activities_in_progress:
+            num_steps = min(num_steps, self.get_num_steps_to_functionality_change(num_steps))
+        if math.isinf(num_steps):
+            return math.inf
+        return self.get_time_step_after_recovery_steps(time_step, num_steps)
+
+    def get_num_steps_to_functionality_change(self, max_num_steps: float) -> float:
+        """
+        Get the number of time steps until the progress of the repair activity changes the functionality level, checking at most max_num_steps time steps.
+        Constant and ReverseBinary relations only change the functionality level once the repair activity is finished, so they are not checked.
+        """
+        if math.isinf(max_num_steps) or isinstance(self.damage_to_functionality_relation, (relation.Constant, relation.ReverseBinary)):
+            return math.inf
+        functionality_level = self.get_functionality_level()
+        for num_steps, level in enumerate(self.recovery_activities[self.REPAIR_ACTIVITY_NAME].get_future_levels(max_num_steps), start=1):
+            if self.damage_to_functionality_relation.get_output(1 - level) != functionality_level:
+                return num_steps
+        return math.inf
+
+    def get_time_step_after_recovery_steps(self, time_step: int, num_steps: int) -> float:
+        """
+        | Get the time step at which the component's state reflects num_steps recovery steps starting at time_step.
+        | If recovery is simulated at each time step, that is time_step + num_steps. Otherwise, a recovery time step covers several time steps,
+        | so the state can change right after the next recovery time step. Recovery time steps are sorted.
+        """
+        index = bisect.bisect_left(self.recovery_time_steps, time_step)
+        if index == len(self.recovery_time_steps):
+            return math.inf
+        next_recovery_time_step = self.recovery_time_steps[index]
+        last_index = index + num_steps - 1
+        if (next_recovery_time_step == time_step and (index == 0 or self.recovery_time_steps[index - 1] == time_step - 1) and
+                last_index < len(self.recovery_time_steps) and self.recovery_time_steps[last_index] == time_step + num_steps - 1):
+            return time_step + num_steps
+        return next_recovery_time_step + 1
+
+    def get_finished_mask(self) -> int:
+        """
+        Get the bitmask of finished recovery activities. Bits follow the order of activities in the precedence graph.
+        If the component is bound to a RecoveryActivitiesEngine, the engine updates the levels of activities, so the mask is found from the current progress levels.
+        """
+        if self.recovery_activities_engine is not None:
+            return self.get_finished_mask_from_levels()
+        return self.finished_mask
+
+    def update_activity_finished(self, recovery_activity_object: RecoveryActivity) -> None:
+        """
+        Set or clear the bit of the recovery activity in the finished mask. Called by the activity whenever its level is set.
+        """
+        activity_bit = 1 << self.precedence_graph.activity_ids[recovery_activity_object.name]
+        if recovery_activity_object.activity_finished():
+            self.finished_mask |= activity_bit
+        else:
+            self.finished_mask &= ~activity_bit
+
+    def get_finished_mask_from_levels(self) -> int:
+        finished_mask = 0
+        for activity_id, recovery_activity_object in enumerate(self.recovery_activities.values()):
+            if recovery_activity_object.activity_finished():
+                finished_mask |= 1 << activity_id
+        return finished_mask
+
+    def check_preceding_activities(self, ready_mask: int = None) -> None:
         """
         Check if preceding activities are finished for all recovery activities and set the preceding_activities_finished attribute accordingly.
+
+        Args:
+            ready_mask (int, optional): Bitmask of activities whose preceding activities are finished. If None, it is found from the finished mask.
         """
-        for recovery_activity_object in self.recovery_activities.values():
-            if self.preceding_activities_finished(recovery_activity_object):
-                recovery_activity_object.set_preceding_activities_finished(True)
-            else:
-                recovery_activity_object.set_preceding_activities_finished(False)
+        if ready_mask is None:
+            ready_mask = self.precedence_graph.get_ready_mask(self.get_finished_mask())
+        for activity_id, recovery_activity_object in enumerate(self.recovery_activities.values()):
+            recovery_activity_object.set_preceding_activities_finished(bool((ready_mask >> activity_id) & 1))
 
     def preceding_activities_finished(self, recovery_activity_object: RecoveryActivity) -> bool:
         """
@@ -112,10 +262,7 @@ class ComponentLevelRecoveryActivitiesModel(AbstractRecoveryModel):
         Returns:
             bool: True if all preceding activities are finished, False otherwise.
         """
-        for preceding_activity in recovery_activity_object.preceding_activities:
-            if not (self.recovery_activities[preceding_activity].activity_finished()):
-                return False
-        return True
+        return self.precedence_graph.is_ready(recovery_activity_object.name, self.get_finished_mask())
 
     def get_damage_level(self) -> float:
         """
@@ -134,9 +281,12 @@ class ComponentLevelRecoveryActivitiesModel(AbstractRecoveryModel):
             dict: A dictionary of resource demands for active recovery activities.
         """
         resource_dict = {}
-        for recovery_activity in self.recovery_activities.values():
-            if self.preceding_activities_finished(recovery_activity) and self.get_damage_level() > 0 and not (
-                    recovery_activity.activity_finished()):
+        if not (self.get_damage_level() > 0):
+            return resource_dict
+        finished_mask = self.get_finished_mask()
+        ready_mask = self.precedence_graph.get_ready_mask(finished_mask)
+        for activity_id, recovery_activity in enumerate(self.recovery_activities.values()):
+            if (ready_mask >> activity_id) & 1 and not (finished_mask >> activity_id) & 1:
                 recovery_activity_demand = recovery_activity.get_demand()
                 if len(recovery_activity_demand) > 0:
                     resource_dict = {**resource_dict, **recovery_activity_demand}
@@ -1,13 +1,21 @@
 from pyrecodes.component_recovery_model.recovery_activity import RecoveryActivity
+import bisect
 import math
+import sys
 from pyrecodes.resource.concrete_resource import ConcreteResource
 from pyrecodes.probability_distribution import probability_distribution
+from pyrecodes.utilities import set_attributes
 
 class ConcreteRecoveryActivity(RecoveryActivity):
     """
     Concrete implementation of a recovery activity.
+    Attributes are stored in __slots__, as systems have a recovery activity object per component and activity.
+    The progress level is stored in progress_level. Setting the level notifies the recovery model that owns the activity, if any, so it can track which activities are finished.
     """
 
+    __slots__ = ('name', 'progress_level', 'recovery_model', 'progress_intervals', 'progress_interval_starts', 'demand_met', 'demand', 'preceding_activities_finished',
+                 'preceding_activities', 'duration_distribution', 'duration', 'rate')
+
     def __init__(self, name: str, initial_level=0.0) -> None:
         """
         Constructor for ConcreteRecoveryActivity.
@@ -17,12 +25,29 @@ class ConcreteRecoveryActivity(RecoveryActivity):
             initial_level (float, optional): The initial progress level (default is 0.0).
         """
         self.set_name(name)
+        self.recovery_model = None
         self.set_level(initial_level)
-        self.time_steps = []
+        self.progress_intervals = []
+        self.progress_interval_starts = []
         self.demand_met = {}
         self.demand = {}
         self.preceding_activities_finished = False
 
+    def __setstate__(self, state) -> None:
+        set_attributes(self, state)
+
+    @property
+    def level(self) -> float:
+        return self.progress_level
+
+    @level.setter
+    def level(self, level: float) -> None:
+        self.progress_level = level
+        # activities restored from pickles made before recovery_model was added have no recovery model
+        recovery_model = getattr(self, 'recovery_model', None)
+        if recovery_model is not None:
+            recovery_model.update_activity_finished(self)
+
     def set_name(self, name: str) -> None:
         """
         Set the name of the activity.
@@ -30,7 +55,7 @@ class ConcreteRecoveryActivity(RecoveryActivity):
         Args:
             name (str): The name of the activity.
         """
-        self.name = name
+        self.name = sys.intern(name)
 
     def set_level(self, level: float) -> None:
         """
@@ -51,6 +76,7 @@ class ConcreteRecoveryActivity(RecoveryActivity):
         Args:
             distribution (dict): A dictionary describing the duration distribution.
         """
+        self.duration_distribution = distribution
         duration = self.sample_duration(distribution)
         self.duration = duration
         if duration > 0:            
@@ -60,6 +86,13 @@ class ConcreteRecoveryActivity(RecoveryActivity):
         else:
             raise ValueError(f'Duration must be a positive number. Recovery activity: {self.name}.')
 
+    def resample_duration(self) -> None:
+        """
+        Sample a new duration of the activity from the distribution used to set its duration.
+        """
+        if hasattr(self, 'duration_distribution'):
+            self.set_duration(self.duration_distribution)
+
     def sample_duration(self, distribution: dict) -> float:
         """
         Sample the duration from a distribution.
@@ -70,10 +103,7 @@ class ConcreteRecoveryActivity(RecoveryActivity):
         Returns:
             float: The sampled duration.
         """
-        distribution_name, distribution_parameters = list(distribution.items())[0]
-        target_distribution = getattr(probability_distribution, distribution_name)
-        distribution = target_distribution(distribution_parameters)
-        return distribution.sample()
+        return probability_distribution.get_distribution(distribution).sample()
 
     def set_preceding_activities(self, preceding_activities: list([str])) -> None:
         """
@@ -136,11 +166,80 @@ class ConcreteRecoveryActivity(RecoveryActivity):
             time_step (int): The time step for which recovery is performed.
         """
         if not self.activity_finished():
-            current_level_increase = self.rate * self.effect_of_unmet_demand_on_activity()
+            current_level_increase = self.get_level_increase()
             self.level = min(self.level + current_level_increase, 1.0)
             if current_level_increase > 0:
                 self.record_progress(time_step)
 
+    def get_level_increase(self) -> float:
+        """
+        Get the increase of the activity's progress level in a time step, based on its rate and the percent of met resource demand.
+        """
+        return self.rate * self.effect_of_unmet_demand_on_activity()
+
+    def get_num_steps_to_finish(self) -> float:
+        """
+        Get the number of time steps until the activity is finished, assuming that the percent of met demand does not change.
+        The level is increased by repeated addition, so the number is reduced by one to account for rounding errors: the activity is never finished earlier.
+
+        Returns:
+            float: The number of time steps, at least 1. math.inf if the activity is finished or does not progress.
+        """
+        level_increase = self.get_level_increase()
+        if self.activity_finished() or not (level_increase > 0):
+            return math.inf
+        return max(1, math.ceil((1.0 - self.level) / level_increase) - 1)
+
+    def get_future_levels(self, num_steps: int):
+        """
+        Get the progress levels of the activity after each of the next num_steps time steps, assuming that the percent of met demand does not change.
+
+        Args:
+            num_steps (int): The number of time steps.
+
+        Yields:
+            float: The progress level after a time step.
+        """
+        level, level_increase = self.level, self.get_level_increase()
+        for _ in range(num_steps):
+            level = min(level + level_increase, 1.0)
+            yield level
+
+    def get_exact_num_steps_to_finish(self) -> float:
+        """
+        Get the number of time steps after which the activity is finished if its level increases linearly, assuming that the percent of met demand does not change.
+
+        Returns:
+            float: The number of time steps, at least 1. math.inf if the activity is finished or does not progress.
+        """
+        level_increase = self.get_level_increase()
+        if self.activity_finished() or not (level_increase > 0):
+            return math.inf
+        if math.isinf(level_increase):
+            return 1
+        # the activity is finished once its level is close to 1, see activity_finished
+        num_steps = max(1, math.ceil((1.0 - 1e-09 - self.level) / level_increase))
+        while num_steps > 1 and math.isclose(min(self.level + (num_steps - 1) * level_increase, 1.0), 1.0):
+            num_steps -= 1
+        while not math.isclose(min(self.level + num_steps * level_increase, 1.0), 1.0):
+            num_steps += 1
+        return num_steps
+
+    def advance(self, time_step: int, num_steps: int) -> None:
+        """
+        Increase the level of the activity linearly over num_steps time steps starting at time_step, assuming that the percent of met demand does not change.
+        num_steps is capped at the number of time steps needed to finish the activity, so progress is recorded as a single interval of the time steps in which the activity progressed.
+
+        Args:
+            time_step (int): The first time step of the advancement.
+            num_steps (int): The number of time steps.
+        """
+        level_increase = self.get_level_increase()
+        if num_steps > 0 and not self.activity_finished() and level_increase > 0:
+            num_steps = min(num_steps, self.get_exact_num_steps_to_finish())
+            self.level = min(self.level + num_steps * level_increase, 1.0)
+            self.record_progress_interval(time_step, time_step + num_steps)
+
     def record_progress(self, time_step: int) -> None:
         """
         Record progress at a specific time step. If the rate at a time step was higher than zero, than the time step is recorded.
@@ -148,7 +247,45 @@ class ConcreteRecoveryActivity(RecoveryActivity):
         Args:
             time_step (int): The time step when progress is recorded.
         """
-        self.time_steps.append(time_step)
+        self.record_progress_interval(time_step, time_step + 1)
+
+    def record_progress_interval(self, start_time_step: int, end_time_step: int) -> None:
+        """
+        Record progress from start_time_step up to end_time_step (not included). Progress intervals are kept as (start, end) ranges; consecutive ranges are merged.
+        Starts of the intervals are also kept in a separate list, which is searched in progressed_at.
+        """
+        if len(self.progress_intervals) > 0 and self.progress_intervals[-1][1] == start_time_step:
+            self.progress_intervals[-1][1] = end_time_step
+        else:
+            self.progress_intervals.append([start_time_step, end_time_step])
+            self.progress_interval_starts.append(start_time_step)
+
+    def get_progress_intervals(self) -> list[list[int]]:
+        """
+        Get the (start, end) intervals of time steps at which the activity progressed, with end not included.
+        """
+        return self.progress_intervals
+
+    @property
+    def time_steps(self) -> list[int]:
+        """
+        Time steps at which the activity progressed, expanded from the progress intervals.
+        """
+        return [time_step for start_time_step, end_time_step in self.progress_intervals for time_step in range(start_time_step, end_time_step)]
+
+    def progressed_at(self, time_step: int) -> bool:
+        """
+        Check if the activity progressed at time_step, with a binary search over the starts of the progress intervals.
+        """
+        interval_id = bisect.bisect_right(self.progress_interval_starts, time_step) - 1
+        return interval_id >= 0 and time_step < self.progress_intervals[interval_id][1]
+
+    @time_steps.setter
+    def time_steps(self, time_steps: list[int]) -> None:
+        self.progress_intervals = []
+        self.progress_interval_starts = []
+        for time_step in time_steps:
+            self.record_progress(time_step)
     
     def effect_of_unmet_demand_on_activity(self) -> float:
         """
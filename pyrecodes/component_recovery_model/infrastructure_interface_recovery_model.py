@@ -1,6 +1,7 @@
 from pyrecodes.component_recovery_model.abstract_recovery_model import AbstractRecoveryModel
 from pyrecodes.component_recovery_model.concrete_recovery_activity import ConcreteRecoveryActivity
 from pyrecodes.relation import relation
+import math
 
 class InfrastructureInterfaceRecoveryModel(AbstractRecoveryModel):
     """
@@ -52,10 +53,12 @@ class InfrastructureInterfaceRecoveryModel(AbstractRecoveryModel):
         """
         self.damage_level = 1.0
         self.recovery_activities[self.RECOVERY_ACTIVITY_NAME].level = 0.0
+        self.notify_state_counter()
 
     def set_damage_functionality(self) -> None:
         """
         Set damage functionality relation. For this model it's always a multiple step relation.
+        The relation is not shared with other components, as its steps are set based on the component's supply dynamics.
         """
         target_damage_functionality = getattr(relation, 'MultipleStep')
         self.damage_to_functionality_relation = target_damage_functionality()
@@ -72,6 +75,7 @@ class InfrastructureInterfaceRecoveryModel(AbstractRecoveryModel):
         """
         
         self.recovery_activities[self.RECOVERY_ACTIVITY_NAME].recover(time_step)
+        self.notify_state_counter()
     
     def get_damage_level(self) -> float:
         """
@@ -100,4 +104,24 @@ class InfrastructureInterfaceRecoveryModel(AbstractRecoveryModel):
         Returns:
             dict: An empty dictionary, as it assumed that there is no recovery demand for infrastructure interfaces.
         """
-        return {}
\ No newline at end of file
+        return {}
+
+    def get_next_event_time_step(self, time_step: int) -> float:
+        """
+        Get the next time step at which the functionality level of the infrastructure interface can change. That is when the supply/demand dynamics reach the next step or when the recovery activity is finished.
+
+        Args:
+            time_step (int): The current time step.
+
+        Returns:
+            float: The next time step, or math.inf if the infrastructure interface is restored.
+        """
+        recovery_activity = self.recovery_activities[self.RECOVERY_ACTIVITY_NAME]
+        num_steps = recovery_activity.get_num_steps_to_finish()
+        if math.isinf(num_steps):
+            return math.inf
+        functionality_level = self.get_functionality_level()
+        for num_steps_to_change, level in enumerate(recovery_activity.get_future_levels(num_steps), start=1):
+            if self.damage_to_functionality_relation.get_output(level) != functionality_level:
+                return time_step + num_steps_to_change
+        return time_step + num_steps
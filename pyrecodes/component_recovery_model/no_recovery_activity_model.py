@@ -1,4 +1,5 @@
 from pyrecodes.component_recovery_model.component_level_recovery_activities_model import AbstractRecoveryModel
+import math
 
 class NoRecoveryActivityModel(AbstractRecoveryModel):
     """
@@ -52,4 +53,19 @@ class NoRecoveryActivityModel(AbstractRecoveryModel):
         Returns:
             dict: An empty dictionary, as there is no demand for undamaged components.
         """
-        return {}    
\ No newline at end of file
+        return {}
+
+    def recover_over_skipped_time_steps(self, time_steps: range) -> None:
+        """
+        Undamaged components do not recover.
+        """
+        pass
+
+    def get_next_event_time_step(self, time_step: int) -> float:
+        """
+        Get the next time step at which the state of the undamaged component can change.
+
+        Returns:
+            float: math.inf, as the state of undamaged components does not change.
+        """
+        return math.inf
@@ -0,0 +1,350 @@
+from pyrecodes.component.component import Component
+from pyrecodes.component_recovery_model.component_level_recovery_activities_model import ComponentLevelRecoveryActivitiesModel
+from pyrecodes.component_recovery_model.concrete_recovery_activity import ConcreteRecoveryActivity
+from pyrecodes.component_recovery_model.recovery_time_schedule import get_recovery_time_schedule
+from pyrecodes.time_step_history import TimeStepIntervals
+from pyrecodes.utilities import get_attributes
+import numpy as np
+
+class RecoveryActivitiesEngine:
+    """
+    | System-level recovery engine that recovers all components with a ComponentLevelRecoveryActivitiesModel in one vectorized step.
+
+    | The state of recovery activities is stored in 2-D NumPy arrays (components x activities) instead of ConcreteRecoveryActivity objects.
+    | Columns are the union of recovery activity names of all components. Activities that a component does not have are marked as not present.
+    | Recovery activities of bound components are replaced by RecoveryActivityView objects, which read and write the engine's arrays,
+    | so the per-component accessors (e.g., recovery_activities['Repair'].level, get_damage_level, get_demand) work as before.
+    | Recovery results are the same as when each component is recovered by its ComponentLevelRecoveryActivitiesModel.
+
+    | Components are grouped by their recovery time steps. A group is recovered only at its recovery time steps, over the same time step length as in the recovery model.
+    | Recovery time steps and precedence of activities are read when components are bound to the engine.
+
+    Attributes:
+        | recovery_models (list[ComponentLevelRecoveryActivitiesModel]): Recovery models of the bound components. Row i of the arrays belongs to recovery_models[i].
+        | activity_names (list[str]): Names of recovery activities. Column j of the arrays belongs to activity_names[j].
+        | column_ids (dict): Maps activity names to columns of the arrays.
+        | levels (np.ndarray): Progress levels of activities. Levels of activities that are not present are 1.
+        | rates (np.ndarray): Rates of progress of activities.
+        | demand_met (np.ndarray): Effect of unmet demand on activities, i.e., the lowest percent of met demand among the activity's resources.
+        | present (np.ndarray): True if the component has the activity.
+        | preceding (np.ndarray): Precedence masks (components x activities x activities). preceding[i, j, k] is True if activity k precedes activity j in component i.
+        | preceding_finished (np.ndarray): True if all preceding activities were finished when the activity was last checked.
+        | after_repair (np.ndarray): True if the activity comes after the repair activity in the component's recovery activities dict.
+        | repair_columns (np.ndarray): Column of the repair activity of each component.
+        | recovery_groups (list[tuple]): Pairs of recovery time schedules and rows of components that use them.
+        | progress_intervals (dict): Maps (row, column) pairs of activities that progressed to the TimeStepIntervals of time steps at which they progressed.
+
+    """
+
+    recovery_models: list[ComponentLevelRecoveryActivitiesModel]
+    activity_names: list[str]
+    levels: np.ndarray
+    rates: np.ndarray
+    demand_met: np.ndarray
+    present: np.ndarray
+    preceding: np.ndarray
+    preceding_finished: np.ndarray
+    after_repair: np.ndarray
+    repair_columns: np.ndarray
+    recovery_groups: list[tuple]
+    progress_intervals: dict
+
+    def __init__(self, components: list[Component]):
+        """
+        Create the arrays and bind the recovery models of components to the engine.
+
+        Args:
+            components (list[Component]): A list of components in the system. Only components with a ComponentLevelRecoveryActivitiesModel are bound.
+        """
+        self.recovery_models = [component.recovery_model for component in components
+                                if isinstance(getattr(component, 'recovery_model', None), ComponentLevelRecoveryActivitiesModel)]
+        self.activity_names = list(dict.fromkeys(activity_name for recovery_model in self.recovery_models
+                                                 for activity_name in recovery_model.recovery_activities.keys()))
+        self.column_ids = {activity_name: column_id for column_id, activity_name in enumerate(self.activity_names)}
+        self.initialize_arrays()
+        self.progress_intervals = {}
+        for row_id, recovery_model in enumerate(self.recovery_models):
+            self.bind(row_id, recovery_model)
+        self.recovery_groups = self.get_recovery_groups()
+
+    def initialize_arrays(self) -> None:
+        num_components, num_activities = len(self.recovery_models), len(self.activity_names)
+        self.levels = np.ones((num_components, num_activities))
+        self.rates = np.zeros((num_components, num_activities))
+        self.demand_met = np.ones((num_components, num_activities))
+        self.present = np.zeros((num_components, num_activities), dtype=bool)
+        self.preceding = np.zeros((num_components, num_activities, num_activities), dtype=bool)
+        self.preceding_finished = np.zeros((num_components, num_activities), dtype=bool)
+        self.after_repair = np.zeros((num_components, num_activities), dtype=bool)
+        self.repair_columns = np.zeros(num_components, dtype=int)
+
+    def bind(self, row_id: int, recovery_model: ComponentLevelRecoveryActivitiesModel) -> None:
+        """
+        Copy the state of the recovery model's activities to row row_id and replace the activities with views of the row.
+
+        Raises:
+            ValueError: If the repair activity or a preceding activity is not one of the recovery model's activities.
+        """
+        if recovery_model.REPAIR_ACTIVITY_NAME not in recovery_model.recovery_activities:
+            raise ValueError(f'Repair activity {recovery_model.REPAIR_ACTIVITY_NAME} is not a recovery activity of the component.')
+        self.repair_columns[row_id] = self.column_ids[recovery_model.REPAIR_ACTIVITY_NAME]
+        repair_activity_passed = False
+        for activity_name, recovery_activity in recovery_model.recovery_activities.items():
+            column_id = self.column_ids[activity_name]
+            for preceding_activity in recovery_activity.preceding_activities:
+                if preceding_activity not in recovery_model.recovery_activities:
+                    raise ValueError(f'Preceding activity {preceding_activity} is not a recovery activity of the component.')
+                self.preceding[row_id, column_id, self.column_ids[preceding_activity]] = True
+            self.present[row_id, column_id] = True
+            self.after_repair[row_id, column_id] = repair_activity_passed
+            repair_activity_passed = repair_activity_passed or activity_name == recovery_model.REPAIR_ACTIVITY_NAME
+            recovery_model.recovery_activities[activity_name] = RecoveryActivityView(self, row_id, column_id, recovery_activity)
+        recovery_model.recovery_activities_engine = self
+
+    def get_recovery_groups(self) -> list[tuple]:
+        """
+        Group rows of components by their recovery time steps.
+        """
+        rows_by_recovery_time_schedule = {}
+        for row_id, recovery_model in enumerate(self.recovery_models):
+            recovery_time_schedule = get_recovery_time_schedule(getattr(recovery_model, 'recovery_time_steps', []))
+            rows_by_recovery_time_schedule.setdefault(recovery_time_schedule, []).append(row_id)
+        return [(recovery_time_schedule, np.asarray(row_ids, dtype=int)) for recovery_time_schedule, row_ids in rows_by_recovery_time_schedule.items()]
+
+    def recover(self, time_step: int) -> None:
+        """
+        Perform recovery of all bound components for a time step, same as the recover method of the ComponentLevelRecoveryActivitiesModel.
+
+        Args:
+            time_step (int): The time step for which recovery is performed.
+        """
+        for recovery_time_schedule, row_ids in self.recovery_groups:
+            if time_step in recovery_time_schedule:
+                start_time_step, end_time_step = recovery_time_schedule.get_interval(time_step)
+                self.recover_rows_over_time_steps(row_ids, start_time_step, end_time_step)
+                self.notify_state_counter(row_ids)
+
+    def recover_over_skipped_time_steps(self, time_steps: range) -> None:
+        """
+        Perform recovery of all bound components at time_steps skipped by the event-driven time advancement, same as the recover_over_skipped_time_steps method
+        of the ComponentLevelRecoveryActivitiesModel: each group is recovered once over the interval covered by its recovery time steps in time_steps.
+        """
+        for recovery_time_schedule, row_ids in self.recovery_groups:
+            covered_interval = recovery_time_schedule.get_covered_interval(time_steps.start, time_steps.stop)
+            if covered_interval is not None:
+                self.recover_rows_over_time_steps(row_ids, *covered_interval)
+                self.notify_state_counter(row_ids)
+
+    def notify_state_counter(self, row_ids: np.ndarray) -> None:
+        """
+        Notify the system's ComponentStateCounter, if there is one, of the damage levels of components in rows row_ids, as AbstractRecoveryModel.notify_state_counter does for a component.
+        """
+        state_counter = self.recovery_models[0].state_counter if len(self.recovery_models) > 0 else None
+        if state_counter is None:
+            return
+        component_ids = np.fromiter((self.recovery_models[row_id].state_counter_id for row_id in row_ids.tolist()), dtype=int, count=len(row_ids))
+        state_counter.set_damage_levels(component_ids, 1 - self.levels[row_ids, self.repair_columns[row_ids]])
+
+    def recover_rows_over_time_steps(self, row_ids: np.ndarray, start_time_step: int, end_time_step: int) -> None:
+        """
+        | Recover components in rows row_ids from start_time_step up to end_time_step (not included), same as the recover_over_time_steps method of the ComponentLevelRecoveryActivitiesModel.
+        | Each row advances in phases between activity completions. An activity is in progress if it is not finished, all its preceding activities are finished,
+        | the component is damaged and the activity's level increases. Activities after the repair activity do not progress in the time step in which the component is repaired.
+        | Rows leave the loop when they reach end_time_step or have no activities in progress, so the number of iterations is at most the number of completions in a row plus one.
+        """
+        time_steps = np.full(len(row_ids), start_time_step)
+        while len(row_ids) > 0:
+            levels = self.levels[row_ids]
+            finished = self.activities_finished(levels)
+            preceding_finished = ~np.any(self.preceding[row_ids] & ~finished[:, np.newaxis, :], axis=2)
+            self.preceding_finished[row_ids] = preceding_finished
+
+            row_range = np.arange(len(row_ids))
+            repair_columns = self.repair_columns[row_ids]
+            level_increase = self.rates[row_ids] * self.demand_met[row_ids]
+            damaged = (1 - levels[row_range, repair_columns]) > 0
+            in_progress = self.present[row_ids] & preceding_finished & ~finished & damaged[:, np.newaxis] & (level_increase > 0)
+            rows_in_progress = in_progress.any(axis=1)
+            if not rows_in_progress.all():
+                row_ids, time_steps, levels, level_increase = (row_ids[rows_in_progress], time_steps[rows_in_progress],
+                                                               levels[rows_in_progress], level_increase[rows_in_progress])
+                in_progress, repair_columns = in_progress[rows_in_progress], repair_columns[rows_in_progress]
+                row_range = np.arange(len(row_ids))
+                if len(row_ids) == 0:
+                    break
+
+            num_steps_to_finish = np.where(in_progress, self.get_num_steps_to_finish(levels, level_increase, in_progress), np.inf)
+            num_steps = np.minimum(num_steps_to_finish.min(axis=1), end_time_step - time_steps)
+            component_repaired = in_progress[row_range, repair_columns] & (
+                np.minimum(levels[row_range, repair_columns] + num_steps * level_increase[row_range, repair_columns], 1.0) >= 1.0)
+            activity_num_steps = np.where(component_repaired[:, np.newaxis] & self.after_repair[row_ids], num_steps[:, np.newaxis] - 1, num_steps[:, np.newaxis])
+            progressed = in_progress & (activity_num_steps > 0)
+            self.levels[row_ids] = np.where(progressed, np.minimum(levels + activity_num_steps * level_increase, 1.0), levels)
+            self.record_progress(row_ids, time_steps, activity_num_steps, progressed)
+
+            time_steps = time_steps + num_steps.astype(int)
+            rows_in_interval = time_steps < end_time_step
+            row_ids, time_steps = row_ids[rows_in_interval], time_steps[rows_in_interval]
+
+    def get_num_steps_to_finish(self, levels: np.ndarray, level_increase: np.ndarray, in_progress: np.ndarray) -> np.ndarray:
+        """
+        Get the number of time steps after which activities in progress are finished if their levels increase linearly, same as ConcreteRecoveryActivity.get_exact_num_steps_to_finish.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            num_steps = np.where(in_progress, np.maximum(1, np.ceil((1.0 - 1e-09 - levels) / level_increase)), 1)
+        num_steps = np.where(np.isinf(level_increase), 1, num_steps)
+        with np.errstate(invalid='ignore'):
+            while True:
+                shrink = in_progress & (num_steps > 1) & self.activities_finished(np.minimum(levels + (num_steps - 1) * level_increase, 1.0))
+                if not shrink.any():
+                    break
+                num_steps = num_steps - shrink
+            while True:
+                grow = in_progress & ~self.activities_finished(np.minimum(levels + num_steps * level_increase, 1.0))
+                if not grow.any():
+                    break
+                num_steps = num_steps + grow
+        return num_steps
+
+    def record_progress(self, row_ids: np.ndarray, time_steps: np.ndarray, activity_num_steps: np.ndarray, progressed: np.ndarray) -> None:
+        """
+        Record progress intervals of activities that progressed in a phase.
+        """
+        if progressed.any():
+            progressed_rows, progressed_columns = np.nonzero(progressed)
+            start_time_steps = time_steps[progressed_rows]
+            end_time_steps = start_time_steps + activity_num_steps[progressed_rows, progressed_columns].astype(int)
+            for row_id, column_id, start_time_step, end_time_step in zip(row_ids[progressed_rows].tolist(), progressed_columns.tolist(),
+                                                                          start_time_steps.tolist(), end_time_steps.tolist()):
+                self.add_progress_interval(row_id, column_id, start_time_step, end_time_step)
+
+    def add_progress_interval(self, row_id: int, column_id: int, start_time_step: int, end_time_step: int) -> None:
+        """
+        Record progress of the activity in row row_id and column column_id from start_time_step up to end_time_step (not included).
+        Intervals are merged, so a phase that continues the previous phase of the activity extends its last interval.
+        """
+        progress_intervals = self.progress_intervals.get((row_id, column_id))
+        if progress_intervals is None:
+            progress_intervals = self.progress_intervals[(row_id, column_id)] = TimeStepIntervals()
+        progress_intervals.add_interval(start_time_step, end_time_step)
+
+    def activities_finished(self, levels: np.ndarray) -> np.ndarray:
+        """
+        Check which activities are finished, using the same tolerance as math.isclose in ConcreteRecoveryActivity.activity_finished.
+        """
+        return np.abs(levels - 1.0) <= 1e-09 * np.maximum(np.abs(levels), 1.0)
+
+    def get_damage_levels(self) -> np.ndarray:
+        """
+        Get the damage levels of all bound components, in the order of recovery_models.
+        """
+        return 1 - self.levels[np.arange(len(self.recovery_models)), self.repair_columns]
+
+    def progressed_at(self, row_id: int, column_id: int, time_step: int) -> bool:
+        """
+        Check if the activity in row row_id and column column_id progressed at time_step, with a binary search over the starts of its progress intervals.
+        """
+        progress_intervals = self.progress_intervals.get((row_id, column_id))
+        return progress_intervals is not None and time_step in progress_intervals
+
+    def get_progress_intervals(self, row_id: int, column_id: int) -> list[list[int]]:
+        """
+        Get the sorted, merged (start, end) intervals of time steps at which the activity in row row_id and column column_id progressed.
+        """
+        progress_intervals = self.progress_intervals.get((row_id, column_id))
+        return progress_intervals.intervals if progress_intervals is not None else []
+
+    def get_progress_time_steps(self, row_id: int, column_id: int) -> list[int]:
+        """
+        Get the time steps at which the activity in row row_id and column column_id progressed.
+        """
+        return list(self.progress_intervals.get((row_id, column_id), ()))
+
+    def reset_progress_intervals(self, row_id: int, column_id: int) -> None:
+        self.progress_intervals.pop((row_id, column_id), None)
+
+class RecoveryActivityView(ConcreteRecoveryActivity):
+    """
+    | Recovery activity whose progress level, rate, preceding activities status and progress intervals are stored in a RecoveryActivitiesEngine.
+    | Other attributes (e.g., duration and demand) are stored in the object, as in the ConcreteRecoveryActivity.
+    """
+
+    # attributes of the activity that are stored in the engine
+    ENGINE_ATTRIBUTES = ('progress_level', 'progress_intervals', 'progress_interval_starts')
+
+    def __init__(self, recovery_activities_engine: RecoveryActivitiesEngine, row_id: int, column_id: int, recovery_activity: ConcreteRecoveryActivity) -> None:
+        """
+        Create a view of the activity in row row_id and column column_id of the engine, with the state of recovery_activity.
+        """
+        self.recovery_activities_engine = recovery_activities_engine
+        self.row_id = row_id
+        self.column_id = column_id
+        for attribute_name, value in get_attributes(recovery_activity).items():
+            if attribute_name not in self.ENGINE_ATTRIBUTES:
+                setattr(self, attribute_name, value)
+        self.level = recovery_activity.level
+        for start_time_step, end_time_step in recovery_activity.get_progress_intervals():
+            self.record_progress_interval(start_time_step, end_time_step)
+        self.set_demand_met_in_engine()
+
+    @property
+    def level(self) -> float:
+        return float(self.recovery_activities_engine.levels[self.row_id, self.column_id])
+
+    @level.setter
+    def level(self, level: float) -> None:
+        self.recovery_activities_engine.levels[self.row_id, self.column_id] = level
+
+    @property
+    def rate(self) -> float:
+        return float(self.recovery_activities_engine.rates[self.row_id, self.column_id])
+
+    @rate.setter
+    def rate(self, rate: float) -> None:
+        self.recovery_activities_engine.rates[self.row_id, self.column_id] = rate
+
+    @property
+    def preceding_activities_finished(self) -> bool:
+        return bool(self.recovery_activities_engine.preceding_finished[self.row_id, self.column_id])
+
+    @preceding_activities_finished.setter
+    def preceding_activities_finished(self, finished: bool) -> None:
+        self.recovery_activities_engine.preceding_finished[self.row_id, self.column_id] = finished
+
+    def record_progress_interval(self, start_time_step: int, end_time_step: int) -> None:
+        """
+        Override the parent method. Progress intervals are stored in the engine.
+        """
+        self.recovery_activities_engine.add_progress_interval(self.row_id, self.column_id, start_time_step, end_time_step)
+
+    def get_progress_intervals(self) -> list[list[int]]:
+        """
+        Override the parent method. Progress intervals are stored in the engine.
+        """
+        return self.recovery_activities_engine.get_progress_intervals(self.row_id, self.column_id)
+
+    @property
+    def time_steps(self) -> list[int]:
+        return self.recovery_activities_engine.get_progress_time_steps(self.row_id, self.column_id)
+
+    @time_steps.setter
+    def time_steps(self, time_steps: list[int]) -> None:
+        self.recovery_activities_engine.reset_progress_intervals(self.row_id, self.column_id)
+        for time_step in time_steps:
+            self.record_progress(time_step)
+
+    def progressed_at(self, time_step: int) -> bool:
+        """
+        Override the parent method. Progress intervals are stored in the engine.
+        """
+        return self.recovery_activities_engine.progressed_at(self.row_id, self.column_id, time_step)
+
+    def set_demand_met(self, resource_name: str, demand_met: float) -> None:
+        """
+        Extend the parent method. The effect of unmet demand on the activity is stored in the engine.
+        """
+        super().set_demand_met(resource_name, demand_met)
+        self.set_demand_met_in_engine()
+
+    def set_demand_met_in_engine(self) -> None:
+        self.recovery_activities_engine.demand_met[self.row_id, self.column_id] = self.effect_of_unmet_demand_on_activity()
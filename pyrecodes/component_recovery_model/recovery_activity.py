@@ -23,6 +23,8 @@ class RecoveryActivity(ABC):
     name: str
     time_steps: list([int])
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, name: str) -> None:
         pass
@@ -0,0 +1,114 @@
+"""
+Module used to define the time steps at which components' recovery is simulated.
+"""
+
+import bisect
+from collections.abc import Sequence
+from pyrecodes.utilities import get_shared_object
+
+# Recovery time schedules shared between recovery models, with tuples of recovery time steps as keys.
+# At most MAX_SHARED_RECOVERY_TIME_SCHEDULES schedules are kept, the oldest schedule is removed first.
+shared_recovery_time_schedules = {}
+MAX_SHARED_RECOVERY_TIME_SCHEDULES = 1024
+
+def get_recovery_time_schedule(recovery_time_steps: Sequence) -> 'RecoveryTimeSchedule':
+    """
+    Get the recovery time schedule with the recovery time steps. Schedules are immutable, so they are shared between all recovery models that use the same recovery time stepping.
+    """
+    if isinstance(recovery_time_steps, RecoveryTimeSchedule):
+        return recovery_time_steps
+    key = tuple(recovery_time_steps)
+    return get_shared_object(shared_recovery_time_schedules, key, lambda: RecoveryTimeSchedule(key), MAX_SHARED_RECOVERY_TIME_SCHEDULES)
+
+class RecoveryTimeSchedule(Sequence):
+    """
+    | Immutable sequence of time steps at which components' recovery is simulated, compiled from the RecoveryTimeStepping rules of the system configuration.
+
+    | Membership checks, indices of time steps and time step intervals are looked up in constant time.
+    | A recovery time step covers the interval of time steps from the time step after the previous recovery time step up to and including the recovery time step.
+    | The first recovery time step covers only itself.
+    | Schedules compare equal to lists and tuples with the same time steps. They are not copied by copy.deepcopy and are shared again when unpickled.
+
+    Attributes:
+        | time_steps (tuple[int]): Recovery time steps.
+        | time_step_ids (dict): Maps recovery time steps to their indices.
+        | intervals (dict): Maps recovery time steps to the (start, end) interval of time steps they cover. The end time step is not included.
+
+    """
+
+    time_steps: tuple
+    time_step_ids: dict
+    intervals: dict
+
+    def __init__(self, time_steps: tuple) -> None:
+        self.time_steps = tuple(time_steps)
+        self.time_step_ids = {}
+        for time_step_id, time_step in enumerate(self.time_steps):
+            # same as list.index, the first occurrence of a time step is used
+            self.time_step_ids.setdefault(time_step, time_step_id)
+        self.intervals = {time_step: ((self.time_steps[time_step_id - 1] + 1 if time_step_id > 0 else time_step), time_step + 1)
+                          for time_step, time_step_id in self.time_step_ids.items()}
+
+    def __contains__(self, time_step) -> bool:
+        return time_step in self.time_step_ids
+
+    def __getitem__(self, index):
+        return self.time_steps[index]
+
+    def __len__(self) -> int:
+        return len(self.time_steps)
+
+    def __iter__(self):
+        return iter(self.time_steps)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, RecoveryTimeSchedule):
+            return self.time_steps == other.time_steps
+        if isinstance(other, (list, tuple)):
+            return self.time_steps == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.time_steps)
+
+    def __repr__(self) -> str:
+        return f'RecoveryTimeSchedule({list(self.time_steps)})'
+
+    def __deepcopy__(self, memo: dict) -> 'RecoveryTimeSchedule':
+        return self
+
+    def __reduce__(self):
+        return (get_recovery_time_schedule, (self.time_steps,))
+
+    def index(self, time_step: int, *args) -> int:
+        """
+        Get the index of the recovery time step.
+
+        Raises:
+            ValueError: If time_step is not a recovery time step.
+        """
+        if time_step not in self.time_step_ids:
+            raise ValueError(f'{time_step} is not a recovery time step.')
+        return self.time_step_ids[time_step]
+
+    def get_interval(self, time_step: int) -> tuple:
+        """
+        Get the (start, end) interval of time steps covered by the recovery time step. The end time step is not included.
+
+        Raises:
+            ValueError: If time_step is not a recovery time step.
+        """
+        if time_step not in self.intervals:
+            raise ValueError(f'{time_step} is not a recovery time step.')
+        return self.intervals[time_step]
+
+    def get_covered_interval(self, start_time_step: int, end_time_step: int):
+        """
+        | Get the (start, end) interval of time steps covered by the recovery time steps from start_time_step up to end_time_step (not included), or None if there are none.
+        | Intervals of consecutive recovery time steps are adjacent, so recovering over this interval is the same as recovering at each of the recovery time steps. Recovery time steps are sorted.
+        """
+        first_id = bisect.bisect_left(self.time_steps, start_time_step)
+        last_id = bisect.bisect_left(self.time_steps, end_time_step) - 1
+        if first_id > last_id:
+            return None
+        return self.intervals[self.time_steps[first_id]][0], self.intervals[self.time_steps[last_id]][1]
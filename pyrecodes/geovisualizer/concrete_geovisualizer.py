@@ -9,10 +9,12 @@ import matplotlib.cm as mcm
 import imageio
 import pandas as pd
 import shapely
+import numpy as np
 from pyrecodes.component.component import Component
 from pyrecodes.plotter.concrete_plotter import ConcretePlotter
 from pyrecodes.system.system import System
 from pyrecodes.resilience_calculator.resilience_calculator import ResilienceCalculator
+from pyrecodes.time_step_history import get_state_matrix
 
 
 class ConcreteGeoVisualizer():
@@ -182,8 +184,8 @@ class ConcreteGeoVisualizer():
         return component_state 
 
     def component_is_in_state(self, component: Component, state: str, time_step: int) -> bool:
-        if state in component.recovery_model.recovery_activities and time_step in \
-            component.recovery_model.recovery_activities[state].time_steps:
+        if state in component.recovery_model.recovery_activities and \
+            component.recovery_model.recovery_activities[state].progressed_at(time_step):
             return True
         elif state == 'Functional' and self.component_is_functional(component, time_step): 
             return True   
@@ -193,6 +195,38 @@ class ConcreteGeoVisualizer():
     def component_is_functional(self, component: Component, time_step: int) -> bool:        
         return time_step in component.functional
     
+    def get_component_state_matrix(self, num_time_steps: int) -> np.ndarray:
+        """
+        | Get a dense (components x time steps) uint8 matrix of the IDs of components' current states, as in get_component_current_state.
+        | A component in several states at a time step gets the ID of the first state in the state_dict, and the ID of the Waiting state if it is in none.
+        | Rows of recovery activity states are filled from the activities' progress intervals, so time steps are not expanded one by one.
+        """
+        state_names = list(self.state_dict.keys())
+        state_matrix = np.full((len(self.components), num_time_steps), self.state_dict['Waiting']['ID'], dtype=np.uint8)
+        for state in reversed(state_names[1:]):
+            if state == 'Functional':
+                in_state = get_state_matrix([component.functional for component in self.components], num_time_steps).astype(bool)
+            else:
+                in_state = self.get_recovery_activity_state_matrix(state, num_time_steps)
+            state_matrix[in_state] = self.state_dict[state]['ID']
+        return state_matrix
+
+    def get_recovery_activity_state_matrix(self, recovery_activity_name: str, num_time_steps: int) -> np.ndarray:
+        """
+        | Get a boolean (components x time steps) matrix, True at the time steps at which the component's recovery activity progressed.
+        """
+        in_state = np.zeros((len(self.components), num_time_steps), dtype=bool)
+        for component_id, component in enumerate(self.components):
+            for start_time_step, end_time_step in self.get_recovery_activity_progress_intervals(component, recovery_activity_name):
+                in_state[component_id, max(start_time_step, 0):max(end_time_step, 0)] = True
+        return in_state
+
+    def get_recovery_activity_progress_intervals(self, component: Component, recovery_activity_name: str) -> list[list[int]]:
+        recovery_activities = getattr(component.recovery_model, 'recovery_activities', {})
+        if recovery_activity_name in recovery_activities:
+            return recovery_activities[recovery_activity_name].get_progress_intervals()
+        return []
+
     def component_is_waiting(self, component_state: list[int]):
         return len(component_state) == 0
     
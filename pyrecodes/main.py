@@ -20,11 +20,12 @@ def form_component_library(input_dict: dict) -> dict:
     
     return component_library_object.form_library()
 
-def create_system(input_dict: dict) -> System:
+def create_system(input_dict: dict, system_configuration: dict = None) -> System:
     """Creates a system object using the input dictionary.
 
     Args:
         input_dict (dict): The input dictionary containing System configuration.
+        system_configuration (dict, optional): System configuration to use instead of the one in the SystemConfigurationFile. Defaults to None.
 
     Returns:
         System: The created system object.
@@ -32,8 +33,9 @@ def create_system(input_dict: dict) -> System:
     # Form the component library dict using the input dictionary.
     component_library = form_component_library(input_dict)
 
-    # Read the system configuration file.
-    system_configuration = read_json_file(input_dict['System']['SystemConfigurationFile'])
+    # Read the system configuration file, unless the system configuration is provided.
+    if system_configuration is None:
+        system_configuration = read_json_file(input_dict['System']['SystemConfigurationFile'])
     
     # Extract the target SystemCreator class from the input dictionary and instantiate it.
     system_creator_target_class = get_class(input_dict['System']['SystemCreatorFileName'], input_dict['System']['SystemCreatorClassName'], 'system_creator')  
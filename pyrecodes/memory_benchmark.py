@@ -0,0 +1,62 @@
+"""
+Module used to measure the memory that a **pyrecodes** system needs per component, with and without the compact object mode.
+
+Run from the repository root, e.g.: python -m pyrecodes.memory_benchmark "./Example 5/Alameda_Main.json" --run
+"""
+import argparse
+import contextlib
+import gc
+import io
+import tracemalloc
+from pyrecodes import main
+from pyrecodes.utilities import read_json_file
+
+def measure_memory_per_component(main_file: str, constants: dict = None, run_assessment: bool = False) -> dict:
+    """
+    Measure the memory allocated while the system is created and, optionally, while the resilience assessment runs, divided by the number of components.
+    Memory is measured with tracemalloc and includes all objects that the system keeps, e.g., components, resources, recovery models and distribution models.
+
+    Args:
+        | main_file (str): The main JSON file of the system.
+        | constants (dict, optional): Constants added to the Constants section of the system configuration, e.g., {'COMPACT_OBJECTS': True}. Defaults to None.
+        | run_assessment (bool, optional): Whether to run the resilience assessment and measure the memory after it as well. Defaults to False.
+
+    Returns:
+        dict: Number of components and bytes per component after the system is created and, if run_assessment is True, after the resilience assessment.
+    """
+    input_dict = read_json_file(main_file)
+    system_configuration = read_json_file(input_dict['System']['SystemConfigurationFile'])
+    system_configuration.setdefault('Constants', {}).update(constants or {})
+    gc.collect()
+    tracemalloc.start()
+    start_memory = tracemalloc.get_traced_memory()[0]
+    system = main.create_system(input_dict, system_configuration)
+    gc.collect()
+    num_components = len(system.components)
+    results = {'NumComponents': num_components,
+               'BytesPerComponentCreated': (tracemalloc.get_traced_memory()[0] - start_memory) / num_components}
+    if run_assessment:
+        with contextlib.redirect_stdout(io.StringIO()):
+            system.start_resilience_assessment()
+        gc.collect()
+        results['BytesPerComponentAssessed'] = (tracemalloc.get_traced_memory()[0] - start_memory) / num_components
+    tracemalloc.stop()
+    return results
+
+def compare_compact_objects(main_file: str, run_assessment: bool = False) -> dict:
+    """
+    Measure the memory per component without and with the compact object mode (COMPACT_OBJECTS constant).
+    The system is created once before measuring, so that modules imported and caches filled on first use are not counted.
+    """
+    measure_memory_per_component(main_file)
+    return {'Default': measure_memory_per_component(main_file, {'COMPACT_OBJECTS': False}, run_assessment),
+            'Compact': measure_memory_per_component(main_file, {'COMPACT_OBJECTS': True}, run_assessment)}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Report the memory used per component of a pyrecodes system, without and with compact objects.')
+    parser.add_argument('main_file', nargs='?', default='./Example 5/Alameda_Main.json', help='Main JSON file of the system.')
+    parser.add_argument('--run', action='store_true', help='Run the resilience assessment and report the memory after it as well.')
+    arguments = parser.parse_args()
+    for mode, results in compare_compact_objects(arguments.main_file, arguments.run).items():
+        report = ', '.join(f'{label}: {value:,.0f}' for label, value in results.items())
+        print(f'{mode} | {report}')
@@ -0,0 +1,240 @@
+"""
+Module used to run multiple independent realizations of the **pyrecodes** resilience assessment (Monte Carlo simulation) in parallel.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable
+import numpy as np
+import json
+from pyrecodes import main
+from pyrecodes.system.system import System
+from pyrecodes.system.system_template import SystemTemplate
+from pyrecodes.utilities import read_json_file
+from pyrecodes.probability_distribution import probability_distribution
+
+# System templates built in the current process, with main file names as keys. Each worker process builds a template only once.
+system_templates = {}
+
+def get_resilience_calculator_outputs(system: System) -> list:
+    """Gets the outputs of the system's resilience calculators after the resilience assessment.
+
+    Args:
+        system (System): The system object after running the resilience assessment.
+
+    Returns:
+        list: A list with a dict for each resilience calculator, containing its class name and the output of its calculate_resilience method.
+    """
+    return [{'ResilienceCalculator': type(resilience_calculator).__name__,
+             'Output': resilience_calculator.calculate_resilience()} for resilience_calculator in system.resilience_calculators]
+
+def to_serializable(value):
+    """Converts numpy types in (nested) lists and dicts to Python types, so that the value can be saved as JSON."""
+    if isinstance(value, dict):
+        return {str(key): to_serializable(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [to_serializable(item) for item in value]
+    elif isinstance(value, np.ndarray):
+        return to_serializable(value.tolist())
+    elif isinstance(value, np.generic):
+        return value.item()
+    else:
+        return value
+
+def get_system_template(main_file: str) -> SystemTemplate:
+    """Gets the system template for the main file. The template is built the first time it is needed in the current process.
+
+    Args:
+        main_file (str): The name of the main JSON configuration file.
+
+    Returns:
+        SystemTemplate: The system template.
+    """
+    if main_file not in system_templates:
+        system_templates[main_file] = SystemTemplate(read_json_file(main_file))
+    return system_templates[main_file]
+
+def replace_damage_file(damage_input_parameters, damage_file: str):
+    """Replaces the damage file in the damage input parameters of the system configuration.
+
+    Damage inputs that read the damage from a file either have a dict with a DamageFile key as parameters (e.g., R2DDamageInput)
+    or the name of the damage file as parameters (e.g., FileDamageInput).
+
+    Args:
+        damage_input_parameters (dict | str): Damage input parameters from the system configuration.
+        damage_file (str): Damage file to use instead of the one in the damage input parameters.
+
+    Returns:
+        dict | str: Damage input parameters with the damage file replaced. A dict is copied, so the system configuration is not changed.
+
+    Raises:
+        ValueError: If the damage input parameters do not define a damage file.
+    """
+    if isinstance(damage_input_parameters, dict):
+        return {**damage_input_parameters, 'DamageFile': damage_file}
+    elif isinstance(damage_input_parameters, str):
+        return damage_file
+    else:
+        raise ValueError(f'Damage file can not be replaced in damage input parameters of type {type(damage_input_parameters).__name__}.')
+
+def create_system(main_file: str, damage_file: str = None, use_system_template: bool = False) -> System:
+    """Creates the system of a realization, either from the input files or as a copy of the system template.
+
+    Args:
+        main_file (str): The name of the main JSON configuration file.
+        damage_file (str, optional): Damage file to use instead of the DamageFile defined in the system configuration's DamageInput parameters. Defaults to None.
+        use_system_template (bool, optional): If True, the system is copied from the system template. Defaults to False.
+
+    Returns:
+        System: The created system object.
+
+    Raises:
+        ValueError: If a damage file is used with a system template whose components get their damage when they are created (e.g., from R2D files).
+    """
+    if use_system_template:
+        system_template = get_system_template(main_file)
+        damage_input_parameters = None
+        if damage_file is not None:
+            damage_input_parameters = replace_damage_file(system_template.system.system_creator.get_damage_input_parameters(), damage_file)
+        return system_template.create_system(damage_input_parameters)
+    else:
+        input_dict = read_json_file(main_file)
+        system_configuration = read_json_file(input_dict['System']['SystemConfigurationFile'])
+        if damage_file is not None:
+            system_configuration['DamageInput']['Parameters'] = replace_damage_file(system_configuration['DamageInput']['Parameters'], damage_file)
+        return main.create_system(input_dict, system_configuration)
+
+def run_realization(main_file: str, seed: int, damage_file: str = None,
+                    output_function: Callable = get_resilience_calculator_outputs, use_system_template: bool = False) -> dict:
+    """Runs a single realization of the resilience assessment.
+
+    A numpy.random.Generator seeded with seed is used to sample probability distributions during the realization.
+    The system template is built before the generator is seeded, so that the output does not depend on the order of realizations in a process.
+
+    Args:
+        main_file (str): The name of the main JSON configuration file.
+        seed (int): The seed of the realization's random number generator.
+        damage_file (str, optional): Damage file to use instead of the DamageFile defined in the system configuration's DamageInput parameters. Defaults to None.
+        output_function (Callable, optional): Function that gets the realization output from the system after the resilience assessment. Defaults to get_resilience_calculator_outputs.
+        use_system_template (bool, optional): If True, the system is copied from the system template instead of created from the input files. Defaults to False.
+
+    Returns:
+        dict: The realization output.
+    """
+    if use_system_template:
+        get_system_template(main_file)
+    previous_random_number_generator = probability_distribution.get_random_number_generator()
+    probability_distribution.set_random_number_generator(np.random.default_rng(seed))
+    try:
+        system = create_system(main_file, damage_file, use_system_template)
+        system.start_resilience_assessment()
+        return to_serializable(output_function(system))
+    finally:
+        probability_distribution.set_random_number_generator(previous_random_number_generator)
+
+class MonteCarloRunner:
+    """
+    Runs independent realizations of the resilience assessment defined in a main JSON configuration file using a ProcessPoolExecutor.
+
+    Realizations differ in the seed of the random number generator used to sample probability distributions (e.g., recovery activity durations)
+    and, optionally, in the damage file (e.g., R2D damage realizations). Outputs of realizations are collected as they finish.
+
+    Attributes:
+        | main_file (str): The name of the main JSON configuration file.
+        | seeds (list[int]): Seeds of the realizations.
+        | damage_files (list[str]): Damage files of the realizations. None if the damage file from the system configuration is used.
+        | max_workers (int): Maximum number of worker processes. If 1, realizations are run in the current process.
+        | results_file (str): JSON lines file to which realization results are appended as they finish. None if results are only kept in memory.
+        | use_system_template (bool): If True, each process builds the system once as a SystemTemplate and copies it for every realization.
+        | results (dict): Results of finished realizations, with realization ids as keys.
+
+    """
+
+    def __init__(self, main_file: str, seeds: list[int] = None, damage_files: list[str] = None, num_realizations: int = None,
+                 base_seed: int = None, max_workers: int = None, results_file: str = None,
+                 output_function: Callable = get_resilience_calculator_outputs, use_system_template: bool = False):
+        """
+        Initialize the MonteCarloRunner.
+
+        Args:
+            | main_file (str): The name of the main JSON configuration file.
+            | seeds (list[int], optional): Seeds of the realizations. If None, seeds are spawned from base_seed using numpy.random.SeedSequence. Defaults to None.
+            | damage_files (list[str], optional): Damage files of the realizations. Must have the same length as seeds, if both are provided. Defaults to None.
+            | num_realizations (int, optional): Number of realizations, if neither seeds nor damage_files are provided. Defaults to None.
+            | base_seed (int, optional): Seed used to spawn realization seeds. Defaults to None.
+            | max_workers (int, optional): Maximum number of worker processes. Defaults to None, i.e., the number of processors.
+            | results_file (str, optional): JSON lines file to which realization results are appended as they finish. Defaults to None.
+            | output_function (Callable, optional): Module-level function that gets the realization output from the system. Defaults to get_resilience_calculator_outputs.
+            | use_system_template (bool, optional): If True, each process builds the system once and copies it for every realization. Check out the SystemTemplate class for limitations. Defaults to False.
+
+        """
+        self.main_file = main_file
+        self.set_realizations(seeds, damage_files, num_realizations, base_seed)
+        self.max_workers = max_workers
+        self.results_file = results_file
+        self.output_function = output_function
+        self.use_system_template = use_system_template
+        self.results = {}
+
+    def set_realizations(self, seeds: list[int], damage_files: list[str], num_realizations: int, base_seed: int) -> None:
+        """
+        Set the seeds and damage files of the realizations.
+        """
+        if seeds is None:
+            if damage_files is not None:
+                num_realizations = len(damage_files)
+            elif num_realizations is None:
+                raise ValueError('Provide seeds, damage files or the number of realizations.')
+            seeds = self.spawn_seeds(num_realizations, base_seed)
+        if damage_files is not None and len(damage_files) != len(seeds):
+            raise ValueError('Number of seeds and damage files must be the same.')
+        self.seeds = list(seeds)
+        self.damage_files = damage_files
+
+    @staticmethod
+    def spawn_seeds(num_realizations: int, base_seed: int) -> list[int]:
+        """
+        Spawn independent realization seeds from base_seed.
+        """
+        seed_sequences = np.random.SeedSequence(base_seed).spawn(num_realizations)
+        return [int(seed_sequence.generate_state(1)[0]) for seed_sequence in seed_sequences]
+
+    def get_damage_file(self, realization_id: int) -> str:
+        if self.damage_files is None:
+            return None
+        else:
+            return self.damage_files[realization_id]
+
+    def run(self) -> dict:
+        """
+        Run all realizations.
+
+        Returns:
+            dict: Results of all realizations, with realization ids as keys.
+        """
+        if self.max_workers == 1:
+            for realization_id, seed in enumerate(self.seeds):
+                output = run_realization(self.main_file, seed, self.get_damage_file(realization_id), self.output_function, self.use_system_template)
+                self.add_result(realization_id, output)
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(run_realization, self.main_file, seed, self.get_damage_file(realization_id), self.output_function, self.use_system_template): realization_id
+                           for realization_id, seed in enumerate(self.seeds)}
+                for future in as_completed(futures):
+                    self.add_result(futures[future], future.result())
+        return self.results
+
+    def add_result(self, realization_id: int, output) -> None:
+        """
+        Add the output of a finished realization to the results and append it to the results file.
+        """
+        self.results[realization_id] = {'Seed': self.seeds[realization_id],
+                                        'DamageFile': self.get_damage_file(realization_id),
+                                        'Output': output}
+        if self.results_file is not None:
+            with open(self.results_file, 'a') as file:
+                file.write(json.dumps({'Realization': realization_id, **self.results[realization_id]}) + '\n')
+
+    def get_results(self) -> list:
+        """
+        Get results of finished realizations ordered by realization id.
+        """
+        return [self.results[realization_id] for realization_id in sorted(self.results.keys())]
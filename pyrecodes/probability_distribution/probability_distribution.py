@@ -4,7 +4,42 @@ Module used to define probability distributions used in pyrecodes.
 
 from abc import ABC, abstractmethod
 import math
+import sys
+import json
 import numpy as np
+from pyrecodes.utilities import get_shared_object
+
+# Random number generator used to sample distributions. By default, numpy's global random state is used.
+# Monte Carlo runs set a seeded numpy.random.Generator for each realization.
+random_number_generator = np.random
+
+def set_random_number_generator(generator) -> None:
+    """
+    Set the random number generator used to sample distributions. Use None to go back to numpy's global random state.
+    """
+    global random_number_generator
+    random_number_generator = np.random if generator is None else generator
+
+def get_random_number_generator():
+    """
+    Get the random number generator used to sample distributions.
+    """
+    return random_number_generator
+
+# Distributions shared between recovery activities, with distribution names and serialized parameters as keys.
+# At most MAX_SHARED_DISTRIBUTIONS distributions are kept, the oldest distribution is removed first.
+shared_distributions = {}
+MAX_SHARED_DISTRIBUTIONS = 1024
+
+def get_distribution(distribution: dict) -> 'Distribution':
+    """
+    Get the distribution object described by the distribution dict, e.g., {'Lognormal': {'Median': 10, 'Dispersion': 0.5}}.
+    Distribution objects only hold their parameters, so they are shared between all recovery activities that use the same distribution.
+    """
+    distribution_name, distribution_parameters = next(iter(distribution.items()))
+    key = (distribution_name, json.dumps(distribution_parameters, sort_keys=True))
+    return get_shared_object(shared_distributions, key, lambda: getattr(sys.modules[__name__], distribution_name)(distribution_parameters),
+                             MAX_SHARED_DISTRIBUTIONS)
 
 class Distribution(ABC):
 
@@ -40,4 +75,4 @@ class Lognormal(Distribution):
 
     def sample(self) -> float:
         mean_normal = math.log(self.median)
-        return np.random.lognormal(mean_normal, self.dispersion)
+        return random_number_generator.lognormal(mean_normal, self.dispersion)
@@ -1,8 +1,34 @@
 from abc import ABC, abstractmethod
 import math
+import sys
+import json
+import numpy as np
+from pyrecodes.utilities import get_shared_object
 
 ABS_TOL = 1e-10
 
+# Relations shared between components, with relation class names and serialized parameters as keys.
+# At most MAX_SHARED_RELATIONS relations are kept, the oldest relation is removed first.
+shared_relations = {}
+MAX_SHARED_RELATIONS = 1024
+
+def get_relation(relation_class_name: str, parameters: dict = None) -> 'Relation':
+    """
+    | Get a relation object of the class relation_class_name with parameters. Relation objects are shared between all components that use the same relation,
+    | as relations do not change during the resilience assessment.
+    | **Note**: Do not use shared relations if the relation is modified afterwards (e.g., by calling set_steps on a MultipleStep relation).
+    """
+    if parameters is None:
+        parameters = {}
+    key = (relation_class_name, json.dumps(parameters, sort_keys=True))
+    return get_shared_object(shared_relations, key, lambda: getattr(sys.modules[__name__], relation_class_name)(parameters), MAX_SHARED_RELATIONS)
+
+def isclose_array(input: np.ndarray, value: float, abs_tol: float = ABS_TOL) -> np.ndarray:
+    """
+    Elementwise math.isclose with the default relative tolerance, used to evaluate relations on arrays of inputs exactly as on single inputs.
+    """
+    return np.abs(input - value) <= np.maximum(1e-09 * np.maximum(np.abs(input), abs(value)), abs_tol)
+
 class Relation(ABC):
     """
     Class used to define various relations between component attributes in pyrecodes.
@@ -15,6 +41,12 @@ class Relation(ABC):
     def get_output(self, input: float) -> float:
         pass
 
+    def get_output_array(self, input: np.ndarray) -> np.ndarray:
+        """
+        Get the outputs of the relation for an array of inputs. Relations that can be evaluated on arrays override this method.
+        """
+        return np.array([self.get_output(value) for value in np.asarray(input, dtype=float)], dtype=float)
+
 class ConcreteRelation(Relation):
 
     def __init__(self, parameters={}):
@@ -29,6 +61,12 @@ class ConcreteRelation(Relation):
         else:
             raise ValueError('Input must be between 0 and 1.')
 
+    def valid_input_array(self, input: np.ndarray) -> bool:
+        if np.all((input >= 0.0) & (input <= 1.0)):
+            return True
+        else:
+            raise ValueError('Input must be between 0 and 1.')
+
 class Constant(ConcreteRelation):
     """
     Class for a relation that always returns 1.0 for any valid input.
@@ -37,6 +75,11 @@ class Constant(ConcreteRelation):
         if self.valid_input(input):
             return 1.0
 
+    def get_output_array(self, input: np.ndarray) -> np.ndarray:
+        input = np.asarray(input, dtype=float)
+        if self.valid_input_array(input):
+            return np.ones_like(input)
+
 class Linear(ConcreteRelation):
     """
     Class for a relation that returns the input value - that is the relation between the input and output is linear with a coefficient of 1.
@@ -45,6 +88,11 @@ class Linear(ConcreteRelation):
         if self.valid_input(input):
             return input
 
+    def get_output_array(self, input: np.ndarray) -> np.ndarray:
+        input = np.asarray(input, dtype=float)
+        if self.valid_input_array(input):
+            return input.copy()
+
 class ReverseLinear(ConcreteRelation):
     """
     Class for a relation that returns 1 - input value.
@@ -53,6 +101,11 @@ class ReverseLinear(ConcreteRelation):
         if self.valid_input(input):
             return 1 - input
 
+    def get_output_array(self, input: np.ndarray) -> np.ndarray:
+        input = np.asarray(input, dtype=float)
+        if self.valid_input_array(input):
+            return 1 - input
+
 class Binary(ConcreteRelation):
     """
     Class for a binary relation that returns 1 if input is 1 and 0 otherwise.
@@ -64,6 +117,11 @@ class Binary(ConcreteRelation):
             else:
                 return 0
 
+    def get_output_array(self, input: np.ndarray) -> np.ndarray:
+        input = np.asarray(input, dtype=float)
+        if self.valid_input_array(input):
+            return np.where(isclose_array(input, 1), 1.0, 0.0)
+
 class ReverseBinary(ConcreteRelation):
     """
     Class for a binary relation that returns 1 if input is 0 and 0 otherwise.
@@ -75,6 +133,11 @@ class ReverseBinary(ConcreteRelation):
             else:
                 return 0
 
+    def get_output_array(self, input: np.ndarray) -> np.ndarray:
+        input = np.asarray(input, dtype=float)
+        if self.valid_input_array(input):
+            return np.where(isclose_array(input, 0), 1.0, 0.0)
+
 class MultipleStep(ConcreteRelation):
     """
     | Multiple step relation between input and output.
@@ -84,6 +147,7 @@ class MultipleStep(ConcreteRelation):
     | if limit larger than the largest limit, output is 1.0
 
     | Note: input has to be rounded, otherwise comparison does not work. 
+    | Arrays of inputs are mapped to steps with a binary search over the step limits, which are assumed to be sorted in ascending order.
     """
 
     def __init__(self, parameters={}):
@@ -94,6 +158,18 @@ class MultipleStep(ConcreteRelation):
             input = round(input, int(math.log10(1 / ABS_TOL)))
             input_step = self.get_step_id(input)
             return self.step_values[input_step]
+
+    def get_output_array(self, input: np.ndarray) -> np.ndarray:
+        input = np.asarray(input, dtype=float)
+        if self.valid_input_array(input):
+            input = np.round(input, int(math.log10(1 / ABS_TOL)))
+            return self.step_values_array[self.get_step_ids(input)]
+
+    def get_step_ids(self, input: np.ndarray) -> np.ndarray:
+        """
+        Get the step ids of an array of inputs. Same as get_step_id, inputs below the lowest limit are in the first step.
+        """
+        return np.clip(np.searchsorted(self.step_limits_array, input, side='right') - 1, 0, len(self.step_limits) - 1)
             
     def get_step_id(self, input: float) -> int:
         for i in range(len(self.step_limits) - 1):
@@ -109,4 +185,6 @@ class MultipleStep(ConcreteRelation):
             raise ValueError('Number of step limits and step values should be the same.')
         else:
             self.step_limits = step_limits
-            self.step_values = step_values
\ No newline at end of file
+            self.step_values = step_values
+            self.step_limits_array = np.array(step_limits, dtype=float)
+            self.step_values_array = np.array(step_values, dtype=float)
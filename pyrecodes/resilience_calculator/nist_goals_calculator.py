@@ -42,6 +42,14 @@ class NISTGoalsCalculator(ReCoDeSCalculator):
             else:
                 resilience_goal['GoalMet'].append(resilience_goal['DesiredFunctionalityLevel'] < total_consumption/total_demand)
 
+    def update_skipped_time_steps(self, system, time_steps: range) -> None:
+        """
+        Record whether the goals are met in skipped time steps in bulk, as demand and consumption are the same as in the last updated time step.
+        """
+        for resilience_goal in self.resilience_goals:
+            if len(resilience_goal['GoalMet']) > 0:
+                resilience_goal['GoalMet'].extend([resilience_goal['GoalMet'][-1]] * len(time_steps))
+
     def calculate_resilience(self):
         """"
         | Method finds the time step at which the goal is met and MAINTAINED - the last time step at which the goal was not met.
@@ -41,4 +41,13 @@ class ReCoDeSCalculator(ResilienceCalculator):
                 self.system_supply[resource_name].append(resource_parameters['DistributionModel'].get_total_supply(scope=self.scope))
                 self.system_demand[resource_name].append(resource_parameters['DistributionModel'].get_total_demand(scope=self.scope))
                 self.system_consumption[resource_name].append(
-                    resource_parameters['DistributionModel'].get_total_consumption(scope=self.scope))
\ No newline at end of file
+                    resource_parameters['DistributionModel'].get_total_consumption(scope=self.scope))
+
+    def update_skipped_time_steps(self, system, time_steps: range) -> None:
+        """
+        Record supply, demand and consumption of resources in skipped time steps in bulk, as they are the same as in the last updated time step.
+        """
+        for resource_name in self.resource_names:
+            for recorded_values in [self.system_supply[resource_name], self.system_demand[resource_name], self.system_consumption[resource_name]]:
+                if len(recorded_values) > 0:
+                    recorded_values.extend([recorded_values[-1]] * len(time_steps))
@@ -16,4 +16,17 @@ class ResilienceCalculator(ABC):
 
     @abstractmethod
     def update(self, system: System):
-        pass
\ No newline at end of file
+        pass
+
+    def update_skipped_time_steps(self, system: System, time_steps: range) -> None:
+        """
+        | Update the calculator at time_steps skipped by the event-driven time advancement of the system. Supply, demand and consumption of resources do not change in skipped time steps.
+        | By default, the calculator is updated at each skipped time step. Calculators that record values at each time step can record them in bulk instead.
+        """
+        current_time_step = system.time_step
+        try:
+            for time_step in time_steps:
+                system.time_step = time_step
+                self.update(system)
+        finally:
+            system.time_step = current_time_step
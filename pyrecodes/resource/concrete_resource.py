@@ -1,25 +1,64 @@
+import sys
 from pyrecodes.resource.resource import Resource
 from pyrecodes.relation import relation
+from pyrecodes.utilities import set_attributes
 
 class ConcreteResource(Resource):
     """
     Class to represent a resource in a component object.
+    Attributes are stored in __slots__, as systems have a resource object per component, supply or demand type and resource.
     """
 
+    __slots__ = ('name', 'amount_version', 'initial_amount', 'current_amount',
+                 'component_functionality_to_amount', 'unmet_demand_to_amount', 'amount_updated_in_batch', 'change_sets')
+
+    # the amount of a consumable resource changes when it is consumed, not only when the component's state changes
+    CONSUMABLE = False
+
     def __init__(self, name: str, parameters: dict, default_relation='Constant') -> None:
-        self.name = name
+        self.name = sys.intern(name)
+        self.amount_version = 0
+        # set by the ResourceAmountUpdater if it updates the resource based on component functionality instead of the component
+        self.amount_updated_in_batch = False
+        # (changed rows, row) pairs of system matrices that hold the resource's amount, see SingleResourceSystemMatrixCreator
+        self.change_sets = ()
         self.set_initial_amount(parameters.get('Amount', 0.0))
         self.set_functionality_to_amount_relation(parameters.get('FunctionalityToAmountRelation', default_relation))
         self.set_unmet_demand_to_amount_relation(parameters.get('UnmetDemandToAmountRelation', default_relation)) 
 
+    def __setstate__(self, state) -> None:
+        set_attributes(self, state)
+        if not hasattr(self, 'amount_updated_in_batch'):
+            self.amount_updated_in_batch = False
+        if not hasattr(self, 'change_sets'):
+            self.change_sets = ()
+
     def set_initial_amount(self, amount: float) -> None:
         if self.amount_is_a_positive_number(amount):
             self.initial_amount = amount
-            self.current_amount = amount
+            self.update_current_amount(amount)
 
     def set_current_amount(self, amount: float) -> None:
         if self.amount_is_a_positive_number(amount):
+            self.update_current_amount(amount)
+
+    def update_current_amount(self, amount: float) -> None:
+        """
+        | Set the current amount of the resource. If the amount changed, increase the resource's amount_version and add the resource's rows to the change sets.
+        | Change sets are used by the SingleResourceSystemMatrixCreator to only update the rows of components whose resource amounts changed.
+        """
+        if amount != getattr(self, 'current_amount', None):
             self.current_amount = amount
+            self.amount_version = getattr(self, 'amount_version', 0) + 1
+            for changed_rows, row in getattr(self, 'change_sets', ()):
+                changed_rows.add(row)
+
+    def add_change_set(self, changed_rows: set, row: int) -> None:
+        """
+        Add row to changed_rows whenever the current amount of the resource changes.
+        """
+        if not any(change_set is changed_rows and change_row == row for change_set, change_row in getattr(self, 'change_sets', ())):
+            self.change_sets = getattr(self, 'change_sets', ()) + ((changed_rows, row),)
 
     @staticmethod
     def amount_is_a_positive_number(amount) -> bool:
@@ -30,8 +69,7 @@ class ConcreteResource(Resource):
 
     def set_relation(self, relation_class_name: str, attribute_name: str) -> None:
         try:
-            target_relation = getattr(relation, relation_class_name)
-            setattr(self, attribute_name, target_relation())
+            setattr(self, attribute_name, relation.get_relation(relation_class_name))
         except:
             raise ValueError(f'Relation {relation_class_name} not defined.')
 
@@ -42,13 +80,13 @@ class ConcreteResource(Resource):
         self.set_relation(relation_class_name, 'unmet_demand_to_amount')
 
     def update_based_on_component_functionality(self, component_functionality_level: float) -> None:
-        self.current_amount = self.initial_amount * self.component_functionality_to_amount.get_output(
-            component_functionality_level)
+        self.update_current_amount(self.initial_amount * self.component_functionality_to_amount.get_output(
+            component_functionality_level))
 
     def update_based_on_unmet_demand(self, percent_of_met_demand: float) -> None:
         reduced_amount = self.initial_amount * self.unmet_demand_to_amount.get_output(percent_of_met_demand)
         if reduced_amount < self.current_amount:
-            self.current_amount = reduced_amount  
+            self.update_current_amount(reduced_amount)  
 
     def update_based_on_consumption(self, consumption: float) -> None:
         """
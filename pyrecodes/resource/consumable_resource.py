@@ -10,6 +10,10 @@ class ConsumableResource(ConcreteResource):
     functionality level is 1 and this value is also decreased for a consumable resource.
     """
 
+    __slots__ = ()
+
+    CONSUMABLE = True
+
     def update_based_on_consumption(self, consumption: float) -> None:
         self.initial_amount = max(self.initial_amount - consumption, 0)
-        self.current_amount = max(self.current_amount - consumption, 0)
\ No newline at end of file
+        self.update_current_amount(max(self.current_amount - consumption, 0))
\ No newline at end of file
@@ -5,6 +5,9 @@ class Resource(ABC):
     """
     Interface for a resource class in a component object.    
     """
+
+    __slots__ = ()
+
     name: str
     initial_amount: float
     current_amount: float
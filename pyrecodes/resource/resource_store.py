@@ -0,0 +1,201 @@
+from pyrecodes.component.component import Component, SupplyOrDemand
+from pyrecodes.component.standard_irecodes_component import StandardiReCoDeSComponent
+from pyrecodes.resource.concrete_resource import ConcreteResource
+from pyrecodes.resource.consumable_resource import ConsumableResource
+from pyrecodes.utilities import get_attributes
+import numpy as np
+
+# Component supply and demand types stored in the ResourceStore, with the component attribute ('supply' or 'demand') that holds them.
+STORED_TYPES = {StandardiReCoDeSComponent.SupplyTypes.SUPPLY.value: SupplyOrDemand.SUPPLY.value,
+                StandardiReCoDeSComponent.DemandTypes.OPERATION_DEMAND.value: SupplyOrDemand.DEMAND.value,
+                StandardiReCoDeSComponent.DemandTypes.RECOVERY_DEMAND.value: SupplyOrDemand.DEMAND.value}
+
+def get_resource_store(components: list[Component]) -> 'ResourceStore':
+    """
+    Get the ResourceStore that all components are bound to. None if components are not bound to the same store.
+    """
+    if len(components) == 0:
+        return None
+    resource_store = getattr(components[0], 'resource_store', None)
+    if resource_store is None or not all(getattr(component, 'resource_store', None) is resource_store for component in components):
+        return None
+    return resource_store
+
+class ResourceStore:
+    """
+    | System-level columnar store of the amounts of components' supply, operation demand and recovery demand.
+
+    | Amounts are stored in 2-D NumPy arrays (components x columns). A column is a pair of a supply or demand type and a resource name, e.g., ('Supply', 'PotableWater').
+    | Columns are created for all resources in the system, for each supply and demand type. Components that do not have a resource have zero amounts in its columns.
+    | Bound components store their row in resource_store_row_id, so rows are kept when the system is copied.
+    | Supply and operation demand resources of bound components are replaced by ConcreteResourceView or ConsumableResourceView objects, which read and write the store's arrays,
+    | so the per-component accessors (e.g., supply['Supply']['PotableWater'].current_amount) work as before.
+    | Recovery demand resources belong to components' recovery activities, so their amounts are copied to the store when components update their recovery demand.
+    | Distribution models, the SpatialResourceAggregator and the ResourceAmountUpdater read and write whole columns of bound components at once.
+
+    Attributes:
+        | components (list[Component]): Bound components. Row i of the arrays belongs to components[i].
+        | column_ids (dict): Maps (supply or demand type, resource name) pairs to columns of the arrays.
+        | initial_amounts (np.ndarray): Initial amounts of resources. Only current amounts of recovery demand are stored.
+        | current_amounts (np.ndarray): Current amounts of resources.
+        | amount_versions (np.ndarray): Number of times the current amount of a resource changed, see ConcreteResource.update_current_amount.
+        | recovery_demand_columns (list[dict]): For each row, the recovery demand columns written in the last recovery demand update, with their amounts.
+
+    """
+
+    components: list[Component]
+    column_ids: dict
+    initial_amounts: np.ndarray
+    current_amounts: np.ndarray
+    amount_versions: np.ndarray
+    recovery_demand_columns: list[dict]
+
+    def __init__(self, components: list[Component], resource_names: list[str]):
+        """
+        Create the arrays and bind the components to the store.
+
+        Args:
+            | components (list[Component]): A list of components in the system.
+            | resource_names (list[str]): Names of resources in the system. Resources of components that are not in the list are added as well.
+        """
+        self.components = components
+        resource_names = list(dict.fromkeys(list(resource_names) + [resource_name for component in components
+                                                                    for stored_type, supply_or_demand in STORED_TYPES.items()
+                                                                    for resource_name in getattr(component, supply_or_demand).get(stored_type, {}).keys()]))
+        self.column_ids = {(stored_type, resource_name): column_id for column_id, (stored_type, resource_name)
+                           in enumerate((stored_type, resource_name) for stored_type in STORED_TYPES for resource_name in resource_names)}
+        num_components, num_columns = len(components), len(self.column_ids)
+        self.initial_amounts = np.zeros((num_components, num_columns))
+        self.current_amounts = np.zeros((num_components, num_columns))
+        self.amount_versions = np.zeros((num_components, num_columns), dtype=np.int64)
+        self.recovery_demand_columns = [{} for _ in range(num_components)]
+        for row_id, component in enumerate(components):
+            self.bind(row_id, component)
+
+    def bind(self, row_id: int, component: Component) -> None:
+        """
+        Copy the amounts of the component's supply and operation demand to row row_id and replace the resources with views of the row.
+
+        Raises:
+            ValueError: If a resource is not a ConcreteResource or a ConsumableResource, as its amounts could not be read from the store.
+        """
+        for stored_type in [StandardiReCoDeSComponent.SupplyTypes.SUPPLY.value, StandardiReCoDeSComponent.DemandTypes.OPERATION_DEMAND.value]:
+            resources = getattr(component, STORED_TYPES[stored_type])[stored_type]
+            for resource_name, resource_object in resources.items():
+                view_class = RESOURCE_VIEW_CLASSES.get(type(resource_object))
+                if view_class is None:
+                    raise ValueError(f'Resource class {type(resource_object).__name__} of resource {resource_name} cannot be stored in the ResourceStore.')
+                resources[resource_name] = view_class(self, row_id, self.column_ids[(stored_type, resource_name)], resource_object)
+        component.resource_store = self
+        component.resource_store_row_id = row_id
+        self.update_recovery_demand(component)
+
+    def get_column_id(self, supply_or_demand_type: str, resource_name: str) -> int:
+        """
+        Get the column of the resource's supply or demand type. None if the resource is not in the store.
+        """
+        return self.column_ids.get((supply_or_demand_type, resource_name), None)
+
+    def get_row_ids(self, components: list[Component]) -> np.ndarray:
+        """
+        Get the rows of components.
+
+        Raises:
+            AttributeError: If a component is not bound to a store.
+        """
+        return np.fromiter((component.resource_store_row_id for component in components), dtype=int, count=len(components))
+
+    def get_current_amounts(self, row_ids: np.ndarray, supply_or_demand_type: str, resource_name: str) -> np.ndarray:
+        """
+        Get the current amounts of the resource's supply or demand type in rows row_ids. Amounts are zero if the resource is not in the store.
+        """
+        column_id = self.get_column_id(supply_or_demand_type, resource_name)
+        if column_id is None:
+            return np.zeros(len(row_ids))
+        return self.current_amounts[row_ids, column_id]
+
+    def get_amount_versions(self, row_ids: np.ndarray, supply_or_demand_type: str, resource_name: str) -> np.ndarray:
+        column_id = self.get_column_id(supply_or_demand_type, resource_name)
+        if column_id is None:
+            return np.zeros(len(row_ids), dtype=np.int64)
+        return self.amount_versions[row_ids, column_id]
+
+    def set_current_amounts(self, row_ids: np.ndarray, column_ids: np.ndarray, current_amounts: np.ndarray) -> None:
+        """
+        Set current amounts of resources in rows row_ids and columns column_ids, increasing the amount_version of resources whose amounts changed.
+        """
+        changed = self.current_amounts[row_ids, column_ids] != current_amounts
+        self.current_amounts[row_ids, column_ids] = current_amounts
+        self.amount_versions[row_ids[changed], column_ids[changed]] += 1
+
+    def update_recovery_demand(self, component: Component) -> None:
+        """
+        Copy the amounts of the component's current recovery demand to its row. Columns of resources that are no longer demanded are set to zero.
+        """
+        row_id = component.resource_store_row_id
+        recovery_demand_type = StandardiReCoDeSComponent.DemandTypes.RECOVERY_DEMAND.value
+        recovery_demand = {self.column_ids[(recovery_demand_type, resource_name)]: resource_object.current_amount
+                           for resource_name, resource_object in component.demand[recovery_demand_type].items()
+                           if (recovery_demand_type, resource_name) in self.column_ids}
+        for column_id in self.recovery_demand_columns[row_id]:
+            if column_id not in recovery_demand:
+                recovery_demand[column_id] = 0.0
+        for column_id, current_amount in recovery_demand.items():
+            if self.current_amounts[row_id, column_id] != current_amount:
+                self.current_amounts[row_id, column_id] = current_amount
+                self.amount_versions[row_id, column_id] += 1
+        self.recovery_demand_columns[row_id] = {column_id: current_amount for column_id, current_amount in recovery_demand.items() if current_amount != 0.0}
+
+class ResourceView:
+    """
+    | Mixin for resources whose initial amount, current amount and amount version are stored in a ResourceStore.
+    | Other attributes (e.g., name and relations) are stored in the object, as in the ConcreteResource.
+    """
+
+    def __init__(self, resource_store: ResourceStore, row_id: int, column_id: int, resource_object: ConcreteResource) -> None:
+        """
+        Create a view of the resource in row row_id and column column_id of the store, with the state of resource_object.
+        """
+        self.resource_store = resource_store
+        self.row_id = row_id
+        self.column_id = column_id
+        for attribute_name, value in get_attributes(resource_object).items():
+            setattr(self, attribute_name, value)
+
+    @property
+    def initial_amount(self) -> float:
+        return float(self.resource_store.initial_amounts[self.row_id, self.column_id])
+
+    @initial_amount.setter
+    def initial_amount(self, amount: float) -> None:
+        self.resource_store.initial_amounts[self.row_id, self.column_id] = amount
+
+    @property
+    def current_amount(self) -> float:
+        return float(self.resource_store.current_amounts[self.row_id, self.column_id])
+
+    @current_amount.setter
+    def current_amount(self, amount: float) -> None:
+        self.resource_store.current_amounts[self.row_id, self.column_id] = amount
+
+    @property
+    def amount_version(self) -> int:
+        return int(self.resource_store.amount_versions[self.row_id, self.column_id])
+
+    @amount_version.setter
+    def amount_version(self, amount_version: int) -> None:
+        self.resource_store.amount_versions[self.row_id, self.column_id] = amount_version
+
+class ConcreteResourceView(ResourceView, ConcreteResource):
+    """
+    ConcreteResource whose amounts are stored in a ResourceStore.
+    """
+
+class ConsumableResourceView(ResourceView, ConsumableResource):
+    """
+    ConsumableResource whose amounts are stored in a ResourceStore.
+    """
+
+# Resource classes that are replaced by views when components are bound to a ResourceStore.
+RESOURCE_VIEW_CLASSES = {ConcreteResource: ConcreteResourceView,
+                         ConsumableResource: ConsumableResourceView}
@@ -2,12 +2,73 @@ from pyrecodes.resource_distribution_model.resource_distribution_model import Re
 from abc import ABC, abstractmethod
 from pyrecodes.resource_distribution_model.concrete_resource_distribution_model_constructor import ConcreteResourceDistributionModelConstructor
 from pyrecodes.component.component import Component
+import contextlib
+import sys
+import math
+import threading
+
+class ThreadStdout:
+    """
+    | Replacement of sys.stdout that writes the output of each thread to the file set with redirect_thread_stdout, or to the original stdout if no file is set.
+    | Used instead of replacing sys.stdout, which is shared by all threads, so flow simulators that run concurrently can redirect their outputs.
+    """
+
+    def __init__(self, stdout) -> None:
+        self.stdout = stdout
+        self.thread_files = threading.local()
+        self.num_redirections = 0
+
+    def get_file(self):
+        return getattr(self.thread_files, 'file', None) or self.stdout
+
+    def write(self, text: str) -> int:
+        return self.get_file().write(text)
+
+    def flush(self) -> None:
+        self.get_file().flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self.get_file(), name)
+
+# Guards the installation of the ThreadStdout in sys.stdout. It is only held while sys.stdout is replaced, not while flow simulators run.
+THREAD_STDOUT_LOCK = threading.Lock()
+
+@contextlib.contextmanager
+def redirect_thread_stdout(file):
+    """
+    | Redirect the standard output of the current thread to file, like contextlib.redirect_stdout does for the whole process.
+    | The ThreadStdout is installed in sys.stdout while at least one thread redirects its output and the original sys.stdout is restored afterwards.
+    """
+    with THREAD_STDOUT_LOCK:
+        if not isinstance(sys.stdout, ThreadStdout):
+            sys.stdout = ThreadStdout(sys.stdout)
+        thread_stdout = sys.stdout
+        thread_stdout.num_redirections += 1
+    previous_file = getattr(thread_stdout.thread_files, 'file', None)
+    thread_stdout.thread_files.file = file
+    try:
+        yield file
+    finally:
+        thread_stdout.thread_files.file = previous_file
+        with THREAD_STDOUT_LOCK:
+            thread_stdout.num_redirections -= 1
+            if thread_stdout.num_redirections == 0 and sys.stdout is thread_stdout:
+                sys.stdout = thread_stdout.stdout
 
 class AbstractResourceDistributionModel(ResourceDistributionModel):
     """
     Abstract class for the Resource Distribution Model.
+
+    CONCURRENT_DISTRIBUTION is True for models whose distribution can run concurrently with distributions of other Independent Resources.
+    Such models redirect the outputs of their flow simulators with redirect_thread_stdout. Check out the IndependentResourceScheduler class for details.
+
+    STOCHASTIC_FLOW_SIMULATOR is True for models whose flow simulator outputs are random, so their outputs are only cached if requested explicitly.
+    Check out the SimCenterResourceDistributionModelConstructor class for details.
     """
 
+    CONCURRENT_DISTRIBUTION = False
+    STOCHASTIC_FLOW_SIMULATOR = False
+
     def __init__(self, resource_name: str, resource_parameters: dict, components: list[Component]):
         self.constructor = ConcreteResourceDistributionModelConstructor()
         self.constructor.construct(resource_name, resource_parameters, components, self)
@@ -30,6 +91,22 @@ class AbstractResourceDistributionModel(ResourceDistributionModel):
         | True if time step is in the distribution_time_steps list or if the list is empty - this implies that it was not specified by the user and the resource is distributed at each time step by default.
         """
         return time_step in self.distribution_time_steps or len(self.distribution_time_steps) == 0
+
+    def get_next_event_time_step(self, time_step: int) -> float:
+        """
+        | Get the next time step at which the distribution can differ from the distribution at time_step if components' supply and demand do not change.
+        | That is the next time step at which the model starts or stops distributing the resource, following the distribution_time_steps list.
+        | Used by the event-driven time advancement of the BuiltEnvironment.
+        """
+        if len(self.distribution_time_steps) == 0:
+            return math.inf
+        distribution_time_steps = set(self.distribution_time_steps)
+        next_time_step = time_step + 1
+        if time_step in distribution_time_steps:
+            while next_time_step in distribution_time_steps:
+                next_time_step += 1
+            return next_time_step
+        return min([distribution_time_step for distribution_time_step in distribution_time_steps if distribution_time_step > time_step], default=math.inf)
     
     def get_scope(self, scope='All') -> list:
         """
@@ -1,14 +1,21 @@
-from pyrecodes.resource_distribution_model.abstract_resource_distribution_model import AbstractResourceDistributionModel
+from pyrecodes.resource_distribution_model.abstract_resource_distribution_model import AbstractResourceDistributionModel, redirect_thread_stdout
 from pyrecodes.resource_distribution_model.residual_demand_traffic_distribution_model_constructor import ResidualDemandTrafficDistributionModelConstructor
 from pyrecodes.resource_distribution_model.spatial_resource_aggregator import SpatialResourceAggregator
+from pyrecodes.resource_distribution_model.simulation_result_cache import get_fingerprint, get_r2d_state
 from pyrecodes.component.component import Component
 from pyrecodes.component.r2d_component import R2DBuildingWithBusiness, R2DBuilding
 import math
 import os
+import numpy as np
 import pandas as pd
 
 class ResidualDemandTrafficDistributionModel(AbstractResourceDistributionModel):
 
+    # the model updates only its own state, so the traffic simulator can run while other simulators run
+    CONCURRENT_DISTRIBUTION = True
+    # trips are sampled randomly in the traffic assignment
+    STOCHASTIC_FLOW_SIMULATOR = True
+
     def __init__(self, resource_name: str, resource_parameters: dict, components: list[Component]):
         self.constructor = ResidualDemandTrafficDistributionModelConstructor()
         self.constructor.construct(resource_name, resource_parameters, components, self)
@@ -16,6 +23,7 @@ class ResidualDemandTrafficDistributionModel(AbstractResourceDistributionModel):
         self.spatial_resource_aggregator = SpatialResourceAggregator()
         self.travel_times = []
         self.travel_time_change_factors = []
+        self.travel_time_tables = []
         self.connect_buildings_to_traffic_nodes()
         self.od_trip_checker = ODTripChecker(resource_parameters['ODFilePre'])
 
@@ -38,19 +46,27 @@ class ResidualDemandTrafficDistributionModel(AbstractResourceDistributionModel):
         | Calculate travel times if the model is supposed to distribute traffic at this time step.
         | If not, append an empty list to the travel_times list to keep the length of the list consistent with the number of time steps.
         """
-        self.add_to_time_step_list(time_step, [self.travel_times, self.travel_time_change_factors])
+        self.add_to_time_step_list(time_step, [self.travel_times, self.travel_time_change_factors, self.travel_time_tables])
         if self.distribute_at_this_time_step(time_step):
             self.update_r2d_dict()
             self.distribute_traffic(time_step)
 
     def add_to_time_step_list(self, time_step: int, list_of_lists: list[list]) -> None:
         """
-        | Add an empty list to the list_of_lists if the time_step is not already in the list.
-        | This is done to keep the length of the list consistent with the number of time steps.
+        | Add empty lists to the list_of_lists until the time_step is in the list.
+        | This is done to keep the length of the list consistent with the number of time steps, also when the event-driven time advancement skips time steps.
         """
         for list in list_of_lists:
-            if len(list) <= time_step:
-                list.append([])   
+            while len(list) <= time_step:
+                list.append([])
+
+    def get_next_event_time_step(self, time_step: int) -> float:
+        """
+        Extend the parent method. If distribution time steps are not defined, travel times are calculated at each time step, so the model is distributed at each time step.
+        """
+        if len(self.distribution_time_steps) == 0:
+            return time_step + 1
+        return super().get_next_event_time_step(time_step)
 
     def find_nearest_distribution_time_step(self, time_step: int) -> int:
         # Assuming self.distribution_time_steps is a sorted list of time steps
@@ -59,30 +75,68 @@ class ResidualDemandTrafficDistributionModel(AbstractResourceDistributionModel):
     def update_r2d_dict(self):
         """
         | Method to update the r2d_dict based on the current state of the components.
-        | At the moment, the r2d_dict is created from scratch at each time step. Not efficient, optimize later.
+        | The r2d_dict is created once and references components' data, so it is only updated where components replaced their data.
+        | r2d_change_set holds (asset type, asset subtype, AIM id) of assets whose data changed since the previous update, for simulators that can use changes only.
         """
-        self.r2d_dict = self.constructor.create_r2d_dict(self.components)
+        self.r2d_dict, self.r2d_change_set = self.constructor.update_r2d_dict(self.components)
 
     def distribute_traffic(self, time_step: int) -> None:
         """
         | Run the traffic simulator to calculate travel times.
-        | Supress output to the console from low-level libraries.
-        """
-        with open(os.devnull, 'w') as devnull:
-            original_stdout_fd = os.dup(1) 
-            try:
-                os.dup2(devnull.fileno(), 1) 
-                self.travel_times[time_step] = self.flow_simulator.simulate(self.r2d_dict)
-            finally:
-                os.dup2(original_stdout_fd, 1)  
-                os.close(original_stdout_fd) 
+        | If the result cache is defined, the traffic simulator is not run for states of roads and buildings that were already simulated.
+        | The first simulation sets the initial state of the traffic simulator, so it is always run.
+        | The result cache is only defined if CacheStochasticResults is set, as traffic simulator outputs are random, see SimCenterResourceDistributionModelConstructor.create_result_cache.
+        """
+        self.set_od_matrix()
+        if self.result_cache is None:
+            self.travel_times[time_step] = self.run_flow_simulator()
+        elif self.flow_simulator.initial_r2d_dict is None:
+            # trips of later simulations are updated from the initial OD matrix and R2D dictionary, so their outputs depend on the initial state as well
+            self.initial_state_fingerprint = get_fingerprint(get_r2d_state(self.r2d_dict), self.flow_simulator.od_pre)
+            self.travel_times[time_step] = self.run_flow_simulator()
+            self.result_cache.set(self.get_result_cache_key(), self.travel_times[time_step])
+        else:
+            self.travel_times[time_step] = self.result_cache.get_or_compute(self.get_result_cache_key(), self.run_flow_simulator, self.replay_flow_simulator_side_effects)
         self.get_travel_time_change(time_step)
+        self.travel_time_tables[time_step] = TravelTimeTable(self.travel_times[time_step], self.travel_time_change_factors[time_step])
+
+    def run_flow_simulator(self) -> pd.DataFrame:
+        """
+        | Run the traffic simulator with the current R2D dictionary.
+        | Supress output to the console. The output of the current thread is redirected (see redirect_thread_stdout), so the simulator can run concurrently with other flow simulators.
+        | Console output of the pandana routing backend is suppressed by the backend.
+        """
+        with open(os.devnull, 'w') as devnull, redirect_thread_stdout(devnull):
+            return self.flow_simulator.simulate(self.r2d_dict)
+
+    def replay_flow_simulator_side_effects(self, travel_times: pd.DataFrame) -> None:
+        """
+        | Update the traffic simulator's state as if it simulated the cached travel times, i.e., count the simulation.
+        """
+        self.flow_simulator.simulate_time += 1
+
+    def get_result_cache_key(self) -> str:
+        return self.result_cache.get_key(self.initial_state_fingerprint, get_r2d_state(self.r2d_dict))
+
+    def set_od_matrix(self) -> None:
+        """
+        | Pass the OD matrix with trips added by the ODTripChecker to the flow simulator, so that the OD matrix file does not have to be written and read again.
+        | The OD matrix file is updated only if SaveODMatrix is True in the resource parameters.
+        """
+        self.flow_simulator.od_pre = self.od_trip_checker.get_od_matrix()
+        if self.save_od_matrix:
+            self.od_trip_checker.save_od_matrix()
 
     def get_travel_time_change(self, time_step: int) -> None:
-        for agent_pre_disaster, agent_now in zip(self.travel_times[0].iterrows(), self.travel_times[-1].iterrows()):
-            travel_time_change_factor = agent_now[1]['travel_time_used'] / agent_pre_disaster[1]['travel_time_used']
-            self.travel_time_change_factors[time_step].append({'agent_id': agent_pre_disaster[1]['agent_id'], 'origin_nid': agent_pre_disaster[1]['origin_nid'], 
-                                            'stop_nid': agent_pre_disaster[1]['stop_nid'], 'travel_time_change': travel_time_change_factor})
+        """
+        | Calculate the ratio between the current and the pre-disaster travel time of each agent at time_step.
+        | Agents are matched with their pre-disaster trips by agent_id. The ratios are stored as an array aligned with the rows of travel_times[time_step].
+        | Agents without a pre-disaster trip (e.g., trips added to the OD matrix after the first traffic distribution) get NaN.
+        """
+        current_travel_times = self.travel_times[time_step]
+        pre_disaster_travel_times = self.travel_times[0].drop_duplicates('agent_id').set_index('agent_id')['travel_time_used']
+        self.travel_time_change_factors[time_step] = (current_travel_times['travel_time_used'].to_numpy(dtype=float) /
+                                                      current_travel_times['agent_id'].map(pre_disaster_travel_times).to_numpy(dtype=float))
 
     # def update_buildings_traffic_situation(self) -> None:
     #     """
@@ -127,19 +181,73 @@ class ResidualDemandTrafficDistributionModel(AbstractResourceDistributionModel):
         """
         if scope == 'All':
             if len(self.travel_times[-1]) > 0:
-                completed_trips = 0
-                for travel_time_change in self.travel_time_change_factors[-1]:
-                    if travel_time_change['travel_time_change'] <= self.TRIP_CUTOFF_THRESHOLD:
-                        completed_trips += 1
-                return completed_trips
+                return int(np.count_nonzero(self.travel_time_change_factors[-1] <= self.TRIP_CUTOFF_THRESHOLD))
             else:
                 return 0
         else:
             raise ValueError("Scope not implemented. Only 'All' is supported.")
 
+class TravelTimeTable:
+    """
+    | Travel times of the trips simulated in a single traffic distribution, used for fast lookups of trips between traffic nodes.
+    | Trips are indexed by their origin and destination nodes. If several trips have the same origin and destination nodes, the first one is used.
+
+    Attributes:
+        | trip_rows (dict): Maps (origin_nid, destin_nid) tuples to rows in the travel times table.
+        | travel_time_used (np.ndarray): Travel time of each trip.
+        | travel_time_change (np.ndarray): Ratio between the current and the pre-disaster travel time of each trip.
+
+    """
+
+    def __init__(self, travel_times: pd.DataFrame, travel_time_change_factors: np.ndarray):
+        self.travel_time_used = travel_times['travel_time_used'].to_numpy(dtype=float)
+        self.travel_time_change = np.asarray(travel_time_change_factors, dtype=float)
+        self.trip_rows = {}
+        for row, trip in enumerate(zip(travel_times['origin_nid'].tolist(), travel_times['destin_nid'].tolist())):
+            self.trip_rows.setdefault((int(trip[0]), int(trip[1])), row)
+
+    def get_trip_row(self, origin_node, destin_node, bidirectional: bool = True) -> int:
+        """
+        Get the row of the trip from origin_node to destin_node. If bidirectional, the trip from destin_node to origin_node is also considered and the first trip in the table is returned.
+
+        Returns:
+            int: Row of the trip in the travel times table, or -1 if the trip is not found or node IDs are not integers.
+        """
+        try:
+            origin_node, destin_node = int(origin_node), int(destin_node)
+        except ValueError:
+            print(f"Warning: Could not convert node IDs to integers: {origin_node}, {destin_node}")
+            return -1
+        rows = [self.trip_rows.get((origin_node, destin_node), -1)]
+        if bidirectional:
+            rows.append(self.trip_rows.get((destin_node, origin_node), -1))
+        rows = [row for row in rows if row >= 0]
+        return min(rows) if len(rows) > 0 else -1
+
+    def get_trip_rows(self, origin_node, destin_nodes: list, bidirectional: bool = True) -> np.ndarray:
+        """
+        Get rows of trips from origin_node to each of the destin_nodes. Missing trips have row -1.
+        """
+        return np.asarray([self.get_trip_row(origin_node, destin_node, bidirectional) for destin_node in destin_nodes], dtype=int)
+
 class ODTripChecker:
+    """
+    | Keeps the OD matrix of the traffic simulator and adds trips that are missing from it (e.g., trips of business employees and suppliers).
+    | Trips are indexed by their origin and destination nodes, so checking whether a trip exists does not scan the OD matrix.
+    | Added trips are buffered and appended to the OD matrix at once when the OD matrix is requested. The OD matrix file is only written by save_od_matrix.
+
+    Attributes:
+        | od_matrix_filename (str): The OD matrix file.
+        | od_matrix (pd.DataFrame): The OD matrix, without buffered trips.
+        | trips (set): (origin_nid, destin_nid) tuples of all trips, including buffered trips.
+        | new_trips (dict): Buffered trips, with OD matrix column names as keys and lists of values.
+        | od_matrix_saved (bool): True if the OD matrix file contains all trips.
+
+    """
 
     BIG_NUMBER = 10e6
+    NEW_TRIP_HOUR = 7
+    NEW_TRIP_QUARTER = 0
 
     def __init__(self, od_matrix_filename: str):
         self.od_matrix_filename = od_matrix_filename
@@ -147,14 +255,18 @@ class ODTripChecker:
         # Ensure node IDs are integers to avoid dtype mismatch errors
         self.od_matrix['origin_nid'] = self.od_matrix['origin_nid'].astype('int64')
         self.od_matrix['destin_nid'] = self.od_matrix['destin_nid'].astype('int64')
+        self.trips = set(zip(self.od_matrix['origin_nid'].tolist(), self.od_matrix['destin_nid'].tolist()))
+        self.new_trips = {'agent_id': [], 'origin_nid': [], 'destin_nid': [], 'tour_category': []}
+        self.od_matrix_saved = True
     
     def add_to_od_matrix(self, origin_node: str, stop_node: str, tour_category: str = 'CONSTANT') -> None:
-        agent_id = len(self.od_matrix) + self.BIG_NUMBER # add a large number to avoid duplicates
-        new_row = pd.DataFrame({'agent_id': [int(agent_id)], 'origin_nid': [int(origin_node)], 'destin_nid': [int(stop_node)], 'hour': [7], 'quarter': [0], 'tour_category': [tour_category], 'person_id': [int(agent_id)]})
-        self.od_matrix = pd.concat([self.od_matrix, new_row], ignore_index=True)
-        # self.od_matrix['origin_nid'] = self.od_matrix['origin_nid'].astype('int64')
-        # self.od_matrix['destin_nid'] = self.od_matrix['destin_nid'].astype('int64')
-        self.od_matrix.to_csv(self.od_matrix_filename, index=False)
+        agent_id = len(self.od_matrix) + len(self.new_trips['agent_id']) + self.BIG_NUMBER # add a large number to avoid duplicates
+        self.new_trips['agent_id'].append(int(agent_id))
+        self.new_trips['origin_nid'].append(int(origin_node))
+        self.new_trips['destin_nid'].append(int(stop_node))
+        self.new_trips['tour_category'].append(tour_category)
+        self.trips.add((int(origin_node), int(stop_node)))
+        self.od_matrix_saved = False
 
     def check_trip_in_od_matrix(self, origin_node_id: int, destin_node_id: int) -> bool:
         """
@@ -167,8 +279,24 @@ class ODTripChecker:
         Returns:
             bool: True if the trip exists, False otherwise
         """
-        trip_exists = ((self.od_matrix['origin_nid'] == int(origin_node_id)) & 
-                      (self.od_matrix['destin_nid'] == int(destin_node_id))).any()
-        
-        return trip_exists
-        
+        return (int(origin_node_id), int(destin_node_id)) in self.trips
+
+    def get_od_matrix(self) -> pd.DataFrame:
+        """
+        Get the OD matrix, including the added trips.
+        """
+        if len(self.new_trips['agent_id']) > 0:
+            new_trips = pd.DataFrame({'agent_id': self.new_trips['agent_id'], 'origin_nid': self.new_trips['origin_nid'],
+                                      'destin_nid': self.new_trips['destin_nid'], 'hour': self.NEW_TRIP_HOUR, 'quarter': self.NEW_TRIP_QUARTER,
+                                      'tour_category': self.new_trips['tour_category'], 'person_id': self.new_trips['agent_id']})
+            self.od_matrix = pd.concat([self.od_matrix, new_trips], ignore_index=True)
+            self.new_trips = {column: [] for column in self.new_trips}
+        return self.od_matrix
+
+    def save_od_matrix(self) -> None:
+        """
+        Write the OD matrix to the OD matrix file, if trips were added since it was last saved.
+        """
+        if not self.od_matrix_saved:
+            self.get_od_matrix().to_csv(self.od_matrix_filename, index=False)
+            self.od_matrix_saved = True
@@ -8,6 +8,7 @@ class ResidualDemandTrafficDistributionModelConstructor(SimCenterResourceDistrib
     def construct(self, resource_name: str, resource_parameters: dict, components: list[Component], distribution_model: ResourceDistributionModel):
         super().construct(resource_name, resource_parameters, components, distribution_model)
         distribution_model.TRIP_CUTOFF_THRESHOLD = resource_parameters['TripCutoffThreshold']
+        distribution_model.save_od_matrix = resource_parameters.get('SaveODMatrix', False)
         distribution_model.flow_simulator = transportation.pyrecodes_residual_demand(
             resource_parameters['EdgeFile'], resource_parameters['NodeFile'],
             resource_parameters['ODFilePre'], resource_parameters['HourList'], 
@@ -15,5 +16,6 @@ class ResidualDemandTrafficDistributionModelConstructor(SimCenterResourceDistrib
             resource_parameters['CapacityRuleset'], resource_parameters['DemandRuleset'],
             self.r2d_dict,
             resource_parameters['TwoWayEdges'],
+            resource_parameters.get('RoutingBackend', 'csr'),
         )
         distribution_model.r2d_dict = self.r2d_dict
@@ -5,6 +5,7 @@ from pyrecodes.component.r2d_component import R2DBuilding
 from pyrecodes.resource_distribution_model.abstract_resource_distribution_model import AbstractResourceDistributionModel
 from pyrecodes.resource_distribution_model.rewet_distribution_model_constructor import REWETDistributionModelConstructor
 from pyrecodes.resource_distribution_model.spatial_resource_aggregator import SpatialResourceAggregator
+from pyrecodes.resource_distribution_model.simulation_result_cache import get_r2d_state
 from pyrecodes.component.component import SupplyOrDemand
 
 class REWETDistributionModel(AbstractResourceDistributionModel):
@@ -12,6 +13,9 @@ class REWETDistributionModel(AbstractResourceDistributionModel):
     | Class that connects pyrecodes with the REWET water flow simulator.
     """
 
+    # the model updates its own state and buildings that demand water, so REWET can run while other simulators run
+    CONCURRENT_DISTRIBUTION = True
+
     def __init__(self, resource_name: str, resource_parameters: dict, components: list[Component]):
         self.constructor = REWETDistributionModelConstructor()
         self.constructor.construct(resource_name, resource_parameters, components, self)
@@ -24,12 +28,21 @@ class REWETDistributionModel(AbstractResourceDistributionModel):
             self.met_demand_per_building = self.distribute_water(time_step)
             self.update_buildings_met_demand(time_step)
 
+    def get_next_event_time_step(self, time_step: int) -> float:
+        """
+        Extend the parent method. If the water network has time-varying demand patterns, REWET results change with the time of day, so the model is distributed at each time step.
+        """
+        if self.flow_simulator.demand_pattern_cycle != 0:
+            return time_step + 1
+        return super().get_next_event_time_step(time_step)
+
     def update_r2d_dict(self):
         """
         | Method to update the r2d_dict based on the current state of the components.
-        | At the moment, the r2d_dict is created from scratch at each time step. Not efficient, optimize later.
+        | The r2d_dict is created once and references components' data, so it is only updated where components replaced their data.
+        | r2d_change_set holds (asset type, asset subtype, AIM id) of assets whose data changed since the previous update, for simulators that can use changes only.
         """
-        self.r2d_dict = self.constructor.create_r2d_dict(self.components)
+        self.r2d_dict, self.r2d_change_set = self.constructor.update_r2d_dict(self.components)
 
     def distribute_water(self, time_step: int) -> None:
         """
@@ -37,11 +50,31 @@ class REWETDistributionModel(AbstractResourceDistributionModel):
         | Returns a dictionary with the met demand for each building.
         | REWET outputs met demand ratios slightly higher than 1.0 and lower than 0.0, this is normalized to the [0, 1] range.
         """
-        met_demand_per_building = self.flow_simulator.system_performance(self.r2d_dict, current_time=time_step*SECONDS_IN_TIME_STEP, next_time=(time_step+1)*SECONDS_IN_TIME_STEP)
+        met_demand_per_building = self.simulate_water_flow(time_step)
         for building in met_demand_per_building.keys():
             met_demand_per_building[building] = max(0.0, min(1.0, met_demand_per_building[building]))
         return met_demand_per_building
     
+    def simulate_water_flow(self, time_step: int) -> dict:
+        """
+        | Run REWET to get the met demand for each building.
+        | If the result cache is defined, REWET is not run for damage and demand states that were already simulated at the same time within the water network's demand patterns.
+        | On cache hits, the damage state of the time step and the building satisfaction are set in the flow simulator, as if REWET was run.
+        | REWET writes its output of the current thread to its log file (see redirect_thread_stdout), so it can run concurrently with other flow simulators.
+        """
+        def run_flow_simulator():
+            return self.flow_simulator.system_performance(self.r2d_dict, current_time=time_step*SECONDS_IN_TIME_STEP, next_time=(time_step+1)*SECONDS_IN_TIME_STEP)
+
+        def replay_flow_simulator_side_effects(building_satisfaction: dict):
+            self.flow_simulator.set_damage_state(self.r2d_dict, time_step*SECONDS_IN_TIME_STEP)
+            self.flow_simulator.building_satisfaction = building_satisfaction
+
+        if self.result_cache is None:
+            return run_flow_simulator()
+        pattern_time = self.flow_simulator.get_demand_pattern_time(time_step*SECONDS_IN_TIME_STEP)
+        return self.result_cache.get_or_compute(self.result_cache.get_key(pattern_time, get_r2d_state(self.r2d_dict)), run_flow_simulator,
+                                                replay_flow_simulator_side_effects)
+
     def update_buildings_met_demand(self, time_step: int) -> None:
         """
         | Update supply of buildings based on their met demand for water.
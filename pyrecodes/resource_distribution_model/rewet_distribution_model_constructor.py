@@ -1,6 +1,7 @@
 from rewet_API import rewet_pyrecodes_api
 from pyrecodes.resource_distribution_model.simcenter_resource_distribution_model_constructor import SimCenterResourceDistributionModelConstructor
 from pyrecodes.resource_distribution_model.resource_distribution_model import ResourceDistributionModel
+from pyrecodes.resource_distribution_model.abstract_resource_distribution_model import redirect_thread_stdout
 from pyrecodes.component.component import Component
 
 class REWETDistributionModelConstructor(SimCenterResourceDistributionModelConstructor):
@@ -11,5 +12,7 @@ class REWETDistributionModelConstructor(SimCenterResourceDistributionModelConstr
                                                                                resource_name,
                                                                                resource_parameters['INPFile'],
                                                                                result_dir=resource_parameters['Results_folder'],
-                                                                               temp_dir=resource_parameters['Temp_folder'])
-        distribution_model.r2d_dict = self.create_r2d_dict(components)
+                                                                               temp_dir=resource_parameters['Temp_folder'],
+                                                                               persistent_session=resource_parameters.get('PersistentSession', False),
+                                                                               redirect_stdout=redirect_thread_stdout)
+        distribution_model.r2d_dict = self.r2d_dict
@@ -1,17 +1,60 @@
 from pyrecodes.resource_distribution_model.concrete_resource_distribution_model_constructor import ConcreteResourceDistributionModelConstructor
+from pyrecodes.resource_distribution_model.simulation_result_cache import SimulationResultCache, get_fingerprint
+from pyrecodes.component.r2d_component import R2DComponent
 
 class SimCenterResourceDistributionModelConstructor(ConcreteResourceDistributionModelConstructor):
      
     def construct(self, resource_name, resource_parameters, components, distribution_model):
         super().construct(resource_name, resource_parameters, components, distribution_model)
         self.create_r2d_dict(components)
+        distribution_model.result_cache = self.create_result_cache(resource_name, resource_parameters, distribution_model.STOCHASTIC_FLOW_SIMULATOR)
+
+    def create_result_cache(self, resource_name: str, resource_parameters: dict, stochastic_flow_simulator: bool = False) -> SimulationResultCache:
+        """
+        Create the cache of the infrastructure simulator's outputs, if ResultCache is defined in the resource parameters, e.g.:
+
+        "ResultCache": {"MaxSize": 32, "Directory": "./result_cache", "MaxDiskEntries": 256}
+
+        Directory and MaxDiskEntries are optional and define the on-disk cache shared between realizations of the resilience assessment.
+        Keys of cached outputs include the resource parameters and the initial R2D dictionary, so outputs are only shared between realizations of the same system.
+
+        Outputs of stochastic flow simulators (e.g., the residual demand traffic simulator samples trips) are cached only if CacheStochasticResults is true:
+
+        "ResultCache": {"MaxSize": 32, "CacheStochasticResults": true}
+
+        In that case, the first output simulated for a state is reused whenever the state repeats, also in other realizations that share the cache directory,
+        so the variability of the simulator's outputs is not propagated to the resilience assessment.
+
+        Args:
+            resource_name (str): Name of the resource.
+            resource_parameters (dict): Parameters of the resource.
+            stochastic_flow_simulator (bool, optional): True if the flow simulator's outputs are random. Defaults to False.
+
+        Returns:
+            SimulationResultCache: The result cache, or None if ResultCache is not defined or the flow simulator is stochastic and CacheStochasticResults is not true.
+        """
+        cache_parameters = resource_parameters.get('ResultCache', None)
+        if cache_parameters is None:
+            return None
+        if stochastic_flow_simulator and not cache_parameters.get('CacheStochasticResults', False):
+            return None
+        return SimulationResultCache(namespace=get_fingerprint(resource_name, resource_parameters, self.r2d_dict),
+                                     max_size=cache_parameters.get('MaxSize', 32),
+                                     cache_directory=cache_parameters.get('Directory', None),
+                                     max_disk_entries=cache_parameters.get('MaxDiskEntries', 256))
 
     def create_r2d_dict(self, components):
         """
         Create a dictionary that follows the structure of the R2D JSON files used as inputs for the resource distribution simulators implemented by the SimCenter.
 
+        The dictionary references components' data, so it does not have to be created again when components change, see update_r2d_dict.
+        R2DComponent objects add their (asset type, asset subtype, AIM id) to the r2d_changes set when their data changes. All components are in the set after the dictionary is created.
         """
+        self.stop_tracking_r2d_changes()
         self.r2d_dict = {}
+        self.r2d_dict_components = components
+        self.r2d_dict_entries = []
+        self.r2d_changes = set()
 
         for component in components:
             component_type = getattr(component, 'asset_type', None)
@@ -23,7 +66,38 @@ class SimCenterResourceDistributionModelConstructor(ConcreteResourceDistribution
             if hasattr(component, 'r2d_dict_getter'):
                 component_r2d_dict = component.r2d_dict_getter.get_dict()
                 self.r2d_dict[component_type][component_subtype][component.aim_id] = component_r2d_dict
+                self.r2d_dict_entries.append((component, component_r2d_dict))
+                if isinstance(component, R2DComponent):
+                    component.r2d_change_sets.append(self.r2d_changes)
+                self.r2d_changes.add((component_type, component_subtype, component.aim_id))
         return self.r2d_dict
 
+    def update_r2d_dict(self, components) -> tuple[dict, set]:
+        """
+        Update the R2D dictionary to the current state of the components and get the change set, i.e., (asset type, asset subtype, AIM id) of assets whose data changed since the previous update.
+        Components' data is referenced from the dictionary, so only references to data that components replaced are updated.
+        The dictionary is created again if the list of components changed.
+
+        Returns:
+            tuple[dict, set]: The R2D dictionary and the change set.
+        """
+        if components is not self.r2d_dict_components:
+            self.create_r2d_dict(components)
+        for component, component_r2d_dict in self.r2d_dict_entries:
+            if component.r2d_dict_getter.update_dict(component_r2d_dict):
+                self.r2d_changes.add((component.asset_type, component.asset_subtype, component.aim_id))
+        change_set = set(self.r2d_changes)
+        # components keep a reference to the r2d_changes set, so it is cleared instead of replaced
+        self.r2d_changes.clear()
+        return self.r2d_dict, change_set
+
+    def stop_tracking_r2d_changes(self) -> None:
+        """
+        Remove the r2d_changes set from the change sets of components referenced by the current R2D dictionary.
+        """
+        for component, _ in getattr(self, 'r2d_dict_entries', []):
+            if isinstance(component, R2DComponent):
+                component.r2d_change_sets[:] = [change_set for change_set in component.r2d_change_sets if change_set is not self.r2d_changes]
+
         
 
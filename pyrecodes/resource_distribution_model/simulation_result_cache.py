@@ -0,0 +1,192 @@
+"""
+Module used to reuse outputs of SimCenter infrastructure simulators (e.g., REWET, residual demand) when the state of the infrastructure repeats.
+"""
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+import copy
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Keys of the components' general information in the R2D dictionary that change during the resilience assessment.
+R2D_STATE_KEYS = ['Status', 'FunctionalityLevel', 'PopulationRatio', 'OperationDemand', 'RecoveryDemand']
+
+# Marks outputs that are not in the cache, so that None outputs can be cached as well.
+MISSING = object()
+
+def to_hashable(value):
+    """
+    Convert numpy and pandas values in (nested) lists and dicts to values that json can serialize. Pandas objects are replaced by hashes of their content.
+    """
+    if isinstance(value, pd.DataFrame):
+        return [list(map(str, value.columns)), pd.util.hash_pandas_object(value).to_numpy().tolist()]
+    elif isinstance(value, pd.Series):
+        return [str(value.name), pd.util.hash_pandas_object(value).to_numpy().tolist()]
+    elif isinstance(value, np.ndarray):
+        return value.tolist()
+    elif isinstance(value, np.generic):
+        return value.item()
+    else:
+        return str(value)
+
+def get_fingerprint(*values) -> str:
+    """
+    Get a stable hash of values. Values are (nested) dicts and lists, as in the R2D dictionary, or pandas objects.
+
+    Returns:
+        str: SHA-256 hash of the values. Equal values have equal hashes in all processes.
+    """
+    serialized_values = json.dumps(values, sort_keys=True, default=to_hashable)
+    return hashlib.sha256(serialized_values.encode('utf-8')).hexdigest()
+
+def get_r2d_state(r2d_dict: dict) -> dict:
+    """
+    Get the part of the R2D dictionary that changes during the resilience assessment: damage and the R2D_STATE_KEYS of each asset's general information.
+    """
+    r2d_state = {}
+    for asset_type, asset_type_dict in r2d_dict.items():
+        for asset_subtype, assets in asset_type_dict.items():
+            r2d_state[f'{asset_type}/{asset_subtype}'] = {
+                asset_id: [asset.get('Damage', {})] + [asset['GeneralInformation'].get(key) for key in R2D_STATE_KEYS]
+                for asset_id, asset in assets.items()}
+    return r2d_state
+
+class SimulationResultCache:
+    """
+    | Least recently used (LRU) cache of infrastructure simulator outputs, keyed by fingerprints of the infrastructure state.
+    | Outputs are kept in memory and, optionally, in a cache directory, so that processes running different realizations of the resilience assessment
+    | (e.g., in a MonteCarloRunner) can reuse each other's outputs. Each output is stored in the directory as a pickle file named by its key.
+    | Files are written atomically and the least recently used files are removed when there are more than max_disk_entries files in the directory.
+    | Cached outputs are copied when they are stored and retrieved, so callers can modify them.
+    | Only the outputs are cached. Changes that a simulator makes to its own state while computing an output are not repeated on cache hits,
+    | unless the caller replays them (see get_or_compute).
+    | Outputs of stochastic simulators are reused for all repetitions of the state, i.e., a single random outcome is cached for each state.
+
+    Attributes:
+        | namespace (str): Fingerprint of the data that does not change during the resilience assessment (e.g., simulator inputs), included in all keys.
+        | max_size (int): Maximum number of outputs kept in memory.
+        | cache_directory (Path): Directory of the on-disk cache. None if outputs are only kept in memory.
+        | max_disk_entries (int): Maximum number of outputs kept in the cache directory.
+        | results (OrderedDict): Outputs kept in memory, from the least to the most recently used.
+        | hits (int): Number of outputs found in the cache.
+        | misses (int): Number of outputs not found in the cache.
+
+    """
+
+    FILE_SUFFIX = '.pkl'
+
+    def __init__(self, namespace: str = '', max_size: int = 32, cache_directory: str = None, max_disk_entries: int = 256):
+        self.namespace = namespace
+        self.max_size = max_size
+        self.max_disk_entries = max_disk_entries
+        self.cache_directory = None
+        if cache_directory is not None:
+            self.cache_directory = Path(cache_directory)
+            self.cache_directory.mkdir(parents=True, exist_ok=True)
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_key(self, *state) -> str:
+        """
+        Get the key of the output for the state, e.g., the R2D state returned by get_r2d_state.
+        """
+        return get_fingerprint(self.namespace, *state)
+
+    def get(self, key: str, default=None):
+        """
+        Get a copy of the output stored under the key, or default if the output is not in the cache.
+        """
+        if key in self.results:
+            self.results.move_to_end(key)
+            result = self.results[key]
+        else:
+            result = self.read_from_disk(key)
+            if result is MISSING:
+                self.misses += 1
+                return default
+            self.add_to_memory(key, result)
+        self.hits += 1
+        return copy.deepcopy(result)
+
+    def set(self, key: str, result) -> None:
+        """
+        Store a copy of the output under the key.
+        """
+        result = copy.deepcopy(result)
+        self.add_to_memory(key, result)
+        self.write_to_disk(key, result)
+
+    def get_or_compute(self, key: str, compute_result: Callable, replay_side_effects: Callable = None):
+        """
+        Get the output stored under the key. If it is not in the cache, compute it by calling compute_result and store it.
+
+        Args:
+            key (str): The key of the output.
+            compute_result (Callable): Function that computes the output, e.g., by running the simulator.
+            replay_side_effects (Callable, optional): Function called with the cached output on cache hits,
+                to make the changes to the simulator's state that compute_result would make. Defaults to None.
+
+        Returns:
+            The output stored under the key.
+        """
+        result = self.get(key, MISSING)
+        if result is MISSING:
+            result = compute_result()
+            self.set(key, result)
+        elif replay_side_effects is not None:
+            replay_side_effects(result)
+        return result
+
+    def add_to_memory(self, key: str, result) -> None:
+        self.results[key] = result
+        self.results.move_to_end(key)
+        while len(self.results) > self.max_size:
+            self.results.popitem(last=False)
+
+    def get_file_path(self, key: str) -> Path:
+        return self.cache_directory / f'{key}{self.FILE_SUFFIX}'
+
+    def read_from_disk(self, key: str):
+        """
+        Read the output stored under the key from the cache directory. Returns MISSING if the file does not exist or can not be read.
+        """
+        if self.cache_directory is None:
+            return MISSING
+        file_path = self.get_file_path(key)
+        try:
+            with open(file_path, 'rb') as file:
+                result = pickle.load(file)
+            # file modification times are used to find the least recently used outputs
+            os.utime(file_path)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return MISSING
+        return result
+
+    def write_to_disk(self, key: str, result) -> None:
+        """
+        Write the output to the cache directory and remove the least recently used files if there are more than max_disk_entries files.
+        """
+        if self.cache_directory is None:
+            return
+        with tempfile.NamedTemporaryFile('wb', dir=self.cache_directory, suffix='.tmp', delete=False) as file:
+            pickle.dump(result, file)
+        os.replace(file.name, self.get_file_path(key))
+        self.remove_least_recently_used_files()
+
+    def remove_least_recently_used_files(self) -> None:
+        file_paths = []
+        for file_path in self.cache_directory.glob(f'*{self.FILE_SUFFIX}'):
+            try:
+                file_paths.append((file_path.stat().st_mtime, file_path))
+            except OSError:
+                # removed by another process
+                continue
+        file_paths.sort()
+        for _, file_path in file_paths[:max(0, len(file_paths) - self.max_disk_entries)]:
+            file_path.unlink(missing_ok=True)
@@ -1,24 +1,36 @@
 from pyrecodes.component.component import Component
 from pyrecodes.component.standard_irecodes_component import StandardiReCoDeSComponent
 from pyrecodes.component.component import SupplyOrDemand
+from pyrecodes.resource.resource_store import ResourceStore, get_resource_store
 import numpy as np
 
 class SingleResourceSystemMatrixCreator():
     """
-    Class to create the system matrix for a single resource used by the utility distribution model.
+    | Class to create the system matrix for a single resource used by the utility distribution model.
+    | Locality columns are filled once. When the system matrix is filled again, only the rows in changed_rows are updated.
+    | Components add their rows to changed_rows when the amount of their supply, operation demand or recovery demand resource changes
+    or when the resource object is replaced (see StandardiReCoDeSComponent.add_resource_change_set), so rows of unchanged components are not read.
+    Components that do not notify the system matrix creator are read in every fill.
+    | If components are bound to a ResourceStore, amount versions and amounts of all components are read from the store's columns at once,
+    as the store updates amounts without notifying the resources.
     """
     
     components: list[Component]
     matrix: np.ndarray
+    changed_rows: set
+    polled_rows: list
     NUM_COLUMN_SETS = 5  # start_locality/end_locality/supply/demand/demand_met
     ROWS_PER_COMPONENT = 2  # operation demand/recovery demand
 
     def __init__(self, components: list[Component], resource_name: str):
         self.components = components
         self.resource_name = resource_name
+        self.resource_store = None
         self.RECOVERY_DEMAND_ROW_OFFSET = len(components)
+        self.bind_components()
         self.set_system_matrix_column_ids()
         self.initialize_system_matrix()
+        self.fill_locality_columns()
 
     def set_system_matrix_column_ids(self):
         self.START_LOCALITY_COL_ID = 0
@@ -30,6 +42,27 @@ class SingleResourceSystemMatrixCreator():
     def initialize_system_matrix(self):
         self.matrix = np.zeros((self.calculate_num_rows_in_system_matrix(),
                                 self.calculate_num_columns_in_system_matrix()))
+        self.reset_filled_resource_states()
+
+    def bind_components(self) -> None:
+        """
+        Create the set of changed rows and add it to the components, so they add their rows to it when their resources change.
+        """
+        self.changed_rows = set()
+        self.polled_rows = []
+        for row, component in enumerate(self.components):
+            if hasattr(component, 'add_resource_change_set'):
+                component.add_resource_change_set(self.resource_name, self.changed_rows, row)
+            else:
+                self.polled_rows.append(row)
+
+    def reset_filled_resource_states(self) -> None:
+        """
+        Mark all rows as changed, so that all rows, including the locality columns, are filled in the next fill_system_matrix call.
+        """
+        self.changed_rows.update(range(len(self.components)))
+        self.filled_amount_versions = None
+        self.locality_columns_filled = False
 
     def calculate_num_rows_in_system_matrix(self):
         return len(self.components) * self.ROWS_PER_COMPONENT
@@ -37,10 +70,87 @@ class SingleResourceSystemMatrixCreator():
     def calculate_num_columns_in_system_matrix(self):
         return self.NUM_COLUMN_SETS
 
+    def fill_locality_columns(self) -> None:
+        start_localities = [component.get_locality()[0] for component in self.components]
+        end_localities = [component.get_locality()[-1] for component in self.components]
+        for row_offset in [0, self.RECOVERY_DEMAND_ROW_OFFSET]:
+            self.matrix[row_offset:row_offset + len(self.components), self.START_LOCALITY_COL_ID] = start_localities
+            self.matrix[row_offset:row_offset + len(self.components), self.END_LOCALITY_COL_ID] = end_localities
+        self.locality_columns_filled = True
+
     def fill_system_matrix(self):
-        for row, component in enumerate(self.components):
-            self.fill_operation_demand_row(row, component)
-            self.fill_recovery_demand_row(row, component)
+        if not self.locality_columns_filled:
+            self.fill_locality_columns()
+        changed_rows, supply, operation_demand, recovery_demand = self.get_changed_rows()
+        if len(changed_rows) > 0:
+            changed_rows = np.asarray(changed_rows, dtype=int)
+            self.matrix[changed_rows, self.SUPPLY_COL_ID] = supply
+            self.matrix[changed_rows, self.DEMAND_COL_ID] = operation_demand
+            self.matrix[changed_rows + self.RECOVERY_DEMAND_ROW_OFFSET, self.DEMAND_COL_ID] = recovery_demand
+        self.matrix[:, self.DEMAND_MET_COL_ID] = self.get_initial_demand_met_indicator()
+
+    def get_changed_rows(self) -> tuple:
+        """
+        | Get the rows of components whose resources changed since the last time the system matrix was filled.
+        | Returns lists of changed rows and the current supply, operation demand and recovery demand of the components in these rows.
+        """
+        resource_store = self.get_resource_store()
+        if resource_store is not None:
+            self.changed_rows.clear()
+            return self.get_changed_rows_from_resource_store(resource_store)
+        changed_rows = sorted(self.changed_rows.union(self.polled_rows))
+        self.changed_rows.clear()
+        supply, operation_demand, recovery_demand = [], [], []
+        for row in changed_rows:
+            resources = self.get_component_resources(self.components[row])
+            supply.append(self.get_resource_amount(resources[0]))
+            operation_demand.append(self.get_resource_amount(resources[1]))
+            recovery_demand.append(self.get_resource_amount(resources[2]))
+        return changed_rows, supply, operation_demand, recovery_demand
+
+    def get_resource_store(self) -> ResourceStore:
+        """
+        Get the ResourceStore that components are bound to, or None. Components are checked again only if the store of the first component changes.
+        """
+        first_component_store = getattr(self.components[0], 'resource_store', None) if len(self.components) > 0 else None
+        if first_component_store is not getattr(self, 'resource_store', None):
+            self.resource_store = get_resource_store(self.components)
+            self.resource_store_row_ids = self.resource_store.get_row_ids(self.components) if self.resource_store is not None else None
+            self.reset_filled_resource_states()
+        return getattr(self, 'resource_store', None)
+
+    def get_changed_rows_from_resource_store(self, resource_store: ResourceStore) -> tuple:
+        """
+        Get the changed rows and the amounts of resources in these rows by comparing the amount versions in the store's columns with the ones in the last fill.
+        """
+        supply_or_demand_types = [StandardiReCoDeSComponent.SupplyTypes.SUPPLY.value,
+                                  StandardiReCoDeSComponent.DemandTypes.OPERATION_DEMAND.value,
+                                  StandardiReCoDeSComponent.DemandTypes.RECOVERY_DEMAND.value]
+        amount_versions = np.stack([resource_store.get_amount_versions(self.resource_store_row_ids, supply_or_demand_type, self.resource_name)
+                                    for supply_or_demand_type in supply_or_demand_types], axis=1)
+        if self.filled_amount_versions is None:
+            changed_rows = np.arange(len(self.components))
+        else:
+            changed_rows = np.flatnonzero(np.any(amount_versions != self.filled_amount_versions, axis=1))
+        self.filled_amount_versions = amount_versions
+        amounts = [resource_store.get_current_amounts(self.resource_store_row_ids[changed_rows], supply_or_demand_type, self.resource_name)
+                   for supply_or_demand_type in supply_or_demand_types]
+        return (changed_rows, *amounts)
+
+    def get_component_resources(self, component: Component) -> list:
+        """
+        Get component's supply, operation demand and recovery demand resource objects for the resource. None if the component does not have the resource.
+        """
+        return [component.supply[StandardiReCoDeSComponent.SupplyTypes.SUPPLY.value].get(self.resource_name, None),
+                component.demand[StandardiReCoDeSComponent.DemandTypes.OPERATION_DEMAND.value].get(self.resource_name, None),
+                component.demand[StandardiReCoDeSComponent.DemandTypes.RECOVERY_DEMAND.value].get(self.resource_name, None)]
+
+    @staticmethod
+    def get_resource_amount(resource) -> float:
+        if resource is None:
+            return 0.0
+        else:
+            return resource.current_amount
 
     def fill_operation_demand_row(self, row: int, component: Component):
         self.matrix[row, :] = np.asarray(self.get_component_properties(component, [
@@ -79,4 +189,8 @@ class SingleResourceSystemMatrixCreator():
         return self.matrix[component_row_id, self.DEMAND_COL_ID]
 
     def update_components(self, components: list[Component]) -> None:
-        self.components = components
\ No newline at end of file
+        if components is not self.components:
+            self.components = components
+            self.resource_store = None
+            self.bind_components()
+            self.reset_filled_resource_states()
\ No newline at end of file
@@ -1,7 +1,8 @@
 from pyrecodes.component.component import Component
 from pyrecodes.component.standard_irecodes_component import StandardiReCoDeSComponent
 from pyrecodes.component.component import SupplyOrDemand
-
+from pyrecodes.resource.resource_store import get_resource_store
+import numpy as np
 
 class SpatialResourceAggregator():
     """
@@ -9,6 +10,7 @@ class SpatialResourceAggregator():
 
     | Used to get the water demand in a locality at different time steps to send to water flow simulators.
     | **TODO**: Maybe connect this class with the resilience calculators, as it seems to be doing something similar.
+    | If components are bound to a ResourceStore, amounts are read from the store's column at once. Amounts are summed in the order of components, as in the loops.
     """
 
     def aggregate_per_locality(self, components: list[Component], resource_name: str, 
@@ -17,6 +19,9 @@ class SpatialResourceAggregator():
         """
         Aggregate the supply or demand for a resource per locality.
         """
+        resource_store = get_resource_store(components)
+        if resource_store is not None:
+            return self.aggregate_per_locality_from_resource_store(resource_store, components, resource_name, supply_or_demand_type)
         resource_per_locality = {}
         for component in components:
             if component.locality[0] in resource_per_locality.keys():
@@ -31,7 +36,23 @@ class SpatialResourceAggregator():
         """
         Aggregate the total supply or demand for a resource in the system.
         """
+        resource_store = get_resource_store(components)
+        if resource_store is not None:
+            return sum(resource_store.get_current_amounts(resource_store.get_row_ids(components), supply_or_demand_type, resource_name).tolist())
         total_resource = 0
         for component in components:
             total_resource += component.get_current_resource_amount(supply_or_demand, supply_or_demand_type, resource_name)
-        return total_resource
\ No newline at end of file
+        return total_resource
+
+    def aggregate_per_locality_from_resource_store(self, resource_store, components: list[Component], resource_name: str, supply_or_demand_type: str) -> dict:
+        """
+        Aggregate the supply or demand for a resource per locality using the column of the ResourceStore. Localities are in the order in which they first appear in components.
+        """
+        localities = [component.locality[0] for component in components]
+        unique_localities = list(dict.fromkeys(localities))
+        locality_ids = {locality: locality_id for locality_id, locality in enumerate(unique_localities)}
+        # np.bincount adds the weights of each bin in order, so sums are the same as in the loop
+        resource_per_locality = np.bincount([locality_ids[locality] for locality in localities],
+                                            weights=resource_store.get_current_amounts(resource_store.get_row_ids(components), supply_or_demand_type, resource_name),
+                                            minlength=len(unique_localities))
+        return dict(zip(unique_localities, resource_per_locality.tolist()))
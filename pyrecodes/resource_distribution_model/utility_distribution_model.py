@@ -92,19 +92,27 @@ class UtilityDistributionModel(AbstractResourceDistributionModel):
                                                                                                   component_localities,                                                                                      
                                                                                                   transfer_service_demand)
             self.update_consumed_amounts(suppliers, initial_suppliers)
-            
-            if component_demand_after_distribution > 0.0:
-                percent_of_met_demand = 1 - (component_demand_after_distribution / component_demand)
-                self.set_demand_met_indicator(component_row_id, percent_of_met_demand)
-                if component_demand_type == StandardiReCoDeSComponent.DemandTypes.OPERATION_DEMAND.value:
-                    self.reduce_component_supply(component_row_id, percent_of_met_demand)
-                elif component_demand_type == StandardiReCoDeSComponent.DemandTypes.RECOVERY_DEMAND.value:
-                    self.set_met_demand_for_recovery_activities(component_row_id, percent_of_met_demand)
-                
-                # suppliers = self.reset_suppliers(initial_suppliers)
+            self.update_component_based_on_unmet_demand(component_row_id, component_demand,
+                                                        component_demand_after_distribution, component_demand_type)
+
+            # suppliers = self.reset_suppliers(initial_suppliers)
 
         return suppliers
 
+    def update_component_based_on_unmet_demand(self, component_row_id: int, component_demand: float,
+                                               component_demand_after_distribution: float, component_demand_type: str) -> None:
+        """
+        | If the component's demand is not fully met, set the demand met indicator in the system matrix and
+        reduce the component's supply (operation demand) or slow down its recovery activities (recovery demand).
+        """
+        if component_demand_after_distribution > 0.0:
+            percent_of_met_demand = 1 - (component_demand_after_distribution / component_demand)
+            self.set_demand_met_indicator(component_row_id, percent_of_met_demand)
+            if component_demand_type == StandardiReCoDeSComponent.DemandTypes.OPERATION_DEMAND.value:
+                self.reduce_component_supply(component_row_id, percent_of_met_demand)
+            elif component_demand_type == StandardiReCoDeSComponent.DemandTypes.RECOVERY_DEMAND.value:
+                self.set_met_demand_for_recovery_activities(component_row_id, percent_of_met_demand)
+
     def suppliers_meet_component_demand(self, suppliers, component_demand, component_localities, transfer_service_demand):
         for supplier in suppliers:
             supplier_start_locality, supplier_end_locality, current_supply = supplier['StartLocality'], supplier['EndLocality'], supplier['CurrentSupply']
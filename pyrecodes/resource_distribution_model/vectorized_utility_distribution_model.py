@@ -0,0 +1,156 @@
+from pyrecodes.resource_distribution_model.utility_distribution_model import UtilityDistributionModel
+from pyrecodes.component.component import Component
+import numpy as np
+
+class VectorizedUtilityDistributionModel(UtilityDistributionModel):
+    """
+    | Utility distribution model that distributes resources in the same way as the UtilityDistributionModel, but keeps the state of the suppliers in NumPy arrays.
+    | Supplier's current supply, consumed amount, start and end locality are stored in arrays instead of a list of dicts that is deepcopied for each component.
+    | Component's demand is allocated to suppliers using the cumulative sum of the available supply and np.searchsorted, instead of updating each supplier one by one.
+
+    | Use it by setting the FileName and ClassName of the resource's DistributionModel in the system configuration file to
+    vectorized_utility_distribution_model and VectorizedUtilityDistributionModel. The parameters are the same as for the UtilityDistributionModel.
+    """
+
+    components: list[Component]
+    supplier_current_supply: np.ndarray
+    supplier_consumed_amount: np.ndarray
+    supplier_start_locality: np.ndarray
+    supplier_end_locality: np.ndarray
+    supplier_row_id: np.ndarray
+    num_suppliers: int
+
+    def distribute(self, time_step: int) -> None:
+        if self.distribute_at_this_time_step(time_step):
+            self.fill_system_matrix()
+
+            component_priorities_by_row, component_demand_types = self.get_component_priorities()
+            self.initialize_supplier_arrays(component_priorities_by_row)
+            self.reset_optimal_path_supply_cache()
+
+            for component_row_id, component_demand_type in zip(component_priorities_by_row, component_demand_types):
+                component_is_supplier = self.add_supplier_to_arrays(component_row_id)
+                self.meet_component_demand_using_arrays(component_row_id, component_demand_type, component_is_supplier)
+
+            self.update_suppliers_based_on_consumption_using_arrays()
+
+    def initialize_supplier_arrays(self, component_priorities_by_row: list[int]) -> None:
+        """
+        | Preallocate supplier arrays. Their size is the number of rows in the priority list that have supply.
+        | Suppliers are stored in the order in which they are added, same as in the UtilityDistributionModel.
+        """
+        rows = np.asarray(component_priorities_by_row, dtype=int)
+        max_num_suppliers = int(np.count_nonzero(self.system_matrix.matrix[rows, self.system_matrix.SUPPLY_COL_ID] > 0)) if len(rows) > 0 else 0
+        self.supplier_current_supply = np.zeros(max_num_suppliers)
+        self.supplier_consumed_amount = np.zeros(max_num_suppliers)
+        self.supplier_start_locality = np.zeros(max_num_suppliers)
+        self.supplier_end_locality = np.zeros(max_num_suppliers)
+        self.supplier_row_id = np.zeros(max_num_suppliers, dtype=int)
+        self.num_suppliers = 0
+
+    def add_supplier_to_arrays(self, component_row_id: int) -> bool:
+        """
+        Add the component to the supplier arrays if it has supply of the resource. Returns True if the component is a supplier.
+        """
+        current_supply = self.system_matrix.matrix[component_row_id, self.system_matrix.SUPPLY_COL_ID]
+        if current_supply > 0:
+            supplier_id = self.num_suppliers
+            self.supplier_current_supply[supplier_id] = current_supply
+            self.supplier_consumed_amount[supplier_id] = 0.0
+            self.supplier_start_locality[supplier_id] = self.system_matrix.matrix[component_row_id, self.system_matrix.START_LOCALITY_COL_ID]
+            self.supplier_end_locality[supplier_id] = self.system_matrix.matrix[component_row_id, self.system_matrix.END_LOCALITY_COL_ID]
+            self.supplier_row_id[supplier_id] = component_row_id
+            self.num_suppliers += 1
+            return True
+        return False
+
+    def get_supplier_order(self, component_is_supplier: bool) -> np.ndarray:
+        """
+        | Get the order in which suppliers meet the component's demand.
+        | If the component is a supplier, it first uses its own supply (it's put on top of the supplier list), followed by other suppliers in the order in which they were added.
+        """
+        if component_is_supplier:
+            return np.concatenate(([self.num_suppliers - 1], np.arange(self.num_suppliers - 1)))
+        else:
+            return np.arange(self.num_suppliers)
+
+    def meet_component_demand_using_arrays(self, component_row_id: int, component_demand_type: str, component_is_supplier: bool) -> None:
+        component_demand = self.get_demand(component_row_id)
+        if component_demand > 0.0:
+            component_localities = [self.system_matrix.matrix[component_row_id, self.system_matrix.START_LOCALITY_COL_ID],
+                                    self.system_matrix.matrix[component_row_id, self.system_matrix.END_LOCALITY_COL_ID]]
+            transfer_service_demand = self.get_transfer_service_demand(component_row_id, component_demand_type)
+            supplier_order = self.get_supplier_order(component_is_supplier)
+            connected_suppliers = self.get_connected_suppliers(supplier_order, component_localities, transfer_service_demand)
+            component_demand_after_distribution = self.allocate_demand_to_suppliers(component_demand, supplier_order, connected_suppliers)
+            self.update_component_based_on_unmet_demand(component_row_id, component_demand,
+                                                        component_demand_after_distribution, component_demand_type)
+
+    def get_connected_suppliers(self, supplier_order: np.ndarray, component_localities: list, transfer_service_demand: float) -> np.ndarray:
+        """
+        | Get a boolean mask of suppliers (in supplier_order) that can transfer the resource to the component.
+        | Same as in the UtilityDistributionModel, a supplier is connected to the component if any of their localities are the same or
+        if there is a path between them whose transfer service supply is larger than the transfer service demand.
+        | Path supply is only calculated once for each unique supplier locality.
+        """
+        start_localities = self.supplier_start_locality[supplier_order]
+        end_localities = self.supplier_end_locality[supplier_order]
+        connected = np.isin(start_localities, component_localities) | np.isin(end_localities, component_localities)
+        if not connected.all():
+            unconnected_localities = np.unique(np.concatenate((start_localities[~connected], end_localities[~connected])))
+            reachable_localities = [locality for locality in unconnected_localities
+                                    if self.locality_is_connected(locality, component_localities, transfer_service_demand)]
+            connected |= np.isin(start_localities, reachable_localities) | np.isin(end_localities, reachable_localities)
+        return connected
+
+    def locality_is_connected(self, start_locality: float, component_localities: list, transfer_service_demand: float) -> bool:
+        for end_locality in set(component_localities):
+            if self.get_optimal_path_supply(start_locality, end_locality) > transfer_service_demand:
+                return True
+        return False
+
+    def get_optimal_path_supply(self, start_locality: float, end_locality: float) -> float:
+        """
+        | Get the transfer service supply of the optimal path between two localities.
+        | Values are cached during a single distribution pass. The cache is reset whenever a component's supply is reduced due to unmet demand,
+        as this can change the supply of the transfer service.
+        """
+        locality_pair = (start_locality, end_locality)
+        if locality_pair not in self.optimal_path_supply_cache:
+            self.optimal_path_supply_cache[locality_pair] = self.get_optimal_path(start_locality, end_locality)[0]
+        return self.optimal_path_supply_cache[locality_pair]
+
+    def reset_optimal_path_supply_cache(self) -> None:
+        self.optimal_path_supply_cache = {}
+
+    def allocate_demand_to_suppliers(self, component_demand: float, supplier_order: np.ndarray, connected_suppliers: np.ndarray) -> float:
+        """
+        | Allocate the component's demand to connected suppliers in supplier_order. Returns the demand that could not be met.
+        | Suppliers before the first one whose cumulative supply exceeds the demand give all their supply.
+        | That supplier gives the rest of the demand. Suppliers after it are not used.
+        """
+        if len(supplier_order) == 0:
+            return component_demand
+        available_supply = np.where(connected_suppliers, self.supplier_current_supply[supplier_order], 0.0)
+        cumulative_supply = np.cumsum(available_supply)
+        last_supplier = int(np.searchsorted(cumulative_supply, component_demand, side='right'))
+        allocated_supply = available_supply
+        if last_supplier < len(supplier_order):
+            supply_before_last_supplier = cumulative_supply[last_supplier - 1] if last_supplier > 0 else 0.0
+            allocated_supply[last_supplier] = component_demand - supply_before_last_supplier
+            allocated_supply[last_supplier + 1:] = 0.0
+            component_demand_after_distribution = 0.0
+        else:
+            component_demand_after_distribution = component_demand - cumulative_supply[-1]
+        self.supplier_current_supply[supplier_order] -= allocated_supply
+        self.supplier_consumed_amount[supplier_order] += allocated_supply
+        return component_demand_after_distribution
+
+    def reduce_component_supply(self, component_row_id: int, percent_of_met_demand: float):
+        super().reduce_component_supply(component_row_id, percent_of_met_demand)
+        self.reset_optimal_path_supply_cache()
+
+    def update_suppliers_based_on_consumption_using_arrays(self) -> None:
+        for supplier_id in range(self.num_suppliers):
+            self.components[self.supplier_row_id[supplier_id]].update_supply_based_on_consumption(self.resource_name,
+                                                                                                  self.supplier_consumed_amount[supplier_id])
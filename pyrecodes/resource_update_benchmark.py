@@ -0,0 +1,55 @@
+"""
+Module used to measure how long it takes to update the components of a **pyrecodes** system in a time step, with and without the vectorized resource update.
+
+Run from the repository root, e.g.: python -m pyrecodes.resource_update_benchmark "./Example 3/NorthEast_SF_Housing_Main.json"
+"""
+import argparse
+import time
+from pyrecodes import main
+from pyrecodes.utilities import read_json_file
+
+def measure_update_time(main_file: str, constants: dict = None, num_updates: int = 20) -> dict:
+    """
+    Measure the time needed to update the system's components (BuiltEnvironment.update) in a time step after the initial damage is set.
+    Components' recovery models are not recovered between updates, so each update computes the same functionality levels and resource amounts.
+
+    Args:
+        | main_file (str): The main JSON file of the system.
+        | constants (dict, optional): Constants added to the Constants section of the system configuration, e.g., {'VECTORIZED_RESOURCE_UPDATE': True}. Defaults to None.
+        | num_updates (int, optional): The number of updates measured. Defaults to 20.
+
+    Returns:
+        dict: Number of components and microseconds per component per update.
+    """
+    input_dict = read_json_file(main_file)
+    system_configuration = read_json_file(input_dict['System']['SystemConfigurationFile'])
+    system_configuration.setdefault('Constants', {}).update(constants or {})
+    system = main.create_system(input_dict, system_configuration)
+    system.time_step = system.DISASTER_TIME_STEP
+    system.set_initial_damage()
+    start_time = time.perf_counter()
+    for _ in range(num_updates):
+        system.update()
+        system.time_step += 1
+    update_time = time.perf_counter() - start_time
+    num_components = len(system.components)
+    return {'NumComponents': num_components,
+            'MicrosecondsPerComponentUpdate': 1e6 * update_time / (num_updates * num_components)}
+
+def compare_resource_updates(main_file: str, num_updates: int = 20) -> dict:
+    """
+    Measure the update time with resources updated by each component, with resource amounts in the columnar ResourceStore (COLUMNAR_RESOURCES constant)
+    and with resource amounts updated in one pass per functionality to amount relation (VECTORIZED_RESOURCE_UPDATE constant).
+    """
+    return {'Default': measure_update_time(main_file, {}, num_updates),
+            'Columnar': measure_update_time(main_file, {'COLUMNAR_RESOURCES': True}, num_updates),
+            'Vectorized': measure_update_time(main_file, {'VECTORIZED_RESOURCE_UPDATE': True}, num_updates)}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Report the time needed to update the components of a pyrecodes system, without and with the vectorized resource update.')
+    parser.add_argument('main_file', nargs='?', default='./Example 3/NorthEast_SF_Housing_Main.json', help='Main JSON file of the system.')
+    parser.add_argument('--num-updates', type=int, default=20, help='Number of updates measured per mode.')
+    arguments = parser.parse_args()
+    for mode, results in compare_resource_updates(arguments.main_file, arguments.num_updates).items():
+        report = ', '.join(f'{label}: {value:,.1f}' for label, value in results.items())
+        print(f'{mode} | {report}')
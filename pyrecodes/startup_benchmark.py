@@ -0,0 +1,62 @@
+"""
+Module used to measure how long it takes to create the components of a **pyrecodes** system, with component factories and with deep copies of component templates.
+
+Run from the repository root, e.g.: python -m pyrecodes.startup_benchmark "./Example 5/Alameda_Main.json" DS3_Building DS1_Pipe
+"""
+import argparse
+import copy
+import time
+from pyrecodes import main
+from pyrecodes.subsystem_creator.subsystem_creator import SubsystemCreator
+from pyrecodes.utilities import read_json_file
+
+def measure_component_creation_time(component_library: dict, component_type: str, num_components: int = 5000) -> dict:
+    """
+    Measure the time needed to create a component of the component_type, with the component factory and by deep copying the component template.
+    Deep copies get new durations of recovery activities, as in SubsystemCreator.get_component_object for templates without a factory.
+
+    Args:
+        | component_library (dict): The component library, created with main.form_component_library.
+        | component_type (str): The name of the component library entry.
+        | num_components (int, optional): The number of components created with each approach. Defaults to 5000.
+
+    Returns:
+        dict: Microseconds per component created with the factory and with deep copies.
+    """
+    component_template = component_library[component_type]
+    subsystem_creator = SubsystemCreator.__new__(SubsystemCreator)
+    start_time = time.perf_counter()
+    for _ in range(num_components):
+        component_template.factory.create()
+    factory_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for _ in range(num_components):
+        subsystem_creator.sample_random_variables_for_component(copy.deepcopy(component_template))
+    deepcopy_time = time.perf_counter() - start_time
+    return {'FactoryMicrosecondsPerComponent': 1e6 * factory_time / num_components,
+            'DeepcopyMicrosecondsPerComponent': 1e6 * deepcopy_time / num_components}
+
+def measure_system_creation_time(main_file: str) -> float:
+    """
+    Measure the time needed to create the system defined in the main file, in seconds. Input files are read before the time is measured.
+    """
+    input_dict = read_json_file(main_file)
+    system_configuration = read_json_file(input_dict['System']['SystemConfigurationFile'])
+    start_time = time.perf_counter()
+    main.create_system(input_dict, system_configuration)
+    return time.perf_counter() - start_time
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Report the time needed to create components of a pyrecodes system, with component factories and with deep copies.')
+    parser.add_argument('main_file', nargs='?', default='./Example 5/Alameda_Main.json', help='Main JSON file of the system.')
+    parser.add_argument('component_types', nargs='*', default=['DS3_Building', 'DS1_Pipe'], help='Component library entries to create.')
+    parser.add_argument('--num-components', type=int, default=5000, help='Number of components created per component type and approach.')
+    parser.add_argument('--system', action='store_true', help='Create the whole system and report the time as well.')
+    arguments = parser.parse_args()
+    component_library = main.form_component_library(read_json_file(arguments.main_file))
+    for component_type in arguments.component_types:
+        results = measure_component_creation_time(component_library, component_type, arguments.num_components)
+        report = ', '.join(f'{label}: {value:,.1f}' for label, value in results.items())
+        print(f'{component_type} | {report}')
+    if arguments.system:
+        print(f'System | Seconds: {measure_system_creation_time(arguments.main_file):.2f}')
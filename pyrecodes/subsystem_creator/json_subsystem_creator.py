@@ -1,4 +1,5 @@
 from pyrecodes.subsystem_creator.subsystem_creator import SubsystemCreator
+from pyrecodes.relation import relation
 import copy
 
 class JSONSubsystemCreator(SubsystemCreator):
@@ -7,12 +8,17 @@ class JSONSubsystemCreator(SubsystemCreator):
     """
 
     def create_components_in_localities(self) -> None:
+        """
+        Create components in the locality. Components of the same type are copies of one component, so they have the same durations of recovery activities.
+        Shared relations (see relation.get_relation) are not copied, so copies keep sharing them with other components.
+        """
         components = []
+        shared_relations = {id(shared_relation): shared_relation for shared_relation in relation.shared_relations.values()}
         for component_type, amount in self.parameters.get('ComponentsInLocality', {}).items():
             component = self.get_component_object(component_type)
             self.component_configurator['Component'].set_parameters(component, [self.locality['LocalityName']])
             for _ in range(amount):
-                components.append(copy.deepcopy(component))
+                components.append(copy.deepcopy(component, dict(shared_relations)))
         return components
 
     def create_components_between_localities(self) -> None:
@@ -8,6 +8,8 @@ class R2DSubsystemCreator(SubsystemCreator):
     Create a System based on SimCenter R2D Tool's JSON output file.
     """
 
+    SETS_DAMAGE_AT_CREATION = True
+
     def create_components_in_localities(self) -> list[Component]:
         return self.create_components()
     
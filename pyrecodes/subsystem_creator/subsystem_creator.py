@@ -5,8 +5,14 @@ import copy
 class SubsystemCreator():
     """
     Create a Subsystem within the System class.
+
+    Attributes:
+        | SETS_DAMAGE_AT_CREATION (bool): True if the subsystem creator reads the damage input when creating components, so their damage can not be changed later.
+
     """
 
+    SETS_DAMAGE_AT_CREATION = False
+
     def __init__(self, component_library: dict, locality: dict, parameters: dict, constants={}, damage_input={}) -> None:
         self.locality = locality
         self.parameters = parameters
@@ -23,8 +29,15 @@ class SubsystemCreator():
         self.component_configurator['Component'] = ComponentConfigurator(system_level_data, recovery_time_stepping)
     
     def get_component_object(self, component_type: str) -> Component:
-        component_template = copy.deepcopy(self.component_library[component_type])
-        component = self.sample_random_variables_for_component(component_template)
+        """
+        | Create a new component of the component_type from the component library.
+        | Components are created using the template's component factory. Templates without a factory (e.g., from component library creators that do not set it) are deep copied.
+        """
+        component_template = self.component_library[component_type]
+        factory = getattr(component_template, 'factory', None)
+        if factory is not None:
+            return factory.create()
+        component = self.sample_random_variables_for_component(copy.deepcopy(component_template))
         return component
     
     def sample_random_variables_for_component(self, component: Component) -> Component:
@@ -6,7 +6,13 @@ from pyrecodes.component.standard_irecodes_component import StandardiReCoDeSComp
 from pyrecodes.component.r2d_component import R2DBuildingWithBusiness
 from pyrecodes.utilities import get_class
 from pyrecodes.system.distribution_list_creator import DistributionListCreator
+from pyrecodes.system.interdependent_resource_scheduler import InterdependentResourceScheduler
+from pyrecodes.system.independent_resource_scheduler import IndependentResourceScheduler
 from pyrecodes.system.recovery_target_checker import NoDamageRecoveryTargetChecker
+from pyrecodes.system.component_state_counter import ComponentStateCounter
+from pyrecodes.component_recovery_model.recovery_activities_engine import RecoveryActivitiesEngine
+from pyrecodes.system.resource_amount_updater import ResourceAmountUpdater
+from pyrecodes.resource.resource_store import ResourceStore
 import pickle
 import json
 import math
@@ -89,24 +95,98 @@ class BuiltEnvironment(System):
         self.START_TIME_STEP = self.system_creator.START_TIME_STEP
         self.MAX_TIME_STEP = self.system_creator.MAX_TIME_STEP
         self.DISASTER_TIME_STEP = self.system_creator.DISASTER_TIME_STEP
-        self.recovery_target_checker = NoDamageRecoveryTargetChecker()
+        self.set_component_state_counter()
+        self.set_recovery_target_checker()
+        self.EVENT_DRIVEN_TIME_STEPPING = getattr(self.system_creator, 'EVENT_DRIVEN_TIME_STEPPING', False)
+        self.set_recovery_activities_engine()
+        self.set_resource_store()
+        self.set_resource_amount_updater()
+        self.set_compact_objects()
         self.set_resource_distribution_dict()
         self.set_damage_input()
 
+    def set_component_state_counter(self):
+        """
+        Sets the ComponentStateCounter that counts damaged and functional components incrementally, as recovery models and components notify it when their state changes.
+        """
+        self.component_state_counter = ComponentStateCounter(self.components)
+
+    def set_recovery_target_checker(self):
+        """
+        Sets the recovery target checker defined in the RecoveryTarget section of the system configuration.
+        If the section is not defined, the system has recovered once all components are damage-free (NoDamageRecoveryTargetChecker).
+        """
+        if hasattr(self.system_creator, 'get_recovery_target_checker'):
+            self.recovery_target_checker = self.system_creator.get_recovery_target_checker()
+        else:
+            self.recovery_target_checker = NoDamageRecoveryTargetChecker()
+
+    def set_recovery_activities_engine(self):
+        """
+        Sets the RecoveryActivitiesEngine that recovers components with a ComponentLevelRecoveryActivitiesModel in one vectorized step,
+        if the VECTORIZED_RECOVERY constant in the system configuration is set to True. Otherwise, each component is recovered by its own recovery model.
+        """
+        self.recovery_activities_engine = None
+        if getattr(self.system_creator, 'VECTORIZED_RECOVERY', False):
+            self.recovery_activities_engine = RecoveryActivitiesEngine(self.components)
+
+    def set_resource_store(self):
+        """
+        Sets the ResourceStore that holds the amounts of components' supply and demand in columns, if the COLUMNAR_RESOURCES constant in the system configuration is set to True.
+        The ResourceAmountUpdater writes amounts to the store, so the store is set if the VECTORIZED_RESOURCE_UPDATE constant is set to True as well.
+        Otherwise, amounts are stored in components' resource objects.
+        """
+        self.resource_store = None
+        if getattr(self.system_creator, 'COLUMNAR_RESOURCES', False) or getattr(self.system_creator, 'VECTORIZED_RESOURCE_UPDATE', False):
+            self.resource_store = ResourceStore(self.components, list(self.resources.keys()))
+
+    def set_resource_amount_updater(self):
+        """
+        Sets the ResourceAmountUpdater that updates components' supply and operation demand in one pass per functionality to amount relation,
+        if the VECTORIZED_RESOURCE_UPDATE constant in the system configuration is set to True. Otherwise, each component updates its own resources.
+        """
+        self.resource_amount_updater = None
+        if getattr(self.system_creator, 'VECTORIZED_RESOURCE_UPDATE', False):
+            self.resource_amount_updater = ResourceAmountUpdater(self.components, self.resource_store)
+
+    def set_compact_objects(self):
+        """
+        Stores the histories of components and businesses (e.g., time steps at which components are functional) in arrays preallocated for MAX_TIME_STEP time steps,
+        if the COMPACT_OBJECTS constant in the system configuration is set to True. Otherwise, histories are stored in lists and dicts.
+        Resources and recovery activities always store their attributes in __slots__.
+        """
+        if getattr(self.system_creator, 'COMPACT_OBJECTS', False):
+            for component in self.components:
+                if hasattr(component, 'set_compact_history'):
+                    component.set_compact_history(self.MAX_TIME_STEP)
+
     def set_resource_distribution_dict(self):
         """
         Sets the resource distribution list for the system based on components and resource parameters using the DistributionListCreator object.
+        Independent Resources are distributed in waves formed by the IndependentResourceScheduler object. Resources in a wave are distributed concurrently,
+        unless the MAX_DISTRIBUTION_WORKERS constant in the system configuration is set to 1.
+        Interdependent Resources are distributed following the schedule formed by the InterdependentResourceScheduler object.
         """
         distribution_list_creator = DistributionListCreator(self.components, self.resources)
         self.resource_distribution_dict = distribution_list_creator.get_resource_distribution_dict()
+        self.independent_resource_scheduler = IndependentResourceScheduler(self.components, self.resources,
+                                                                           self.resource_distribution_dict['IndependentResources'],
+                                                                           getattr(self.system_creator, 'MAX_DISTRIBUTION_WORKERS', None))
+        self.interdependent_resource_scheduler = InterdependentResourceScheduler(self.components, self.resources,
+                                                                                 self.resource_distribution_dict['InterdependentResources'])
     
-    def set_damage_input(self):
+    def set_damage_input(self, damage_input_parameters: dict = None):
         """
         Sets the damage input for the system based on the specified damage input type and parameters.
+
+        Args:
+            damage_input_parameters (dict, optional): Damage input parameters to use instead of the ones in the system configuration. Defaults to None.
         """
+        if damage_input_parameters is None:
+            damage_input_parameters = self.system_creator.get_damage_input_parameters()
         damage_input_class_filename, damage_input_class_name = self.system_creator.get_damage_input_type()
         target_damage_input_class = get_class(damage_input_class_filename, damage_input_class_name, 'damage_input')
-        self.damage_input = target_damage_input_class(self.system_creator.get_damage_input_parameters(), self)        
+        self.damage_input = target_damage_input_class(damage_input_parameters, self)        
 
     def start_resilience_assessment(self):
         """
@@ -117,7 +197,14 @@ class BuiltEnvironment(System):
         At each time step, components' state is update, resources are distributed among components to capture their interaction, and components recover following their recovery model. 
         
         Recovery starts after the disaster has occured.
+
+        If EVENT_DRIVEN_TIME_STEPPING is set to True in the constants of the system configuration, time steps in which the system's state does not change are skipped.
+        Check out the start_event_driven_resilience_assessment method for details.
         """
+        if getattr(self, 'EVENT_DRIVEN_TIME_STEPPING', False):
+            self.start_event_driven_resilience_assessment()
+            return
+
         for self.time_step in range(self.START_TIME_STEP, self.MAX_TIME_STEP):
 
             print("Time step: ", self.time_step)
@@ -141,6 +228,79 @@ class BuiltEnvironment(System):
                 print('Resilience assessment finished.')
                 break
 
+    def start_event_driven_resilience_assessment(self):
+        """
+        | Initiates the resilience assessment for the built environment, advancing from one event to the next instead of one time step at a time.
+
+        | At an event time step, the system is updated, resources are distributed and components recover as in the start_resilience_assessment method.
+        | The next event is the earliest time step at which a component or a distribution model reports that its state can change (e.g., a recovery activity is finished,
+        | a distribution time step is reached, or an infrastructure interface restores its supply), or the disaster time step.
+        | In the time steps skipped until the next event, components' supply and demand do not change and resource distribution gives the same results,
+        | so resilience calculators record the values of the last event in bulk and components only progress with their recovery.
+        """
+        self.time_step = self.START_TIME_STEP
+        while self.time_step < self.MAX_TIME_STEP:
+
+            print("Time step: ", self.time_step)
+
+            if self.recovery_target_met():
+                self.FINISH = True
+
+            if self.time_step == self.DISASTER_TIME_STEP:
+                self.set_initial_damage()
+
+            self.update()
+
+            self.distribute_resources()
+
+            self.update_resilience_calculators()
+
+            # the next event depends on the percent of met demand of recovery activities, so it is found before components recover
+            next_event_time_step = self.get_next_event_time_step()
+
+            if self.time_step > self.DISASTER_TIME_STEP:
+                self.recover()
+
+            if self.FINISH:
+                print('Resilience assessment finished.')
+                break
+
+            self.skip_time_steps(range(self.time_step + 1, next_event_time_step))
+            self.time_step = next_event_time_step
+
+    def get_next_event_time_step(self) -> int:
+        """
+        Gets the next time step at which the state of the system can change, at most MAX_TIME_STEP.
+
+        Returns:
+            int: The next event time step, later than the current time step.
+        """
+        if self.time_step == self.DISASTER_TIME_STEP:
+            return self.time_step + 1
+        next_event_time_step = self.MAX_TIME_STEP
+        if self.time_step < self.DISASTER_TIME_STEP:
+            next_event_time_step = self.DISASTER_TIME_STEP
+        for component in self.components:
+            next_event_time_step = min(next_event_time_step, component.get_next_event_time_step(self.time_step))
+            if next_event_time_step == self.time_step + 1:
+                return next_event_time_step
+        for resource_parameters in self.resources.values():
+            next_event_time_step = min(next_event_time_step, resource_parameters['DistributionModel'].get_next_event_time_step(self.time_step))
+        return max(int(next_event_time_step), self.time_step + 1)
+
+    def skip_time_steps(self, time_steps: range) -> None:
+        """
+        Advances the system over time steps skipped by the event-driven time advancement: resilience calculators record the skipped time steps and components recover.
+        """
+        if len(time_steps) == 0:
+            return
+        for resilience_calculator in self.resilience_calculators:
+            resilience_calculator.update_skipped_time_steps(self, time_steps)
+        for component in self.components:
+            component.skip_time_steps(time_steps, self.time_step > self.DISASTER_TIME_STEP)
+        if getattr(self, 'recovery_activities_engine', None) is not None and self.time_step > self.DISASTER_TIME_STEP:
+            self.recovery_activities_engine.recover_over_skipped_time_steps(time_steps)
+
     def recovery_target_met(self) -> bool:
         """
         Checks whether the recovery target has been met for the built environment system.
@@ -163,16 +323,14 @@ class BuiltEnvironment(System):
         Returns:
             float: The percent of damaged buildings in the system.
         """
-        num_damaged_buildings = 0
-        for component in self.components:
-            if component.get_damage_level() > 0:
-                num_damaged_buildings += 1
-        return num_damaged_buildings / len(self.components)
+        return self.component_state_counter.get_num_damaged() / len(self.components)
 
     def update(self) -> None:
         """
         Updates the system state during the resilience assessment by updating the state of components.
         """
+        if getattr(self, 'resource_amount_updater', None) is not None:
+            self.resource_amount_updater.update()
         for component in self.components:
             component.update(self.time_step)
 
@@ -183,20 +341,23 @@ class BuiltEnvironment(System):
         self.distribute_independent_resources()
         self.distribute_interdependent_resources()  
 
-    def distribute_independent_resources(self) -> None:        
-        for resource_name in self.resource_distribution_dict['IndependentResources']:
-            self.resources[resource_name]['DistributionModel'].distribute(self.time_step)
+    def distribute_independent_resources(self) -> None:
+        """
+        Distributes Independent Resources once.
+
+        Resources whose distributions do not affect each other are distributed concurrently.
+        Check out the IndependentResourceScheduler class for details.
+        """
+        self.independent_resource_scheduler.distribute(self.time_step)
     
     def distribute_interdependent_resources(self) -> None:
-        system_converged = False
-        system_supply = self.get_supply_of_interdependent_resources()
-        updated_system_supply = self.get_supply_of_interdependent_resources()
-        while not(system_converged):
-            for resource_name in self.resource_distribution_dict['InterdependentResources']:
-                self.resources[resource_name]['DistributionModel'].distribute(self.time_step)
-            updated_system_supply = self.get_supply_of_interdependent_resources()
-            system_converged = self.check_system_convergence(system_supply, updated_system_supply)
-            system_supply = self.deepcopy(updated_system_supply)
+        """
+        Distributes Interdependent Resources until their supply converges.
+
+        Resources are distributed in the order of their dependencies and a resource is distributed again only if its supply changed.
+        Check out the InterdependentResourceScheduler class for details.
+        """
+        self.interdependent_resource_scheduler.distribute(self.time_step)
         
     def get_supply_of_interdependent_resources(self) -> dict:
         """
@@ -243,7 +404,10 @@ class BuiltEnvironment(System):
     def recover(self) -> None:
         """
         Simulates the recovery process in the system at a single time step.
+        Components bound to the RecoveryActivitiesEngine are recovered by the engine, their recovery models do nothing.
         """
+        if getattr(self, 'recovery_activities_engine', None) is not None:
+            self.recovery_activities_engine.recover(self.time_step)
         for component in self.components:
             component.recover(self.time_step)
 
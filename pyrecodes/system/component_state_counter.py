@@ -0,0 +1,117 @@
+import math
+import numpy as np
+from pyrecodes.component.component import Component
+
+class ComponentStateCounter:
+    """
+    | System-level counter of damaged and functional components, kept up to date incrementally.
+
+    | Recovery models notify the counter when a component's damage level changes (see AbstractRecoveryModel.notify_state_counter)
+    | and components notify it when their functionality level is updated (see StandardiReCoDeSComponent.update_functionality).
+    | The counter only changes its counts when a component crosses to or from zero damage, or to or from zero functionality,
+    | so recovery target checkers get the number of damaged or functional components without scanning all components.
+    | Counts are kept per component name (e.g., 'WaterPipe'), so targets can be set for groups of components.
+    | A component is damaged if its damage level is not close to 0 and functional if its functionality level is higher than 0, as in StandardiReCoDeSComponent.check_if_functional.
+
+    Attributes:
+        | component_names (list[str]): Names of components in the system.
+        | name_ids (list[int]): For each component, the index of its name in component_names.
+        | damaged (np.ndarray): True if the component is damaged.
+        | functional (np.ndarray): True if the component is functional.
+        | num_components (list[int]): Number of components per name.
+        | num_damaged (list[int]): Number of damaged components per name.
+        | num_functional (list[int]): Number of functional components per name.
+
+    """
+
+    component_names: list[str]
+    name_ids: list[int]
+    damaged: np.ndarray
+    functional: np.ndarray
+    num_components: list[int]
+    num_damaged: list[int]
+    num_functional: list[int]
+
+    def __init__(self, components: list[Component]):
+        """
+        Count the damaged and functional components and bind the components and their recovery models to the counter.
+
+        Args:
+            components (list[Component]): A list of components in the system.
+        """
+        self.component_names = list(dict.fromkeys(component.name for component in components))
+        name_indices = {component_name: name_id for name_id, component_name in enumerate(self.component_names)}
+        self.name_ids = [name_indices[component.name] for component in components]
+        self.damaged = np.zeros(len(components), dtype=bool)
+        self.functional = np.zeros(len(components), dtype=bool)
+        self.num_components = [self.name_ids.count(name_id) for name_id in range(len(self.component_names))]
+        self.num_damaged = [0] * len(self.component_names)
+        self.num_functional = [0] * len(self.component_names)
+        for component_id, component in enumerate(components):
+            self.bind(component_id, component)
+
+    def bind(self, component_id: int, component: Component) -> None:
+        component.state_counter = self
+        component.state_counter_id = component_id
+        if getattr(component, 'recovery_model', None) is not None:
+            component.recovery_model.state_counter = self
+            component.recovery_model.state_counter_id = component_id
+            self.set_damage_level(component_id, component.get_damage_level())
+        self.set_functionality_level(component_id, component.functionality_level)
+
+    @staticmethod
+    def is_damaged(damage_level: float) -> bool:
+        return not math.isclose(damage_level, 0, abs_tol=1e-10)
+
+    def set_damage_level(self, component_id: int, damage_level: float) -> None:
+        """
+        Update the counts if the component crossed to or from zero damage.
+        """
+        self.set_damaged(component_id, self.is_damaged(damage_level))
+
+    def set_damage_levels(self, component_ids: np.ndarray, damage_levels: np.ndarray) -> None:
+        """
+        Update the counts for components whose damage levels changed in one vectorized step, e.g., in the RecoveryActivitiesEngine.
+        abs(damage_level) > 1e-10 is the same check as in is_damaged.
+        """
+        damaged = np.abs(damage_levels) > 1e-10
+        changed = damaged != self.damaged[component_ids]
+        for component_id, component_damaged in zip(component_ids[changed].tolist(), damaged[changed].tolist()):
+            self.set_damaged(component_id, component_damaged)
+
+    def set_damaged(self, component_id: int, damaged: bool) -> None:
+        if damaged != self.damaged[component_id]:
+            self.damaged[component_id] = damaged
+            self.num_damaged[self.name_ids[component_id]] += 1 if damaged else -1
+
+    def set_functionality_level(self, component_id: int, functionality_level: float) -> None:
+        """
+        Update the counts if the component crossed to or from zero functionality.
+        """
+        functional = functionality_level > 0
+        if functional != self.functional[component_id]:
+            self.functional[component_id] = functional
+            self.num_functional[self.name_ids[component_id]] += 1 if functional else -1
+
+    def get_name_ids(self, component_names: list[str] = None) -> list[int]:
+        if component_names is None:
+            return list(range(len(self.component_names)))
+        return [name_id for name_id, component_name in enumerate(self.component_names) if component_name in component_names]
+
+    def get_num_components(self, component_names: list[str] = None) -> int:
+        """
+        Get the number of components with names in component_names, or of all components if component_names is None.
+        """
+        return sum(self.num_components[name_id] for name_id in self.get_name_ids(component_names))
+
+    def get_num_damaged(self, component_names: list[str] = None) -> int:
+        """
+        Get the number of damaged components with names in component_names, or of all damaged components if component_names is None.
+        """
+        return sum(self.num_damaged[name_id] for name_id in self.get_name_ids(component_names))
+
+    def get_num_functional(self, component_names: list[str] = None) -> int:
+        """
+        Get the number of functional components with names in component_names, or of all functional components if component_names is None.
+        """
+        return sum(self.num_functional[name_id] for name_id in self.get_name_ids(component_names))
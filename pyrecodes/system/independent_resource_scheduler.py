@@ -0,0 +1,157 @@
+from concurrent.futures import ThreadPoolExecutor
+from pyrecodes.component.component import Component
+from pyrecodes.component.standard_irecodes_component import StandardiReCoDeSComponent
+from pyrecodes.component.r2d_component import R2DBuildingWithBusiness
+
+class IndependentResourceScheduler:
+    """
+    Schedules the distribution of Independent Resources at a time step.
+
+    Independent Resources are distributed once per time step. Distributions of resources that do not affect each other are run concurrently in a thread pool,
+    so that the work of distribution models around SimCenter infrastructure simulators (e.g., REWET and the residual demand traffic simulator) overlaps.
+    Threads are used instead of processes, as distribution models update components in place.
+    Simulators redirect only the standard output of their thread (see redirect_thread_stdout in abstract_resource_distribution_model), so simulators in a wave run at the same time,
+    as well as the updates of R2D dictionaries, cached results and the processing of simulator outputs.
+
+    A distribution model is distributed concurrently only if its CONCURRENT_DISTRIBUTION attribute is True. Such a model may update its own state and,
+    through update_supply_based_on_unmet_demand, components that demand its resource for operation.
+    The list of Independent Resources is split into distribution waves: groups of consecutive resources that can be distributed concurrently.
+    A resource starts a new wave if it conflicts with a resource in the current wave, i.e., if:
+
+        | - the distribution of one resource can reduce the supply of the other resource or of the transfer service the other resource uses,
+        | - the distributions of both resources can reduce the supply of the same resource,
+        | - both resources are demanded for operation by a building with businesses, as unmet demand updates the businesses,
+        | - the resources are distributed by distribution models of the same class, as their simulators can share module-level state and output files.
+
+    Waves are distributed one after another, so conflicting resources are distributed in the order of the list and results are the same as in serial distribution.
+
+    Attributes:
+        | components (list[Component]): A list of components in the system.
+        | resources (dict): A dictionary containing resource parameters for the system.
+        | independent_resources (list[str]): A list of Independent Resources, in the order in which they are distributed.
+        | max_workers (int): Maximum number of threads used to distribute a wave. If 1, resources are distributed serially. If None, the ThreadPoolExecutor default is used.
+        | resource_dependency_graph (dict): Maps each Independent Resource to the resources whose supply can be affected by its distribution.
+        | business_buildings (dict): Maps each Independent Resource to the buildings with businesses that demand it for operation.
+        | distribution_waves (list[list[str]]): Groups of Independent Resources in the order in which they are distributed.
+
+    """
+
+    def __init__(self, components: list[Component], resources: dict, independent_resources: list[str], max_workers: int = None):
+        """
+        Initialize the IndependentResourceScheduler and form the distribution waves.
+
+        Args:
+            | components (list[Component]): A list of components in the system.
+            | resources (dict): A dictionary containing resource parameters for the system.
+            | independent_resources (list[str]): A list of Independent Resources.
+            | max_workers (int, optional): Maximum number of threads used to distribute a wave. Set to 1 to distribute resources serially. Defaults to None.
+
+        """
+        self.components = components
+        self.resources = resources
+        self.independent_resources = independent_resources
+        self.max_workers = max_workers
+        self.resource_dependency_graph = self.get_resource_dependency_graph()
+        self.business_buildings = self.get_business_buildings()
+        self.distribution_waves = self.get_distribution_waves()
+
+    def get_resource_dependency_graph(self) -> dict:
+        """
+        Get the resource dependency graph, following the same rule as the InterdependentResourceScheduler.
+
+        Resource A affects resource B if a component has operation demand for resource A, supplies resource B
+        and the supply of resource B can be affected by unmet demand.
+
+        Returns:
+            dict: A dict with Independent Resources as keys and sets of resources whose supply they affect as values.
+
+        """
+        resource_dependency_graph = {resource_name: set() for resource_name in self.independent_resources}
+        for component in self.components:
+            affected_resources = [resource_name for resource_name in component.supply[StandardiReCoDeSComponent.SupplyTypes.SUPPLY.value].keys()
+                                  if component.unmet_demand_can_affect_resource_supply(resource_name)]
+            for demanded_resource in component.demand[StandardiReCoDeSComponent.DemandTypes.OPERATION_DEMAND.value].keys():
+                if demanded_resource in resource_dependency_graph:
+                    resource_dependency_graph[demanded_resource].update(affected_resources)
+        return resource_dependency_graph
+
+    def get_business_buildings(self) -> dict:
+        """
+        Get the buildings with businesses that demand each Independent Resource for operation.
+        """
+        business_buildings = {resource_name: set() for resource_name in self.independent_resources}
+        for component in self.components:
+            if isinstance(component, R2DBuildingWithBusiness) and len(component.businesses) > 0:
+                for demanded_resource in component.demand[StandardiReCoDeSComponent.DemandTypes.OPERATION_DEMAND.value].keys():
+                    if demanded_resource in business_buildings:
+                        business_buildings[demanded_resource].add(component)
+        return business_buildings
+
+    def get_used_resources(self, resource_name: str) -> set:
+        """
+        Get the resources whose supply is used by the distribution of resource_name: the resource itself and the transfer service its distribution model uses.
+        """
+        used_resources = {resource_name}
+        transfer_service_distribution_model = getattr(self.resources[resource_name]['DistributionModel'], 'transfer_service_distribution_model', None)
+        if getattr(transfer_service_distribution_model, 'resource_name', None) is not None:
+            used_resources.add(transfer_service_distribution_model.resource_name)
+        return used_resources
+
+    def resources_conflict(self, resource_name: str, other_resource_name: str) -> bool:
+        """
+        Check whether two Independent Resources have to be distributed one after another. Check out the class docstring for the conflict rules.
+        """
+        distribution_model = self.resources[resource_name]['DistributionModel']
+        other_distribution_model = self.resources[other_resource_name]['DistributionModel']
+        affected_resources = self.resource_dependency_graph[resource_name] | {resource_name}
+        other_affected_resources = self.resource_dependency_graph[other_resource_name] | {other_resource_name}
+        return (len(affected_resources & (other_affected_resources | self.get_used_resources(other_resource_name))) > 0 or
+                len(other_affected_resources & self.get_used_resources(resource_name)) > 0 or
+                len(self.business_buildings[resource_name] & self.business_buildings[other_resource_name]) > 0 or
+                type(distribution_model) is type(other_distribution_model))
+
+    def get_distribution_waves(self) -> list[list[str]]:
+        """
+        Split the list of Independent Resources into distribution waves.
+
+        Resources that can not be distributed concurrently form a wave on their own.
+
+        Returns:
+            list[list[str]]: A list of groups of Independent Resources.
+
+        """
+        distribution_waves = []
+        for resource_name in self.independent_resources:
+            current_wave = distribution_waves[-1] if len(distribution_waves) > 0 else []
+            if (len(current_wave) > 0 and self.can_distribute_concurrently(resource_name) and
+                    self.can_distribute_concurrently(current_wave[0]) and
+                    not any(self.resources_conflict(resource_name, wave_resource) for wave_resource in current_wave)):
+                current_wave.append(resource_name)
+            else:
+                distribution_waves.append([resource_name])
+        return distribution_waves
+
+    def can_distribute_concurrently(self, resource_name: str) -> bool:
+        return getattr(self.resources[resource_name]['DistributionModel'], 'CONCURRENT_DISTRIBUTION', False)
+
+    def distribute(self, time_step: int) -> None:
+        """
+        Distribute Independent Resources at time_step following the distribution waves.
+
+        All distributions in a wave are finished before the next wave is distributed.
+        Exceptions raised in a thread are raised again here.
+
+        Args:
+            time_step (int): The current time step.
+
+        """
+        for distribution_wave in self.distribution_waves:
+            if len(distribution_wave) == 1 or self.max_workers == 1:
+                for resource_name in distribution_wave:
+                    self.resources[resource_name]['DistributionModel'].distribute(time_step)
+            else:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as thread_pool:
+                    futures = [thread_pool.submit(self.resources[resource_name]['DistributionModel'].distribute, time_step)
+                               for resource_name in distribution_wave]
+                    for future in futures:
+                        future.result()
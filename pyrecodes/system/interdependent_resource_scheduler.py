@@ -0,0 +1,189 @@
+from pyrecodes.component.component import Component
+from pyrecodes.component.component import SupplyOrDemand
+from pyrecodes.component.standard_irecodes_component import StandardiReCoDeSComponent
+import math
+
+class InterdependentResourceScheduler:
+    """
+    Schedules the distribution of Interdependent Resources at a time step.
+
+    Distribution of a resource can reduce the supply of other resources if a component that demands the resource for operation
+    supplies other resources and its supply can be affected by unmet demand. These dependencies form a resource dependency graph.
+    The graph is split into strongly connected components (groups of resources that depend on each other) which are distributed in topological order.
+    Within a group, a worklist is used: a resource is distributed again only if its supply, or the supply of the transfer service it uses, changed
+    since its last distribution. The distribution is finished once no resource in the group changes the supply of resources that depend on it.
+
+    Attributes:
+        | components (list[Component]): A list of components in the system.
+        | resources (dict): A dictionary containing resource parameters for the system.
+        | interdependent_resources (list[str]): A list of Interdependent Resources, in the order in which they are distributed in the same group.
+        | resource_dependency_graph (dict): Maps each Interdependent Resource to the resources whose supply can be affected by its distribution.
+        | resources_to_redistribute (dict): Maps each resource in the dependency graph to the Interdependent Resources to distribute again if its supply changes.
+        | distribution_schedule (list[list[str]]): Groups of interdependent resources in the order in which they are distributed.
+
+    """
+
+    def __init__(self, components: list[Component], resources: dict, interdependent_resources: list[str]):
+        """
+        Initialize the InterdependentResourceScheduler and form the distribution schedule.
+
+        Args:
+            | components (list[Component]): A list of components in the system.
+            | resources (dict): A dictionary containing resource parameters for the system.
+            | interdependent_resources (list[str]): A list of Interdependent Resources. Repeated resource names are ignored.
+
+        """
+        self.components = components
+        self.resources = resources
+        self.interdependent_resources = list(dict.fromkeys(interdependent_resources))
+        self.resource_dependency_graph = self.get_resource_dependency_graph()
+        self.resources_to_redistribute = self.get_resources_to_redistribute()
+        self.supplier_components = self.get_supplier_components()
+        self.distribution_schedule = self.get_strongly_connected_components()
+
+    def get_resource_dependency_graph(self) -> dict:
+        """
+        Get the resource dependency graph.
+
+        Resource A affects resource B if a component has operation demand for resource A, supplies resource B
+        and the supply of resource B can be affected by unmet demand.
+
+        Returns:
+            dict: A dict with Interdependent Resources as keys and lists of resources whose supply they affect as values.
+
+        """
+        resource_dependency_graph = {resource_name: [] for resource_name in self.interdependent_resources}
+        for component in self.components:
+            affected_resources = [resource_name for resource_name in component.supply[StandardiReCoDeSComponent.SupplyTypes.SUPPLY.value].keys()
+                                  if component.unmet_demand_can_affect_resource_supply(resource_name)]
+            for demanded_resource in component.demand[StandardiReCoDeSComponent.DemandTypes.OPERATION_DEMAND.value].keys():
+                if demanded_resource in resource_dependency_graph:
+                    for affected_resource in affected_resources:
+                        if affected_resource not in resource_dependency_graph[demanded_resource]:
+                            resource_dependency_graph[demanded_resource].append(affected_resource)
+        return resource_dependency_graph
+
+    def get_resources_to_redistribute(self) -> dict:
+        """
+        Get the Interdependent Resources that have to be distributed again when the supply of a resource in the dependency graph changes.
+
+        An Interdependent Resource has to be distributed again when its own supply changes.
+        Other affected resources, such as Transfer Services, are not distributed again, but the Interdependent Resources that use them are.
+
+        Returns:
+            dict: A dict with affected resources as keys and lists of Interdependent Resources as values.
+
+        """
+        resources_to_redistribute = {}
+        for affected_resources in self.resource_dependency_graph.values():
+            for affected_resource in affected_resources:
+                if affected_resource in self.resource_dependency_graph:
+                    resources_to_redistribute[affected_resource] = [affected_resource]
+                else:
+                    resources_to_redistribute[affected_resource] = self.get_resources_using_transfer_service(affected_resource)
+        return resources_to_redistribute
+
+    def get_resources_using_transfer_service(self, transfer_service_name: str) -> list[str]:
+        """
+        Get Interdependent Resources whose distribution model uses the transfer service transfer_service_name.
+        """
+        resources_using_transfer_service = []
+        for resource_name in self.interdependent_resources:
+            transfer_service_distribution_model = getattr(self.resources[resource_name]['DistributionModel'], 'transfer_service_distribution_model', None)
+            if getattr(transfer_service_distribution_model, 'resource_name', None) == transfer_service_name:
+                resources_using_transfer_service.append(resource_name)
+        return resources_using_transfer_service
+
+    def get_supplier_components(self) -> dict:
+        """
+        Get the components that supply each resource in the dependency graph, so that the supply of a resource can be calculated without going through all components.
+        """
+        return {resource_name: [component for component in self.components if component.has_resource_supply(resource_name)]
+                for resource_name in self.resources_to_redistribute.keys()}
+
+    def get_strongly_connected_components(self) -> list[list[str]]:
+        """
+        Get strongly connected components of the graph in which each Interdependent Resource points to the Interdependent Resources it causes to be distributed again.
+
+        Strongly connected components are found using Tarjan's algorithm and returned in topological order, so that a group of resources
+        is distributed only after all groups that can affect it. Resources within a group keep the order of the interdependent_resources list.
+
+        Returns:
+            list[list[str]]: A list of groups of Interdependent Resources.
+
+        """
+        successors = {resource_name: [redistributed_resource for affected_resource in self.resource_dependency_graph[resource_name]
+                                      for redistributed_resource in self.resources_to_redistribute[affected_resource]]
+                      for resource_name in self.interdependent_resources}
+        index, lowlink, on_stack, stack, strongly_connected_components = {}, {}, set(), [], []
+
+        def strong_connect(resource_name: str) -> None:
+            index[resource_name] = lowlink[resource_name] = len(index)
+            stack.append(resource_name)
+            on_stack.add(resource_name)
+            for successor in successors[resource_name]:
+                if successor not in index:
+                    strong_connect(successor)
+                    lowlink[resource_name] = min(lowlink[resource_name], lowlink[successor])
+                elif successor in on_stack:
+                    lowlink[resource_name] = min(lowlink[resource_name], index[successor])
+            if lowlink[resource_name] == index[resource_name]:
+                strongly_connected_component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    strongly_connected_component.append(member)
+                    if member == resource_name:
+                        break
+                strongly_connected_components.append(sorted(strongly_connected_component, key=self.interdependent_resources.index))
+
+        for resource_name in self.interdependent_resources:
+            if resource_name not in index:
+                strong_connect(resource_name)
+        # Tarjan's algorithm finds strongly connected components in reverse topological order
+        return strongly_connected_components[::-1]
+
+    def get_supply(self, resource_name: str) -> float:
+        """
+        Get the system-level supply for a resource resource_name based on current components' state.
+        """
+        return sum(component.get_current_resource_amount(SupplyOrDemand.SUPPLY.value,
+                                                         StandardiReCoDeSComponent.SupplyTypes.SUPPLY.value,
+                                                         resource_name) for component in self.supplier_components[resource_name])
+
+    def distribute(self, time_step: int) -> int:
+        """
+        Distribute Interdependent Resources at time_step following the distribution schedule.
+
+        Each Interdependent Resource is distributed at least once.
+
+        Args:
+            time_step (int): The current time step.
+
+        Returns:
+            int: The number of resource distributions performed.
+
+        """
+        num_distributions = 0
+        for strongly_connected_component in self.distribution_schedule:
+            worklist = list(strongly_connected_component)
+            while len(worklist) > 0:
+                resource_name = worklist.pop(0)
+                affected_resources = self.resource_dependency_graph[resource_name]
+                supply_before_distribution = [self.get_supply(affected_resource) for affected_resource in affected_resources]
+                self.resources[resource_name]['DistributionModel'].distribute(time_step)
+                num_distributions += 1
+                for affected_resource, supply in zip(affected_resources, supply_before_distribution):
+                    if not (math.isclose(supply, self.get_supply(affected_resource))):
+                        self.add_to_worklist(worklist, self.resources_to_redistribute[affected_resource], strongly_connected_component)
+        return num_distributions
+
+    @staticmethod
+    def add_to_worklist(worklist: list[str], resource_names: list[str], strongly_connected_component: list[str]) -> None:
+        """
+        Add resources from the currently distributed group to the worklist, unless they are already waiting to be distributed.
+        Resources from later groups are not added, as all resources in a group are distributed once the group is reached.
+        """
+        for resource_name in resource_names:
+            if resource_name in strongly_connected_component and resource_name not in worklist:
+                worklist.append(resource_name)
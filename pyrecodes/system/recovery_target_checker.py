@@ -8,8 +8,17 @@ class RecoveryTargetChecker(ABC):
 
     This class defines the interface for checking whether the system has recovered and the resilience assessment interval
     is finished.
+
+    Checkers get the number of damaged and functional components from the system's ComponentStateCounter, which is updated incrementally,
+    so that the check does not scan all components at each time step.
     """
 
+    def __init__(self, parameters: dict = None) -> None:
+        """
+        Set the parameters of the recovery target, e.g., the names of components that the target applies to. Defined in the RecoveryTarget section of the system configuration.
+        """
+        self.parameters = parameters or {}
+
     @abstractmethod
     def recovery_target_met(self, system: System) -> bool:
         """
@@ -46,8 +55,47 @@ class NoDamageRecoveryTargetChecker(RecoveryTargetChecker):
         """
         if system.time_step <= system.DISASTER_TIME_STEP:
             return False
-        else:
-            for component in system.components:
-                if not (math.isclose(component.get_damage_level(), 0, abs_tol=1e-10)):
-                    return False
+        state_counter = getattr(system, 'component_state_counter', None)
+        if state_counter is not None:
+            return state_counter.get_num_damaged() == 0
+        for component in system.components:
+            if not (math.isclose(component.get_damage_level(), 0, abs_tol=1e-10)):
+                return False
         return True
+
+
+class RepairedComponentsRecoveryTargetChecker(RecoveryTargetChecker):
+    """
+    | Recovery target checker where the system has recovered once a percent of components with given names is damage-free, e.g., all water pipes are repaired.
+
+    | Parameters:
+    |   ComponentNames (list[str], optional): Names of components the target applies to. All components if not defined.
+    |   Percent (float, optional): Percent of components (between 0 and 1) that have to be damage-free. Defaults to 1.0.
+    """
+
+    def recovery_target_met(self, system: System) -> bool:
+        if system.time_step <= system.DISASTER_TIME_STEP:
+            return False
+        component_names = self.parameters.get('ComponentNames', None)
+        num_components = system.component_state_counter.get_num_components(component_names)
+        num_repaired = num_components - system.component_state_counter.get_num_damaged(component_names)
+        return num_repaired >= self.parameters.get('Percent', 1.0) * num_components
+
+
+class FunctionalComponentsRecoveryTargetChecker(RecoveryTargetChecker):
+    """
+    | Recovery target checker where the system has recovered once a percent of components with given names is functional, e.g., 95% of buildings are functional.
+    | A component is functional if its functionality level is higher than 0, as in StandardiReCoDeSComponent.check_if_functional.
+
+    | Parameters:
+    |   ComponentNames (list[str], optional): Names of components the target applies to. All components if not defined.
+    |   Percent (float, optional): Percent of components (between 0 and 1) that have to be functional. Defaults to 1.0.
+    """
+
+    def recovery_target_met(self, system: System) -> bool:
+        if system.time_step <= system.DISASTER_TIME_STEP:
+            return False
+        component_names = self.parameters.get('ComponentNames', None)
+        num_components = system.component_state_counter.get_num_components(component_names)
+        num_functional = system.component_state_counter.get_num_functional(component_names)
+        return num_functional >= self.parameters.get('Percent', 1.0) * num_components
@@ -0,0 +1,98 @@
+import numpy as np
+from pyrecodes.component.component import Component, SupplyOrDemand
+from pyrecodes.component.standard_irecodes_component import StandardiReCoDeSComponent
+from pyrecodes.relation.relation import Relation
+from pyrecodes.resource.resource_store import ResourceStore
+
+class ResourceAmountUpdater:
+    """
+    Updates the current amounts of components' supply and operation demand based on components' functionality levels in one pass per relation.
+
+    Resources are grouped by their functionality to amount relation. Relations are shared between components (see relation.get_relation),
+    so all resources that use the same relation are updated with one call to the relation's get_output_array method.
+    Consumable resources are not grouped, as their initial amount changes when they are consumed, and are updated by their components.
+    Grouped resources are marked with amount_updated_in_batch, so that components do not update them again in update_resources_based_on_component_functionality.
+    Components must be bound to a ResourceStore, as the amounts of a group are read from and written to the store's arrays at once.
+    The updater updates components' functionality levels as well and marks components with functionality_updated_in_batch,
+    so functionality levels are computed once per time step and components do not update them again in StandardiReCoDeSComponent.update.
+    Components without consumable supply or operation demand are marked with amounts_updated_in_batch, so they skip updating their supply and operation demand altogether.
+
+    Attributes:
+        | components (list[Component]): A list of components in the system.
+        | resource_store (ResourceStore): The ResourceStore that components are bound to.
+        | relation_groups (list[dict]): Groups of resources updated together. Each group has the Relation, the ids of components, the resource objects
+        | and the slice of the group's resources in store_row_ids and store_column_ids.
+        | store_row_ids (np.ndarray): Rows of all grouped resources in the store, ordered by relation group.
+        | store_column_ids (np.ndarray): Columns of all grouped resources in the store, ordered by relation group.
+
+    """
+
+    def __init__(self, components: list[Component], resource_store: ResourceStore):
+        """
+        Initialize the ResourceAmountUpdater and group components' resources by their functionality to amount relation.
+
+        Args:
+            | components (list[Component]): A list of components in the system.
+            | resource_store (ResourceStore): The ResourceStore that components are bound to.
+
+        Raises:
+            ValueError: If resource_store is None or a component is not bound to it.
+        """
+        if resource_store is None or any(getattr(component, 'resource_store', None) is not resource_store for component in components):
+            raise ValueError('Components must be bound to the ResourceStore to update their resource amounts in one pass per relation.')
+        self.components = components
+        self.resource_store = resource_store
+        self.relation_groups = self.get_relation_groups()
+        resources = [resource_object for relation_group in self.relation_groups for resource_object in relation_group['Resources']]
+        self.store_row_ids = np.array([resource_object.row_id for resource_object in resources], dtype=int)
+        self.store_column_ids = np.array([resource_object.column_id for resource_object in resources], dtype=int)
+        for component in components:
+            component.functionality_updated_in_batch = True
+            component.amounts_updated_in_batch = all(resource_object.amount_updated_in_batch for resource_object in self.get_resources_to_update(component))
+
+    def get_relation_groups(self) -> list[dict]:
+        relation_groups = {}
+        for component_id, component in enumerate(self.components):
+            for resource_object in self.get_resources_to_update(component):
+                if resource_object.CONSUMABLE:
+                    continue
+                relation = resource_object.component_functionality_to_amount
+                relation_group = relation_groups.setdefault(id(relation), {'Relation': relation, 'ComponentIds': [], 'Resources': []})
+                relation_group['ComponentIds'].append(component_id)
+                relation_group['Resources'].append(resource_object)
+                resource_object.amount_updated_in_batch = True
+        start = 0
+        for relation_group in relation_groups.values():
+            relation_group['ComponentIds'] = np.array(relation_group['ComponentIds'], dtype=int)
+            relation_group['Slice'] = slice(start, start + len(relation_group['Resources']))
+            start += len(relation_group['Resources'])
+        return list(relation_groups.values())
+
+    @staticmethod
+    def get_resources_to_update(component: Component) -> list:
+        """
+        Get the component's supply and operation demand resources, i.e., the resources updated based on the component's functionality level.
+        """
+        supply = getattr(component, SupplyOrDemand.SUPPLY.value, {}).get(StandardiReCoDeSComponent.SupplyTypes.SUPPLY.value, {})
+        operation_demand = getattr(component, SupplyOrDemand.DEMAND.value, {}).get(StandardiReCoDeSComponent.DemandTypes.OPERATION_DEMAND.value, {})
+        return list(supply.values()) + list(operation_demand.values())
+
+    def update_functionality_levels(self) -> np.ndarray:
+        """
+        Update components' functionality levels with StandardiReCoDeSComponent.update_functionality and return them, so they are computed once per time step.
+        """
+        for component in self.components:
+            component.update_functionality()
+        return np.fromiter((component.functionality_level for component in self.components), dtype=float, count=len(self.components))
+
+    def update(self) -> None:
+        """
+        Update components' functionality levels and the current amounts of all grouped resources. Called before components are updated in a time step.
+        Each relation evaluates the functionality levels of its group and the current amounts of all groups are written to the store at once.
+        """
+        functionality_levels = self.update_functionality_levels()
+        current_amounts = self.resource_store.initial_amounts[self.store_row_ids, self.store_column_ids]
+        for relation_group in self.relation_groups:
+            relation: Relation = relation_group['Relation']
+            current_amounts[relation_group['Slice']] *= relation.get_output_array(functionality_levels[relation_group['ComponentIds']])
+        self.resource_store.set_current_amounts(self.store_row_ids, self.store_column_ids, current_amounts)
@@ -0,0 +1,113 @@
+from pyrecodes import main
+from pyrecodes.system.system import System
+from pyrecodes.relation import relation
+from pyrecodes.component_recovery_model import activity_precedence_graph
+from pyrecodes.utilities import get_class
+import copy
+
+class SystemTemplate:
+    """
+    Builds an undamaged system once and creates copies of it for independent realizations of the resilience assessment (e.g., in Monte Carlo simulations).
+
+    Creating a copy is much cheaper than creating the system from the input files, as component library and system configuration files are not read again,
+    subsystems are not created again and SimCenter infrastructure simulators are not constructed again.
+
+    Data that does not change during the resilience assessment is shared between the template and its copies, while the rest of the system
+    (e.g., resource amounts, recovery activity levels, resilience calculators) is copied. Shared data is:
+
+        | - component library, system configuration and system creator,
+        | - components' locality, geometry and footprint, and relations and precedence graphs of recovery activities shared between components,
+        | - components' general information, except for the demand dicts that are updated during the resilience assessment,
+        | - network tables and ruleset modules of SimCenter infrastructure simulators.
+
+    Random variables of components (durations of recovery activities) are resampled in every copy.
+    Damage is set during the resilience assessment, so copies can use a different damage input file if the damage input reads it when setting the damage.
+    **Note**: Components created from R2D files get their damage state when they are created, so their damage can not be changed in a copy.
+    Creating a copy with different damage input parameters raises a ValueError for such systems.
+
+    Attributes:
+        | system (System): The undamaged template system. It is never used to run the resilience assessment.
+        | shared_objects (list): Objects shared between the template and its copies.
+        | damage_set_at_creation (bool): True if some components get their damage when they are created.
+
+    """
+
+    SHARED_COMPONENT_ATTRIBUTES = ['locality', 'geometry', 'footprint']
+    MUTABLE_GENERAL_INFORMATION_KEYS = ['OperationDemand', 'RecoveryDemand']
+    SHARED_FLOW_SIMULATOR_ATTRIBUTES = ['edges_df', 'nodes_df', 'building_df', 'capacity_ruleset', 'demand_ruleset']
+
+    def __init__(self, input_dict: dict):
+        """
+        Create the template system.
+
+        Args:
+            input_dict (dict): The input dictionary from the main JSON configuration file.
+        """
+        self.system = main.create_system(input_dict)
+        self.shared_objects = self.get_shared_objects()
+        self.damage_set_at_creation = self.check_damage_set_at_creation(self.system.system_configuration)
+
+    @staticmethod
+    def check_damage_set_at_creation(system_configuration: dict) -> bool:
+        """
+        Check if any subsystem creator in the system configuration sets the damage of components when creating them (e.g., R2DSubsystemCreator).
+
+        Args:
+            system_configuration (dict): The system configuration.
+
+        Returns:
+            bool: True if some components get their damage when they are created.
+        """
+        for content in system_configuration.get('Content', {}).values():
+            for subsystems_list in content['Components'].values():
+                for subsystem in subsystems_list:
+                    subsystem_content = list(subsystem.values())[0]
+                    subsystem_creator_class = get_class(subsystem_content['CreatorFileName'], subsystem_content['CreatorClassName'], 'subsystem_creator')
+                    if subsystem_creator_class.SETS_DAMAGE_AT_CREATION:
+                        return True
+        return False
+
+    def get_shared_objects(self) -> list:
+        """
+        Get the objects that are shared between the template and its copies.
+
+        Returns:
+            list: A list of shared objects.
+        """
+        shared_objects = [self.system.component_library, self.system.system_configuration, self.system.system_creator]
+        shared_objects += list(relation.shared_relations.values())
+        shared_objects += list(activity_precedence_graph.shared_precedence_graphs.values())
+        for component in self.system.components:
+            shared_objects += [getattr(component, attribute_name) for attribute_name in self.SHARED_COMPONENT_ATTRIBUTES
+                               if getattr(component, attribute_name, None) is not None]
+            for key, value in getattr(component, 'general_information', {}).items():
+                if key not in self.MUTABLE_GENERAL_INFORMATION_KEYS:
+                    shared_objects.append(value)
+        for resource_parameters in self.system.resources.values():
+            flow_simulator = getattr(resource_parameters['DistributionModel'], 'flow_simulator', None)
+            shared_objects += [getattr(flow_simulator, attribute_name) for attribute_name in self.SHARED_FLOW_SIMULATOR_ATTRIBUTES
+                               if getattr(flow_simulator, attribute_name, None) is not None]
+        return shared_objects
+
+    def create_system(self, damage_input_parameters: dict = None) -> System:
+        """
+        Create a copy of the template system with resampled random variables.
+
+        Args:
+            damage_input_parameters (dict, optional): Damage input parameters to use instead of the ones in the system configuration, e.g., with a different DamageFile. Defaults to None.
+
+        Returns:
+            System: A copy of the template system, ready for the resilience assessment.
+
+        Raises:
+            ValueError: If damage input parameters are provided, but some components got their damage when the template was created.
+        """
+        if damage_input_parameters is not None and self.damage_set_at_creation:
+            raise ValueError('Components of the system template get their damage when they are created. Create the system from the input files to use a different damage input.')
+        memo = {id(shared_object): shared_object for shared_object in self.shared_objects}
+        system = copy.deepcopy(self.system, memo)
+        for component in system.components:
+            component.sample_random_variables()
+        if damage_input_parameters is not None:
+            system.set_damage_input(damage_input_parameters)
+        return system
@@ -2,6 +2,7 @@ from pyrecodes.system_creator.system_creator import SystemCreator
 from pyrecodes.component.component import Component
 from pyrecodes.resilience_calculator.resilience_calculator import ResilienceCalculator
 from pyrecodes.resource_distribution_model.resource_distribution_model import ResourceDistributionModel
+from pyrecodes.system.recovery_target_checker import RecoveryTargetChecker
 from pyrecodes.utilities import get_class, get_locality_coordinates_from_geojson
 
 class ConcreteSystemCreator(SystemCreator):
@@ -112,6 +113,11 @@ class ConcreteSystemCreator(SystemCreator):
             resilience_calculators.append(target_resilience_calculator(resilience_calculator_parameters['Parameters']))
         return resilience_calculators
 
+    def get_recovery_target_checker(self) -> RecoveryTargetChecker:
+        recovery_target_parameters = self.system_configuration.get('RecoveryTarget', {'FileName': 'recovery_target_checker', 'ClassName': 'NoDamageRecoveryTargetChecker'})
+        target_recovery_target_checker = get_class(recovery_target_parameters['FileName'], recovery_target_parameters['ClassName'], 'system')
+        return target_recovery_target_checker(recovery_target_parameters.get('Parameters', {}))
+
     def get_locality_coordinates(self, content) -> dict:
         locality_info = content.get('Coordinates', {})
         if list(locality_info.keys())[0] == 'BoundingBox' or list(locality_info.keys())[0] == 'Centroid':
@@ -0,0 +1,374 @@
+"""
+Module used to store histories of components and businesses over time steps compactly.
+
+TimeStepIntervals stores time steps as run-length intervals and is the default history of the time steps at which a component is functional.
+The other histories are preallocated typed arrays used in the compact object mode (COMPACT_OBJECTS constant in the system configuration) instead of Python lists and dicts,
+which store a pointer and often an object per time step. Arrays are sized to the MAX_TIME_STEP of the resilience assessment and grow if a later time step is recorded.
+Histories are exported to dense (histories x time steps) uint8 matrices with get_state_matrix.
+"""
+import bisect
+import numpy as np
+
+def get_array_size(max_time_step: int, time_step: int) -> int:
+    """
+    Get the size of a history array that has to hold time_step. Arrays at least double when they grow, so that recording time steps one by one stays cheap.
+    """
+    return max(2 * max_time_step, time_step + 1)
+
+def get_history_array(history, num_time_steps: int) -> np.ndarray:
+    """
+    Get a boolean array of num_time_steps time steps, True at the time steps in the history. Time steps after num_time_steps are ignored.
+
+    Args:
+        | history: A TimeStepIntervals, a TimeStepSet or an iterable of time steps, e.g., a list.
+        | num_time_steps (int): The number of time steps in the array.
+
+    Returns:
+        np.ndarray: Boolean array of length num_time_steps.
+    """
+    if isinstance(history, (TimeStepIntervals, TimeStepSet)):
+        return history.to_array(num_time_steps)
+    history_array = np.zeros(num_time_steps, dtype=bool)
+    time_steps = np.fromiter(history, dtype=int)
+    history_array[time_steps[(time_steps >= 0) & (time_steps < num_time_steps)]] = True
+    return history_array
+
+def get_state_matrix(histories: list, num_time_steps: int) -> np.ndarray:
+    """
+    Get a dense (histories x time steps) uint8 matrix, 1 at the time steps in a history and 0 otherwise, e.g., the functional state of components over time.
+    """
+    state_matrix = np.zeros((len(histories), num_time_steps), dtype=np.uint8)
+    for history_id, history in enumerate(histories):
+        state_matrix[history_id] = get_history_array(history, num_time_steps)
+    return state_matrix
+
+class TimeStepIntervals:
+    """
+    | Set of time steps stored as sorted, non-overlapping [start, end) intervals of consecutive time steps. Used for the time steps at which a component is functional.
+
+    | Components are usually functional over long runs of time steps, so a history needs a few intervals instead of an entry per time step.
+    | Behaves like the list of time steps it replaces: time steps are appended, iterated in ascending order and compared with lists.
+    | Membership is checked with a binary search over interval starts, in O(log n) for n intervals.
+
+    Attributes:
+        | starts (list[int]): First time steps of intervals.
+        | ends (list[int]): Time steps after the last time steps of intervals.
+        | num_time_steps (int): Number of time steps in the intervals.
+
+    """
+
+    starts: list[int]
+    ends: list[int]
+    num_time_steps: int
+
+    def __init__(self, time_steps: list = ()) -> None:
+        self.starts = []
+        self.ends = []
+        self.num_time_steps = 0
+        for time_step in time_steps:
+            self.append(time_step)
+
+    def append(self, time_step: int) -> None:
+        """
+        Add a time step. Time steps are usually added in ascending order, which extends the last interval or starts a new one.
+        """
+        if len(self.ends) > 0 and self.ends[-1] == time_step:
+            self.ends[-1] += 1
+        elif len(self.ends) == 0 or self.ends[-1] < time_step:
+            self.starts.append(time_step)
+            self.ends.append(time_step + 1)
+        elif time_step in self:
+            return
+        else:
+            self.insert(time_step)
+        self.num_time_steps += 1
+
+    def add_interval(self, start_time_step: int, end_time_step: int) -> None:
+        """
+        Add the time steps from start_time_step up to end_time_step (not included), merging the interval with the intervals it overlaps or touches.
+        """
+        if start_time_step >= end_time_step:
+            return
+        first_interval_id = bisect.bisect_left(self.ends, start_time_step)
+        last_interval_id = bisect.bisect_right(self.starts, end_time_step)
+        if first_interval_id < last_interval_id:
+            start_time_step = min(start_time_step, self.starts[first_interval_id])
+            end_time_step = max(end_time_step, self.ends[last_interval_id - 1])
+            self.num_time_steps -= sum(end - start for start, end in zip(self.starts[first_interval_id:last_interval_id], self.ends[first_interval_id:last_interval_id]))
+        self.starts[first_interval_id:last_interval_id] = [start_time_step]
+        self.ends[first_interval_id:last_interval_id] = [end_time_step]
+        self.num_time_steps += end_time_step - start_time_step
+
+    def insert(self, time_step: int) -> None:
+        """
+        Add a time step before the last interval, merging it with the neighbouring intervals.
+        """
+        interval_id = bisect.bisect_right(self.starts, time_step)
+        if interval_id > 0 and self.ends[interval_id - 1] == time_step:
+            self.ends[interval_id - 1] += 1
+            if self.ends[interval_id - 1] == self.starts[interval_id]:
+                self.ends[interval_id - 1] = self.ends.pop(interval_id)
+                self.starts.pop(interval_id)
+        elif self.starts[interval_id] == time_step + 1:
+            self.starts[interval_id] = time_step
+        else:
+            self.starts.insert(interval_id, time_step)
+            self.ends.insert(interval_id, time_step + 1)
+
+    @property
+    def intervals(self) -> list[list[int]]:
+        return [[start, end] for start, end in zip(self.starts, self.ends)]
+
+    def __contains__(self, time_step) -> bool:
+        interval_id = bisect.bisect_right(self.starts, time_step) - 1
+        return interval_id >= 0 and time_step < self.ends[interval_id]
+
+    def __iter__(self):
+        return (time_step for start, end in zip(self.starts, self.ends) for time_step in range(start, end))
+
+    def __len__(self) -> int:
+        return self.num_time_steps
+
+    def __getitem__(self, index):
+        if index == 0 and len(self.starts) > 0:
+            return self.starts[0]
+        if index == -1 and len(self.ends) > 0:
+            return self.ends[-1] - 1
+        return list(self)[index]
+
+    def to_array(self, num_time_steps: int) -> np.ndarray:
+        history_array = np.zeros(num_time_steps, dtype=bool)
+        for start, end in zip(self.starts, self.ends):
+            history_array[start:end] = True
+        return history_array
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TimeStepIntervals):
+            return self.starts == other.starts and self.ends == other.ends
+        if isinstance(other, (TimeStepSet, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'TimeStepIntervals({self.intervals})'
+
+class TimeStepSet:
+    """
+    | Set of time steps stored as a boolean array, with time steps as indices. Used for the time steps at which a component is functional.
+
+    | Behaves like the list of time steps it replaces: time steps are appended, iterated in ascending order and compared with lists.
+    | Membership is checked in constant time.
+
+    Attributes:
+        | recorded (np.ndarray): True at the recorded time steps.
+        | num_time_steps (int): Number of recorded time steps.
+
+    """
+
+    recorded: np.ndarray
+    num_time_steps: int
+
+    def __init__(self, max_time_step: int, time_steps: list = ()) -> None:
+        self.recorded = np.zeros(max(max_time_step, 1), dtype=bool)
+        self.num_time_steps = 0
+        for time_step in time_steps:
+            self.append(time_step)
+
+    def append(self, time_step: int) -> None:
+        if time_step >= len(self.recorded):
+            self.recorded = np.concatenate([self.recorded, np.zeros(get_array_size(len(self.recorded), time_step) - len(self.recorded), dtype=bool)])
+        if not self.recorded[time_step]:
+            self.recorded[time_step] = True
+            self.num_time_steps += 1
+
+    def add_interval(self, start_time_step: int, end_time_step: int) -> None:
+        """
+        Add the time steps from start_time_step up to end_time_step (not included).
+        """
+        if start_time_step >= end_time_step:
+            return
+        if end_time_step > len(self.recorded):
+            self.recorded = np.concatenate([self.recorded, np.zeros(get_array_size(len(self.recorded), end_time_step - 1) - len(self.recorded), dtype=bool)])
+        self.num_time_steps += end_time_step - start_time_step - int(np.count_nonzero(self.recorded[start_time_step:end_time_step]))
+        self.recorded[start_time_step:end_time_step] = True
+
+    def __contains__(self, time_step) -> bool:
+        return 0 <= time_step < len(self.recorded) and bool(self.recorded[time_step])
+
+    def __iter__(self):
+        return iter(np.flatnonzero(self.recorded).tolist())
+
+    def __len__(self) -> int:
+        return self.num_time_steps
+
+    def __getitem__(self, index):
+        return np.flatnonzero(self.recorded).tolist()[index]
+
+    def to_array(self, num_time_steps: int) -> np.ndarray:
+        history_array = np.zeros(num_time_steps, dtype=bool)
+        num_recorded = min(num_time_steps, len(self.recorded))
+        history_array[:num_recorded] = self.recorded[:num_recorded]
+        return history_array
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (TimeStepSet, TimeStepIntervals, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'TimeStepSet({list(self)})'
+
+class TimeStepValues:
+    """
+    | Values per time step stored as a float array, with time steps as indices. Used for the daily revenue of a business.
+
+    | Behaves like the dict of time steps and values it replaces. Time steps without a value are marked in a boolean array.
+
+    Attributes:
+        | value_array (np.ndarray): Values at time steps.
+        | recorded (np.ndarray): True at time steps that have a value.
+
+    """
+
+    value_array: np.ndarray
+    recorded: np.ndarray
+
+    def __init__(self, max_time_step: int, values: dict = None) -> None:
+        self.value_array = np.zeros(max(max_time_step, 1))
+        self.recorded = np.zeros(max(max_time_step, 1), dtype=bool)
+        for time_step, value in (values or {}).items():
+            self[time_step] = value
+
+    def __setitem__(self, time_step: int, value: float) -> None:
+        if time_step >= len(self.value_array):
+            new_size = get_array_size(len(self.value_array), time_step)
+            self.value_array = np.concatenate([self.value_array, np.zeros(new_size - len(self.value_array))])
+            self.recorded = np.concatenate([self.recorded, np.zeros(new_size - len(self.recorded), dtype=bool)])
+        self.value_array[time_step] = value
+        self.recorded[time_step] = True
+
+    def __getitem__(self, time_step: int) -> float:
+        if time_step not in self:
+            raise KeyError(time_step)
+        return float(self.value_array[time_step])
+
+    def __contains__(self, time_step) -> bool:
+        return 0 <= time_step < len(self.recorded) and bool(self.recorded[time_step])
+
+    def get(self, time_step: int, default=None):
+        return self[time_step] if time_step in self else default
+
+    def keys(self) -> list[int]:
+        return np.flatnonzero(self.recorded).tolist()
+
+    def values(self) -> list[float]:
+        return self.value_array[self.recorded].tolist()
+
+    def items(self) -> list[tuple]:
+        return list(zip(self.keys(), self.values()))
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.recorded))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (TimeStepValues, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'TimeStepValues({dict(self.items())})'
+
+class TimeStepRecords:
+    """
+    | Named records per time step, e.g., the reasons for the drop of a business' functionality with the functionality level they caused.
+
+    | Record names are interned as codes in the names list. Codes and levels of records are stored in (time steps x records) arrays,
+    | in the order in which records were added in a time step. The number of record columns grows if a time step has more records than columns.
+    | Behaves like the dict of time steps and lists of {'Name': name, 'Level': level} records it replaces, for time steps that were reset or have records.
+
+    Attributes:
+        | names (list[str]): Names of records. The code of a record is the index of its name.
+        | codes (np.ndarray): Codes of records, -1 where there is no record.
+        | levels (np.ndarray): Levels of records.
+        | recorded (np.ndarray): True at time steps that were reset or have records.
+
+    """
+
+    names: list[str]
+    codes: np.ndarray
+    levels: np.ndarray
+    recorded: np.ndarray
+
+    def __init__(self, max_time_step: int, records: dict = None, num_records_per_time_step: int = 2) -> None:
+        self.names = []
+        self.codes = np.full((max(max_time_step, 1), num_records_per_time_step), -1, dtype=np.int16)
+        self.levels = np.zeros((max(max_time_step, 1), num_records_per_time_step))
+        self.recorded = np.zeros(max(max_time_step, 1), dtype=bool)
+        for time_step, time_step_records in (records or {}).items():
+            self.reset(time_step)
+            for record in time_step_records:
+                self.add(time_step, record['Name'], record['Level'])
+
+    def grow(self, time_step: int, num_records: int) -> None:
+        num_rows, num_columns = self.codes.shape
+        new_num_rows = get_array_size(num_rows, time_step) if time_step >= num_rows else num_rows
+        new_num_columns = 2 * num_columns if num_records > num_columns else num_columns
+        codes = np.full((new_num_rows, new_num_columns), -1, dtype=np.int16)
+        levels = np.zeros((new_num_rows, new_num_columns))
+        codes[:num_rows, :num_columns] = self.codes
+        levels[:num_rows, :num_columns] = self.levels
+        self.codes, self.levels = codes, levels
+        self.recorded = np.concatenate([self.recorded, np.zeros(new_num_rows - num_rows, dtype=bool)])
+
+    def reset(self, time_step: int) -> None:
+        """
+        Remove the records of the time step, keeping it as a time step with an empty list of records.
+        """
+        if time_step >= len(self.recorded):
+            self.grow(time_step, 0)
+        self.codes[time_step] = -1
+        self.recorded[time_step] = True
+
+    def add(self, time_step: int, name: str, level: float) -> None:
+        if time_step >= len(self.recorded):
+            self.grow(time_step, 0)
+        record_id = int(np.count_nonzero(self.codes[time_step] >= 0))
+        if record_id >= self.codes.shape[1]:
+            self.grow(time_step, record_id + 1)
+        if name not in self.names:
+            self.names.append(name)
+        self.codes[time_step, record_id] = self.names.index(name)
+        self.levels[time_step, record_id] = level
+        self.recorded[time_step] = True
+
+    def __getitem__(self, time_step: int) -> list[dict]:
+        if time_step not in self:
+            raise KeyError(time_step)
+        return [{'Name': self.names[code], 'Level': float(level)}
+                for code, level in zip(self.codes[time_step].tolist(), self.levels[time_step].tolist()) if code >= 0]
+
+    def __contains__(self, time_step) -> bool:
+        return 0 <= time_step < len(self.recorded) and bool(self.recorded[time_step])
+
+    def keys(self) -> list[int]:
+        return np.flatnonzero(self.recorded).tolist()
+
+    def items(self) -> list[tuple]:
+        return [(time_step, self[time_step]) for time_step in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.recorded))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (TimeStepRecords, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'TimeStepRecords({dict(self.items())})'
@@ -38,4 +38,45 @@ def get_locality_coordinates_from_geojson(locality_info: dict) -> dict:
     return {'BoundingBox': geojson_file['features'][0]['geometry']['coordinates'][0][0]}
 
 def format_locality_id(locality_string) -> int:
-    return int(locality_string.split(' ')[-1])
\ No newline at end of file
+    return int(locality_string.split(' ')[-1])
+
+
+def get_shared_object(shared_objects: dict, key, create_object, max_shared_objects: int):
+    """
+    Get the object stored under key in shared_objects, a module-level dict of objects shared between components. If the object is not stored, it is created by calling create_object.
+    At most max_shared_objects objects are kept, the oldest object is removed first, so the dict does not grow with the number of distinct keys.
+    """
+    if key not in shared_objects:
+        if len(shared_objects) >= max_shared_objects:
+            del shared_objects[next(iter(shared_objects))]
+        shared_objects[key] = create_object()
+    return shared_objects[key]
+
+def get_attributes(obj: object) -> dict:
+    """
+    Get the attributes of an object that are set, both in its __dict__ and in its __slots__ (see ConcreteResource and ConcreteRecoveryActivity).
+    """
+    attributes = dict(getattr(obj, '__dict__', {}))
+    for cls in type(obj).__mro__:
+        for attribute_name in cls.__dict__.get('__slots__', ()):
+            if attribute_name not in attributes and hasattr(obj, attribute_name):
+                attributes[attribute_name] = getattr(obj, attribute_name)
+    return attributes
+
+def set_attributes(obj: object, state) -> None:
+    """
+    Set the attributes of an object from its pickled state. The state is a dict of attributes, as pickled before the object's class defined __slots__,
+    or a (dict, slots dict) tuple, as pickled for objects with __slots__.
+    Attributes are set directly in the __dict__ and the slots, as properties of subclasses (e.g., ResourceView) may depend on objects that are not restored yet.
+    Attributes that are neither in the __dict__ nor in the slots (e.g., time_steps of old ConcreteRecoveryActivity objects) are set with setattr.
+    """
+    instance_dict, slots_dict = state if isinstance(state, tuple) else (state, None)
+    slot_descriptors = {attribute_name: cls.__dict__[attribute_name] for cls in reversed(type(obj).__mro__)
+                        for attribute_name in cls.__dict__.get('__slots__', ()) if attribute_name != '__dict__'}
+    for attribute_name, value in {**(instance_dict or {}), **(slots_dict or {})}.items():
+        if attribute_name in slot_descriptors:
+            slot_descriptors[attribute_name].__set__(obj, value)
+        elif hasattr(obj, '__dict__'):
+            obj.__dict__[attribute_name] = value
+        else:
+            setattr(obj, attribute_name, value)
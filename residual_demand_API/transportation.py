@@ -49,11 +49,13 @@ import os
 import json
 import logging
 import sys
+import threading
 import time
 import copy
 import importlib
 import math
 from collections import defaultdict
+from contextlib import contextmanager
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Set, Tuple, Dict, Literal, Union, Optional
@@ -66,6 +68,8 @@ import numpy as np
 import pandana.network as pdna
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
 from scipy.spatial.distance import cdist
 from shapely.wkt import loads
 import warnings
@@ -105,6 +109,288 @@ def calculate_road_capacity(nlanes: int,
     """
     return nlanes * traffic_volume_per_lane
 
+
+class RoutingBackend(ABC):
+    """
+    An abstract base class for shortest path routing on the road network.
+
+    The backend is created once for a node table and keeps the graph topology
+    (the start and end nodes of open edges) between calls to set_edges. The
+    topology is rebuilt only if the open edges change, e.g., due to closures.
+    Otherwise, only the edge weights are updated, so that the cost of a traffic
+    assignment substep is dominated by path queries rather than preprocessing.
+
+    Attributes__
+        nodes_df (pd.DataFrame): Node table with node ids as index and 'x' and
+                                 'y' coordinate columns.
+        two_way_edges (bool): Flag indicating if edges can be traversed in
+                              both directions.
+        start_nid (np.ndarray): Start node ids of the current edges.
+        end_nid (np.ndarray): End node ids of the current edges.
+        edge_index (pd.MultiIndex): Index mapping (start, end) node id pairs
+                                    to edge ids, i.e., positions of the
+                                    current edges.
+    """
+
+    def __init__(self, nodes_df, two_way_edges=False):  # noqa: FBT002
+        self.nodes_df = nodes_df
+        self.two_way_edges = two_way_edges
+        self.start_nid = None
+        self.end_nid = None
+
+    def uses_nodes(self, nodes_df, two_way_edges) -> bool:
+        """Check if the backend was created for the node table and edge direction."""
+        return self.nodes_df is nodes_df and self.two_way_edges == two_way_edges
+
+    def set_edges(self, start_nid, end_nid, weights) -> None:
+        """
+        Set the edges of the road network and their weights.
+
+        Args:
+            start_nid (array-like): Start node ids of the edges.
+            end_nid (array-like): End node ids of the edges.
+            weights (array-like): Edge weights, e.g., travel times.
+        """
+        start_nid = np.asarray(start_nid)
+        end_nid = np.asarray(end_nid)
+        if (
+            self.start_nid is None
+            or not np.array_equal(self.start_nid, start_nid)
+            or not np.array_equal(self.end_nid, end_nid)
+        ):
+            self.set_topology(start_nid, end_nid)
+            self.start_nid = start_nid
+            self.end_nid = end_nid
+            self.edge_index = pd.MultiIndex.from_arrays([start_nid, end_nid])
+        self.set_weights(np.asarray(weights, dtype=float))
+
+    def get_edge_ids(self, from_nodes, to_nodes) -> np.ndarray:
+        """
+        Get ids of the edges between pairs of nodes.
+
+        Args:
+            from_nodes (array-like): Start node ids.
+            to_nodes (array-like): End node ids.
+
+        Returns
+        -------
+            np.ndarray: Edge ids, i.e., positions in the edges set in set_edges.
+        """
+        edge_ids = self.edge_index.get_indexer(
+            pd.MultiIndex.from_arrays([from_nodes, to_nodes])
+        )
+        if np.any(edge_ids < 0):
+            missing = np.flatnonzero(edge_ids < 0)[0]
+            raise KeyError(f'{from_nodes[missing]}-{to_nodes[missing]}')
+        return edge_ids
+
+    def get_path_edge_ids(self, paths) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Convert paths of node ids into edge ids.
+
+        Args:
+            paths (list): Paths as arrays of node ids.
+
+        Returns
+        -------
+            tuple: Concatenated edge ids of all paths and offsets of each
+                   path's edges in the concatenated array.
+        """
+        path_sizes = np.fromiter((len(path) for path in paths), dtype=int, count=len(paths))
+        nodes = np.concatenate(
+            [np.asarray(path) for path in paths] + [np.empty(0, dtype=self.start_nid.dtype)]
+        ).astype(self.start_nid.dtype, copy=False)
+        has_next_node = np.ones(len(nodes), dtype=bool)
+        has_next_node[np.cumsum(path_sizes)[path_sizes > 0] - 1] = False
+        hops = np.flatnonzero(has_next_node)
+        edge_offsets = np.zeros(len(paths) + 1, dtype=int)
+        edge_offsets[1:] = np.cumsum(np.maximum(path_sizes - 1, 0))
+        return self.get_edge_ids(nodes[hops], nodes[hops + 1]), edge_offsets
+
+    @abstractmethod
+    def set_topology(self, start_nid, end_nid) -> None:
+        """Build the graph topology from the start and end node ids of edges."""
+
+    @abstractmethod
+    def set_weights(self, weights) -> None:
+        """Update the weights of the edges set in set_topology."""
+
+    @abstractmethod
+    def route(self, origins, destinations) -> tuple[list, np.ndarray]:
+        """
+        Find shortest paths and their lengths between origin and destination nodes.
+
+        Args:
+            origins (array-like): Origin node ids.
+            destinations (array-like): Destination node ids.
+
+        Returns
+        -------
+            tuple: List of paths as arrays of node ids (empty if there is no
+                   path) and an array of path lengths.
+        """
+
+    def shortest_paths(self, origins, destinations) -> list:
+        """Find shortest paths as arrays of node ids between origin and destination nodes."""
+        return self.route(origins, destinations)[0]
+
+
+# pandana prints from C++ to file descriptor 1, which is shared by all
+# threads of the process. Only pandana calls hold this lock while the file
+# descriptor is redirected, so other simulators can run concurrently.
+PANDANA_OUTPUT_LOCK = threading.Lock()
+
+
+@contextmanager
+def suppress_pandana_output():
+    """Redirect file descriptor 1 to os.devnull while pandana runs."""
+    with PANDANA_OUTPUT_LOCK, open(os.devnull, 'w') as devnull:  # noqa: PTH123
+        sys.stdout.flush()
+        original_stdout_fd = os.dup(1)
+        try:
+            os.dup2(devnull.fileno(), 1)
+            yield
+        finally:
+            os.dup2(original_stdout_fd, 1)
+            os.close(original_stdout_fd)
+
+
+class PandanaRoutingBackend(RoutingBackend):
+    """
+    Routing backend using pandana's contraction hierarchies.
+
+    Contraction hierarchies depend on edge weights, so the pandana network is
+    rebuilt every time the weights are updated. pandana's console output is
+    suppressed with suppress_pandana_output.
+    """
+
+    def set_topology(self, start_nid, end_nid) -> None:  # noqa: D102
+        self.net = None
+
+    def set_weights(self, weights) -> None:  # noqa: D102
+        with suppress_pandana_output():
+            self.net = pdna.Network(
+                self.nodes_df['x'],
+                self.nodes_df['y'],
+                pd.Series(self.start_nid),
+                pd.Series(self.end_nid),
+                pd.DataFrame({'weight': weights}),
+                twoway=self.two_way_edges,
+            )
+
+    def route(self, origins, destinations) -> tuple[list, np.ndarray]:  # noqa: D102
+        paths = self.shortest_paths(origins, destinations)
+        with suppress_pandana_output():
+            path_lengths = np.asarray(self.net.shortest_path_lengths(origins, destinations))
+        return paths, path_lengths
+
+    def shortest_paths(self, origins, destinations) -> list:  # noqa: D102
+        with suppress_pandana_output():
+            return self.net.shortest_paths(origins, destinations)
+
+
+class CSRRoutingBackend(RoutingBackend):
+    """
+    Routing backend using a CSR graph and SciPy's Dijkstra algorithm.
+
+    The CSR structure is built once per topology. Parallel edges between the
+    same pair of nodes are merged into a single entry with the minimum weight,
+    and weights are updated in place. Dijkstra is run once for each unique
+    origin, in chunks of SOURCE_CHUNK_SIZE origins to limit memory usage.
+    Unreachable destinations get an empty path and an infinite path length.
+    """
+
+    SOURCE_CHUNK_SIZE = 256
+
+    def __init__(self, nodes_df, two_way_edges=False):  # noqa: FBT002
+        super().__init__(nodes_df, two_way_edges)
+        self.node_ids = nodes_df.index.to_numpy()
+        self.node_indexes = pd.Index(self.node_ids)
+        self.graph = None
+
+    def get_node_indexes(self, node_ids) -> np.ndarray:
+        """Map node ids to graph node indexes."""
+        node_indexes = self.node_indexes.get_indexer(np.asarray(node_ids))
+        if np.any(node_indexes < 0):
+            msg = 'Node ids are not in the network node table.'
+            raise ValueError(msg)
+        return node_indexes
+
+    def set_topology(self, start_nid, end_nid) -> None:  # noqa: D102
+        start = self.get_node_indexes(start_nid)
+        end = self.get_node_indexes(end_nid)
+        if self.two_way_edges:
+            start, end = np.concatenate([start, end]), np.concatenate([end, start])
+        self.edge_order = np.lexsort((end, start))
+        start = start[self.edge_order]
+        end = end[self.edge_order]
+        new_entry = np.ones(len(start), dtype=bool)
+        new_entry[1:] = (start[1:] != start[:-1]) | (end[1:] != end[:-1])
+        self.entry_starts = np.flatnonzero(new_entry)
+        num_nodes = len(self.node_ids)
+        indptr = np.zeros(num_nodes + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum(
+            np.bincount(start[self.entry_starts], minlength=num_nodes)
+        )
+        self.graph = csr_matrix(
+            (
+                np.zeros(len(self.entry_starts)),
+                end[self.entry_starts].astype(np.int32),
+                indptr,
+            ),
+            shape=(num_nodes, num_nodes),
+        )
+
+    def set_weights(self, weights) -> None:  # noqa: D102
+        if len(self.entry_starts) == 0:
+            return
+        if self.two_way_edges:
+            weights = np.concatenate([weights, weights])
+        self.graph.data[:] = np.minimum.reduceat(
+            weights[self.edge_order], self.entry_starts
+        )
+
+    def route(self, origins, destinations) -> tuple[list, np.ndarray]:  # noqa: D102
+        origin_indexes = self.get_node_indexes(origins)
+        destin_indexes = self.get_node_indexes(destinations)
+        sources, source_rows = np.unique(origin_indexes, return_inverse=True)
+        paths = [None] * len(origin_indexes)
+        lengths = np.full(len(origin_indexes), np.inf)
+        for chunk_start in range(0, len(sources), self.SOURCE_CHUNK_SIZE):
+            chunk_sources = sources[chunk_start : chunk_start + self.SOURCE_CHUNK_SIZE]
+            distances, predecessors = dijkstra(
+                self.graph,
+                directed=True,
+                indices=chunk_sources,
+                return_predecessors=True,
+            )
+            od_ids = np.flatnonzero(
+                (source_rows >= chunk_start)
+                & (source_rows < chunk_start + len(chunk_sources))
+            )
+            for od_id in od_ids:
+                row = source_rows[od_id] - chunk_start
+                lengths[od_id] = distances[row, destin_indexes[od_id]]
+                paths[od_id] = self.get_path(
+                    chunk_sources[row],
+                    destin_indexes[od_id],
+                    predecessors[row],
+                    lengths[od_id],
+                )
+        return paths, lengths
+
+    def get_path(self, source, destination, predecessors, length) -> np.ndarray:
+        """Reconstruct the path from source to destination from Dijkstra's predecessors."""
+        if np.isinf(length):
+            return np.array([], dtype=self.node_ids.dtype)
+        path = [destination]
+        while path[-1] != source:
+            path.append(predecessors[path[-1]])
+        return self.node_ids[path[::-1]]
+
+
+ROUTING_BACKENDS = {'csr': CSRRoutingBackend, 'pandana': PandanaRoutingBackend}
+
 class TransportationPerformance(ABC):  # noqa: B024
     """
     An abstract base class for simulating transportation networks.
@@ -165,6 +451,7 @@ class TransportationPerformance(ABC):  # noqa: B024
         od_file=None,
         hour_list=[],  # noqa: B006
         tmp_dir=None,
+        routing_backend_name='csr',
     ):  # noqa: B006, RUF100, UP007
         """
         Initialize the TransportationPerformance class with essential data.
@@ -179,6 +466,9 @@ class TransportationPerformance(ABC):  # noqa: B024
             no_identifier (dict): A mapping of asset types to their unique
                                   identifiers.
             network_inventory (dict): A dictionary of "edges" and "nodes" file.
+            routing_backend_name (str): Name of the shortest path routing
+                                        backend in ROUTING_BACKENDS ('csr' or
+                                        'pandana').
         """
         if assets is None:
             assets = ['Bridge', 'Roadway', 'Tunnel']
@@ -213,6 +503,31 @@ class TransportationPerformance(ABC):  # noqa: B024
         self.od_file = od_file
         self.hour_list = hour_list
         self.tmp_dir = tmp_dir
+        self.routing_backend_name = routing_backend_name
+        self.routing_backend = None
+
+    def get_routing_backend(self, nodes_df, two_way_edges=False):  # noqa: FBT002
+        """
+        Get the routing backend for the node table.
+
+        The backend is reused between assignments on the same node table, so the
+        graph topology is only rebuilt if the open edges change.
+
+        Args:
+            nodes_df (pd.DataFrame): DataFrame containing node information.
+            two_way_edges (bool): Flag indicating if edges are two-way.
+
+        Returns
+        -------
+            RoutingBackend: The routing backend.
+        """
+        if self.routing_backend is None or not self.routing_backend.uses_nodes(
+            nodes_df, two_way_edges
+        ):
+            self.routing_backend = ROUTING_BACKENDS[self.routing_backend_name](
+                nodes_df, two_way_edges
+            )
+        return self.routing_backend
 
     def closest_neighbour(self, building_df, nodes_df):
         # Find the nearest road network node to each building
@@ -494,10 +809,14 @@ class TransportationPerformance(ABC):  # noqa: B024
         alpha_f=0.3,
         beta_f=3,
         two_way_edges=False,  # noqa: FBT002
+        routing_backend=None,
     ):
         """
         Perform substep assignment for transportation network simulation.
 
+        Edge volumes, current vehicles, flows and average travel times are
+        updated in place in weighted_edges_df.
+
         Args:
             nodes_df (pd.DataFrame): DataFrame containing node information.
             weighted_edges_df (pd.DataFrame): DataFrame containing edge information with weights.
@@ -515,148 +834,146 @@ class TransportationPerformance(ABC):  # noqa: B024
             alpha_f (float): Alpha factor for travel time calculation.
             beta_f (float): Beta factor for travel time calculation.
             two_way_edges (bool): Flag indicating if edges are two-way.
+            routing_backend (RoutingBackend): Routing backend reused between
+                                              substeps. If None, the backend
+                                              of the node table is used.
 
         Returns
         -------
-            tuple: Updated edges DataFrame, residual OD list, trip information, and agent paths.
+            tuple: Updated edges DataFrame (weighted_edges_df), residual OD list, trip information, and agent paths.
         """
         # open_edges_df = weighted_edges_df.loc[weighted_edges_df['fft'] < 36000]
         open_edges_df = weighted_edges_df
 
-        net = pdna.Network(
-            nodes_df['x'],
-            nodes_df['y'],
+        if routing_backend is None:
+            routing_backend = self.get_routing_backend(nodes_df, two_way_edges)
+        # Only edge weights change between substeps, so the topology is reused
+        routing_backend.set_edges(
             open_edges_df['start_nid'],
             open_edges_df['end_nid'],
-            open_edges_df[['weight']],
-            twoway=two_way_edges,
+            open_edges_df['weight'],
         )
 
-        # print('network')  # noqa: RUF100, T201
-        net.set(pd.Series(net.node_ids))
-        # print('net')  # noqa: RUF100, T201
-
         nodes_origin = od_ss['origin_nid'].to_numpy()
         nodes_destin = od_ss['destin_nid'].to_numpy()
         nodes_current = od_ss['current_nid'].to_numpy()
         agent_ids = od_ss['agent_id'].to_numpy()
         agent_current_links = od_ss['current_link'].to_numpy()
         agent_current_link_times = od_ss['current_link_time'].to_numpy()
-        paths = net.shortest_paths(nodes_current, nodes_destin)
+        paths, path_lengths = routing_backend.route(nodes_current, nodes_destin)
 
         # check agent time limit
-        path_lengths = net.shortest_path_lengths(nodes_current, nodes_destin)
-        remove_agent_list = []
         if agent_time_limit is None:
-            pass
+            removed_agents = np.zeros(len(agent_ids), dtype=bool)
         else:
-            for agent_idx, agent_id in enumerate(agent_ids):
-                planned_trip_length = path_lengths[agent_idx]
-                # agent_time_limit[agent_id]
-                trip_length_limit = agent_time_limit
-                if planned_trip_length > trip_length_limit + 0:
-                    remove_agent_list.append(agent_id)
-
-        edge_travel_time_dict = weighted_edges_df['t_avg'].T.to_dict()
-        edge_current_vehicles = weighted_edges_df['veh_current'].T.to_dict()
-        edge_quarter_vol = weighted_edges_df['vol_true'].T.to_dict()
-        # edge_length_dict = weighted_edges_df['length'].T.to_dict()
-        od_residual_ss_list = []
-        # all_paths = []
-        path_i = 0
-        for path in paths:
-            trip_origin = nodes_origin[path_i]
-            trip_destin = nodes_destin[path_i]
-            agent_id = agent_ids[path_i]
-            # remove some agent (path too long)
-            if agent_id in remove_agent_list:
-                path_i += 1
-                # no need to update trip info
-                continue
-            remaining_time = (
-                3600 / quarter_counts + agent_current_link_times[path_i]
-            )
-            used_time = 0
-            for edge_s, edge_e in zip(path, path[1:]):
-                edge_str = f'{edge_s}-{edge_e}'
-                edge_travel_time = edge_travel_time_dict[edge_str]
-                if (remaining_time > edge_travel_time) and (
-                    edge_travel_time < 36000  # noqa: PLR2004
-                ):
-                    # all_paths.append(edge_str)
-                    # p_dist += edge_travel_time
-                    remaining_time -= edge_travel_time
-                    used_time += edge_travel_time
-                    edge_quarter_vol[edge_str] += 1 * sample_interval
-                    trip_stop = edge_e
-                    if edge_str == agent_current_links[path_i]:
-                        edge_current_vehicles[edge_str] -= 1 * sample_interval
-                else:
-                    if edge_str != agent_current_links[path_i]:
-                        edge_current_vehicles[edge_str] += 1 * sample_interval
-                    new_current_link = edge_str
-                    new_current_link_time = remaining_time
-                    trip_stop = edge_s
-                    od_residual_ss_list.append(
-                        [
-                            agent_id,
-                            trip_origin,
-                            trip_destin,
-                            trip_stop,
-                            new_current_link,
-                            new_current_link_time,
-                        ]
-                    )
-                    break
-            trip_info[(agent_id, trip_origin, trip_destin)][0] += (
-                3600 / quarter_counts
+            removed_agents = path_lengths > agent_time_limit + 0
+
+        # Edges are identified by their position in weighted_edges_df
+        edge_ids, edge_offsets = routing_backend.get_path_edge_ids(paths)
+        path_edge_counts = np.diff(edge_offsets)
+        edge_agents = np.repeat(np.arange(len(agent_ids)), path_edge_counts)
+        agent_current_link_ids = weighted_edges_df.index.get_indexer(
+            agent_current_links
+        )
+        edge_travel_times = weighted_edges_df['t_avg'].to_numpy(dtype=float)
+        edge_quarter_vol = weighted_edges_df['vol_true'].to_numpy()
+        edge_current_vehicles = weighted_edges_df['veh_current'].to_numpy()
+        edge_quarter_vol = edge_quarter_vol.astype(
+            np.result_type(edge_quarter_vol, sample_interval)
+        )
+        edge_current_vehicles = edge_current_vehicles.astype(
+            np.result_type(edge_current_vehicles, sample_interval)
+        )
+
+        # Move all agents along their paths one edge at a time, until the
+        # remaining time is not enough to traverse the next edge
+        remaining_times = 3600 / quarter_counts + agent_current_link_times.astype(
+            float
+        )
+        used_times = np.zeros(len(agent_ids))
+        traversed_edge_counts = path_edge_counts.copy()
+        moving_agents = np.flatnonzero(~removed_agents & (path_edge_counts > 0))
+        hop = 0
+        while len(moving_agents) > 0:
+            hop_travel_times = edge_travel_times[
+                edge_ids[edge_offsets[moving_agents] + hop]
+            ]
+            traversed = (remaining_times[moving_agents] > hop_travel_times) & (
+                hop_travel_times < 36000  # noqa: PLR2004
             )
-            trip_info[(agent_id, trip_origin, trip_destin)][1] += used_time
-            trip_info[(agent_id, trip_origin, trip_destin)][2] = trip_stop
-            trip_info[(agent_id, trip_origin, trip_destin)][3] = hour
-            trip_info[(agent_id, trip_origin, trip_destin)][4] = quarter
-            trip_info[(agent_id, trip_origin, trip_destin)][5] = ss_id
-            path_i += 1
-
-        new_edges_df = weighted_edges_df[
+            traversed_edge_counts[moving_agents[~traversed]] = hop
+            moving_agents = moving_agents[traversed]
+            remaining_times[moving_agents] -= hop_travel_times[traversed]
+            used_times[moving_agents] += hop_travel_times[traversed]
+            hop += 1
+            moving_agents = moving_agents[path_edge_counts[moving_agents] > hop]
+
+        edge_hops = np.arange(len(edge_ids)) - edge_offsets[edge_agents]
+        traversed_edges = ~removed_agents[edge_agents] & (
+            edge_hops < traversed_edge_counts[edge_agents]
+        )
+        np.add.at(edge_quarter_vol, edge_ids[traversed_edges], 1 * sample_interval)
+        left_current_link = traversed_edges & (
+            edge_ids == agent_current_link_ids[edge_agents]
+        )
+        np.add.at(
+            edge_current_vehicles, edge_ids[left_current_link], -1 * sample_interval
+        )
+        stopped_agents = np.flatnonzero(
+            ~removed_agents & (traversed_edge_counts < path_edge_counts)
+        )
+        stop_edge_ids = edge_ids[
+            edge_offsets[stopped_agents] + traversed_edge_counts[stopped_agents]
+        ]
+        entered_new_link = stop_edge_ids != agent_current_link_ids[stopped_agents]
+        np.add.at(
+            edge_current_vehicles,
+            stop_edge_ids[entered_new_link],
+            1 * sample_interval,
+        )
+
+        trip_stops = np.array(nodes_current)
+        completed_paths = np.flatnonzero(path_edge_counts > 0)
+        trip_stops[completed_paths] = routing_backend.end_nid[
+            edge_ids[edge_offsets[completed_paths + 1] - 1]
+        ]
+        trip_stops[stopped_agents] = routing_backend.start_nid[stop_edge_ids]
+        od_residual_ss_list = [
             [
-                'uniqueid',
-                'u',
-                'v',
-                'start_nid',
-                'end_nid',
-                'fft',
-                'capacity',
-                'normal_fft',
-                'normal_capacity',
-                'length',
-                'vol_true',
-                'vol_tot',
-                'veh_current',
-                'geometry',
+                agent_ids[agent_idx],
+                nodes_origin[agent_idx],
+                nodes_destin[agent_idx],
+                trip_stops[agent_idx],
+                weighted_edges_df.index[stop_edge_id],
+                remaining_times[agent_idx],
             ]
-        ].copy()
-        # new_edges_df = new_edges_df.join(edge_volume, how='left')
-        # new_edges_df['vol_ss'] = new_edges_df['vol_ss'].fillna(0)
-        # new_edges_df['vol_true'] += new_edges_df['vol_ss']
-        new_edges_df['vol_true'] = new_edges_df.index.map(edge_quarter_vol)
-        new_edges_df['veh_current'] = new_edges_df.index.map(
-            edge_current_vehicles
-        )
-        # new_edges_df['vol_tot'] += new_edges_df['vol_ss']
-        new_edges_df['flow'] = (
-            new_edges_df['vol_true'] * quarter_demand / assigned_demand
-        ) * quarter_counts
-        new_edges_df['t_avg'] = new_edges_df['fft'] * (
+            for agent_idx, stop_edge_id in zip(stopped_agents, stop_edge_ids)
+        ]
+        for agent_idx in np.flatnonzero(~removed_agents):
+            trip = trip_info[
+                (agent_ids[agent_idx], nodes_origin[agent_idx], nodes_destin[agent_idx])
+            ]
+            trip[0] += 3600 / quarter_counts
+            trip[1] += used_times[agent_idx]
+            trip[2] = trip_stops[agent_idx]
+            trip[3] = hour
+            trip[4] = quarter
+            trip[5] = ss_id
+
+        # Update edge volumes and travel times in place
+        weighted_edges_df['vol_true'] = edge_quarter_vol
+        weighted_edges_df['veh_current'] = edge_current_vehicles
+        edge_flows = (edge_quarter_vol * quarter_demand / assigned_demand) * quarter_counts
+        edge_travel_times = weighted_edges_df['fft'].to_numpy() * (
             1
             + alpha_f
-            * (new_edges_df['flow'] / new_edges_df['capacity']) ** beta_f
+            * (edge_flows / weighted_edges_df['capacity'].to_numpy()) ** beta_f
         )
-        new_edges_df['t_avg'] = np.where(
-            new_edges_df['t_avg'] > 36000, 36000, new_edges_df['t_avg']  # noqa: PLR2004
-        )
-        new_edges_df['t_avg'] = new_edges_df['t_avg'].round(2)
-        return new_edges_df, od_residual_ss_list, trip_info, agents_path
+        weighted_edges_df['flow'] = edge_flows
+        weighted_edges_df['t_avg'] = np.where(
+            edge_travel_times > 36000, 36000, edge_travel_times  # noqa: PLR2004
+        ).round(2)
+        return weighted_edges_df, od_residual_ss_list, trip_info, agents_path
     def write_edge_vol(
         self,
         edges_df=None,
@@ -841,19 +1158,18 @@ class TransportationPerformance(ABC):  # noqa: B024
 
         # Nikola: have issues with this way of redirecting output
         # different way of supressing the print statements
-        net = pdna.Network(
-                    nodes_df['x'],
-                    nodes_df['y'],
-                    open_edges_df['start_nid'],
-                    open_edges_df['end_nid'],
-                    open_edges_df[['fft']],
-                    twoway=two_way_edges,
-                )
-        net.set(pd.Series(net.node_ids))
-        paths = net.shortest_paths(orig, dest)
+        routing_backend = self.get_routing_backend(nodes_df, two_way_edges)
+        routing_backend.set_edges(
+            open_edges_df['start_nid'],
+            open_edges_df['end_nid'],
+            open_edges_df['fft'],
+        )
+        paths = routing_backend.shortest_paths(orig, dest)
         no_path_ind = [i for i in range(len(paths)) if len(paths[i]) == 0]
         od_no_path = od_all.iloc[no_path_ind].copy()
         od_all = od_all.drop(od_no_path.index)
+        # Closed links are dropped from the road network
+        edges_df = open_edges_df.copy()
 
         od_all['current_nid'] = od_all['origin_nid']
         trip_info = {
@@ -995,7 +1311,6 @@ class TransportationPerformance(ABC):  # noqa: B024
                         if assigned_demand == 0:
                             continue
                         # calculate weight
-                        weighted_edges_df = edges_df.copy()
                         # weight by travel distance
                         # weighted_edges_df['weight'] = edges_df['length']
                         # weight by travel time
@@ -1006,10 +1321,7 @@ class TransportationPerformance(ABC):  # noqa: B024
                         # + cost_factor*edges_df['length']*0.1*(
                         # edges_df['is_highway'])
                         # 10 yen per 100 m --> 0.1 yen per m
-                        weighted_edges_df['weight'] = edges_df['t_avg']
-                        open_edges_df = weighted_edges_df[
-                            ~weighted_edges_df['uniqueid'].isin(closed_links['uniqueid'].to_numpy())
-                        ]
+                        edges_df['weight'] = edges_df['t_avg']
                         # weighted_edges_df['weight'] = np.where(
                         # weighted_edges_df['weight']<0.1, 0.1,
                         # weighted_edges_df['weight'])
@@ -1021,7 +1333,7 @@ class TransportationPerformance(ABC):  # noqa: B024
                             agents_path,
                         ) = self.substep_assignment(
                             nodes_df=nodes_df,
-                            weighted_edges_df=open_edges_df,
+                            weighted_edges_df=edges_df,
                             od_ss=od_ss,
                             quarter_demand=quarter_demand,
                             assigned_demand=assigned_demand,
@@ -1036,6 +1348,7 @@ class TransportationPerformance(ABC):  # noqa: B024
                             alpha_f=alpha_f,
                             beta_f=beta_f,
                             two_way_edges=two_way_edges,
+                            routing_backend=routing_backend,
                         )
                         od_residual_list += od_residual_ss_list
                         # write_edge_vol(edges_df=edges_df,
@@ -1419,6 +1732,7 @@ class pyrecodes_residual_demand(TransportationPerformance):
         demand_ruleset_script,
         r2d_dict,
         two_way_edges=False,  # noqa: FBT002
+        routing_backend_name='csr',
     ):
         # Default not save pandana output
         self.tmp_dir = Path.cwd()
@@ -1476,10 +1790,14 @@ class pyrecodes_residual_demand(TransportationPerformance):
         self.connect_buildings_to_nodes(nodes_gdf, r2d_dict)
 
         self.od_pre_file = od_pre_file
+        # OD matrix used instead of reading od_pre_file, if set before the first simulation
+        self.od_pre = None
         self.initial_r2d_dict = None
         self.hour_list = hour_list
         self.results_dir = results_dir
         self.two_way_edges = two_way_edges
+        self.routing_backend_name = routing_backend_name
+        self.routing_backend = None
 
         # import update_edges from capacity_ruleset_script
         module_name = Path(capacity_ruleset_script).stem
@@ -1527,7 +1845,10 @@ class pyrecodes_residual_demand(TransportationPerformance):
             pd.DataFrame: DataFrame containing trip information.
         """
         if self.initial_r2d_dict is None:
-            od_matrix = pd.read_csv(self.od_pre_file)
+            if self.od_pre is None:
+                od_matrix = pd.read_csv(self.od_pre_file)
+            else:
+                od_matrix = self.od_pre.copy()
             self.initial_od = copy.deepcopy(od_matrix)
             self.initial_r2d_dict = copy.deepcopy(r2d_dict)
         else:
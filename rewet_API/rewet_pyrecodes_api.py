@@ -37,17 +37,26 @@
 
 """Provide Interface between REWET and PYReCoDes."""
 
-import sys
+import contextlib
 import copy
 import json
+import math
 import random
 from pathlib import Path
 
 import pandas as pd
 import rewet
 import wntrfr
+from rewet import Damage, Result, Timeline
 from rewet.api import API as REWET_API
+from rewet.EnhancedWNTR.network.model import WaterNetworkModel
+from rewet.Input.Input_IO import resolve_path
+from rewet.Input.Settings import PROCESS_PATH_LIKE_KEYS, SCENARIO_PATH_LIKE_KEYS
+from rewet.Project import Project
+from rewet.restoration.model import Restoration
+from rewet.restoration.registry import Registry
 from sklearn.cluster import KMeans
+from wntrfr.utils.ordered_set import OrderedSet
 
 # Nikola: moved these constant into the class constructor
 # TEMP_DIR = './'
@@ -55,6 +64,160 @@ from sklearn.cluster import KMeans
 # INPUT_FILE_DIR = './'
 
 
+class REWETSession(REWET_API):
+    """
+    Keep REWET inputs in memory between the time steps of a recovery simulation.
+
+    The REWET API reads the settings, damage list and damage files from disk
+    and parses the inp file every time it is initiated. The session applies
+    the settings once, parses the inp file once and gets damages as pandas
+    objects, so no input or result files are written at each time step.
+    REWET splits damaged pipes in its network model and cannot undo that, so
+    each time step starts from a copy of the parsed undamaged network.
+    """
+
+    def __init__(self, settings, damage_list):
+        """
+        Apply the settings and parse the inp file.
+
+        Parameters
+        ----------
+        settings : dict
+            REWET settings, as written to REWET's json input file.
+        damage_list : pandas.DataFrame
+            REWET damage list with a single damage scenario.
+
+        Returns
+        -------
+        None.
+
+        """
+        super().__init__(None)
+        # the json round trip keeps settings' values the same as when they are
+        # read from REWET's json input file
+        for key, value in json.loads(json.dumps(settings)).items():
+            self.settings[key] = value
+        self.settings.resolve_settings_path(PROCESS_PATH_LIKE_KEYS)
+        self.settings.resolve_settings_path(SCENARIO_PATH_LIKE_KEYS)
+
+        self.damage_list = damage_list
+        self.project = Project(self.settings, self.damage_list)
+
+        inp_file_path = resolve_path(self.settings.process['WN_INP'])
+        self._clean_wn = WaterNetworkModel(inp_file_path)
+        self._clean_wn.options.time.hydraulic_timestep = int(
+            self.settings['hydraulic_time_step']
+        )
+
+        demand_ratio = self.settings.process['demand_ratio']
+        for junction_name, junction in self._clean_wn.junctions():  # noqa: B007
+            base_value = junction.demand_timeseries_list[0].base_value
+            if base_value > 0:
+                junction.demand_timeseries_list[0].base_value = base_value * demand_ratio
+
+        # REWET's Result compares delivered demands to the demands in the
+        # undamaged network parsed with wntrfr
+        self.undamaged_wn = wntrfr.network.WaterNetworkModel(inp_file_path)
+        self.demand_node_name_list = [
+            node_name
+            for node_name, node in self.undamaged_wn.junctions()
+            if node.demand_timeseries_list[0].base_value > 0
+        ]
+
+    def start(self, current_time, run_time, damages, debug=False):  # noqa: FBT002
+        """
+        Start a new REWET run from the undamaged network.
+
+        Parameters
+        ----------
+        current_time : int
+            Current time in seconds.
+        run_time : int
+            Length of the run in seconds.
+        damages : dict
+            Pipe, Node, Pump and Tank damages in REWET's pickle format.
+        debug : bool
+            If True, REWET raises exceptions.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.current_time = current_time
+        self.iDebug = debug
+        self.mpi_rank = None
+        self.settings['RUN_TIME'] = run_time
+        self.settings['minimum_simulation_time'] = run_time
+        self._prev_isolated_junctions = OrderedSet()
+        self._prev_isolated_links = OrderedSet()
+
+        self.wn = copy.deepcopy(self._clean_wn)
+        self.damage = Damage(None, self.settings.scenario)
+        self.registry = Registry(
+            self.wn,
+            self.settings,
+            self.damage_list.loc[0, 'Scenario Name'],
+            copy.deepcopy(damages['Pipe']),
+            copy.deepcopy(damages['Node']),
+            copy.deepcopy(damages['Pump']),
+            copy.deepcopy(damages['Tank']),
+            self.damage,
+        )
+        self.restoration = Restoration(
+            self.settings.scenario['Restortion_config_file'],
+            self.registry,
+            self.damage,
+        )
+        self.timeline = Timeline(
+            self.wn,
+            self.damage,
+            self.registry,
+            self.settings.process['RUN_TIME'],
+            self.restoration,
+            mode='PDD',
+            i_restoration=self.settings.process['Restoration_on'],
+        )
+        self._if_init = True
+
+    def get_satisfied_demand_ratio(self):
+        """
+        Get the satisfied demand ratio of demand nodes from the registry.
+
+        It matches REWET's Result.getDeliveredDemandRatio, without saving and
+        loading the registry.
+
+        Returns
+        -------
+        delivered_demand_ratio : pandas.DataFrame
+            Satisfied demand ratio of demand nodes at each result time.
+
+        """
+        result = copy.deepcopy(self.registry.result)
+        Result.remove_maximum_trials(result)
+        delivered_demand = result.node['demand']
+
+        required_demand = Result._getRequiredDemandForAllNodesandtime(  # noqa: SLF001
+            self.undamaged_wn,
+            self.demand_node_name_list,
+            delivered_demand.index,
+            self.settings.process['demand_ratio'],
+        ).filter(self.demand_node_name_list)
+
+        common_nodes_demand = list(
+            set(delivered_demand.columns).intersection(set(self.demand_node_name_list))
+        )
+        left_overs = list(set(self.demand_node_name_list) - set(common_nodes_demand))
+
+        delivered_demand = delivered_demand[common_nodes_demand].sort_index()
+        required_demand = required_demand[common_nodes_demand].sort_index()
+
+        delivered_demand_ratio = delivered_demand / required_demand
+        delivered_demand_ratio.loc[:, left_overs] = 0.0
+
+        return delivered_demand_ratio
+
+
 class REWETPyReCoDes:
     """Provide the wrapper for REWET API."""
 
@@ -64,7 +227,7 @@ class REWETPyReCoDes:
     # RESULT_DIR = './rewet_result'
     # INPUT_FILE_DIR = './'
 
-    def __init__(self, state: dict, resource_name: str, inp_file_path: str, result_dir='./rewet_result', temp_dir='./'):
+    def __init__(self, state: dict, resource_name: str, inp_file_path: str, result_dir='./rewet_result', temp_dir='./', persistent_session=False, redirect_stdout=contextlib.redirect_stdout):  # noqa: FBT002
         self.wn = None
         self._clean_wn = None
         self.asset_information = {}
@@ -83,6 +246,14 @@ class REWETPyReCoDes:
         self.inp_file_path = inp_file_path
         self.result_dir = result_dir
         self.temp_dir = temp_dir
+        # If True, REWET inputs are kept in a REWETSession between time steps
+        # instead of being written to and read from files at each time step.
+        self.persistent_session = persistent_session
+        self.session = None
+        # Context manager that redirects REWET's output to the log file.
+        # contextlib.redirect_stdout replaces sys.stdout of the whole process,
+        # callers running REWET in a thread can pass a redirection of the thread's output.
+        self.redirect_stdout = redirect_stdout
 
         # Nikola: added this attribute - needed to get demand from the state dict
         self.resource_name = resource_name
@@ -154,6 +325,8 @@ class REWETPyReCoDes:
             The ratio of satiesfied water for each building.
 
         """
+        if self.persistent_session:
+            return self.session_performance(state, current_time, next_time)
 
         self.wn = copy.deepcopy(self._clean_wn)
         # sets the damage state based on the current (change of the network)
@@ -163,12 +336,9 @@ class REWETPyReCoDes:
         # prepare rewet inputs
         self.make_rewet_inputs(current_time, next_time)
 
-        system_std_out = sys.stdout
         rewet_log_path = Path(self.result_dir) / "rewet_log.txt"
 
-        with rewet_log_path.open('at') as log_file:
-            sys.stdout = log_file
-
+        with rewet_log_path.open('at') as log_file, self.redirect_stdout(log_file):
             # load REWET API interface
             self.rewet = REWET_API(self.input_file_path)
 
@@ -188,10 +358,77 @@ class REWETPyReCoDes:
             building_satisfaction = self.get_building_data_satisfaction(method='mean')
             self.building_satisfaction = building_satisfaction
 
-            sys.stdout = system_std_out
+        return building_satisfaction
+
+    def session_performance(self, state, current_time, next_time):
+        """
+        Assess the system functionality in the persistent REWET session.
+
+        Parameters
+        ----------
+        state : dict.
+            The _det file content.
+        current_time : int
+            Current time in seconds.
+        next_time : int
+            Next time in seconds.
+
+        Returns
+        -------
+        building_satisfaction : dict
+            The ratio of satiesfied water for each building.
+
+        """
+        self.set_damage_state(state, current_time)
+
+        rewet_log_path = Path(self.result_dir) / "rewet_log.txt"
+
+        with rewet_log_path.open('at') as log_file, self.redirect_stdout(log_file):
+            if self.session is None:
+                self.session = REWETSession(
+                    self.get_rewet_settings(current_time, next_time),
+                    self.get_session_damage_list(),
+                )
+            self.rewet = self.session
+
+            # sets the new demand based on the new percentage
+            self.set_new_demand(state)
+
+            # run WDN performance evaluation
+            self.run_performance(current_time, next_time)
+
+            # Get result
+            building_satisfaction = self.get_building_data_satisfaction(method='mean')
+            self.building_satisfaction = building_satisfaction
 
         return building_satisfaction
 
+    def get_session_damage_list(self):
+        """
+        Create the damage list of the persistent REWET session.
+
+        Damages are passed to the session directly, so the list only names
+        the damage scenario.
+
+        Returns
+        -------
+        damage_list : pandas.DataFrame
+            REWET damage list with a single damage scenario.
+
+        """
+        return pd.DataFrame.from_dict(
+            [
+                {
+                    'Scenario Name': 'SCN_',
+                    'Pipe Damage': None,
+                    'Nodal Damage': None,
+                    'Pump Damage': None,
+                    'Tank Damage': None,
+                    'Probability': 1,
+                }
+            ]
+        )
+
     def read_inp_file(self, inp_file):
         """
         Read the inp file.
@@ -217,6 +454,7 @@ class REWETPyReCoDes:
         # Read the inp file and create the WDN object file
         self.wn = wntrfr.network.model.WaterNetworkModel(self.inp_file_path)
         self._clean_wn = copy.deepcopy(self.wn)
+        self.demand_pattern_cycle = self.get_demand_pattern_cycle(self.wn)
 
         for node_name, node in self.wn.junctions():
             node_demand_base_value = node.demand_timeseries_list[0].base_value
@@ -229,6 +467,55 @@ class REWETPyReCoDes:
 
                 self.nodes[node_name]['coordinates'] = node.coordinates
 
+    def get_demand_pattern_cycle(self, wn):
+        """
+        Get the length of the cycle after which the patterns of the WDN repeat.
+
+        Parameters
+        ----------
+        wn : wntrfr.network.model.WaterNetworkModel
+            The WDN object.
+
+        Returns
+        -------
+        int
+            The cycle length in seconds, or 0 if the WDN has no time-varying
+            patterns.
+
+        """
+        pattern_timestep = int(wn.options.time.pattern_timestep)
+        cycle = 0
+        for pattern_name, pattern in wn.patterns():  # noqa: B007
+            if len(set(pattern.multipliers)) > 1:
+                pattern_duration = len(pattern.multipliers) * pattern_timestep
+                cycle = pattern_duration if cycle == 0 else math.lcm(cycle, pattern_duration)
+
+        return cycle
+
+    def get_demand_pattern_time(self, time):
+        """
+        Get the time within the cycle of the WDN patterns.
+
+        REWET results at two times with the same pattern time and the same
+        damage and demand state are the same.
+
+        Parameters
+        ----------
+        time : int
+            Time in seconds.
+
+        Returns
+        -------
+        int
+            The pattern time in seconds.
+
+        """
+        if self.demand_pattern_cycle == 0:
+            return 0
+
+        pattern_start = int(self._clean_wn.options.time.pattern_start)
+        return (int(time) + pattern_start) % self.demand_pattern_cycle
+
     def set_asset_data(self, state):
         """
         Set the asset information from state file.
@@ -584,6 +871,41 @@ class REWETPyReCoDes:
             demand += self.buildings[building_name]['initial_demand']
         return demand
     
+    def set_damage_state(self, state, current_time):
+        """
+        Set REWET damages from state and keep them in the damage state.
+
+        Parameters
+        ----------
+        state : dict
+            _det file in dict format.
+        current_time : int
+            Current time.
+
+        Raises
+        ------
+        ValueError
+            Damages are already set for the current time.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.set_rewet_damage_from_state(state, current_time)
+
+        if current_time in self.damage_state:
+            raise ValueError(  # noqa: TRY003
+                f'The time {current_time} is already in ' f' damage state.'  # noqa: EM102
+            )
+
+        self.damage_state[current_time] = {
+            'Pipe': self.pipe_damage,
+            'Node': self.node_damage,
+            'Pump': self.pump_damage,
+            'Tank': self.tank_damage,
+        }
+
     def save_damage(self, state, current_time):
         """
         Convert and save the dmaages that are set before.
@@ -617,19 +939,7 @@ class REWETPyReCoDes:
         pump_path = str(pump_path)
 
         # self.damage_state[current_time] = damage
-        self.set_rewet_damage_from_state(state, current_time)
-
-        if current_time in self.damage_state:
-            raise ValueError(  # noqa: TRY003
-                f'The time {current_time} is already in ' f' damage state.'  # noqa: EM102
-            )
-
-        self.damage_state[current_time] = {
-            'Pipe': self.pipe_damage,
-            'Node': self.node_damage,
-            'Pump': self.pump_damage,
-            'Tank': self.tank_damage,
-        }
+        self.set_damage_state(state, current_time)
 
         self.pipe_damage.to_pickle(pipe_path)
         self.node_damage.to_pickle(node_path)
@@ -686,9 +996,17 @@ class REWETPyReCoDes:
                 'the hydraulci time step.'
             )
 
-        status = self.rewet.initiate(current_time=current_time, debug=True)
-        if status != 0:
-            raise ValueError(f'There is an error: {status}')  # noqa: EM102, TRY003
+        if self.rewet is self.session:
+            self.session.start(
+                current_time,
+                next_time - current_time,
+                self.damage_state[current_time],
+                debug=True,
+            )
+        else:
+            status = self.rewet.initiate(current_time=current_time, debug=True)
+            if status != 0:
+                raise ValueError(f'There is an error: {status}')  # noqa: EM102, TRY003
 
         self.rewet.apply_damage(current_time, 0.001)
 
@@ -720,8 +1038,6 @@ class REWETPyReCoDes:
         None.
 
         """
-        settings = get_rewet_hydraulic_basic_setting()
-        run_time = next_time - current_time
         list_file_path = Path(self.list_path)
         list_file_path = list_file_path.resolve()
         if not list_file_path.exists():
@@ -730,6 +1046,41 @@ class REWETPyReCoDes:
             )
         list_file_path = str(list_file_path)
 
+        settings = self.get_rewet_settings(current_time, next_time)
+        settings['pipe_damage_file_list'] = list_file_path
+
+        input_file_path = Path(self.temp_dir) / 'rewet_input.json'
+        input_file_path = input_file_path.resolve()
+        with open(input_file_path, 'w') as f:  # noqa: PTH123
+            json.dump(settings, f, indent=4)
+
+        self.input_file_path = str(input_file_path)
+
+    def get_rewet_settings(self, current_time, next_time):
+        """
+        Create REWET settings for a run from current to next time.
+
+        Parameters
+        ----------
+        current_time : int
+            Current time in seconds.
+        next_time : TYPE
+            Next stop time in seconds.
+
+        Raises
+        ------
+        ValueError
+            Path are not available.
+
+        Returns
+        -------
+        settings : dict
+            REWET settings.
+
+        """
+        settings = get_rewet_hydraulic_basic_setting()
+        run_time = next_time - current_time
+
         temp_dir = Path(self.temp_dir).resolve()
         if not temp_dir.exists():
             raise ValueError(f'The temp directory does not exists: ' f'{temp_dir!s}')  # noqa: EM102, TRY003
@@ -740,17 +1091,11 @@ class REWETPyReCoDes:
         settings['result_directory'] = self.result_dir
         settings['temp_directory'] = temp_dir
         settings['WN_INP'] = self.inp_file_path
-        settings['pipe_damage_file_list'] = list_file_path
         settings['pipe_damage_file_directory'] = temp_dir
         settings['Restoration_on'] = False
         settings['Pipe_damage_input_method'] = 'pickle'
 
-        input_file_path = Path(self.temp_dir) / 'rewet_input.json'
-        input_file_path = input_file_path.resolve()
-        with open(input_file_path, 'w') as f:  # noqa: PTH123
-            json.dump(settings, f, indent=4)
-
-        self.input_file_path = str(input_file_path)
+        return settings
 
     def get_building_data_satisfaction(self, method):
         """
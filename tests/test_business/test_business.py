@@ -0,0 +1,56 @@
+import pytest
+import types
+import numpy as np
+import pandas as pd
+from pyrecodes.business.business import Business, TRAVEL_TIME_CUTOFF, TRAVEL_TIME_CHANGE_CUTOFF
+from pyrecodes.component.r2d_component import R2DBuilding
+from pyrecodes.resource_distribution_model.residual_demand_traffic_distribution_model import TravelTimeTable
+
+def create_building(aim_id: str, functionality_level: float = 1.0) -> R2DBuilding:
+    building = R2DBuilding()
+    building.aim_id = aim_id
+    building.functionality_level = functionality_level
+    return building
+
+class TestBusiness:
+
+    @pytest.fixture
+    def traffic_flow_model(self):
+        travel_times = pd.DataFrame({'origin_nid': [0, 2, 0], 'destin_nid': [1, 0, 3],
+                                     'travel_time_used': [100.0, 2 * TRAVEL_TIME_CUTOFF, 2 * TRAVEL_TIME_CUTOFF]})
+        travel_time_change_factors = np.asarray([1.0, 2 * TRAVEL_TIME_CHANGE_CUTOFF, 1.0])
+        return types.SimpleNamespace(building_to_traffic_node_dict={'B': 0, 'E1': 1, 'E2': 2, 'E3': 3, 'E4': 4},
+                                     travel_time_tables=[TravelTimeTable(travel_times, travel_time_change_factors)],
+                                     find_nearest_distribution_time_step=lambda time_step: 0)
+
+    @pytest.fixture
+    def business(self):
+        business = Business('1', {'SalesVolume': 365, 'NumEmployees': 5, 'EmployeeLocations': ['E1', 'E2', 'E3', 'E4', 'E5']},
+                            create_building('B'))
+        business.set_employee_homes([create_building('E1'), create_building('E2'), create_building('E3'),
+                                     create_building('E4'), create_building('E5', functionality_level=0.5)])
+        return business
+
+    def test_check_accessibility_of_nodes(self, business, traffic_flow_model):
+        accessible = business.check_accessibility_of_nodes(0, [1, 2, 3, 4], traffic_flow_model.travel_time_tables[0])
+        assert list(accessible) == [True, False, True, False]
+
+    def test_business_accessible(self, business, traffic_flow_model):
+        assert business.business_accessible(1, traffic_flow_model, business.employee_homes[0])
+        assert not business.business_accessible(1, traffic_flow_model, business.employee_homes[1])
+
+    def test_check_employees(self, business, traffic_flow_model):
+        business.update(1)
+        business.check_employees(1, traffic_flow_model)
+        assert business.employees_available[1] == 2 / 5
+        assert business.business_functionality_level == 2 / 5
+        assert business.reason_for_drop[1] == [{'Name': 'Labor', 'Level': 2 / 5}]
+
+    def test_set_compact_history(self, business, traffic_flow_model):
+        business.set_compact_history(10)
+        business.update(1)
+        business.check_employees(1, traffic_flow_model)
+        assert business.employees_available[1] == 2 / 5
+        assert business.revenue == {0: 1.0, 1: 2 / 5}
+        assert business.reason_for_drop == {1: [{'Name': 'Labor', 'Level': 2 / 5}]}
+        assert business.get_employee_supply() == 2
@@ -345,6 +345,31 @@ class TestStandardiReCoDeSComponent():
             component.recover(time_step=time_step)
         assert component.functional == list(range(11, 150))
     
+    def test_skip_time_steps(self, component):
+        COMPONENT_PARAMETERS['RecoveryModel']['DamageFunctionalityRelation']['Type'] = 'ReverseLinear'
+        stepwise_component = StandardiReCoDeSComponent()
+        for recovered_component in [component, stepwise_component]:
+            recovered_component.set_recovery_model(COMPONENT_PARAMETERS['RecoveryModel'])
+            recovered_component.set_recovery_time_steps(RECOVERY_TIME_STEPS_SPARSE)
+            recovered_component.set_initial_damage_level(0.5)
+            recovered_component.update_functionality()
+        recovered_intervals = []
+        recover_over_time_steps = component.recovery_model.recover_over_time_steps
+        def record_recovered_interval(start_time_step, end_time_step):
+            recovered_intervals.append((start_time_step, end_time_step))
+            recover_over_time_steps(start_time_step, end_time_step)
+        component.recovery_model.recover_over_time_steps = record_recovered_interval
+        component.skip_time_steps(range(1, 30), recover=True)
+        for time_step in range(1, 30):
+            stepwise_component.check_if_functional(time_step)
+            stepwise_component.recover(time_step)
+        assert recovered_intervals == [component.recovery_model.recovery_time_steps.get_covered_interval(1, 30)]
+        assert component.functional.intervals == [[1, 30]]
+        assert component.functional == stepwise_component.functional
+        for activity_name, activity in component.recovery_model.recovery_activities.items():
+            assert activity.time_steps == stepwise_component.recovery_model.recovery_activities[activity_name].time_steps
+            assert math.isclose(activity.level, stepwise_component.recovery_model.recovery_activities[activity_name].level)
+
     def test_update_resources_based_on_component_functionality(self, component):
         COMPONENT_PARAMETERS['RecoveryModel']['DamageFunctionalityRelation']['Type'] = 'ReverseLinear'
         component.construct(COMPONENT_NAME, COMPONENT_PARAMETERS)
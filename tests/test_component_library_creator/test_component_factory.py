@@ -0,0 +1,36 @@
+import pytest
+from pyrecodes.component_library_creator.component_factory import ComponentFactory
+from pyrecodes.component_library_creator.json_component_library_creator import JSONComponentLibraryCreator
+from pyrecodes.component.standard_irecodes_component import StandardiReCoDeSComponent
+
+
+class TestComponentFactory():
+    COMPONENT_LIBRARY_FILE = './tests/test_inputs/test_inputs_Alameda_ComponentLibrary.json'
+
+    @pytest.fixture
+    def component_library(self):
+        return JSONComponentLibraryCreator(self.COMPONENT_LIBRARY_FILE).form_library()
+
+    def test_template_factory(self, component_library):
+        for component_name, component_template in component_library.items():
+            assert isinstance(component_template.factory, ComponentFactory)
+            assert component_template.factory.component_name == component_name
+            assert isinstance(component_template, component_template.factory.component_class)
+
+    def test_create(self, component_library):
+        factory = component_library['DS3_Building'].factory
+        components = [factory.create() for _ in range(2)]
+        assert all(isinstance(component, StandardiReCoDeSComponent) for component in components)
+        assert components[0].name == components[1].name == 'DS3_Building'
+        assert not hasattr(components[0], 'factory')
+        assert components[0].recovery_model is not components[1].recovery_model
+        for resource_name, resource in components[0].demand['OperationDemand'].items():
+            other_resource = components[1].demand['OperationDemand'][resource_name]
+            assert resource is not other_resource
+            assert resource.component_functionality_to_amount is other_resource.component_functionality_to_amount
+        assert components[0].recovery_model.damage_to_functionality_relation is components[1].recovery_model.damage_to_functionality_relation
+
+    def test_create_samples_durations(self, component_library):
+        factory = component_library['DS3_Building'].factory
+        durations = [{activity_name: activity.duration for activity_name, activity in factory.create().recovery_model.recovery_activities.items()} for _ in range(2)]
+        assert durations[0] != durations[1]
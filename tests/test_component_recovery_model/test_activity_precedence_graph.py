@@ -0,0 +1,50 @@
+import pytest
+from test_component_recovery_model_inputs import RECOVERY_MODEL_PARAMETERS_MULTIPLE_ACTIVITIES
+from pyrecodes.component_recovery_model import activity_precedence_graph
+from pyrecodes.component_recovery_model.activity_precedence_graph import ActivityPrecedenceGraph, get_precedence_graph
+from pyrecodes.component_recovery_model.component_level_recovery_activities_model import ComponentLevelRecoveryActivitiesModel
+
+class TestActivityPrecedenceGraph:
+
+    @pytest.fixture
+    def precedence_graph(self):
+        return get_precedence_graph(RECOVERY_MODEL_PARAMETERS_MULTIPLE_ACTIVITIES['Parameters'])
+
+    def test_init(self, precedence_graph: ActivityPrecedenceGraph):
+        assert precedence_graph.activity_names == ['RapidInspection', 'ContractorMobilization', 'Repair']
+        assert precedence_graph.predecessor_masks == [0b000, 0b001, 0b011]
+
+    def test_shared_between_recovery_models(self, precedence_graph: ActivityPrecedenceGraph):
+        recovery_models = [ComponentLevelRecoveryActivitiesModel(RECOVERY_MODEL_PARAMETERS_MULTIPLE_ACTIVITIES) for _ in range(2)]
+        assert recovery_models[0].precedence_graph is precedence_graph
+        assert recovery_models[1].precedence_graph is precedence_graph
+
+    def test_get_ready_mask(self, precedence_graph: ActivityPrecedenceGraph):
+        assert precedence_graph.get_ready_mask(0b000) == 0b001
+        assert precedence_graph.get_ready_mask(0b001) == 0b011
+        assert precedence_graph.get_ready_mask(0b011) == 0b111
+        assert precedence_graph.ready_masks[0b001] == 0b011
+        assert precedence_graph.is_ready('Repair', 0b011)
+        assert not precedence_graph.is_ready('Repair', 0b010)
+
+    def test_shared_precedence_graphs_bounded(self, monkeypatch):
+        monkeypatch.setattr(activity_precedence_graph, 'shared_precedence_graphs', {})
+        monkeypatch.setattr(activity_precedence_graph, 'MAX_SHARED_PRECEDENCE_GRAPHS', 2)
+        first_precedence_graph = get_precedence_graph({'Repair': {}})
+        get_precedence_graph({'Inspection': {}, 'Repair': {'PrecedingActivities': ['Inspection']}})
+        get_precedence_graph({'Financing': {}, 'Repair': {'PrecedingActivities': ['Financing']}})
+        assert len(activity_precedence_graph.shared_precedence_graphs) == 2
+        assert get_precedence_graph({'Repair': {}}) is not first_precedence_graph
+
+    def test_activities_defined_after_their_successors(self):
+        precedence_graph = ActivityPrecedenceGraph({'Repair': ['Inspection', 'Financing'], 'Financing': ['Inspection'], 'Inspection': []})
+        assert precedence_graph.get_ready_mask(0b000) == 0b100
+        assert precedence_graph.get_ready_mask(0b100) == 0b110
+
+    def test_undefined_preceding_activity(self):
+        with pytest.raises(ValueError):
+            ActivityPrecedenceGraph({'Repair': ['Inspection']})
+
+    def test_cycle(self):
+        with pytest.raises(ValueError):
+            ActivityPrecedenceGraph({'Repair': ['Inspection'], 'Inspection': ['Repair']})
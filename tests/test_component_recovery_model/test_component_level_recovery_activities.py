@@ -1,4 +1,5 @@
 import pytest
+import copy
 import math
 from test_component_recovery_model_inputs import RECOVERY_MODEL_PARAMETERS_SINGLE_ACTIVITY, RECOVERY_MODEL_PARAMETERS_MULTIPLE_ACTIVITIES, RECOVERY_TIME_STEPS_DENSE, RECOVERY_TIME_STEPS_SPARSE
 from pyrecodes.component_recovery_model.component_level_recovery_activities_model import ComponentLevelRecoveryActivitiesModel
@@ -276,6 +277,25 @@ class TestComponentLevelRecoveryActivitiesModel_MultipleActivities:
             else:
                 assert recovery_activity.level == 0.0
 
+    def test_finished_mask(self, recovery_model: AbstractRecoveryModel):
+        assert recovery_model.get_finished_mask() == 0b111
+        recovery_model.set_initial_damage_level(0.5)
+        assert recovery_model.get_finished_mask() == 0b000
+        recovery_model.recover_over_time_steps(0, 2)
+        assert recovery_model.get_finished_mask() == 0b011
+        recovery_model.recover_over_time_steps(2, 20)
+        assert recovery_model.get_finished_mask() == 0b111
+        recovery_model.set_initial_damage_level(0.0)
+        assert recovery_model.get_finished_mask() == 0b100
+        recovery_model.recovery_activities['Repair'].set_level(0.5)
+        assert recovery_model.get_finished_mask() == 0b000
+        recovery_model.recovery_activities['RapidInspection'].level = 1.0
+        assert recovery_model.get_finished_mask() == 0b001
+        copied_recovery_model = copy.deepcopy(recovery_model)
+        copied_recovery_model.recovery_activities['Repair'].level = 1.0
+        assert copied_recovery_model.get_finished_mask() == 0b101
+        assert recovery_model.get_finished_mask() == 0b001
+
     def test_set_wrong_initial_damage_level(self, recovery_model: AbstractRecoveryModel):
         with pytest.raises(ValueError):
             recovery_model.set_initial_damage_level(1.5)
@@ -533,4 +553,17 @@ class TestComponentLevelRecoveryActivitiesModel_MultipleActivities:
         assert recovery_model.recovery_activities['Repair'].time_steps == [3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
         assert recovery_model.recovery_activities['RapidInspection'].level == 1.0
         assert recovery_model.recovery_activities['ContractorMobilization'].level == 1.0
-        assert math.isclose(recovery_model.recovery_activities['Repair'].level, 1.0)
\ No newline at end of file
+        assert math.isclose(recovery_model.recovery_activities['Repair'].level, 1.0)
+
+    def test_recover_over_time_steps(self, recovery_model: AbstractRecoveryModel):
+        recovery_model.set_initial_damage_level(0.5)
+        stepwise_recovery_model = ComponentLevelRecoveryActivitiesModel(RECOVERY_MODEL_PARAMETERS_MULTIPLE_ACTIVITIES)
+        stepwise_recovery_model.set_recovery_time_steps(RECOVERY_TIME_STEPS_DENSE)
+        stepwise_recovery_model.set_initial_damage_level(0.5)
+        recovery_model.recover_over_time_steps(0, 20)
+        for time_step in range(20):
+            stepwise_recovery_model.recover(time_step)
+        for activity_name, activity in recovery_model.recovery_activities.items():
+            assert activity.time_steps == stepwise_recovery_model.recovery_activities[activity_name].time_steps
+            assert math.isclose(activity.level, stepwise_recovery_model.recovery_activities[activity_name].level)
+        assert recovery_model.recovery_activities['Repair'].progress_intervals == [[2, 12]]
@@ -51,6 +51,14 @@ class TestConcreteRecoveryActivity:
         recovery_activity.set_duration(distribution)
         assert math.isclose(recovery_activity.duration, 5) and math.isclose(recovery_activity.rate, 1 / 5)
 
+    def test_resample_duration(self, recovery_activity: ConcreteRecoveryActivity):
+        recovery_activity.resample_duration()
+        assert not hasattr(recovery_activity, 'duration')
+        recovery_activity.set_duration({'Lognormal': {'Median': 2, 'Dispersion': 1}})
+        duration = recovery_activity.duration
+        recovery_activity.resample_duration()
+        assert recovery_activity.duration != duration and math.isclose(recovery_activity.rate, 1 / recovery_activity.duration)
+
     def test_set_negative_duration(self, recovery_activity: ConcreteRecoveryActivity):
         distribution = {'Deterministic': {'Value': -5}}
         with pytest.raises(ValueError):
@@ -181,4 +189,47 @@ class TestConcreteRecoveryActivity:
         recovery_activity.set_duration({'Deterministic': {'Value': 5}})
         for time_step in range(5):
             recovery_activity.recover(time_step)
-        assert recovery_activity.activity_finished() == True
\ No newline at end of file
+        assert recovery_activity.activity_finished() == True
+
+    def test_get_num_steps_to_finish(self, recovery_activity: ConcreteRecoveryActivity):
+        recovery_activity.set_duration({'Deterministic': {'Value': 5}})
+        assert recovery_activity.get_num_steps_to_finish() == 4
+        recovery_activity.set_demand([{'Resource': 'Resource 1', 'Amount': 5}])
+        recovery_activity.set_demand_met('Resource 1', 0.0)
+        assert recovery_activity.get_num_steps_to_finish() == math.inf
+        recovery_activity.set_demand_met('Resource 1', 1.0)
+        for time_step in range(5):
+            recovery_activity.recover(time_step)
+        assert recovery_activity.get_num_steps_to_finish() == math.inf
+
+    def test_get_future_levels(self, recovery_activity: ConcreteRecoveryActivity):
+        recovery_activity.set_duration({'Deterministic': {'Value': 4}})
+        recovery_activity.set_demand([{'Resource': 'Resource 1', 'Amount': 5}])
+        recovery_activity.set_demand_met('Resource 1', 0.5)
+        assert list(recovery_activity.get_future_levels(3)) == [0.125, 0.25, 0.375]
+        assert recovery_activity.level == 0.0
+
+    def test_get_exact_num_steps_to_finish(self, recovery_activity: ConcreteRecoveryActivity):
+        recovery_activity.set_duration({'Deterministic': {'Value': 5}})
+        assert recovery_activity.get_exact_num_steps_to_finish() == 5
+        recovery_activity.set_level(0.7)
+        assert recovery_activity.get_exact_num_steps_to_finish() == 2
+        recovery_activity.set_level(1.0)
+        assert recovery_activity.get_exact_num_steps_to_finish() == math.inf
+
+    def test_advance(self, recovery_activity: ConcreteRecoveryActivity):
+        recovery_activity.set_duration({'Deterministic': {'Value': 10}})
+        recovery_activity.advance(3, 4)
+        recovery_activity.advance(7, 2)
+        assert math.isclose(recovery_activity.level, 0.6)
+        assert recovery_activity.progress_intervals == [[3, 9]]
+        assert recovery_activity.time_steps == [3, 4, 5, 6, 7, 8]
+        recovery_activity.advance(12, 10)
+        assert recovery_activity.level == 1.0
+        assert recovery_activity.progress_intervals == [[3, 9], [12, 16]]
+
+    def test_progressed_at(self, recovery_activity: ConcreteRecoveryActivity):
+        recovery_activity.time_steps = [3, 4, 5, 12]
+        assert recovery_activity.progress_interval_starts == [3, 12]
+        assert recovery_activity.get_progress_intervals() == [[3, 6], [12, 13]]
+        assert [recovery_activity.progressed_at(time_step) for time_step in [2, 3, 5, 6, 11, 12, 13]] == [False, True, True, False, False, True, False]
@@ -0,0 +1,93 @@
+import pytest
+import copy
+import math
+import types
+from test_component_recovery_model_inputs import RECOVERY_MODEL_PARAMETERS_SINGLE_ACTIVITY, RECOVERY_MODEL_PARAMETERS_MULTIPLE_ACTIVITIES, RECOVERY_TIME_STEPS_DENSE, RECOVERY_TIME_STEPS_SPARSE
+from pyrecodes.component_recovery_model.component_level_recovery_activities_model import ComponentLevelRecoveryActivitiesModel
+from pyrecodes.component_recovery_model.recovery_activities_engine import RecoveryActivitiesEngine, RecoveryActivityView
+
+def create_recovery_models() -> list:
+    recovery_models = []
+    for parameters, recovery_time_steps, damage_level in [(RECOVERY_MODEL_PARAMETERS_MULTIPLE_ACTIVITIES, RECOVERY_TIME_STEPS_DENSE, 0.6),
+                                                          (RECOVERY_MODEL_PARAMETERS_MULTIPLE_ACTIVITIES, RECOVERY_TIME_STEPS_SPARSE, 0.3),
+                                                          (RECOVERY_MODEL_PARAMETERS_SINGLE_ACTIVITY, RECOVERY_TIME_STEPS_DENSE, 0.5),
+                                                          (RECOVERY_MODEL_PARAMETERS_SINGLE_ACTIVITY, RECOVERY_TIME_STEPS_DENSE, 0.0)]:
+        recovery_model = ComponentLevelRecoveryActivitiesModel(parameters)
+        recovery_model.set_recovery_time_steps(recovery_time_steps)
+        recovery_model.set_initial_damage_level(damage_level)
+        recovery_models.append(recovery_model)
+    return recovery_models
+
+def get_state(recovery_models: list) -> list:
+    return [{activity_name: (activity.level, activity.time_steps, activity.preceding_activities_finished)
+             for activity_name, activity in recovery_model.recovery_activities.items()} for recovery_model in recovery_models]
+
+class TestRecoveryActivitiesEngine:
+
+    @pytest.fixture
+    def recovery_models(self):
+        return create_recovery_models()
+
+    @pytest.fixture
+    def engine(self, recovery_models):
+        return RecoveryActivitiesEngine([types.SimpleNamespace(recovery_model=recovery_model) for recovery_model in recovery_models])
+
+    def test_init(self, engine: RecoveryActivitiesEngine, recovery_models: list):
+        assert engine.activity_names == ['RapidInspection', 'ContractorMobilization', 'Repair']
+        assert engine.levels.shape == (4, 3)
+        assert engine.present[2].tolist() == [False, False, True]
+        assert engine.preceding[0, 2].tolist() == [True, True, False]
+        assert len(engine.recovery_groups) == 2
+        assert all(isinstance(activity, RecoveryActivityView) for activity in recovery_models[0].recovery_activities.values())
+        assert math.isclose(recovery_models[0].get_damage_level(), 0.6)
+        assert [math.isclose(damage_level, target) for damage_level, target in zip(engine.get_damage_levels(), [0.6, 0.3, 0.5, 0.0])] == [True] * 4
+
+    def test_views(self, engine: RecoveryActivitiesEngine, recovery_models: list):
+        repair_activity = recovery_models[1].recovery_activities['Repair']
+        repair_activity.set_level(0.2)
+        assert engine.levels[1, 2] == 0.2
+        repair_activity.set_demand_met('RepairCrew', 0.5)
+        assert engine.demand_met[1, 2] == 0.5
+        recovery_models[1].set_activities_demand_to_met()
+        assert engine.demand_met[1, 2] == 1.0
+
+    def test_recover_same_as_recovery_models(self, engine: RecoveryActivitiesEngine, recovery_models: list):
+        unbound_recovery_models = create_recovery_models()
+        for time_step in range(40):
+            for recovery_model in recovery_models + unbound_recovery_models:
+                recovery_model.set_activities_demand_to_met()
+                if time_step > 10:
+                    recovery_model.set_met_demand_for_recovery_activities('RepairCrew', 0.5)
+            engine.recover(time_step)
+            for recovery_model in recovery_models + unbound_recovery_models:
+                recovery_model.recover(time_step)
+            assert get_state(recovery_models) == get_state(unbound_recovery_models)
+        assert recovery_models[0].recovery_activities['Repair'].time_steps == list(range(2, 13))
+        assert [recovery_models[0].recovery_activities['Repair'].progressed_at(time_step) for time_step in [1, 2, 12, 13]] == [False, True, True, False]
+        progress_intervals = recovery_models[0].recovery_activities['Repair'].get_progress_intervals()
+        assert progress_intervals == [[2, 13]]
+        for recovery_model, unbound_recovery_model in zip(recovery_models, unbound_recovery_models):
+            for activity_name, activity in recovery_model.recovery_activities.items():
+                assert activity.get_progress_intervals() == unbound_recovery_model.recovery_activities[activity_name].get_progress_intervals()
+
+    def test_progress_before_binding(self):
+        recovery_models = create_recovery_models()
+        for time_step in range(5):
+            recovery_models[0].set_activities_demand_to_met()
+            recovery_models[0].recover(time_step)
+        progress_intervals = recovery_models[0].recovery_activities['RapidInspection'].get_progress_intervals()
+        engine = RecoveryActivitiesEngine([types.SimpleNamespace(recovery_model=recovery_model) for recovery_model in recovery_models])
+        rapid_inspection = recovery_models[0].recovery_activities['RapidInspection']
+        assert rapid_inspection.get_progress_intervals() == progress_intervals == [[0, 1]]
+        assert [rapid_inspection.progressed_at(time_step) for time_step in [0, 1]] == [True, False]
+        engine.add_progress_interval(0, 0, 1, 3)
+        assert rapid_inspection.get_progress_intervals() == [[0, 3]]
+        assert rapid_inspection.time_steps == [0, 1, 2]
+        rapid_inspection.time_steps = [4]
+        assert rapid_inspection.get_progress_intervals() == [[4, 5]]
+
+    def test_deepcopy(self, engine: RecoveryActivitiesEngine, recovery_models: list):
+        copied_engine, copied_recovery_models = copy.deepcopy((engine, recovery_models))
+        copied_engine.recover(0)
+        assert copied_recovery_models[0].recovery_activities['RapidInspection'].time_steps == [0]
+        assert recovery_models[0].recovery_activities['RapidInspection'].time_steps == []
@@ -0,0 +1,55 @@
+import pytest
+import copy
+import pickle
+from test_component_recovery_model_inputs import RECOVERY_MODEL_PARAMETERS_SINGLE_ACTIVITY, RECOVERY_TIME_STEPS_SPARSE
+from pyrecodes.component_recovery_model import recovery_time_schedule as recovery_time_schedule_module
+from pyrecodes.component_recovery_model.recovery_time_schedule import RecoveryTimeSchedule, get_recovery_time_schedule
+from pyrecodes.component_recovery_model.component_level_recovery_activities_model import ComponentLevelRecoveryActivitiesModel
+
+class TestRecoveryTimeSchedule:
+
+    @pytest.fixture
+    def recovery_time_schedule(self):
+        return get_recovery_time_schedule([4, 8, 12, 15, 22, 40])
+
+    def test_init(self, recovery_time_schedule: RecoveryTimeSchedule):
+        assert recovery_time_schedule == [4, 8, 12, 15, 22, 40]
+        assert len(recovery_time_schedule) == 6
+        assert recovery_time_schedule[-1] == 40
+        assert 12 in recovery_time_schedule and 13 not in recovery_time_schedule
+
+    def test_shared(self, recovery_time_schedule: RecoveryTimeSchedule):
+        assert get_recovery_time_schedule((4, 8, 12, 15, 22, 40)) is recovery_time_schedule
+        assert get_recovery_time_schedule(recovery_time_schedule) is recovery_time_schedule
+        assert copy.deepcopy(recovery_time_schedule) is recovery_time_schedule
+        assert pickle.loads(pickle.dumps(recovery_time_schedule)) is recovery_time_schedule
+        recovery_models = [ComponentLevelRecoveryActivitiesModel(RECOVERY_MODEL_PARAMETERS_SINGLE_ACTIVITY) for _ in range(2)]
+        for recovery_model in recovery_models:
+            recovery_model.set_recovery_time_steps(RECOVERY_TIME_STEPS_SPARSE)
+        assert recovery_models[0].recovery_time_steps is recovery_models[1].recovery_time_steps
+
+    def test_index(self, recovery_time_schedule: RecoveryTimeSchedule):
+        assert recovery_time_schedule.index(15) == 3
+        with pytest.raises(ValueError):
+            recovery_time_schedule.index(16)
+
+    def test_get_interval(self, recovery_time_schedule: RecoveryTimeSchedule):
+        assert recovery_time_schedule.get_interval(4) == (4, 5)
+        assert recovery_time_schedule.get_interval(22) == (16, 23)
+        with pytest.raises(ValueError):
+            recovery_time_schedule.get_interval(0)
+
+    def test_shared_recovery_time_schedules_bounded(self, monkeypatch):
+        monkeypatch.setattr(recovery_time_schedule_module, 'shared_recovery_time_schedules', {})
+        monkeypatch.setattr(recovery_time_schedule_module, 'MAX_SHARED_RECOVERY_TIME_SCHEDULES', 2)
+        first_recovery_time_schedule = get_recovery_time_schedule([1, 2])
+        get_recovery_time_schedule([1, 3])
+        get_recovery_time_schedule([1, 4])
+        assert list(recovery_time_schedule_module.shared_recovery_time_schedules.keys()) == [(1, 3), (1, 4)]
+        assert get_recovery_time_schedule([1, 2]) is not first_recovery_time_schedule
+
+    def test_get_covered_interval(self, recovery_time_schedule: RecoveryTimeSchedule):
+        assert recovery_time_schedule.get_covered_interval(0, 13) == (4, 13)
+        assert recovery_time_schedule.get_covered_interval(9, 23) == (9, 23)
+        assert recovery_time_schedule.get_covered_interval(16, 22) is None
+        assert recovery_time_schedule.get_covered_interval(41, 50) is None
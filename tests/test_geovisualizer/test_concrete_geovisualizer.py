@@ -62,7 +62,12 @@ class TestConcreteGeoVisualizer:
         assert geo_visualizer.component_is_in_state(system.components[1], 'Repair', 2) == False
         assert geo_visualizer.component_is_in_state(system.components[1], 'Repair', 15) == True
 
-
-
-
-
+    def test_get_component_state_matrix(self, geo_visualizer, system: System):
+        system.components[1].functional = [0, 20, 21]
+        system.components[1].recovery_model.recovery_activities['CleanUp'].time_steps = [2, 3, 4]
+        system.components[1].recovery_model.recovery_activities['Permitting'].time_steps = [4, 5, 6]
+        state_matrix = geo_visualizer.get_component_state_matrix(22)
+        assert state_matrix.shape == (len(system.components), 22)
+        for time_step in [0, 2, 4, 5, 10, 20]:
+            current_state = geo_visualizer.get_component_current_state(system.components[1], time_step)[0]
+            assert state_matrix[1, time_step] == geo_visualizer.state_dict[current_state]['ID']
@@ -0,0 +1,99 @@
+import json
+import pytest
+from pyrecodes import monte_carlo_runner
+from pyrecodes.monte_carlo_runner import MonteCarloRunner
+from pyrecodes.probability_distribution import probability_distribution
+
+from pyrecodes.utilities import read_json_file
+
+MAIN_FILE = "./tests/test_inputs/test_inputs_ThreeLocalitiesCommunity_Main.json"
+FILE_DAMAGE_INPUT_MAIN_FILE = "./tests/test_inputs/test_inputs_VirtualCommunity_Main.json"
+
+@pytest.fixture
+def main_file(tmp_path) -> str:
+    """
+    Main file of the three localities community in which repair durations follow a lognormal distribution.
+    """
+    input_dict = read_json_file(MAIN_FILE)
+    with open(input_dict['ComponentLibrary']['ComponentLibraryFile'], 'r') as file:
+        component_library = file.read().replace('{"Deterministic": {"Value": 10}}', '{"Lognormal": {"Median": 10, "Dispersion": 1.0}}')
+    input_dict['ComponentLibrary']['ComponentLibraryFile'] = str(tmp_path / 'component_library.json')
+    with open(input_dict['ComponentLibrary']['ComponentLibraryFile'], 'w') as file:
+        file.write(component_library)
+    with open(tmp_path / 'main.json', 'w') as file:
+        json.dump(input_dict, file)
+    return str(tmp_path / 'main.json')
+
+class TestMonteCarloRunner():
+
+    def test_run_realization(self, main_file):
+        output = monte_carlo_runner.run_realization(main_file, seed=1)
+        assert [calculator_output['ResilienceCalculator'] for calculator_output in output] == ['ReCoDeSCalculator', 'NISTGoalsCalculator']
+        assert output == monte_carlo_runner.run_realization(main_file, seed=1)
+        assert output != monte_carlo_runner.run_realization(main_file, seed=2)
+        assert probability_distribution.get_random_number_generator() is monte_carlo_runner.np.random
+
+    def test_run_realization_with_file_damage_input(self, tmp_path):
+        damage_file = "./tests/test_inputs/test_inputs_virtual_community_damage_input.txt"
+        output = monte_carlo_runner.run_realization(FILE_DAMAGE_INPUT_MAIN_FILE, seed=1)
+        assert output == monte_carlo_runner.run_realization(FILE_DAMAGE_INPUT_MAIN_FILE, seed=1, damage_file=damage_file)
+        with open(damage_file, 'r') as file:
+            num_damage_levels = len(file.read().replace('\n', '').split(','))
+        undamaged_file = tmp_path / 'undamaged.txt'
+        undamaged_file.write_text(', '.join(['0.0'] * num_damage_levels))
+        assert output != monte_carlo_runner.run_realization(FILE_DAMAGE_INPUT_MAIN_FILE, seed=1, damage_file=str(undamaged_file))
+
+    def test_run_with_system_template_and_file_damage_input(self, tmp_path):
+        damage_file = "./tests/test_inputs/test_inputs_virtual_community_damage_input.txt"
+        output = monte_carlo_runner.run_realization(FILE_DAMAGE_INPUT_MAIN_FILE, seed=1, damage_file=damage_file)
+        assert output == monte_carlo_runner.run_realization(FILE_DAMAGE_INPUT_MAIN_FILE, seed=1, damage_file=damage_file, use_system_template=True)
+
+    def test_replace_damage_file(self):
+        damage_input_parameters = {'DamageFile': 'damage_1.json', 'DamageStateRealization': 0}
+        assert monte_carlo_runner.replace_damage_file(damage_input_parameters, 'damage_2.json') == {'DamageFile': 'damage_2.json', 'DamageStateRealization': 0}
+        assert damage_input_parameters['DamageFile'] == 'damage_1.json'
+        assert monte_carlo_runner.replace_damage_file('damage_1.txt', 'damage_2.txt') == 'damage_2.txt'
+        with pytest.raises(ValueError):
+            monte_carlo_runner.replace_damage_file([0.1, 0.2], 'damage_2.txt')
+
+    def test_set_realizations(self):
+        runner = MonteCarloRunner(MAIN_FILE, num_realizations=3, base_seed=0)
+        assert len(runner.seeds) == 3 and len(set(runner.seeds)) == 3
+        assert runner.seeds == MonteCarloRunner(MAIN_FILE, num_realizations=3, base_seed=0).seeds
+        runner = MonteCarloRunner(MAIN_FILE, damage_files=['damage_1.json', 'damage_2.json'])
+        assert len(runner.seeds) == 2 and runner.get_damage_file(1) == 'damage_2.json'
+        with pytest.raises(ValueError):
+            MonteCarloRunner(MAIN_FILE, seeds=[1], damage_files=['damage_1.json', 'damage_2.json'])
+        with pytest.raises(ValueError):
+            MonteCarloRunner(MAIN_FILE)
+
+    def test_run_in_current_process(self, main_file, tmp_path):
+        results_file = tmp_path / 'results.jsonl'
+        runner = MonteCarloRunner(main_file, seeds=[1, 2, 1], max_workers=1, results_file=str(results_file))
+        results = runner.run()
+        assert results[0]['Output'] == results[2]['Output']
+        assert results[0]['Output'] != results[1]['Output']
+        with open(results_file, 'r') as file:
+            saved_results = [json.loads(line) for line in file]
+        assert [saved_result['Realization'] for saved_result in saved_results] == [0, 1, 2]
+
+    def test_run_in_process_pool(self, main_file):
+        results = MonteCarloRunner(main_file, seeds=[1, 2], max_workers=2).run()
+        assert results == MonteCarloRunner(main_file, seeds=[1, 2], max_workers=1).run()
+
+    def test_run_with_system_template(self, main_file):
+        results = MonteCarloRunner(main_file, seeds=[1, 2, 1], max_workers=1, use_system_template=True).run()
+        assert main_file in monte_carlo_runner.system_templates
+        assert results[0]['Output'] == results[2]['Output']
+        assert results[0]['Output'] != results[1]['Output']
+        assert results[1]['Output'] == MonteCarloRunner(main_file, seeds=[2], max_workers=1, use_system_template=True).run()[0]['Output']
+
+    def test_get_results(self):
+        runner = MonteCarloRunner(MAIN_FILE, seeds=[1, 2])
+        runner.add_result(1, 'Output 2')
+        runner.add_result(0, 'Output 1')
+        assert [result['Output'] for result in runner.get_results()] == ['Output 1', 'Output 2']
+
+    def test_to_serializable(self):
+        value = {1: monte_carlo_runner.np.float64(1.5), 'List': (monte_carlo_runner.np.arange(2), monte_carlo_runner.np.int64(3))}
+        assert json.dumps(monte_carlo_runner.to_serializable(value)) == '{"1": 1.5, "List": [[0, 1], 3]}'
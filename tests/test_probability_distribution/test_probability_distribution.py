@@ -1,5 +1,6 @@
 import math
 import numpy as np
+from pyrecodes.probability_distribution import probability_distribution
 from pyrecodes.probability_distribution.probability_distribution import Deterministic, Lognormal
 
 class TestProbabilityDistribution:
@@ -31,3 +32,26 @@ class TestProbabilityDistribution:
             samples = [dist.sample() for _ in range(num_samples)]
             assert math.isclose(target_dispersion, np.std(np.log(samples)), abs_tol=0.03)
 
+    def test_set_random_number_generator(self):
+        dist = Lognormal({'Median': 5, 'Dispersion': 0.5})
+        samples = []
+        for _ in range(2):
+            probability_distribution.set_random_number_generator(np.random.default_rng(42))
+            samples.append([dist.sample() for _ in range(10)])
+        probability_distribution.set_random_number_generator(None)
+        assert samples[0] == samples[1]
+        assert probability_distribution.get_random_number_generator() is np.random
+
+    def test_get_distribution(self):
+        dist = probability_distribution.get_distribution({'Lognormal': {'Median': 5, 'Dispersion': 0.5}})
+        assert isinstance(dist, Lognormal)
+        assert dist is probability_distribution.get_distribution({'Lognormal': {'Dispersion': 0.5, 'Median': 5}})
+        assert dist is not probability_distribution.get_distribution({'Lognormal': {'Median': 5, 'Dispersion': 1.0}})
+        assert probability_distribution.get_distribution({'Deterministic': {'Value': [1, 2]}}) is probability_distribution.get_distribution({'Deterministic': {'Value': [1, 2]}})
+
+    def test_shared_distributions_bounded(self, monkeypatch):
+        monkeypatch.setattr(probability_distribution, 'shared_distributions', {})
+        monkeypatch.setattr(probability_distribution, 'MAX_SHARED_DISTRIBUTIONS', 2)
+        for value in [1, 2, 3]:
+            probability_distribution.get_distribution({'Deterministic': {'Value': value}})
+        assert list(probability_distribution.shared_distributions.keys()) == [('Deterministic', '{"Value": 2}'), ('Deterministic', '{"Value": 3}')]
@@ -1,6 +1,8 @@
 import pytest
 from pyrecodes.relation import relation
+import numpy as np
 import math
+import json
 
 class TestRelation():
 
@@ -75,3 +77,36 @@ class TestRelation():
             self.relation.set_steps([0.0, 0.2, 0.4, 0.6, 0.8], [0.15, 0.25, 0.55, 0.75, 0.95, 1.0])   
 
     
+
+    def test_get_relation(self):
+        assert isinstance(relation.get_relation('Linear'), relation.Linear)
+        assert relation.get_relation('Linear') is relation.get_relation('Linear')
+        parameters = {'StepLimits': [0.5, 1.0], 'StepValues': [0.0, 1.0]}
+        multiple_step_relation = relation.get_relation('MultipleStep', parameters)
+        assert multiple_step_relation.step_limits == [0.5, 1.0]
+        assert multiple_step_relation is relation.get_relation('MultipleStep', dict(parameters))
+        assert multiple_step_relation is not relation.get_relation('MultipleStep', {'StepLimits': [1.0], 'StepValues': [1.0]})
+        with pytest.raises(AttributeError):
+            relation.get_relation('UndefinedRelation')
+
+    def test_shared_relations_bounded(self, monkeypatch):
+        monkeypatch.setattr(relation, 'shared_relations', {})
+        monkeypatch.setattr(relation, 'MAX_SHARED_RELATIONS', 2)
+        for step_limit in [0.2, 0.4, 0.6]:
+            relation.get_relation('MultipleStep', {'StepLimits': [step_limit, 1.0], 'StepValues': [0.0, 1.0]})
+        assert len(relation.shared_relations) == 2
+        assert [json.loads(parameters)['StepLimits'][0] for _, parameters in relation.shared_relations.keys()] == [0.4, 0.6]
+
+    @pytest.mark.parametrize('relation_name', ['Constant', 'Linear', 'ReverseLinear', 'Binary', 'ReverseBinary', 'MultipleStep'])
+    def test_get_output_array(self, relation_name: str):
+        self.construct_relation_object(relation_name)
+        if relation_name == 'MultipleStep':
+            self.relation.set_steps([0.0, 0.2, 0.4, 0.6, 0.8], [0.15, 0.25, 0.55, 0.75, 0.95])
+        input = np.array(self.test_values + [1 - 1e-11, 1e-11, 0.19999999999999999, 0.4 - 1e-12])
+        output = self.relation.get_output_array(input)
+        assert output.tolist() == [self.relation.get_output(value) for value in input.tolist()]
+
+    def test_get_output_array_invalid_input(self):
+        self.construct_relation_object('Binary')
+        with pytest.raises(ValueError):
+            self.relation.get_output_array(np.array([0.5, 1.5]))
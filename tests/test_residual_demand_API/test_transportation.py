@@ -0,0 +1,126 @@
+import pytest
+import numpy as np
+import pandas as pd
+from residual_demand_API.transportation import CSRRoutingBackend, PandanaRoutingBackend, TransportationPerformance
+
+# Node 5 is not connected to the rest of the network. There are two parallel edges from node 1 to node 2.
+START_NID = [1, 1, 2, 3, 1]
+END_NID = [2, 3, 4, 4, 2]
+WEIGHTS = [10.0, 4.0, 10.0, 8.0, 5.0]
+ORIGINS = [1, 1, 2, 4, 1]
+DESTINATIONS = [4, 2, 4, 1, 5]
+
+class TestCSRRoutingBackend:
+
+    @pytest.fixture
+    def nodes_df(self):
+        return pd.DataFrame({'x': [0.0, 1.0, 1.0, 2.0, 3.0], 'y': [0.0, 1.0, -1.0, 0.0, 0.0]}, index=[1, 2, 3, 4, 5])
+
+    @pytest.fixture
+    def routing_backend(self, nodes_df):
+        routing_backend = CSRRoutingBackend(nodes_df)
+        routing_backend.set_edges(START_NID, END_NID, WEIGHTS)
+        return routing_backend
+
+    def test_route(self, routing_backend: CSRRoutingBackend):
+        paths, lengths = routing_backend.route(ORIGINS, DESTINATIONS)
+        assert [list(path) for path in paths] == [[1, 3, 4], [1, 2], [2, 4], [], []]
+        assert list(lengths) == [12.0, 5.0, 10.0, np.inf, np.inf]
+
+    def test_two_way_edges(self, nodes_df):
+        routing_backend = CSRRoutingBackend(nodes_df, two_way_edges=True)
+        routing_backend.set_edges(START_NID, END_NID, WEIGHTS)
+        paths, lengths = routing_backend.route([4, 2], [1, 3])
+        assert [list(path) for path in paths] == [[4, 3, 1], [2, 1, 3]]
+        assert list(lengths) == [12.0, 9.0]
+
+    def test_set_edges_updates_weights_in_place(self, routing_backend: CSRRoutingBackend):
+        graph = routing_backend.graph
+        routing_backend.set_edges(START_NID, END_NID, [1.0, 4.0, 1.0, 8.0, 5.0])
+        assert routing_backend.graph is graph
+        paths, lengths = routing_backend.route([1], [4])
+        assert list(paths[0]) == [1, 2, 4]
+        assert list(lengths) == [2.0]
+
+    def test_set_edges_rebuilds_changed_topology(self, routing_backend: CSRRoutingBackend):
+        graph = routing_backend.graph
+        routing_backend.set_edges(START_NID[1:], END_NID[1:], WEIGHTS[1:])
+        assert routing_backend.graph is not graph
+        assert list(routing_backend.shortest_paths([1], [2])[0]) == [1, 2]
+        assert routing_backend.route([1], [2])[1][0] == 5.0
+
+    def test_unknown_node(self, routing_backend: CSRRoutingBackend):
+        with pytest.raises(ValueError):
+            routing_backend.route([1], [6])
+
+    def test_same_as_pandana(self):
+        rng = np.random.default_rng(0)
+        nodes_df = pd.DataFrame({'x': rng.random(50), 'y': rng.random(50)}, index=np.arange(50) + 10)
+        start_nid, end_nid = rng.integers(10, 60, size=(2, 150))
+        start_nid, end_nid = start_nid[start_nid != end_nid], end_nid[start_nid != end_nid]
+        weights = rng.integers(1, 1000, size=len(start_nid)) / 10
+        origins, destinations = rng.integers(10, 60, size=(2, 100))
+        for two_way_edges in [False, True]:
+            csr_routing_backend = CSRRoutingBackend(nodes_df, two_way_edges)
+            pandana_routing_backend = PandanaRoutingBackend(nodes_df, two_way_edges)
+            for routing_backend in [csr_routing_backend, pandana_routing_backend]:
+                routing_backend.set_edges(start_nid, end_nid, weights)
+            csr_paths, csr_lengths = csr_routing_backend.route(origins, destinations)
+            pandana_paths, pandana_lengths = pandana_routing_backend.route(origins, destinations)
+            for csr_path, pandana_path in zip(csr_paths, pandana_paths):
+                assert len(csr_path) == len(pandana_path) == 0 or list(csr_path[[0, -1]]) == list(pandana_path[[0, -1]])
+            reachable = np.asarray([len(path) > 0 for path in pandana_paths])
+            assert np.allclose(csr_lengths[reachable], pandana_lengths[reachable])
+            assert np.all(np.isinf(csr_lengths[~reachable]))
+
+class TestTransportationPerformance:
+
+    @pytest.fixture
+    def edges_df(self):
+        edges_df = pd.DataFrame({'uniqueid': [0, 1, 2], 'start_nid': [1, 2, 3], 'end_nid': [2, 3, 4],
+                                 'fft': [100.0, 200.0, 600.0], 'capacity': [100, 100, 100], 'vol_true': 0, 'veh_current': 0},
+                                index=['1-2', '2-3', '3-4'])
+        edges_df['t_avg'] = edges_df['fft']
+        edges_df['weight'] = edges_df['t_avg']
+        return edges_df
+
+    def test_substep_assignment(self, edges_df):
+        nodes_df = pd.DataFrame({'x': [0.0, 1.0, 2.0, 3.0], 'y': [0.0, 0.0, 0.0, 0.0]}, index=[1, 2, 3, 4])
+        od_ss = pd.DataFrame({'agent_id': [0, 1], 'origin_nid': [1, 2], 'destin_nid': [4, 3], 'current_nid': [1, 2],
+                              'current_link': [None, None], 'current_link_time': [0, 0]})
+        trip_info = {(0, 1, 4): [0, 0, 1, 0, 7, 0, 0, 0], (1, 2, 3): [0, 0, 2, 0, 7, 0, 0, 0]}
+        new_edges_df, od_residual_ss_list, trip_info, _ = TransportationPerformance().substep_assignment(
+            nodes_df=nodes_df, weighted_edges_df=edges_df, od_ss=od_ss, quarter_demand=2, assigned_demand=2, quarter_counts=6,
+            trip_info=trip_info, agent_time_limit=None, hour=7, quarter=0, ss_id=0)
+        assert new_edges_df is edges_df
+        assert list(edges_df['vol_true']) == [1, 2, 0]
+        assert list(edges_df['veh_current']) == [0, 0, 1]
+        assert list(edges_df['flow']) == [6.0, 12.0, 0.0]
+        assert list(edges_df['t_avg']) == [round(100.0 * (1 + 0.3 * 0.06 ** 3), 2), round(200.0 * (1 + 0.3 * 0.12 ** 3), 2), 600.0]
+        # Agent 0 stops at node 3, as the remaining 300 seconds are not enough to traverse link 3-4.
+        assert od_residual_ss_list == [[0, 1, 4, 3, '3-4', 300.0]]
+        assert trip_info[(0, 1, 4)][:6] == [600.0, 300.0, 3, 7, 0, 0]
+        assert trip_info[(1, 2, 3)][:6] == [600.0, 200.0, 3, 7, 0, 0]
+
+    def test_substep_assignment_current_link(self, edges_df):
+        nodes_df = pd.DataFrame({'x': [0.0, 1.0, 2.0, 3.0], 'y': [0.0, 0.0, 0.0, 0.0]}, index=[1, 2, 3, 4])
+        edges_df['veh_current'] = [0, 0, 1]
+        od_ss = pd.DataFrame({'agent_id': [0], 'origin_nid': [1], 'destin_nid': [4], 'current_nid': [3],
+                              'current_link': ['3-4'], 'current_link_time': [300.0]})
+        trip_info = {(0, 1, 4): [600.0, 300.0, 3, 7, 0, 0, 0, 0]}
+        _, od_residual_ss_list, trip_info, _ = TransportationPerformance().substep_assignment(
+            nodes_df=nodes_df, weighted_edges_df=edges_df, od_ss=od_ss, quarter_demand=1, assigned_demand=1, quarter_counts=6,
+            trip_info=trip_info, agent_time_limit=None, hour=7, quarter=1, ss_id=0)
+        assert list(edges_df['vol_true']) == [0, 0, 1]
+        assert list(edges_df['veh_current']) == [0, 0, 0]
+        assert od_residual_ss_list == []
+        assert trip_info[(0, 1, 4)][:6] == [1200.0, 900.0, 4, 7, 1, 0]
+
+    def test_get_routing_backend(self):
+        nodes_df = pd.DataFrame({'x': [0.0, 1.0], 'y': [0.0, 0.0]}, index=[1, 2])
+        transportation_performance = TransportationPerformance()
+        routing_backend = transportation_performance.get_routing_backend(nodes_df)
+        assert isinstance(routing_backend, CSRRoutingBackend)
+        assert transportation_performance.get_routing_backend(nodes_df) is routing_backend
+        assert transportation_performance.get_routing_backend(nodes_df, two_way_edges=True) is not routing_backend
+        assert isinstance(TransportationPerformance(routing_backend_name='pandana').get_routing_backend(nodes_df), PandanaRoutingBackend)
@@ -0,0 +1,37 @@
+import pytest
+from types import SimpleNamespace
+from pyrecodes.resilience_calculator.resilience_calculator import ResilienceCalculator
+
+class RecordingCalculator(ResilienceCalculator):
+
+    def __init__(self, failing_time_step=None):
+        self.updated_time_steps = []
+        self.failing_time_step = failing_time_step
+
+    def __str__(self):
+        return 'RecordingCalculator'
+
+    def calculate_resilience(self):
+        return self.updated_time_steps
+
+    def update(self, system):
+        if system.time_step == self.failing_time_step:
+            raise RuntimeError('Update failed.')
+        self.updated_time_steps.append(system.time_step)
+
+class TestResilienceCalculator():
+
+    def test_update_skipped_time_steps(self):
+        system = SimpleNamespace(time_step=3)
+        resilience_calculator = RecordingCalculator()
+        resilience_calculator.update_skipped_time_steps(system, range(4, 8))
+        assert resilience_calculator.updated_time_steps == [4, 5, 6, 7]
+        assert system.time_step == 3
+
+    def test_update_skipped_time_steps_restores_time_step(self):
+        system = SimpleNamespace(time_step=3)
+        resilience_calculator = RecordingCalculator(failing_time_step=6)
+        with pytest.raises(RuntimeError):
+            resilience_calculator.update_skipped_time_steps(system, range(4, 8))
+        assert resilience_calculator.updated_time_steps == [4, 5]
+        assert system.time_step == 3
@@ -46,6 +46,14 @@ class TestConcreteResource():
         with pytest.raises(ValueError):
             resource.set_current_amount(-50)
 
+    def test_update_current_amount(self):
+        resource = ConcreteResource('TestResource', RESOURCE_PARAMETERS)
+        amount_version = resource.amount_version
+        resource.update_current_amount(100)
+        assert resource.amount_version == amount_version
+        resource.update_current_amount(50)
+        assert resource.current_amount == 50 and resource.amount_version == amount_version + 1
+
     def test_set_relation(self):
         resource = ConcreteResource('TestResource', {})
         resource.set_relation('Linear', 'component_functionality_to_amount')
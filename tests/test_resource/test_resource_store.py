@@ -0,0 +1,79 @@
+import pytest
+import copy
+import numpy as np
+from pyrecodes.component.standard_irecodes_component import StandardiReCoDeSComponent
+from pyrecodes.resource.concrete_resource import ConcreteResource
+from pyrecodes.resource.consumable_resource import ConsumableResource
+from pyrecodes.resource.resource_store import ResourceStore, ConcreteResourceView, ConsumableResourceView, get_resource_store
+from pyrecodes.resource_distribution_model.spatial_resource_aggregator import SpatialResourceAggregator
+
+def create_component(locality: int, supply: dict, operation_demand: dict) -> StandardiReCoDeSComponent:
+    component = StandardiReCoDeSComponent()
+    component.locality = [locality]
+    component.supply['Supply'] = supply
+    component.demand['OperationDemand'] = operation_demand
+    return component
+
+class TestResourceStore():
+
+    @pytest.fixture
+    def components(self):
+        return [create_component(1, {'Power': ConcreteResource('Power', {'Amount': 100, 'FunctionalityToAmountRelation': 'Linear'})},
+                                 {'Water': ConcreteResource('Water', {'Amount': 5})}),
+                create_component(2, {'Fuel': ConsumableResource('Fuel', {'Amount': 50})},
+                                 {'Water': ConcreteResource('Water', {'Amount': 3}), 'Power': ConcreteResource('Power', {'Amount': 10})}),
+                create_component(1, {}, {'Water': ConcreteResource('Water', {'Amount': 2})})]
+
+    @pytest.fixture
+    def resource_store(self, components):
+        return ResourceStore(components, ['Power', 'Water'])
+
+    def test_init(self, resource_store: ResourceStore, components: list):
+        assert resource_store.current_amounts.shape == (3, 9)
+        assert resource_store.get_column_id('OperationDemand', 'Water') == 4
+        assert resource_store.get_column_id('RecoveryDemand', 'Fuel') == 8
+        assert isinstance(components[0].supply['Supply']['Power'], ConcreteResourceView)
+        assert isinstance(components[1].supply['Supply']['Fuel'], ConsumableResourceView)
+        assert get_resource_store(components) is resource_store
+        assert get_resource_store(components + [StandardiReCoDeSComponent()]) is None
+        assert resource_store.get_current_amounts(np.arange(3), 'OperationDemand', 'Water').tolist() == [5.0, 3.0, 2.0]
+        assert resource_store.get_current_amounts(np.arange(3), 'Supply', 'Gas').tolist() == [0.0, 0.0, 0.0]
+
+    def test_views(self, resource_store: ResourceStore, components: list):
+        power_supply = components[0].supply['Supply']['Power']
+        amount_version = power_supply.amount_version
+        power_supply.update_based_on_component_functionality(0.4)
+        assert resource_store.current_amounts[0, resource_store.get_column_id('Supply', 'Power')] == 40.0
+        assert power_supply.amount_version == amount_version + 1
+        fuel_supply = components[1].supply['Supply']['Fuel']
+        fuel_supply.update_based_on_consumption(20)
+        assert resource_store.initial_amounts[1, resource_store.get_column_id('Supply', 'Fuel')] == 30.0
+        assert fuel_supply.current_amount == 30.0
+
+    def test_set_current_amounts(self, resource_store: ResourceStore):
+        column_id = resource_store.get_column_id('OperationDemand', 'Water')
+        resource_store.set_current_amounts(np.array([0, 1]), np.array([column_id, column_id]), np.array([5.0, 1.0]))
+        assert resource_store.amount_versions[:2, column_id].tolist() == [1, 2]
+
+    def test_update_recovery_demand(self, resource_store: ResourceStore, components: list):
+        column_id = resource_store.get_column_id('RecoveryDemand', 'Power')
+        components[0].demand['RecoveryDemand'] = {'Power': ConcreteResource('Power', {'Amount': 7})}
+        resource_store.update_recovery_demand(components[0])
+        assert resource_store.current_amounts[0, column_id] == 7.0
+        components[0].demand['RecoveryDemand'] = {}
+        resource_store.update_recovery_demand(components[0])
+        assert resource_store.current_amounts[0, column_id] == 0.0
+        assert resource_store.amount_versions[0, column_id] == 2
+
+    def test_deepcopy(self, resource_store: ResourceStore, components: list):
+        copied_components = copy.deepcopy(components)
+        copied_resource_store = get_resource_store(copied_components)
+        assert copied_resource_store is not resource_store
+        copied_components[0].supply['Supply']['Power'].set_current_amount(1.0)
+        assert components[0].supply['Supply']['Power'].current_amount == 100.0
+
+    def test_spatial_resource_aggregator(self, resource_store: ResourceStore, components: list):
+        aggregator = SpatialResourceAggregator()
+        assert aggregator.aggregate_total(components, 'Water') == 10.0
+        assert aggregator.aggregate_per_locality(components, 'Water') == {1: 7.0, 2: 3.0}
+        assert aggregator.aggregate_total(components, 'Power', 'supply', 'Supply') == 100.0
@@ -1,10 +1,12 @@
 import pytest
 import math
 import copy
+import numpy as np
+import pandas as pd
 from pyrecodes import main
 from pyrecodes.utilities import read_json_file
 from pyrecodes.resource_distribution_model.residual_demand_traffic_distribution_model_constructor import ResidualDemandTrafficDistributionModelConstructor
-from pyrecodes.resource_distribution_model.residual_demand_traffic_distribution_model import ResidualDemandTrafficDistributionModel
+from pyrecodes.resource_distribution_model.residual_demand_traffic_distribution_model import ResidualDemandTrafficDistributionModel, TravelTimeTable, ODTripChecker
 from tests.test_resource_distribution_model.test_resource_distribution_model_inputs import MAIN_FILE_RESIDUAL_DEMAND, RESOURCE_NAME_RESIDUAL_DEMAND, RESOURCE_PARAMETERS_RESIDUAL_DEMAND, INITIAL_R2D_DICT_RESIDUAL_DEMAND
 
 UNDAMAGED_TRAVEL_TIMES = [2660.83, 2660.83, 1874.03, 1874.03]
@@ -226,6 +228,38 @@ class TestResidualDemandTrafficDistributionModel:
             else:
                 assert residual_demand_traffic_distribution_model.travel_times[time_step] == []
 
+    def test_distribute_traffic_with_result_cache(self, system):
+        residual_demand_traffic_distribution_model = ResidualDemandTrafficDistributionModel(RESOURCE_NAME_RESIDUAL_DEMAND, {**RESOURCE_PARAMETERS_RESIDUAL_DEMAND, 'ResultCache': {}}, system.components)
+        assert residual_demand_traffic_distribution_model.result_cache is None
+
+        residual_demand_traffic_distribution_model = ResidualDemandTrafficDistributionModel(RESOURCE_NAME_RESIDUAL_DEMAND,
+                                                                                            {**RESOURCE_PARAMETERS_RESIDUAL_DEMAND, 'ResultCache': {'CacheStochasticResults': True}},
+                                                                                            system.components)
+        simulate = residual_demand_traffic_distribution_model.flow_simulator.simulate
+        simulated_states = []
+        def count_simulate(r2d_dict):
+            simulated_states.append(r2d_dict)
+            return simulate(r2d_dict)
+        residual_demand_traffic_distribution_model.flow_simulator.simulate = count_simulate
+
+        for time_step in range(0, 3):
+            residual_demand_traffic_distribution_model.distribute(time_step)
+        assert len(simulated_states) == 1
+        assert residual_demand_traffic_distribution_model.flow_simulator.simulate_time == 3
+        assert (residual_demand_traffic_distribution_model.result_cache.hits, residual_demand_traffic_distribution_model.result_cache.misses) == (2, 0)
+        for time_step in range(1, 3):
+            assert residual_demand_traffic_distribution_model.travel_times[time_step].equals(residual_demand_traffic_distribution_model.travel_times[0])
+
+    def test_get_travel_time_change(self, residual_demand_traffic_distribution_model):
+        residual_demand_traffic_distribution_model.distribute(0)
+        current_travel_times = residual_demand_traffic_distribution_model.travel_times[0].iloc[::-1].reset_index(drop=True)
+        current_travel_times['travel_time_used'] = current_travel_times['travel_time_used'] * [1.0, 2.0, 3.0, 4.0]
+        residual_demand_traffic_distribution_model.travel_times.append(current_travel_times)
+        residual_demand_traffic_distribution_model.travel_time_change_factors.append([])
+        residual_demand_traffic_distribution_model.get_travel_time_change(1)
+        assert np.allclose(residual_demand_traffic_distribution_model.travel_time_change_factors[1], [1.0, 2.0, 3.0, 4.0])
+        assert residual_demand_traffic_distribution_model.get_total_consumption('All') == sum(factor <= residual_demand_traffic_distribution_model.TRIP_CUTOFF_THRESHOLD for factor in [1.0, 2.0, 3.0, 4.0])
+
     def test_get_total_supply(self, residual_demand_traffic_distribution_model, system):
         residual_demand_traffic_distribution_model.distribute(0)
         assert residual_demand_traffic_distribution_model.get_total_supply('All') == 4
@@ -482,3 +516,70 @@ class TestResidualDemandTrafficDistributionModel:
 
 
 
+
+class TestTravelTimeTable:
+
+    @pytest.fixture
+    def travel_time_table(self):
+        travel_times = pd.DataFrame({'agent_id': [0, 1, 2, 3], 'origin_nid': [0, 2, 1, 0], 'destin_nid': [2, 0, 2, 2],
+                                     'travel_time_used': [100.0, 200.0, 300.0, 400.0]})
+        travel_time_change_factors = np.asarray([1.0, 2.0, 3.0, 4.0])
+        return TravelTimeTable(travel_times, travel_time_change_factors)
+
+    def test_init(self, travel_time_table):
+        assert travel_time_table.trip_rows == {(0, 2): 0, (2, 0): 1, (1, 2): 2}
+        assert list(travel_time_table.travel_time_used) == [100.0, 200.0, 300.0, 400.0]
+        assert list(travel_time_table.travel_time_change) == [1.0, 2.0, 3.0, 4.0]
+
+    def test_get_trip_row(self, travel_time_table):
+        assert travel_time_table.get_trip_row('0', '2') == 0
+        assert travel_time_table.get_trip_row(2, 0) == 0
+        assert travel_time_table.get_trip_row(2, 0, bidirectional=False) == 1
+        assert travel_time_table.get_trip_row(2, 1) == 2
+        assert travel_time_table.get_trip_row(2, 1, bidirectional=False) == -1
+        assert travel_time_table.get_trip_row(0, 1) == -1
+        assert travel_time_table.get_trip_row('node', 1) == -1
+
+    def test_get_trip_rows(self, travel_time_table):
+        assert list(travel_time_table.get_trip_rows(2, [0, 1, 3])) == [0, 2, -1]
+
+class TestODTripChecker:
+
+    @pytest.fixture
+    def od_matrix_file(self, tmp_path):
+        od_matrix_file = tmp_path / 'OD_Matrix.csv'
+        pd.DataFrame({'agent_id': [0, 1], 'origin_nid': [0, 2], 'destin_nid': [2, 0], 'hour': [7, 7], 'quarter': [2, 2],
+                      'tour_category': ['MANDATORY', 'MANDATORY'], 'person_id': [5, 5]}).to_csv(od_matrix_file, index=False)
+        return od_matrix_file
+
+    @pytest.fixture
+    def od_trip_checker(self, od_matrix_file):
+        return ODTripChecker(str(od_matrix_file))
+
+    def test_check_trip_in_od_matrix(self, od_trip_checker):
+        assert od_trip_checker.check_trip_in_od_matrix(0, 2)
+        assert od_trip_checker.check_trip_in_od_matrix('2', '0')
+        assert not od_trip_checker.check_trip_in_od_matrix(1, 2)
+
+    def test_add_to_od_matrix(self, od_trip_checker, od_matrix_file):
+        od_trip_checker.add_to_od_matrix(1, 2)
+        od_trip_checker.add_to_od_matrix('3', '2')
+        assert od_trip_checker.check_trip_in_od_matrix(1, 2)
+        assert od_trip_checker.check_trip_in_od_matrix(3, 2)
+        assert len(pd.read_csv(od_matrix_file)) == 2
+        od_matrix = od_trip_checker.get_od_matrix()
+        assert list(od_matrix['agent_id']) == [0, 1, 10000002, 10000003]
+        assert list(od_matrix['person_id']) == [5, 5, 10000002, 10000003]
+        assert list(od_matrix['origin_nid']) == [0, 2, 1, 3]
+        assert list(od_matrix['destin_nid']) == [2, 0, 2, 2]
+        assert list(od_matrix['hour']) == [7, 7, 7, 7]
+        assert list(od_matrix['quarter']) == [2, 2, 0, 0]
+        assert list(od_matrix['tour_category']) == ['MANDATORY', 'MANDATORY', 'CONSTANT', 'CONSTANT']
+        od_trip_checker.add_to_od_matrix(4, 2)
+        assert od_trip_checker.get_od_matrix()['agent_id'].iloc[-1] == 10000004
+
+    def test_save_od_matrix(self, od_trip_checker, od_matrix_file):
+        od_trip_checker.add_to_od_matrix(1, 2)
+        od_trip_checker.save_od_matrix()
+        assert list(pd.read_csv(od_matrix_file)['origin_nid']) == [0, 2, 1]
+        assert ODTripChecker(str(od_matrix_file)).check_trip_in_od_matrix(1, 2)
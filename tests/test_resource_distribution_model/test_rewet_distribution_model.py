@@ -2,10 +2,11 @@ import pytest
 import math
 import copy
 from pyrecodes import main
+from pyrecodes.constants import SECONDS_IN_TIME_STEP
 from pyrecodes.utilities import read_json_file
 from pyrecodes.resource_distribution_model.rewet_distribution_model_constructor import REWETDistributionModelConstructor
 from pyrecodes.resource_distribution_model.rewet_distribution_model import REWETDistributionModel
-from rewet_API.rewet_pyrecodes_api import REWETPyReCoDes
+from rewet_API.rewet_pyrecodes_api import REWETPyReCoDes, REWETSession
 from test_resource_distribution_model_inputs import MAIN_FILE_REWET, RESOURCE_NAME_REWET, RESOURCE_PARAMETERS_REWET, INITIAL_R2D_DICT_REWET
 
 class TestREWETDistributionModel:
@@ -57,6 +58,31 @@ class TestREWETDistributionModel:
         }
         assert rewet_distribution_model.r2d_dict == TEMP_R2D_DICT 
 
+    def test_update_r2d_dict_change_set(self, rewet_distribution_model):
+        r2d_dict = rewet_distribution_model.r2d_dict
+        rewet_distribution_model.update_r2d_dict()
+        assert rewet_distribution_model.r2d_dict is r2d_dict
+        assert len(rewet_distribution_model.r2d_change_set) == sum(len(assets) for asset_type in r2d_dict.values() for assets in asset_type.values())
+
+        rewet_distribution_model.components[12].update_r2d_dict()
+        rewet_distribution_model.update_r2d_dict()
+        assert rewet_distribution_model.r2d_change_set == {('Buildings', 'Building', '1')}
+
+        rewet_distribution_model.components[12].update_r2d_dict()
+        rewet_distribution_model.update_r2d_dict()
+        assert rewet_distribution_model.r2d_change_set == set()
+
+        rewet_distribution_model.components[1].damage_information = {"Location": [0.5], "Type": [1]}
+        rewet_distribution_model.update_r2d_dict()
+        assert rewet_distribution_model.r2d_change_set == {('WaterDistributionNetwork', 'Pipe', '1')}
+
+        rewet_distribution_model.components[6].functionality_level = 0.0
+        rewet_distribution_model.components[6].update_r2d_dict()
+        rewet_distribution_model.components[12].update_r2d_dict()
+        rewet_distribution_model.update_r2d_dict()
+        assert rewet_distribution_model.r2d_change_set == {('WaterDistributionNetwork', 'Pipe', '2')}
+        assert rewet_distribution_model.r2d_dict['WaterDistributionNetwork']['Pipe']['2']['GeneralInformation']['Status'] == 'CLOSED'
+
     def test_update_component_met_demand(self, rewet_distribution_model):
         rewet_distribution_model.met_demand_per_building = {"1": 0.7}
         rewet_distribution_model.update_buildings_met_demand()
@@ -180,6 +206,77 @@ class TestREWETDistributionModel:
         met_demand_per_building = rewet_distribution_model.distribute_water(system.time_step)
         assert met_demand_per_building == {"1": 1.0}
 
+    def test_distribute_water_in_persistent_session(self, system):
+        system = self.create_damaged_system('./tests/test_inputs/test_inputs_ThreeLocalitiesCommunityREWET_Main_AllPipesDamaged.json')
+        rewet_distribution_model = REWETDistributionModel(RESOURCE_NAME_REWET, {**RESOURCE_PARAMETERS_REWET, 'PersistentSession': True}, system.components)
+        system.time_step = 0
+        system.set_initial_damage()
+        system.update()
+        rewet_distribution_model.update_r2d_dict()
+        assert rewet_distribution_model.distribute_water(system.time_step) == {"1": 0.0}
+        session = rewet_distribution_model.flow_simulator.session
+        assert isinstance(session, REWETSession)
+
+        for time_step in range(1, 22):
+            system.time_step = time_step
+            system.update()
+            system.recover()
+
+        system.update()
+        rewet_distribution_model.update_r2d_dict()
+        assert rewet_distribution_model.distribute_water(system.time_step) == {"1": 1.0}
+        assert rewet_distribution_model.flow_simulator.session is session
+
+    def get_resource_amounts(self, components: list) -> list:
+        return [{resource_name: resource.current_amount for supply_or_demand in [component.supply['Supply'], component.demand['OperationDemand']]
+                 for resource_name, resource in supply_or_demand.items()} for component in components]
+
+    @pytest.mark.parametrize('main_file', ['./tests/test_inputs/test_inputs_ThreeLocalitiesCommunityREWET_Main_Pipes12Damaged.json',
+                                           './tests/test_inputs/test_inputs_ThreeLocalitiesCommunityREWET_Main_AllPipesDamaged.json'])
+    def test_persistent_session_matches_file_based_workflow(self, main_file: str):
+        systems = [self.create_damaged_system(main_file) for _ in range(2)]
+        rewet_distribution_models = [REWETDistributionModel(RESOURCE_NAME_REWET, {**RESOURCE_PARAMETERS_REWET, 'PersistentSession': persistent_session}, system.components)
+                                     for system, persistent_session in zip(systems, [False, True])]
+        for system in systems:
+            system.time_step = 0
+            system.set_initial_damage()
+        for time_step in range(0, 24, 3):
+            for system, rewet_distribution_model in zip(systems, rewet_distribution_models):
+                system.time_step = time_step
+                system.update()
+                rewet_distribution_model.distribute(time_step)
+            file_based_model, session_model = rewet_distribution_models
+            assert session_model.flow_simulator.building_satisfaction == file_based_model.flow_simulator.building_satisfaction
+            assert session_model.get_total_supply() == file_based_model.get_total_supply()
+            assert session_model.get_total_demand() == file_based_model.get_total_demand()
+            assert session_model.get_total_consumption() == file_based_model.get_total_consumption()
+            assert self.get_resource_amounts(systems[1].components) == self.get_resource_amounts(systems[0].components)
+            for system in systems:
+                for _ in range(3):
+                    system.recover()
+                    system.time_step += 1
+        assert isinstance(rewet_distribution_models[1].flow_simulator.session, REWETSession)
+
+    def test_distribute_water_with_result_cache(self, system):
+        rewet_distribution_model = REWETDistributionModel(RESOURCE_NAME_REWET, {**RESOURCE_PARAMETERS_REWET, 'ResultCache': {}}, system.components)
+        system_performance = rewet_distribution_model.flow_simulator.system_performance
+        simulated_times = []
+        def count_system_performance(state, current_time, next_time):
+            simulated_times.append(current_time)
+            return system_performance(state, current_time, next_time)
+        rewet_distribution_model.flow_simulator.system_performance = count_system_performance
+
+        assert rewet_distribution_model.distribute_water(0) == {"1": 1.0}
+        assert rewet_distribution_model.distribute_water(1) == {"1": 1.0}
+        assert len(simulated_times) == 1
+        assert list(rewet_distribution_model.flow_simulator.damage_state.keys()) == [0, SECONDS_IN_TIME_STEP]
+        assert rewet_distribution_model.flow_simulator.building_satisfaction == {"1": 1.0}
+
+        rewet_distribution_model.components[1].damage_information = {"Location": [0.5], "Type": ["leak"]}
+        rewet_distribution_model.update_r2d_dict()
+        rewet_distribution_model.distribute_water(2)
+        assert len(simulated_times) == 2
+
     def test_distribute_no_damage(self, rewet_distribution_model):
         rewet_distribution_model.distribute(0)
         assert rewet_distribution_model.components[12].supply['Supply']['Shelter'].current_amount == 10
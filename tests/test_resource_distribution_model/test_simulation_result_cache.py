@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+import pandas as pd
+from pyrecodes.resource_distribution_model.simulation_result_cache import SimulationResultCache, get_fingerprint, get_r2d_state
+
+R2D_DICT = {'WaterDistributionNetwork': {'Pipe': {'1': {'GeneralInformation': {'AIM_id': '1', 'Status': 'OPEN', 'location': [0, 1]},
+                                                        'Damage': {'Location': [], 'Type': []}}}},
+            'Buildings': {'Building': {'2': {'GeneralInformation': {'AIM_id': '2', 'PopulationRatio': 1.0,
+                                                                    'OperationDemand': {'PotableWater': 2.0}},
+                                             'Damage': {}}}}}
+
+class TestSimulationResultCache:
+
+    @pytest.fixture
+    def result_cache(self):
+        return SimulationResultCache(namespace='system', max_size=2)
+
+    def test_get_fingerprint(self):
+        assert get_fingerprint({'a': 1, 'b': [1.0, 'x']}) == get_fingerprint({'b': [1.0, 'x'], 'a': 1})
+        assert get_fingerprint({'a': 1}) != get_fingerprint({'a': 2})
+        assert get_fingerprint(np.float64(0.5), pd.Series([1, 2])) == get_fingerprint(0.5, pd.Series([1, 2]))
+        assert get_fingerprint(pd.DataFrame({'a': [1, 2]})) != get_fingerprint(pd.DataFrame({'a': [2, 1]}))
+
+    def test_get_r2d_state(self):
+        r2d_state = get_r2d_state(R2D_DICT)
+        assert r2d_state['WaterDistributionNetwork/Pipe']['1'] == [{'Location': [], 'Type': []}, 'OPEN', None, None, None, None]
+        assert r2d_state['Buildings/Building']['2'] == [{}, None, None, 1.0, {'PotableWater': 2.0}, None]
+
+    def test_get_or_compute(self, result_cache: SimulationResultCache):
+        key = result_cache.get_key(get_r2d_state(R2D_DICT))
+        assert result_cache.get_or_compute(key, lambda: {'2': 1.0}) == {'2': 1.0}
+        result = result_cache.get_or_compute(key, lambda: pytest.fail('The result should be cached.'))
+        assert result == {'2': 1.0}
+        result['2'] = 0.0
+        assert result_cache.get(key) == {'2': 1.0}
+        assert (result_cache.hits, result_cache.misses) == (2, 1)
+        assert result_cache.get(SimulationResultCache(namespace='other_system').get_key(get_r2d_state(R2D_DICT))) is None
+
+    def test_none_result_cached(self, result_cache: SimulationResultCache):
+        assert result_cache.get_or_compute('a', lambda: None) is None
+        assert result_cache.get_or_compute('a', lambda: pytest.fail('The result should be cached.')) is None
+        assert (result_cache.hits, result_cache.misses) == (1, 1)
+
+    def test_replay_side_effects(self, result_cache: SimulationResultCache):
+        replayed_results = []
+        result_cache.get_or_compute('a', lambda: 1.0, replayed_results.append)
+        assert replayed_results == []
+        result_cache.get_or_compute('a', lambda: pytest.fail('The result should be cached.'), replayed_results.append)
+        assert replayed_results == [1.0]
+
+    def test_least_recently_used_removed(self, result_cache: SimulationResultCache):
+        for key in ['a', 'b']:
+            result_cache.set(key, key)
+        result_cache.get('a')
+        result_cache.set('c', 'c')
+        assert list(result_cache.results.keys()) == ['a', 'c']
+
+    def test_shared_cache_directory(self, tmp_path):
+        result_caches = [SimulationResultCache(namespace='system', cache_directory=tmp_path, max_disk_entries=2) for _ in range(2)]
+        result_caches[0].set('a', pd.DataFrame({'travel_time_used': [1.0, 2.0]}))
+        assert result_caches[1].get('a').equals(pd.DataFrame({'travel_time_used': [1.0, 2.0]}))
+        for key in ['b', 'c']:
+            result_caches[0].set(key, key)
+        assert len(list(tmp_path.glob('*.pkl'))) == 2
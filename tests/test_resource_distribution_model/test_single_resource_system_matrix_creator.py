@@ -122,6 +122,53 @@ class TestSingleResourceSystemMatrixCreator():
              recovery_demand_matrix_part), axis=0)
         assert np.all(np.isclose(target_cooling_water_matrix, distribution_models['CoolingWater'].system_matrix.matrix))
 
+    def test_get_changed_rows(self, distribution_models: dict):
+        system_matrix = distribution_models['ElectricPower'].system_matrix
+        system_matrix.fill_system_matrix()
+        assert system_matrix.get_changed_rows() == ([], [], [], [])
+        system_matrix.components[0].supply['Supply']['ElectricPower'].set_current_amount(2.0)
+        assert system_matrix.get_changed_rows() == ([0], [2.0], [0.0], [0.0])
+        system_matrix.components[1].recovery_model.get_demand = lambda: {'ElectricPower': system_matrix.components[0].supply['Supply']['ElectricPower']}
+        system_matrix.components[1].update_recovery_demand()
+        assert system_matrix.get_changed_rows() == ([1], [0.0], [1.0], [2.0])
+        system_matrix.components[0].supply['Supply']['ElectricPower'].set_current_amount(3.0)
+        assert system_matrix.get_changed_rows() == ([0, 1], [3.0, 0.0], [0.0, 1.0], [0.0, 3.0])
+
+    def test_fill_system_matrix_reads_only_changed_rows(self, distribution_models: dict, monkeypatch):
+        system_matrix = distribution_models['ElectricPower'].system_matrix
+        system_matrix.fill_system_matrix()
+        read_components = []
+        get_component_resources = system_matrix.get_component_resources
+        def record_component_resources(component):
+            read_components.append(component)
+            return get_component_resources(component)
+        monkeypatch.setattr(system_matrix, 'get_component_resources', record_component_resources)
+        system_matrix.components[8].demand['OperationDemand']['ElectricPower'].set_current_amount(0.3)
+        system_matrix.fill_system_matrix()
+        assert read_components == [system_matrix.components[8]]
+        assert system_matrix.matrix[8, system_matrix.DEMAND_COL_ID] == 0.3
+        assert system_matrix.changed_rows == set()
+
+    def test_fill_system_matrix_only_changed_rows(self, distribution_models: dict):
+        system_matrix = distribution_models['ElectricPower'].system_matrix
+        system_matrix.fill_system_matrix()
+        system_matrix.set_demand_met_indicator(0, 0.5)
+        system_matrix.matrix[2, system_matrix.DEMAND_COL_ID] = -1.0
+        system_matrix.components[0].supply['Supply']['ElectricPower'].set_current_amount(2.0)
+        system_matrix.fill_system_matrix()
+        assert system_matrix.matrix[0, system_matrix.SUPPLY_COL_ID] == 2.0
+        assert system_matrix.matrix[2, system_matrix.DEMAND_COL_ID] == -1.0
+        assert np.all(system_matrix.matrix[:, system_matrix.DEMAND_MET_COL_ID] == 1.0)
+
+    def test_update_components(self, distribution_models: dict):
+        system_matrix = distribution_models['ElectricPower'].system_matrix
+        system_matrix.fill_system_matrix()
+        system_matrix.update_components(system_matrix.components)
+        assert system_matrix.locality_columns_filled
+        system_matrix.update_components(list(system_matrix.components))
+        assert not system_matrix.locality_columns_filled
+        assert system_matrix.changed_rows == set(range(len(system_matrix.components)))
+
     def test_get_component_properties(self, distribution_models: dict):
         
         electric_power_plant = distribution_models['ElectricPower'].components[0]
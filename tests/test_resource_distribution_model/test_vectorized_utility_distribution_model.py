@@ -0,0 +1,79 @@
+import pytest
+import numpy as np
+from pyrecodes import main
+from pyrecodes.utilities import read_json_file
+from pyrecodes.system.built_environment import BuiltEnvironment
+from pyrecodes.system_creator.concrete_system_creator import ConcreteSystemCreator
+from pyrecodes.resilience_calculator.recodes_calculator import ReCoDeSCalculator
+from pyrecodes.resource_distribution_model.vectorized_utility_distribution_model import VectorizedUtilityDistributionModel
+
+def create_system(main_file: str, vectorized: bool) -> BuiltEnvironment:
+    """
+    Create a system in which all utility resources use either the UtilityDistributionModel or the VectorizedUtilityDistributionModel.
+    """
+    np.random.seed(0)
+    input_dict = read_json_file(main_file)
+    component_library = main.form_component_library(input_dict)
+    system_configuration = read_json_file(input_dict['System']['SystemConfigurationFile'])
+    if vectorized:
+        for resource_parameters in system_configuration['Resources'].values():
+            if resource_parameters['DistributionModel']['ClassName'] == 'UtilityDistributionModel':
+                resource_parameters['DistributionModel']['ClassName'] = 'VectorizedUtilityDistributionModel'
+                resource_parameters['DistributionModel']['FileName'] = 'vectorized_utility_distribution_model'
+    system = BuiltEnvironment(system_configuration, component_library, ConcreteSystemCreator())
+    system.create_system()
+    return system
+
+class TestVectorizedUtilityDistributionModel():
+
+    @pytest.mark.parametrize('main_file', ['./tests/test_inputs/test_inputs_ThreeLocalitiesCommunity_Main.json',
+                                           './tests/test_inputs/test_inputs_VirtualCommunity_Main.json'])
+    def test_same_allocations_as_utility_distribution_model(self, main_file):
+        systems = [create_system(main_file, vectorized) for vectorized in [False, True]]
+        assert any(isinstance(resource['DistributionModel'], VectorizedUtilityDistributionModel) for resource in systems[1].resources.values())
+        for system in systems:
+            system.start_resilience_assessment()
+        assert systems[0].time_step == systems[1].time_step
+        for calculator, vectorized_calculator in zip(*[system.resilience_calculators for system in systems]):
+            if type(calculator) is ReCoDeSCalculator:
+                for resource_name in calculator.resource_names:
+                    assert np.allclose(calculator.system_supply[resource_name], vectorized_calculator.system_supply[resource_name])
+                    assert np.allclose(calculator.system_demand[resource_name], vectorized_calculator.system_demand[resource_name])
+                    assert np.allclose(calculator.system_consumption[resource_name], vectorized_calculator.system_consumption[resource_name])
+        for component, vectorized_component in zip(systems[0].components, systems[1].components):
+            assert component.functional == vectorized_component.functional
+
+    @pytest.fixture
+    def distribution_model(self):
+        system = create_system('./tests/test_inputs/test_inputs_ThreeLocalitiesCommunity_Main.json', vectorized=True)
+        distribution_model = system.resources['ElectricPower']['DistributionModel']
+        distribution_model.fill_system_matrix()
+        distribution_model.initialize_supplier_arrays([0, 8])
+        distribution_model.reset_optimal_path_supply_cache()
+        return distribution_model
+
+    def test_add_supplier_to_arrays(self, distribution_model):
+        assert len(distribution_model.supplier_current_supply) == 1
+        assert distribution_model.add_supplier_to_arrays(0)
+        assert not distribution_model.add_supplier_to_arrays(8)
+        assert distribution_model.num_suppliers == 1
+        assert distribution_model.supplier_current_supply[0] == 5.0
+        assert distribution_model.supplier_row_id[0] == 0
+
+    def test_get_supplier_order(self, distribution_model):
+        distribution_model.num_suppliers = 3
+        assert list(distribution_model.get_supplier_order(component_is_supplier=False)) == [0, 1, 2]
+        assert list(distribution_model.get_supplier_order(component_is_supplier=True)) == [2, 0, 1]
+
+    def test_allocate_demand_to_suppliers(self, distribution_model):
+        distribution_model.supplier_current_supply = np.asarray([0.5, 2.0, 1.0])
+        distribution_model.supplier_consumed_amount = np.zeros(3)
+        distribution_model.num_suppliers = 3
+        supplier_order = np.asarray([2, 0, 1])
+        connected = np.asarray([True, False, True])
+        assert distribution_model.allocate_demand_to_suppliers(1.5, supplier_order, connected) == 0.0
+        assert np.allclose(distribution_model.supplier_current_supply, [0.5, 1.5, 0.0])
+        assert np.allclose(distribution_model.supplier_consumed_amount, [0.0, 0.5, 1.0])
+        assert distribution_model.allocate_demand_to_suppliers(2.0, supplier_order, connected) == 0.5
+        assert np.allclose(distribution_model.supplier_current_supply, [0.5, 0.0, 0.0])
+        assert np.allclose(distribution_model.supplier_consumed_amount, [0.0, 2.0, 1.0])
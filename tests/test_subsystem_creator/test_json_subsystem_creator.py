@@ -2,6 +2,7 @@ import pytest
 from pyrecodes.utilities import read_json_file
 from pyrecodes import main
 from pyrecodes.subsystem_creator.json_subsystem_creator import JSONSubsystemCreator
+from pyrecodes.component_recovery_model.concrete_recovery_activity import ConcreteRecoveryActivity
 from tests.test_subsystem_creator.test_subsystem_creator_inputs import MAIN_FILE, LOCALITY_CENTROID, PARAMETERS_BTS, PARAMETERS_LINKS, PARAMETERS_DIFFERENT_COMPONENTS, CONSTANTS
 
 class TestJSONSubsystemCreator:
@@ -28,6 +29,21 @@ class TestJSONSubsystemCreator:
         assert components[1].name == 'BaseTransceiverStation_2'
         assert components[2].name == 'ElectricPowerPlant'
 
+    def test_components_of_same_type_have_same_durations(self, component_library, monkeypatch):
+        samples = iter(range(1, 1000))
+        monkeypatch.setattr(ConcreteRecoveryActivity, 'sample_duration', lambda recovery_activity, distribution: next(samples))
+        json_subsystem_creator = JSONSubsystemCreator(component_library, LOCALITY_CENTROID, {'ComponentsInLocality': {'BuildingStockUnit': 3}}, constants=CONSTANTS, damage_input={})
+        components = json_subsystem_creator.create_components_in_localities()
+        durations = [[recovery_activity.duration for recovery_activity in component.recovery_model.recovery_activities.values()] for component in components]
+        assert len(durations[0]) > 0
+        assert durations[0] == durations[1] == durations[2]
+        assert components[0].recovery_model is not components[1].recovery_model
+
+    def test_components_of_same_type_share_relations(self, component_library):
+        json_subsystem_creator = JSONSubsystemCreator(component_library, LOCALITY_CENTROID, {'ComponentsInLocality': {'BuildingStockUnit': 2}}, constants=CONSTANTS, damage_input={})
+        components = json_subsystem_creator.create_components_in_localities()
+        assert components[0].recovery_model.damage_to_functionality_relation is components[1].recovery_model.damage_to_functionality_relation
+
     def test_create_components_between_localities(self, component_library):
         json_subsystem_creator = JSONSubsystemCreator(component_library, LOCALITY_CENTROID, PARAMETERS_BTS, constants=CONSTANTS, damage_input={})
         components = json_subsystem_creator.create_components_between_localities()
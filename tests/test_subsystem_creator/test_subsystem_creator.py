@@ -36,4 +36,10 @@ class TestSubsystemCreator:
             component = subsystem_creator.get_component_object(component_type)
             assert isinstance(component, StandardiReCoDeSComponent)
             assert component.name == component_type
-    
\ No newline at end of file
+    
+    def test_get_component_object_without_factory(self, subsystem_creator):
+        component_template = subsystem_creator.component_library['SuperLink']
+        del component_template.factory
+        component = subsystem_creator.get_component_object('SuperLink')
+        assert component is not component_template
+        assert component.name == 'SuperLink'
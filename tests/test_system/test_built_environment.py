@@ -1,6 +1,7 @@
 import pytest
 import numpy as np
 import math
+import copy
 from pyrecodes import main
 from pyrecodes.utilities import read_json_file
 from pyrecodes.system_creator.concrete_system_creator import ConcreteSystemCreator
@@ -8,6 +9,9 @@ from pyrecodes.system_creator.system_creator import SystemCreator
 from pyrecodes.damage_input.list_damage_input import ListDamageInput
 from pyrecodes.system.recovery_target_checker import NoDamageRecoveryTargetChecker
 from pyrecodes.system.system import System
+from pyrecodes.relation import relation
+from pyrecodes.component_recovery_model.component_level_recovery_activities_model import ComponentLevelRecoveryActivitiesModel
+from pyrecodes.time_step_history import TimeStepSet
    
 
 class TestBuiltEnvironmentSystem():
@@ -120,6 +124,66 @@ class TestThreeLocalitiesSystem(TestBuiltEnvironmentSystem):
         system.save_as_pickle('./tests/test_inputs/test_inputs_ThreeLocalitiesCommunitySystem.pickle')
         system_loaded = system.load_as_pickle('./tests/test_inputs/test_inputs_ThreeLocalitiesCommunitySystem.pickle')
         assert isinstance(system_loaded, System)
+
+    def run_resilience_assessment(self, system, event_driven_time_stepping: bool, capsys) -> tuple:
+        system = copy.deepcopy(system)
+        system.EVENT_DRIVEN_TIME_STEPPING = event_driven_time_stepping
+        system.start_resilience_assessment()
+        num_processed_time_steps = capsys.readouterr().out.count('Time step')
+        component_states = [(component.functional, component.functionality_level, component.get_damage_level(),
+                             {name: (activity.level, activity.time_steps) for name, activity in component.recovery_model.recovery_activities.items()})
+                            for component in system.components]
+        return num_processed_time_steps, system.time_step, component_states, system.resilience_calculators[0].system_supply
+
+    def test_event_driven_resilience_assessment(self, system, capsys):
+        system.DISASTER_TIME_STEP = 5
+        # functionality of components changes only when their repair is finished
+        for component in system.components:
+            if isinstance(component.recovery_model, ComponentLevelRecoveryActivitiesModel):
+                component.recovery_model.damage_to_functionality_relation = relation.ReverseBinary()
+        num_time_steps, *results = self.run_resilience_assessment(system, False, capsys)
+        num_event_time_steps, *event_driven_results = self.run_resilience_assessment(system, True, capsys)
+        assert event_driven_results == results
+        assert num_event_time_steps < num_time_steps
+
+    def test_vectorized_recovery(self, system, capsys):
+        _, *results = self.run_resilience_assessment(system, False, capsys)
+        system.system_creator.VECTORIZED_RECOVERY = True
+        system.set_recovery_activities_engine()
+        assert len(system.recovery_activities_engine.recovery_models) == len(system.components)
+        for event_driven_time_stepping in [False, True]:
+            _, *vectorized_results = self.run_resilience_assessment(system, event_driven_time_stepping, capsys)
+            assert vectorized_results == results
+
+    def test_vectorized_resource_update(self, system, capsys):
+        _, *results = self.run_resilience_assessment(system, False, capsys)
+        system.system_creator.VECTORIZED_RESOURCE_UPDATE = True
+        system.set_resource_store()
+        system.set_resource_amount_updater()
+        assert system.resource_amount_updater.resource_store is system.resource_store
+        assert len(system.resource_amount_updater.relation_groups) > 0
+        _, *vectorized_results = self.run_resilience_assessment(system, False, capsys)
+        assert vectorized_results == results
+
+    def test_columnar_resources(self, system, capsys):
+        _, *results = self.run_resilience_assessment(system, False, capsys)
+        system.system_creator.COLUMNAR_RESOURCES = True
+        system.system_creator.VECTORIZED_RESOURCE_UPDATE = True
+        system.set_resource_store()
+        assert all(component.resource_store is system.resource_store for component in system.components)
+        for vectorized_resource_update in [False, True]:
+            system.system_creator.VECTORIZED_RESOURCE_UPDATE = vectorized_resource_update
+            system.set_resource_amount_updater()
+            _, *columnar_results = self.run_resilience_assessment(system, False, capsys)
+            assert columnar_results == results
+
+    def test_compact_objects(self, system, capsys):
+        _, *results = self.run_resilience_assessment(system, False, capsys)
+        system.system_creator.COMPACT_OBJECTS = True
+        system.set_compact_objects()
+        assert all(isinstance(component.functional, TimeStepSet) for component in system.components)
+        _, *compact_results = self.run_resilience_assessment(system, False, capsys)
+        assert compact_results == results
         
 class TestVirtualCommunity(TestBuiltEnvironmentSystem):
 
@@ -0,0 +1,58 @@
+import pytest
+import math
+import numpy as np
+from pyrecodes import main
+from pyrecodes.utilities import read_json_file
+from pyrecodes.system.component_state_counter import ComponentStateCounter
+
+MAIN_FILE = './tests/test_inputs/test_inputs_VirtualCommunity_Main.json'
+
+def count_damaged(components: list) -> int:
+    return sum(not math.isclose(component.get_damage_level(), 0, abs_tol=1e-10) for component in components)
+
+class TestComponentStateCounter:
+
+    @pytest.fixture
+    def system(self):
+        input_dict = read_json_file(MAIN_FILE)
+        return main.create_system(input_dict)
+
+    def test_init(self, system):
+        state_counter = system.component_state_counter
+        assert isinstance(state_counter, ComponentStateCounter)
+        assert state_counter.get_num_components() == len(system.components)
+        assert state_counter.get_num_components(['PotableWaterPipe', 'Bridge']) == 57
+        assert state_counter.get_num_damaged() == 0
+        assert state_counter.get_num_functional() == len(system.components)
+        assert all(component.state_counter is state_counter and component.recovery_model.state_counter is state_counter for component in system.components)
+
+    def test_counts_follow_recovery(self, system):
+        state_counter = system.component_state_counter
+        system.set_initial_damage()
+        assert state_counter.get_num_damaged() == count_damaged(system.components) > 0
+        for time_step in range(1, 200):
+            system.time_step = time_step
+            system.update()
+            system.recover()
+            assert state_counter.get_num_damaged() == count_damaged(system.components)
+            assert state_counter.get_num_functional() == sum(component.functionality_level > 0 for component in system.components)
+        assert state_counter.get_num_damaged() == 0
+
+    def test_counts_follow_vectorized_recovery(self, system):
+        system.system_creator.VECTORIZED_RECOVERY = True
+        system.set_recovery_activities_engine()
+        system.set_initial_damage()
+        for time_step in range(1, 200):
+            system.time_step = time_step
+            system.recover()
+            assert system.component_state_counter.get_num_damaged() == count_damaged(system.components)
+
+    def test_set_damage_levels(self, system):
+        state_counter = system.component_state_counter
+        state_counter.set_damage_levels(np.array([0, 2, 15]), np.array([0.5, 1e-12, 1.0]))
+        assert state_counter.get_num_damaged() == 2
+        assert state_counter.get_num_damaged(['ElectricPowerTransmissionLine']) == 1
+        assert state_counter.get_num_damaged(['PotableWaterPipe']) == 0
+        assert state_counter.get_num_damaged(['PotableWaterFacility']) == 1
+        state_counter.set_damage_level(0, 0.0)
+        assert state_counter.get_num_damaged() == 1
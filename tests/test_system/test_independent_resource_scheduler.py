@@ -0,0 +1,133 @@
+import sys
+import threading
+import pytest
+from pyrecodes import main
+from pyrecodes.utilities import read_json_file
+from pyrecodes.system.independent_resource_scheduler import IndependentResourceScheduler
+from pyrecodes.resource_distribution_model.abstract_resource_distribution_model import ThreadStdout, redirect_thread_stdout
+
+MAIN_FILE = './tests/test_inputs/test_inputs_VirtualCommunity_Main.json'
+CONCURRENT_RESOURCES = ['BridgeService', 'PotableWaterTransferService', 'CoolingWaterTransferService', 'Shelter']
+MAIN_FILE_REWET = './tests/test_inputs/test_inputs_ThreeLocalitiesCommunityREWET_Main_Pipe1Damaged.json'
+MAIN_FILE_RESIDUAL_DEMAND = './tests/test_inputs/test_inputs_ThreeLocalitiesCommunityResidualDemand_Main_Road2Damaged.json'
+
+def create_system(max_workers: int = None):
+    system = main.create_system(read_json_file(MAIN_FILE))
+    for resource_name in CONCURRENT_RESOURCES:
+        system.resources[resource_name]['DistributionModel'].CONCURRENT_DISTRIBUTION = True
+    system.independent_resource_scheduler = IndependentResourceScheduler(system.components, system.resources,
+                                                                         system.resource_distribution_dict['IndependentResources'], max_workers)
+    return system
+
+def distribute_after_disaster(system) -> dict:
+    system.time_step = system.DISASTER_TIME_STEP
+    system.set_initial_damage()
+    system.update()
+    system.distribute_resources()
+    return {resource_name: system.get_system_supply(resource_name) for resource_name in system.resources.keys()}
+
+def distribute_simulators(max_workers: int = None, simulator_barrier: threading.Barrier = None) -> tuple:
+    """
+    Distribute water with REWET and traffic with the residual demand traffic simulator in one wave, before and after the disaster.
+    If simulator_barrier is defined, each simulator waits at the barrier before it runs, so the simulators have to run at the same time.
+    """
+    systems = [main.create_system(read_json_file(MAIN_FILE_REWET)), main.create_system(read_json_file(MAIN_FILE_RESIDUAL_DEMAND))]
+    resources = {'PotableWater': systems[0].resources['PotableWater'], 'TransportationService': systems[1].resources['TransportationService']}
+    if simulator_barrier is not None:
+        wait_before_running(resources['PotableWater']['DistributionModel'].flow_simulator, 'system_performance', simulator_barrier)
+        wait_before_running(resources['TransportationService']['DistributionModel'].flow_simulator, 'simulate', simulator_barrier)
+    scheduler = IndependentResourceScheduler(systems[0].components + systems[1].components, resources, list(resources.keys()), max_workers)
+    scheduler.distribute(systems[0].START_TIME_STEP)
+    for system in systems:
+        system.time_step = system.DISASTER_TIME_STEP
+        system.set_initial_damage()
+        system.update()
+    scheduler.distribute(systems[0].DISASTER_TIME_STEP)
+    return scheduler, resources['PotableWater']['DistributionModel'], resources['TransportationService']['DistributionModel']
+
+def wait_before_running(flow_simulator, method_name: str, simulator_barrier: threading.Barrier) -> None:
+    method = getattr(flow_simulator, method_name)
+    def wait_and_run(*args, **kwargs):
+        simulator_barrier.wait()
+        return method(*args, **kwargs)
+    setattr(flow_simulator, method_name, wait_and_run)
+
+class TestIndependentResourceScheduler:
+
+    @pytest.fixture
+    def system(self):
+        return create_system()
+
+    @pytest.fixture
+    def scheduler(self, system):
+        return system.independent_resource_scheduler
+
+    def test_no_concurrent_distribution_by_default(self):
+        system = main.create_system(read_json_file(MAIN_FILE))
+        assert system.independent_resource_scheduler.distribution_waves == [[resource_name] for resource_name in
+                                                                            system.resource_distribution_dict['IndependentResources']]
+
+    def test_get_resource_dependency_graph(self, scheduler):
+        assert scheduler.resource_dependency_graph['BridgeService'] == {'ElectricPowerTransferService', 'PotableWaterTransferService', 'CoolingWaterTransferService'}
+        assert scheduler.resource_dependency_graph['Shelter'] == {'FunctionalHousing'}
+
+    def test_resources_conflict(self, scheduler):
+        # bridges reduce the supply of transfer services
+        assert scheduler.resources_conflict('BridgeService', 'CoolingWaterTransferService')
+        # transfer services are distributed by the same distribution model class
+        assert scheduler.resources_conflict('PotableWaterTransferService', 'CoolingWaterTransferService')
+        assert not scheduler.resources_conflict('CoolingWaterTransferService', 'Shelter')
+
+    def test_get_distribution_waves(self, scheduler):
+        assert scheduler.distribution_waves == [['BridgeService'], ['ElectricPowerTransferService'], ['PotableWaterTransferService'],
+                                                ['CoolingWaterTransferService', 'Shelter']]
+
+    def test_concurrent_distribution_same_as_serial(self):
+        assert distribute_after_disaster(create_system()) == distribute_after_disaster(create_system(max_workers=1))
+
+    def test_distribution_exception_raised(self, system, scheduler):
+        def distribute(time_step):
+            raise RuntimeError('Simulator failed.')
+        system.resources['Shelter']['DistributionModel'].distribute = distribute
+        with pytest.raises(RuntimeError):
+            scheduler.distribute(system.START_TIME_STEP)
+
+    def test_rewet_and_traffic_distributed_in_one_wave(self):
+        standard_output = sys.stdout
+        # the barrier is broken and raises if a simulator waits for longer than the timeout, i.e., if simulators run one after another
+        simulator_barrier = threading.Barrier(2, timeout=60)
+        scheduler, rewet_distribution_model, traffic_distribution_model = distribute_simulators(simulator_barrier=simulator_barrier)
+        assert scheduler.distribution_waves == [['PotableWater', 'TransportationService']]
+        assert not simulator_barrier.broken
+        assert sys.stdout is standard_output
+        _, serial_rewet_distribution_model, _ = distribute_simulators(max_workers=1)
+        assert rewet_distribution_model.met_demand_per_building == serial_rewet_distribution_model.met_demand_per_building
+        assert len(traffic_distribution_model.travel_times[-1]) > 0
+
+class TestRedirectThreadStdout:
+
+    def test_redirect_thread_stdout(self, capsys):
+        standard_output = sys.stdout
+        thread_output = []
+        class ThreadFile:
+            def write(self, text):
+                thread_output.append(text)
+            def flush(self):
+                pass
+        redirected = threading.Event()
+        printed = threading.Event()
+        def print_in_thread():
+            with redirect_thread_stdout(ThreadFile()):
+                redirected.set()
+                print('thread')
+                printed.wait(timeout=10)
+        thread = threading.Thread(target=print_in_thread)
+        thread.start()
+        redirected.wait(timeout=10)
+        assert isinstance(sys.stdout, ThreadStdout)
+        print('main')
+        printed.set()
+        thread.join()
+        assert sys.stdout is standard_output
+        assert thread_output == ['thread', '\n']
+        assert capsys.readouterr().out == 'main\n'
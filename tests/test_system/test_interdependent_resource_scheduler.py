@@ -0,0 +1,66 @@
+import pytest
+from pyrecodes import main
+from pyrecodes.utilities import read_json_file
+from pyrecodes.system.interdependent_resource_scheduler import InterdependentResourceScheduler
+
+MAIN_FILE = './tests/test_inputs/test_inputs_VirtualCommunity_Main.json'
+
+class TestInterdependentResourceScheduler:
+
+    @pytest.fixture
+    def system(self):
+        input_dict = read_json_file(MAIN_FILE)
+        return main.create_system(input_dict)
+
+    @pytest.fixture
+    def scheduler(self, system):
+        return InterdependentResourceScheduler(system.components, system.resources,
+                                               system.resource_distribution_dict['InterdependentResources'])
+
+    def test_interdependent_resources(self, scheduler):
+        assert scheduler.interdependent_resources == ['ElectricPower', 'HighLevelCommunication', 'LowLevelCommunication',
+                                                      'PotableWater', 'CoolingWater', 'FunctionalHousing']
+
+    def test_get_resource_dependency_graph(self, scheduler):
+        resource_dependency_graph = scheduler.get_resource_dependency_graph()
+        assert set(resource_dependency_graph['HighLevelCommunication']) == {'LowLevelCommunication'}
+        assert set(resource_dependency_graph['PotableWater']) == {'FunctionalHousing'}
+        assert set(resource_dependency_graph['CoolingWater']) == {'HighLevelCommunication', 'ElectricPower'}
+        assert set(resource_dependency_graph['FunctionalHousing']) == {'FunctionalHousing'}
+
+    def test_get_resources_to_redistribute(self, scheduler):
+        for resource_name, resources_to_redistribute in scheduler.get_resources_to_redistribute().items():
+            assert resources_to_redistribute == [resource_name]
+
+    def test_get_resources_using_transfer_service(self, scheduler):
+        assert scheduler.get_resources_using_transfer_service('PotableWaterTransferService') == ['PotableWater']
+        assert scheduler.get_resources_using_transfer_service('DummyTransferService') == []
+
+    def test_get_strongly_connected_components(self, scheduler):
+        assert scheduler.get_strongly_connected_components() == [['ElectricPower', 'HighLevelCommunication', 'LowLevelCommunication', 'CoolingWater'],
+                                                                  ['PotableWater'],
+                                                                  ['FunctionalHousing']]
+
+    def test_get_supply(self, system, scheduler):
+        for resource_name in scheduler.supplier_components.keys():
+            assert scheduler.get_supply(resource_name) == system.get_system_supply(resource_name)
+
+    def test_add_to_worklist(self, scheduler):
+        worklist = ['ElectricPower']
+        scheduler.add_to_worklist(worklist, ['ElectricPower', 'CoolingWater', 'PotableWater'], ['ElectricPower', 'CoolingWater'])
+        assert worklist == ['ElectricPower', 'CoolingWater']
+
+    def test_distribute_no_damage(self, system, scheduler):
+        system.time_step = system.START_TIME_STEP
+        system.update()
+        system.distribute_independent_resources()
+        assert scheduler.distribute(system.time_step) == len(scheduler.interdependent_resources)
+
+    def test_distribute_with_damage(self, system, scheduler):
+        system.time_step = system.DISASTER_TIME_STEP
+        system.set_initial_damage()
+        system.update()
+        system.distribute_independent_resources()
+        assert scheduler.distribute(system.time_step) > len(scheduler.interdependent_resources)
+        for resource_name in scheduler.interdependent_resources:
+            assert system.resources[resource_name]['DistributionModel'].get_total_supply() == 0
@@ -1,7 +1,7 @@
 import pytest
 from pyrecodes import main
 from pyrecodes.utilities import read_json_file
-from pyrecodes.system.recovery_target_checker import NoDamageRecoveryTargetChecker
+from pyrecodes.system.recovery_target_checker import NoDamageRecoveryTargetChecker, RepairedComponentsRecoveryTargetChecker, FunctionalComponentsRecoveryTargetChecker
 
 MAIN_FILE = './tests/test_inputs/test_inputs_VirtualCommunity_Main.json'
 
@@ -28,4 +28,45 @@ class TestNoDamageRecoveryTargetChecker:
         for time_step in range(not_enough_time_steps_to_recover, enough_time_steps_to_recovery):
             system.time_step = time_step
             system.recover()
-        assert recovery_target_checker.recovery_target_met(system) == True   
\ No newline at end of file
+        assert recovery_target_checker.recovery_target_met(system) == True
+
+    def test_recovery_target_met_without_state_counter(self, system):
+        system.component_state_counter = None
+        self.test_recovery_target_met(system)
+
+class TestComponentGroupRecoveryTargetCheckers:
+
+    @pytest.fixture
+    def system(self):
+        input_dict = read_json_file(MAIN_FILE)
+        system = main.create_system(input_dict)
+        system.set_initial_damage()
+        system.time_step = system.DISASTER_TIME_STEP + 1
+        return system
+
+    def test_repaired_components(self, system):
+        all_components_repaired = RepairedComponentsRecoveryTargetChecker()
+        potable_water_pipes_repaired = RepairedComponentsRecoveryTargetChecker({'ComponentNames': ['PotableWaterPipe']})
+        assert all_components_repaired.recovery_target_met(system) == False
+        assert potable_water_pipes_repaired.recovery_target_met(system) == False
+        for component in system.components:
+            if component.name == 'PotableWaterPipe':
+                system.component_state_counter.set_damage_level(component.state_counter_id, 0.0)
+        assert potable_water_pipes_repaired.recovery_target_met(system) == True
+        assert all_components_repaired.recovery_target_met(system) == False
+
+    def test_functional_components(self, system):
+        system.update()
+        # two of four cooling water facilities are functional after the disaster
+        assert FunctionalComponentsRecoveryTargetChecker({'ComponentNames': ['CoolingWaterFacility'], 'Percent': 0.5}).recovery_target_met(system) == True
+        assert FunctionalComponentsRecoveryTargetChecker({'ComponentNames': ['CoolingWaterFacility'], 'Percent': 0.95}).recovery_target_met(system) == False
+        assert FunctionalComponentsRecoveryTargetChecker({'ComponentNames': ['BuildingStockUnit', 'Bridge']}).recovery_target_met(system) == True
+
+    def test_recovery_target_from_system_configuration(self):
+        input_dict = read_json_file(MAIN_FILE)
+        system_configuration = read_json_file(input_dict['System']['SystemConfigurationFile'])
+        system_configuration['RecoveryTarget'] = {'FileName': 'recovery_target_checker', 'ClassName': 'FunctionalComponentsRecoveryTargetChecker',
+                                                  'Parameters': {'ComponentNames': ['BuildingStockUnit'], 'Percent': 0.95}}
+        system = main.create_system(input_dict, system_configuration)
+        assert isinstance(system.recovery_target_checker, FunctionalComponentsRecoveryTargetChecker)
+        assert system.recovery_target_checker.parameters['Percent'] == 0.95
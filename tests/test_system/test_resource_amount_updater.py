@@ -0,0 +1,66 @@
+import pytest
+from pyrecodes import main
+from pyrecodes.utilities import read_json_file
+from pyrecodes.system.resource_amount_updater import ResourceAmountUpdater
+from pyrecodes.resource.resource_store import ResourceStore
+
+MAIN_FILE = './tests/test_inputs/test_inputs_VirtualCommunity_Main.json'
+
+def get_amounts_after_disaster(system) -> list:
+    system.time_step = system.DISASTER_TIME_STEP
+    system.set_initial_damage()
+    system.update()
+    return [[resource_object.current_amount for resource_object in ResourceAmountUpdater.get_resources_to_update(component)]
+            for component in system.components]
+
+def get_resource_amount_updater(system) -> ResourceAmountUpdater:
+    return ResourceAmountUpdater(system.components, ResourceStore(system.components, list(system.resources.keys())))
+
+class TestResourceAmountUpdater:
+
+    @pytest.fixture
+    def system(self):
+        return main.create_system(read_json_file(MAIN_FILE))
+
+    def test_relation_groups(self, system):
+        resource_amount_updater = get_resource_amount_updater(system)
+        relations = [relation_group['Relation'] for relation_group in resource_amount_updater.relation_groups]
+        assert len(set(map(id, relations))) == len(relations)
+        num_grouped_resources = sum(len(relation_group['Resources']) for relation_group in resource_amount_updater.relation_groups)
+        num_resources = sum(len([resource_object for resource_object in resource_amount_updater.get_resources_to_update(component) if not resource_object.CONSUMABLE])
+                            for component in system.components)
+        assert num_grouped_resources == num_resources
+
+    def test_update(self, system):
+        amounts = get_amounts_after_disaster(system)
+        functionality_levels = [component.functionality_level for component in system.components]
+        updated_system = main.create_system(read_json_file(MAIN_FILE))
+        updated_system.resource_amount_updater = get_resource_amount_updater(updated_system)
+        assert get_amounts_after_disaster(updated_system) == amounts
+        assert [component.functionality_level for component in updated_system.components] == functionality_levels
+        assert all(resource_object.amount_updated_in_batch for resource_object in updated_system.resource_amount_updater.relation_groups[0]['Resources'])
+
+    def test_functionality_computed_once(self, system, monkeypatch):
+        resource_amount_updater = get_resource_amount_updater(system)
+        recovery_model_class = type(system.components[0].recovery_model)
+        num_calls = []
+        get_functionality_level = recovery_model_class.get_functionality_level
+        monkeypatch.setattr(recovery_model_class, 'get_functionality_level', lambda recovery_model: num_calls.append(1) or get_functionality_level(recovery_model))
+        resource_amount_updater.update()
+        system.components[0].update(system.DISASTER_TIME_STEP)
+        assert len(num_calls) == sum(type(component.recovery_model) is recovery_model_class for component in system.components)
+
+    def test_relations_shared_between_copies(self, system):
+        resource_amount_updater = get_resource_amount_updater(system)
+        relations = [relation_group['Relation'] for relation_group in resource_amount_updater.relation_groups]
+        assert len(set((type(relation), str(vars(relation))) for relation in relations)) == len(relations)
+
+    def test_amounts_updated_in_batch(self, system):
+        resource_amount_updater = get_resource_amount_updater(system)
+        for component in system.components:
+            assert component.functionality_updated_in_batch
+            assert component.amounts_updated_in_batch == all(not resource_object.CONSUMABLE for resource_object in resource_amount_updater.get_resources_to_update(component))
+
+    def test_requires_resource_store(self, system):
+        with pytest.raises(ValueError):
+            ResourceAmountUpdater(system.components, None)
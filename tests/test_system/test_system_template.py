@@ -0,0 +1,72 @@
+import pytest
+import numpy as np
+from pyrecodes import main
+from pyrecodes.utilities import read_json_file
+from pyrecodes.system.system_template import SystemTemplate
+
+THREE_LOCALITIES_MAIN_FILE = './tests/test_inputs/test_inputs_ThreeLocalitiesCommunity_Main.json'
+VIRTUAL_COMMUNITY_MAIN_FILE = './tests/test_inputs/test_inputs_VirtualCommunity_Main.json'
+ALAMEDA_SYSTEM_CONFIGURATION_FILE = './tests/test_inputs/test_inputs_Alameda_SystemConfiguration.json'
+
+def get_durations(system) -> list:
+    return [recovery_activity.duration for component in system.components
+            for recovery_activity in component.recovery_model.recovery_activities.values() if hasattr(recovery_activity, 'duration')]
+
+class TestSystemTemplate:
+
+    @pytest.fixture
+    def system_template(self):
+        return SystemTemplate(read_json_file(VIRTUAL_COMMUNITY_MAIN_FILE))
+
+    def test_shared_objects(self, system_template: SystemTemplate):
+        system = system_template.create_system()
+        assert system is not system_template.system
+        assert system.component_library is system_template.system.component_library
+        assert system.system_creator is system_template.system.system_creator
+        for component, template_component in zip(system.components, system_template.system.components):
+            assert component is not template_component
+            assert component.locality is template_component.locality
+            assert component.supply is not template_component.supply
+            assert component.recovery_model is not template_component.recovery_model
+
+    def test_check_damage_set_at_creation(self, system_template: SystemTemplate):
+        assert not system_template.damage_set_at_creation
+        assert SystemTemplate.check_damage_set_at_creation(read_json_file(ALAMEDA_SYSTEM_CONFIGURATION_FILE))
+        system_template.damage_set_at_creation = True
+        system_template.create_system()
+        with pytest.raises(ValueError):
+            system_template.create_system('./tests/test_inputs/test_inputs_virtual_community_damage_input.txt')
+
+    def test_created_system_independent_of_template(self, system_template: SystemTemplate):
+        system = system_template.create_system()
+        system.start_resilience_assessment()
+        assert system.time_step > system.START_TIME_STEP
+        assert not hasattr(system_template.system, 'time_step')
+        assert all(component.functional == [] for component in system_template.system.components)
+        assert all(len(resilience_calculator.system_supply[resource_name]) == 0
+                   for resilience_calculator in system_template.system.resilience_calculators if hasattr(resilience_calculator, 'system_supply')
+                   for resource_name in resilience_calculator.resource_names)
+
+    def test_random_variables_resampled(self, tmp_path):
+        input_dict = read_json_file(THREE_LOCALITIES_MAIN_FILE)
+        with open(input_dict['ComponentLibrary']['ComponentLibraryFile'], 'r') as file:
+            component_library = file.read().replace('{"Deterministic": {"Value": 10}}', '{"Lognormal": {"Median": 10, "Dispersion": 1.0}}')
+        input_dict['ComponentLibrary']['ComponentLibraryFile'] = str(tmp_path / 'component_library.json')
+        with open(input_dict['ComponentLibrary']['ComponentLibraryFile'], 'w') as file:
+            file.write(component_library)
+        system_template = SystemTemplate(input_dict)
+        template_durations = get_durations(system_template.system)
+        assert get_durations(system_template.create_system()) != get_durations(system_template.create_system())
+        assert get_durations(system_template.system) == template_durations
+
+    def test_same_results_as_created_system(self):
+        system_template = SystemTemplate(read_json_file(THREE_LOCALITIES_MAIN_FILE))
+        systems = [system_template.create_system(), system_template.create_system(), main.create_system(read_json_file(THREE_LOCALITIES_MAIN_FILE))]
+        for system in systems:
+            system.start_resilience_assessment()
+        for system in systems[:2]:
+            assert system.time_step == systems[2].time_step
+            for component, created_component in zip(system.components, systems[2].components):
+                assert component.functional == created_component.functional
+            assert np.allclose(system.resilience_calculators[0].system_supply['ElectricPower'],
+                               systems[2].resilience_calculators[0].system_supply['ElectricPower'])
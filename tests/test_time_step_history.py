@@ -0,0 +1,107 @@
+import copy
+import pytest
+import numpy as np
+from pyrecodes.time_step_history import TimeStepIntervals, TimeStepSet, TimeStepValues, TimeStepRecords, get_state_matrix
+
+class TestTimeStepIntervals:
+
+    @pytest.fixture
+    def time_step_intervals(self):
+        return TimeStepIntervals([0, 1, 2, 5, 6, 10])
+
+    def test_init(self, time_step_intervals: TimeStepIntervals):
+        assert time_step_intervals.intervals == [[0, 3], [5, 7], [10, 11]]
+        assert time_step_intervals == [0, 1, 2, 5, 6, 10]
+        assert len(time_step_intervals) == 6
+        assert time_step_intervals[0] == 0 and time_step_intervals[-1] == 10 and time_step_intervals[3] == 5
+
+    def test_append(self, time_step_intervals: TimeStepIntervals):
+        for time_step in [11, 11, 4, 3, 8, 9]:
+            time_step_intervals.append(time_step)
+        assert time_step_intervals.intervals == [[0, 7], [8, 12]]
+        assert len(time_step_intervals) == 11
+
+    def test_add_interval(self, time_step_intervals: TimeStepIntervals):
+        time_step_intervals.add_interval(11, 20)
+        assert time_step_intervals.intervals == [[0, 3], [5, 7], [10, 20]]
+        time_step_intervals.add_interval(25, 30)
+        time_step_intervals.add_interval(2, 6)
+        assert time_step_intervals.intervals == [[0, 7], [10, 20], [25, 30]]
+        time_step_intervals.add_interval(8, 8)
+        assert time_step_intervals == TimeStepIntervals(list(range(0, 7)) + list(range(10, 20)) + list(range(25, 30)))
+        assert len(time_step_intervals) == 22
+
+    def test_contains(self, time_step_intervals: TimeStepIntervals):
+        assert all(time_step in time_step_intervals for time_step in [0, 2, 5, 6, 10])
+        assert all(time_step not in time_step_intervals for time_step in [-1, 3, 4, 7, 11])
+
+    def test_to_array(self, time_step_intervals: TimeStepIntervals):
+        assert time_step_intervals.to_array(8).tolist() == [True, True, True, False, False, True, True, False]
+
+class TestTimeStepSet:
+
+    @pytest.fixture
+    def time_step_set(self):
+        return TimeStepSet(5, [0, 2])
+
+    def test_append(self, time_step_set: TimeStepSet):
+        time_step_set.append(3)
+        time_step_set.append(3)
+        time_step_set.append(12)
+        assert time_step_set == [0, 2, 3, 12]
+        assert len(time_step_set) == 4
+        assert time_step_set[-1] == 12
+
+    def test_add_interval(self, time_step_set: TimeStepSet):
+        time_step_set.add_interval(2, 4)
+        time_step_set.add_interval(8, 11)
+        assert time_step_set == [0, 2, 3, 8, 9, 10]
+        assert len(time_step_set) == 6
+
+    def test_contains(self, time_step_set: TimeStepSet):
+        assert 2 in time_step_set
+        assert 1 not in time_step_set
+        assert 100 not in time_step_set
+
+    def test_deepcopy(self, time_step_set: TimeStepSet):
+        copied_time_step_set = copy.deepcopy(time_step_set)
+        copied_time_step_set.append(4)
+        assert time_step_set == [0, 2]
+        assert copied_time_step_set == [0, 2, 4]
+
+class TestTimeStepValues:
+
+    def test_setitem(self):
+        time_step_values = TimeStepValues(3, {0: 10.0})
+        time_step_values[1] = 5.0
+        time_step_values[7] = 2.5
+        assert time_step_values == {0: 10.0, 1: 5.0, 7: 2.5}
+        assert time_step_values[7] == 2.5
+        assert 2 not in time_step_values
+        assert time_step_values.get(2, 0.0) == 0.0
+        assert max(time_step_values.keys()) == 7
+        assert time_step_values.values() == [10.0, 5.0, 2.5]
+        assert time_step_values.items() == [(0, 10.0), (1, 5.0), (7, 2.5)]
+        with pytest.raises(KeyError):
+            time_step_values[2]
+
+class TestTimeStepRecords:
+
+    def test_add(self):
+        time_step_records = TimeStepRecords(3, num_records_per_time_step=1)
+        time_step_records.reset(1)
+        time_step_records.add(1, 'Labor', 0.4)
+        time_step_records.add(1, 'Infrastructure', 0.5)
+        time_step_records.reset(2)
+        time_step_records.add(5, 'Labor', 0.2)
+        assert time_step_records == {1: [{'Name': 'Labor', 'Level': 0.4}, {'Name': 'Infrastructure', 'Level': 0.5}],
+                                     2: [],
+                                     5: [{'Name': 'Labor', 'Level': 0.2}]}
+        assert time_step_records.names == ['Labor', 'Infrastructure']
+        time_step_records.reset(1)
+        assert time_step_records[1] == []
+
+def test_get_state_matrix():
+    state_matrix = get_state_matrix([TimeStepIntervals([1, 2]), TimeStepSet(2, [0, 3]), [2, 5]], 4)
+    assert state_matrix.dtype == np.uint8
+    assert state_matrix.tolist() == [[0, 1, 1, 0], [1, 0, 0, 1], [0, 0, 1, 0]]
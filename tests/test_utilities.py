@@ -1,4 +1,7 @@
-from pyrecodes.utilities import format_locality_id
+import pickle
+from pyrecodes.utilities import format_locality_id, get_attributes, set_attributes, get_shared_object
+from pyrecodes.resource.concrete_resource import ConcreteResource
+from pyrecodes.component_recovery_model.concrete_recovery_activity import ConcreteRecoveryActivity
 
 def test_format_locality_id():
     pass
@@ -6,3 +9,27 @@ def test_format_locality_id():
     # assert format_locality_id('Locality 100') == 100
     # assert format_locality_id('Locality -5') == -5
      
+
+def test_get_shared_object():
+    shared_objects = {}
+    first_object = get_shared_object(shared_objects, 'first', list, 2)
+    assert get_shared_object(shared_objects, 'first', list, 2) is first_object
+    get_shared_object(shared_objects, 'second', list, 2)
+    get_shared_object(shared_objects, 'third', list, 2)
+    assert list(shared_objects.keys()) == ['second', 'third']
+    assert get_shared_object(shared_objects, 'first', list, 2) is not first_object
+
+def test_get_and_set_attributes():
+    resource = ConcreteResource('PotableWater', {'Amount': 10.0})
+    attributes = get_attributes(resource)
+    assert attributes['name'] == 'PotableWater' and attributes['initial_amount'] == 10.0
+    assert not hasattr(resource, '__dict__')
+    loaded_resource = ConcreteResource.__new__(ConcreteResource)
+    loaded_resource.__setstate__({key: value for key, value in attributes.items() if key != 'amount_updated_in_batch'})
+    assert loaded_resource.current_amount == 10.0 and loaded_resource.amount_updated_in_batch == False
+    recovery_activity = ConcreteRecoveryActivity('Repair')
+    loaded_recovery_activity = ConcreteRecoveryActivity.__new__(ConcreteRecoveryActivity)
+    set_attributes(loaded_recovery_activity, (None, {'name': 'Repair', 'level': 0.5, 'progress_intervals': []}))
+    loaded_recovery_activity.time_steps = [3, 4]
+    assert loaded_recovery_activity.progress_intervals == [[3, 5]]
+    assert pickle.loads(pickle.dumps(recovery_activity)).name == 'Repair'